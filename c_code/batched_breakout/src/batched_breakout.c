@@ -0,0 +1,858 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Several independent games of Breakout on one core.
+//!
+//! Each game plays as the game of bkout.c does, with its own state, random
+//! number generator and frame buffer.  The games share their dimensions;
+//! each sends its pixel and score events with keys in its own sub-range of
+//! the keys of the core, and is controlled by its own pair of neurons of
+//! the source population: neuron 2g moves the bat of game g left and
+//! neuron 2g + 1 moves it right, where g counts the games of every core
+//! running part of the same vertex.
+
+// Standard includes
+#include <stdbool.h>
+#include <stdint.h>
+#include <bit_field.h>
+
+// Spin 1 API includes
+#include <spin1_api.h>
+
+// Common includes
+#include <debug.h>
+
+// Front end common includes
+#include <data_specification.h>
+#include <simulation.h>
+#include "random.h"
+
+#include <recording.h>
+
+//! The most games a core can run; must match BatchedBreakoutMachineVertex
+#define MAX_GAMES 32
+
+// The score of every game is recorded in each sample
+#define MAX_SCORE_WORDS MAX_GAMES
+#include "score_recording.h"
+#include "event_recording.h"
+#include "game_reset.h"
+
+//----------------------------------------------------------------------------
+// Macros
+//----------------------------------------------------------------------------
+// Game dimension constants, before subsampling
+#define GAME_WIDTH_MAX  160
+#define GAME_HEIGHT_MAX 128
+
+#define NUMBER_OF_LIVES 5
+
+#define BRICKS_PER_ROW  5
+#define BRICKS_PER_COLUMN  2
+
+#define MAX_BALL_SPEED 2
+
+// Ball outof play time (frames)
+#define OUT_OF_PLAY 20
+
+// Frame delay (ms)
+#define FRAME_DELAY 20
+
+// Bat LHS x position at the start of the game, before subsampling
+#define BAT_START_X 32
+
+// Bat length in pixels, before subsampling
+#define BAT_LENGTH 32
+
+// Where the game is in a recorded event; the event type is below it
+#define EVENT_GAME_SHIFT 16
+
+//----------------------------------------------------------------------------
+// Enumerations
+//----------------------------------------------------------------------------
+typedef enum {
+  REGION_SYSTEM,
+  REGION_BREAKOUT,
+  REGION_RECORDING,
+  REGION_PARAM,
+  REGION_PROVENANCE,
+} region_t;
+
+typedef enum {
+  COLOUR_BACKGROUND = 0x0,
+  COLOUR_BAT        = 0x2,
+  COLOUR_BALL       = 0x1,
+  COLOUR_SCORE      = 0x1,
+  COLOUR_BRICK_ON   = 0x1,
+  COLOUR_BRICK_OFF  = 0x0
+} colour_t;
+
+typedef enum {
+  KEY_LEFT  = 0x0,
+  KEY_RIGHT = 0x1,
+} key_t;
+
+typedef enum {
+  SPECIAL_EVENT_SCORE_UP,
+  SPECIAL_EVENT_SCORE_DOWN,
+  SPECIAL_EVENT_MAX,
+} special_event_t;
+
+//! Episode events, in the order of BreakoutEvent
+typedef enum {
+  EVENT_LIFE_LOST,
+  EVENT_BRICKS_CLEARED,
+} episode_event_t;
+
+//! Parameter region words, in the order of BatchedBreakoutMachineVertex
+typedef enum {
+  PARAM_X_FACTOR,
+  PARAM_Y_FACTOR,
+  PARAM_BRICKING,
+  PARAM_N_GAMES,
+  PARAM_RECORD_CHANGES_ONLY,
+  PARAM_RESET_FLAGS,
+  PARAM_RANDOM_SEEDS,
+} param_word_t;
+
+typedef enum callback_priorities {
+    MC = -1, DMA = 0, USER = 0, SDP = 1, TIMER = 2
+} callback_priorities;
+
+//----------------------------------------------------------------------------
+// Structures
+//----------------------------------------------------------------------------
+//! The breakout region, as written by BatchedBreakoutMachineVertex
+struct breakout_region {
+    //! The key of the first game
+    uint32_t key;
+    //! How far the index of a game is shifted up in its keys
+    uint32_t game_key_shift;
+    //! The index of the first game among those of the whole vertex
+    uint32_t first_game;
+    //! The number of colour bits in the keys of the source
+    uint32_t n_colour_bits;
+    //! The bits of a source key that hold the neuron within its core
+    uint32_t source_atom_mask;
+    //! How far the index of the source core is shifted up in its keys
+    uint32_t source_core_shift;
+    //! The mask of the index of the source core, once shifted down
+    uint32_t source_core_mask;
+    //! The number of neurons on each source core
+    uint32_t source_atoms_per_core;
+};
+
+//! Provenance data, in the order read by BatchedBreakoutMachineVertex
+struct breakout_provenance {
+    //! The number of multicast packets received
+    uint32_t packets_received;
+    //! The number of left key spikes received
+    uint32_t left_key_spikes;
+    //! The number of right key spikes received
+    uint32_t right_key_spikes;
+    //! The number of frames in which a bat moved left
+    uint32_t moves_left;
+    //! The number of frames in which a bat moved right
+    uint32_t moves_right;
+    //! The number of spikes sent
+    uint32_t spikes_sent;
+    //! The number of packets from neurons that control no game of the core
+    uint32_t other_game_packets;
+};
+
+//! The state of one game
+typedef struct breakout_game {
+    //! The index of the game, and of its score
+    uint32_t index;
+    //! The key of the game, to which its events are added
+    uint32_t key;
+    //! Ball coordinates
+    int x, y;
+    //! Ball velocity
+    int u, v;
+    //! Bat LHS x position
+    int x_bat;
+    //! Whether the bat must be drawn at the next frame update
+    bool redraw_bat;
+    //! Frames until the ball is back in play
+    int out_of_play;
+    int number_of_lives;
+    bool bricks[BRICKS_PER_COLUMN][BRICKS_PER_ROW];
+    int current_number_of_bricks;
+    //! The brick last hit, or -1 if none
+    int brick_corner_x, brick_corner_y;
+    //! The key spikes received since the last frame
+    uint32_t left_key_count, right_key_count;
+    mars_kiss64_seed_t kiss_seed;
+    //! The colour of each pixel, a column at a time
+    uint8_t *frame_buff;
+} breakout_game_t;
+
+//----------------------------------------------------------------------------
+// Globals
+//----------------------------------------------------------------------------
+
+//! Should simulation run for ever? 0 if not
+static uint32_t infinite_run;
+
+static uint32_t _time = 0;
+
+//! the number of timer ticks that this model should run for before exiting.
+static uint32_t simulation_ticks = 0;
+
+//! The parameter region, which is read again when the simulation resumes
+static address_t param_region;
+
+//! How to find the game of a received key
+static struct breakout_region input;
+
+static uint32_t n_games;
+static breakout_game_t games[MAX_GAMES];
+
+//! The score of each game, as recorded
+static int32_t scores[MAX_GAMES];
+
+// Dimensions shared by the games, after subsampling
+static int game_width = GAME_WIDTH_MAX;
+static int game_height = GAME_HEIGHT_MAX;
+static int y_bits = 8;
+static int bat_len = BAT_LENGTH;
+static int brick_width = 10;
+static int brick_height = 5;
+static int brick_layer_offset = 16;
+static int brick_layer_height = 12;
+
+static int x_factor = 1;
+static int y_factor = 1;
+static int bricking = 1;
+
+static uint32_t score_change_count = 0;
+
+// Counters for provenance
+static uint32_t pkt_count = 0;
+static uint32_t total_left_key_count = 0;
+static uint32_t total_right_key_count = 0;
+static uint32_t move_count_l = 0;
+static uint32_t move_count_r = 0;
+static uint32_t spikes_sent = 0;
+static uint32_t other_game_packets = 0;
+
+//----------------------------------------------------------------------------
+// Inline functions
+//----------------------------------------------------------------------------
+static inline void add_score_up_event(breakout_game_t *game)
+{
+    spin1_send_mc_packet(game->key | SPECIAL_EVENT_SCORE_UP, 0, NO_PAYLOAD);
+    spikes_sent++;
+    scores[game->index]++;
+}
+
+static inline void add_score_down_event(breakout_game_t *game)
+{
+    spin1_send_mc_packet(game->key | SPECIAL_EVENT_SCORE_DOWN, 0, NO_PAYLOAD);
+    spikes_sent++;
+    scores[game->index]--;
+}
+
+static inline void record_game_event(
+        breakout_game_t *game, uint32_t time, episode_event_t event)
+{
+    event_record(time, (game->index << EVENT_GAME_SHIFT) | event);
+}
+
+// send packet containing pixel colour change
+static inline void add_event(
+        breakout_game_t *game, int i, int j, colour_t col, bool bricked)
+{
+    const uint32_t colour_bit = (col == COLOUR_BACKGROUND) ? 0 : 1;
+
+    const uint32_t spike_key = game->key | (
+        SPECIAL_EVENT_MAX + (i << (y_bits + 2)) + (j << 2) + (bricked << 1) +
+        colour_bit);
+
+    spin1_send_mc_packet(spike_key, 0, NO_PAYLOAD);
+    spikes_sent++;
+}
+
+static inline bool in_frame(int i, int j)
+{
+    return i >= 0 && j >= 0 && i < game_width && j < game_height;
+}
+
+// gets pixel colour; anything outside the frame is background
+static inline colour_t get_pixel_col(breakout_game_t *game, int i, int j)
+{
+    if (!in_frame(i, j)) {
+        return COLOUR_BACKGROUND;
+    }
+    return (colour_t) game->frame_buff[i * game_height + j];
+}
+
+// sets pixel colour and sends the change
+static inline void set_pixel_col(
+        breakout_game_t *game, int i, int j, colour_t col, bool bricked)
+{
+    if (bricked) {
+        add_event(game, game->brick_corner_x * brick_width,
+                game->brick_corner_y * brick_height + brick_layer_offset,
+                COLOUR_BACKGROUND, bricked);
+    }
+    if (in_frame(i, j)) {
+        game->frame_buff[i * game_height + j] = col;
+    }
+    add_event(game, i, j, col, bricked);
+}
+
+static inline bool is_a_brick(breakout_game_t *game, int the_x, int the_y)
+{
+    if (the_x < 0 || the_y < 0 || the_x >= game_width - 1 ||
+            the_y >= game_height - 1) {
+        return false;
+    }
+
+    if (the_y >= brick_layer_offset &&
+            the_y < brick_layer_offset + brick_layer_height) {
+        int pos_x = the_x / brick_width;
+        int pos_y = (the_y - brick_layer_offset) / brick_height;
+        bool val = game->bricks[pos_y][pos_x];
+        if (val) {
+            add_event(game, pos_x * brick_width,
+                    (pos_y * brick_height) + brick_layer_offset,
+                    COLOUR_BACKGROUND, true);
+        }
+        game->bricks[pos_y][pos_x] = false;
+        if (val) {
+            game->brick_corner_x = pos_x;
+            game->brick_corner_y = pos_y;
+            game->current_number_of_bricks--;
+        } else {
+            game->brick_corner_x = -1;
+            game->brick_corner_y = -1;
+        }
+        return val;
+    }
+    game->brick_corner_x = -1;
+    game->brick_corner_y = -1;
+    return false;
+}
+
+static inline uint32_t hitting_a_brick(
+        breakout_game_t *game, int the_x, int the_y)
+{
+    uint32_t encoded_result = 0;
+    if (game->u > 0) {
+        if (is_a_brick(game, the_x + 1, the_y)) {
+            encoded_result += 1;
+        }
+    } else if (is_a_brick(game, the_x - 1, the_y)) {
+        encoded_result += 2;
+    }
+    if (game->v > 0) {
+        if (is_a_brick(game, the_x, the_y + 1)) {
+            encoded_result += 4;
+        }
+    } else if (is_a_brick(game, the_x, the_y - 1)) {
+        encoded_result += 8;
+    }
+    return encoded_result;
+}
+
+//----------------------------------------------------------------------------
+// Static functions
+//----------------------------------------------------------------------------
+// clear the frame buffer and build the wall
+static void init_frame(breakout_game_t *game)
+{
+    for (int i = 0; i < game_width * game_height; i++) {
+        game->frame_buff[i] = COLOUR_BACKGROUND;
+    }
+
+    for (int i = 0; i < BRICKS_PER_COLUMN; i++) {
+        for (int j = 0; j < BRICKS_PER_ROW; j++) {
+            game->bricks[i][j] = (bricking == 1);
+        }
+    }
+    game->current_number_of_bricks = BRICKS_PER_COLUMN * BRICKS_PER_ROW;
+}
+
+static float rand021(breakout_game_t *game)
+{
+    return (float) (mars_kiss64_seed(game->kiss_seed) / (float) 0xffffffff);
+}
+
+// bounce the ball off any bricks hit, scoring for each
+static void bounce_off_bricks(breakout_game_t *game, uint32_t encoded_result)
+{
+    if (encoded_result & 1) {
+        game->u = -game->u;
+        add_score_up_event(game);
+    }
+    if (encoded_result & 2) {
+        game->u = -game->u;
+        add_score_up_event(game);
+    }
+    if (encoded_result & 4) {
+        game->v = -game->v;
+        add_score_up_event(game);
+    }
+    if (encoded_result & 8) {
+        game->v = -game->v;
+        add_score_up_event(game);
+    }
+}
+
+static void update_frame(breakout_game_t *game, uint32_t time)
+{
+    // Cache old bat position
+    const int old_xbat = game->x_bat;
+    int move_direction;
+    if (game->right_key_count > game->left_key_count) {
+        move_direction = KEY_RIGHT;
+        move_count_r++;
+    } else if (game->left_key_count > game->right_key_count) {
+        move_direction = KEY_LEFT;
+        move_count_l++;
+    } else {
+        move_direction = 2;
+    }
+
+    // Update bat and clamp
+    if (move_direction == KEY_LEFT && --game->x_bat < 0) {
+        game->x_bat = 1;
+    } else if (move_direction == KEY_RIGHT &&
+            ++game->x_bat > game_width - bat_len) {
+        game->x_bat = game_width - bat_len - 1;
+    }
+
+    // Clear keystate
+    game->left_key_count = 0;
+    game->right_key_count = 0;
+
+    // If bat's moved
+    if (old_xbat != game->x_bat) {
+        // Draw bat pixels
+        for (int i = game->x_bat; i < (game->x_bat + bat_len); i++) {
+            set_pixel_col(game, i, game_height - 1, COLOUR_BAT, false);
+        }
+        // Remove pixels left over from old bat
+        if (game->x_bat > old_xbat) {
+            set_pixel_col(game, old_xbat, game_height - 1,
+                    COLOUR_BACKGROUND, false);
+        } else if (game->x_bat < old_xbat) {
+            set_pixel_col(game, old_xbat + bat_len - 1, game_height - 1,
+                    COLOUR_BACKGROUND, false);
+        }
+    }
+
+    if (game->out_of_play != 0) {
+        --game->out_of_play;
+        return;
+    }
+    if (time % (20 * x_factor) != 0) {
+        return;
+    }
+
+    // clear pixel to background
+    if (get_pixel_col(game, game->x, game->y) != COLOUR_BAT) {
+        set_pixel_col(game, game->x, game->y, COLOUR_BACKGROUND, false);
+    }
+
+    // move ball in x and bounce off sides
+    game->x += game->u;
+    if (game->x + game->u < 0) {
+        game->u = -game->u;
+    }
+    if (game->x + game->u >= game_width) {
+        game->u = -game->u;
+    }
+
+    // move ball in y and bounce off top
+    game->y += game->v;
+    if (game->y + game->v > game_height) {
+        game->y = game_height - 1;
+    }
+    if (game->y + game->v < 0) {
+        game->v = -game->v;
+    }
+
+    uint32_t encoded_result = hitting_a_brick(game, game->x, game->y);
+    if (encoded_result) {
+        set_pixel_col(game, game->x, game->y, COLOUR_BACKGROUND, false);
+        bounce_off_bricks(game, encoded_result);
+    } else {
+        encoded_result = hitting_a_brick(
+                game, game->x + (game->u / 2), game->y + (game->v / 2));
+        if (encoded_result) {
+            game->x = game->x + (game->u / 2);
+            game->y = game->y + (game->v / 2);
+            bounce_off_bricks(game, encoded_result);
+        }
+    }
+
+    const int x = game->x;
+    if (get_pixel_col(game, x, game->y) == COLOUR_BAT ||
+            get_pixel_col(game, x + (game->u / 2),
+                    game->y + (game->v / 2)) == COLOUR_BAT ||
+            get_pixel_col(game, x, game->y + (game->v / 2)) == COLOUR_BAT) {
+        if (x < (game->x_bat + bat_len / 4)) {
+            game->u = -MAX_BALL_SPEED;
+            game->v = -game->v;
+        } else if (x < (game->x_bat + (bat_len / 2))) {
+            game->u = -(MAX_BALL_SPEED / 2);
+            game->v = -game->v;
+        } else if (x < (game->x_bat + ((3 * bat_len) / 4))) {
+            game->u = (MAX_BALL_SPEED / 2);
+            game->v = -game->v;
+        } else if (x < (game->x_bat + bat_len)) {
+            game->u = MAX_BALL_SPEED;
+            game->v = -game->v;
+        }
+
+        // Increase score
+        if (!bricking) {
+            add_score_up_event(game);
+        }
+    }
+
+    // lost ball
+    if (game->y + game->v > game_height) {
+        game->v = -MAX_BALL_SPEED;
+        game->x = game->x_bat + (bat_len / 2);
+        game->y = game_height - 2;
+
+        if (mars_kiss64_seed(game->kiss_seed) > 0x7FFFFFFF) {
+            game->u = -MAX_BALL_SPEED;
+        } else {
+            game->u = MAX_BALL_SPEED;
+        }
+
+        game->out_of_play = OUT_OF_PLAY;
+        game->number_of_lives--;
+        record_game_event(game, time, EVENT_LIFE_LOST);
+        add_score_down_event(game);
+    } else if (get_pixel_col(game, game->x, game->y) != COLOUR_BAT) {
+        // draw ball
+        set_pixel_col(game, game->x, game->y, COLOUR_BALL, false);
+    }
+}
+
+// rebuild the wall once every brick has been hit
+static void rebuild_bricks(breakout_game_t *game, uint32_t time)
+{
+    record_game_event(game, time, EVENT_BRICKS_CLEARED);
+    for (int i = 0; i < BRICKS_PER_COLUMN; i++) {
+        for (int j = 0; j < BRICKS_PER_ROW; j++) {
+            game->bricks[i][j] = true;
+        }
+    }
+    game->current_number_of_bricks = BRICKS_PER_COLUMN * BRICKS_PER_ROW;
+    set_pixel_col(game, game->x, game->y, COLOUR_BACKGROUND, false);
+    game->v = -MAX_BALL_SPEED;
+    game->y = game_height - 2;
+
+    if (mars_kiss64_seed(game->kiss_seed) > 0x7FFFFFFF) {
+        game->u = -game->u;
+    }
+    game->x = game->x_bat + (bat_len / 2);
+}
+
+static void update_game(breakout_game_t *game, uint32_t time)
+{
+    if (!game->current_number_of_bricks && bricking == 1) {
+        rebuild_bricks(game, time);
+    }
+
+    for (int i = 0; i < BRICKS_PER_COLUMN; i++) {
+        for (int j = 0; j < BRICKS_PER_ROW; j++) {
+            if (game->bricks[i][j]) {
+                add_event(game, j * brick_width,
+                        (i * brick_height) + brick_layer_offset,
+                        COLOUR_BRICK_ON, true);
+            }
+        }
+    }
+
+    // Collision detection relies on the bat being drawn; as in bkout.c, it
+    // is first drawn on the second frame
+    if (time == FRAME_DELAY || game->redraw_bat) {
+        game->redraw_bat = false;
+        for (int i = game->x_bat; i < (game->x_bat + bat_len); i++) {
+            set_pixel_col(game, i, game_height - 1, COLOUR_BAT, false);
+        }
+    }
+    update_frame(game, time);
+}
+
+//! \brief Read the parameters that can be changed between runs
+static void read_parameters(void)
+{
+    bricking = param_region[PARAM_BRICKING];
+}
+
+//! \brief Seed the random number generator of each game from the
+//!        parameter region, making each seed valid
+static void read_seeds(void)
+{
+    for (uint32_t g = 0; g < n_games; g++) {
+        uint32_t *seed = &param_region[PARAM_RANDOM_SEEDS + 4 * g];
+        for (uint32_t i = 0; i < 4; i++) {
+            games[g].kiss_seed[i] = seed[i];
+        }
+        validate_mars_kiss64_seed(games[g].kiss_seed);
+    }
+}
+
+//! \brief Put a game back into its starting state
+static void reset_game(breakout_game_t *game)
+{
+    init_frame(game);
+    game->number_of_lives = NUMBER_OF_LIVES;
+    scores[game->index] = 0;
+    game->out_of_play = 0;
+    game->left_key_count = 0;
+    game->right_key_count = 0;
+    game->brick_corner_x = -1;
+    game->brick_corner_y = -1;
+
+    // Serve the ball from the bat, back at its starting position
+    game->x_bat = BAT_START_X / x_factor;
+    game->x = game->x_bat + (bat_len / 2);
+    game->y = game_height - 2;
+    game->v = -MAX_BALL_SPEED;
+    if (rand021(game) < 0.5) {
+        game->u = MAX_BALL_SPEED;
+    } else {
+        game->u = -MAX_BALL_SPEED;
+    }
+    game->redraw_bat = true;
+}
+
+static void store_provenance_data(address_t provenance_region)
+{
+    struct breakout_provenance *prov = (void *) provenance_region;
+    prov->packets_received = pkt_count;
+    prov->left_key_spikes = total_left_key_count;
+    prov->right_key_spikes = total_right_key_count;
+    prov->moves_left = move_count_l;
+    prov->moves_right = move_count_r;
+    prov->spikes_sent = spikes_sent;
+    prov->other_game_packets = other_game_packets;
+}
+
+static bool initialize(uint32_t *timer_period)
+{
+    io_printf(IO_BUF, "Initialise batched breakout: started\n");
+
+    // Get the address this core's DTCM data starts at from SRAM
+    data_specification_metadata_t *ds_regions =
+            data_specification_get_data_address();
+
+    // Read the header
+    if (!data_specification_read_header(ds_regions)) {
+        return false;
+    }
+
+    // Get the timing details and set up the simulation interface
+    if (!simulation_initialise(
+            data_specification_get_region(REGION_SYSTEM, ds_regions),
+            APPLICATION_NAME_HASH, timer_period, &simulation_ticks,
+            &infinite_run, &_time, SDP, DMA)) {
+        return false;
+    }
+    simulation_set_provenance_function(
+            store_provenance_data,
+            data_specification_get_region(REGION_PROVENANCE, ds_regions));
+
+    // Read breakout region memory
+    struct breakout_region *breakout_region =
+            data_specification_get_region(REGION_BREAKOUT, ds_regions);
+    input = *breakout_region;
+    io_printf(IO_BUF, "\tKey=%08x\n", input.key);
+
+    //get recording region
+    void *recording_region = data_specification_get_region(
+            REGION_RECORDING, ds_regions);
+
+    // Read param region to initialise game parameters
+    param_region = data_specification_get_region(REGION_PARAM, ds_regions);
+
+    x_factor = param_region[PARAM_X_FACTOR];
+    y_factor = param_region[PARAM_Y_FACTOR];
+    read_parameters();
+    n_games = param_region[PARAM_N_GAMES];
+    if (n_games > MAX_GAMES) {
+        io_printf(IO_BUF, "Too many games: %u\n", n_games);
+        return false;
+    }
+    score_recording_initialise(
+            param_region[PARAM_RECORD_CHANGES_ONLY], n_games);
+    // The games start in their reset state anyway
+    take_reset_request(&param_region[PARAM_RESET_FLAGS]);
+
+    if (bricking != 0 && bricking != 1) {
+        io_printf(IO_BUF, "\n Brick setting invalid at: %d \n", bricking);
+        return false;
+    }
+
+    // Setup game environment
+    game_width = GAME_WIDTH_MAX / x_factor;
+    game_height = GAME_HEIGHT_MAX / y_factor;
+    bat_len = BAT_LENGTH / x_factor;
+    brick_width = game_width / BRICKS_PER_ROW;
+    brick_height = 16 / y_factor;
+    brick_layer_offset = brick_layer_offset / y_factor;
+    brick_layer_height = BRICKS_PER_COLUMN * brick_height;
+    y_bits = get_bit_field_size(game_height);
+
+    io_printf(IO_BUF, "%u games of w = %d, h = %d, xf = %d, yf = %d\n",
+            n_games, game_width, game_height, x_factor, y_factor);
+
+    read_seeds();
+    for (uint32_t g = 0; g < n_games; g++) {
+        breakout_game_t *game = &games[g];
+        game->index = g;
+        game->key = input.key | (g << input.game_key_shift);
+        game->frame_buff = spin1_malloc(game_width * game_height);
+        if (game->frame_buff == NULL) {
+            io_printf(IO_BUF, "Can't allocate the frame of game %u\n", g);
+            return false;
+        }
+        reset_game(game);
+        game->redraw_bat = false;
+    }
+
+    // Setup recording
+    uint32_t recording_flags = 0;
+    if (!recording_initialize(&recording_region, &recording_flags)) {
+        rt_error(RTE_SWERR);
+        return false;
+    }
+
+    io_printf(IO_BUF, "Initialise: completed successfully\n");
+
+    return true;
+}
+
+void resume_callback(void)
+{
+    read_parameters();
+    uint32_t reset = take_reset_request(&param_region[PARAM_RESET_FLAGS]);
+    if (reset & RESET_SEED) {
+        read_seeds();
+    }
+    if (reset & RESET_GAME) {
+        for (uint32_t g = 0; g < n_games; g++) {
+            reset_game(&games[g]);
+        }
+        io_printf(IO_BUF, "Games reset\n");
+    }
+    recording_reset();
+}
+
+void timer_callback(uint unused, uint dummy)
+{
+    use(unused);
+    use(dummy);
+
+    _time++;
+    score_change_count++;
+
+    if (!infinite_run && _time >= simulation_ticks) {
+        // Finalise recording
+        recording_finalise();
+
+        // go into pause and resume state to avoid another tick
+        simulation_handle_pause_resume(resume_callback);
+
+        io_printf(IO_BUF, "move count Left %u\n", move_count_l);
+        io_printf(IO_BUF, "move count Right %u\n", move_count_r);
+        io_printf(IO_BUF, "Exiting on timer.\n");
+        simulation_ready_to_read();
+
+        _time -= 1;
+        return;
+    }
+
+    // Update the frames of the games every frame delay
+    if (_time % FRAME_DELAY == 0) {
+        for (uint32_t g = 0; g < n_games; g++) {
+            update_game(&games[g], _time);
+        }
+        // Update recorded scores every 1s
+        if (score_change_count >= 1000) {
+            score_record(_time, scores);
+            score_change_count = 0;
+        }
+    }
+}
+
+void mc_packet_received_callback(uint key, uint payload)
+{
+    // If no payload has been set, make sure the loop will run
+    if (payload == 0) {
+        payload = 1;
+    }
+
+    pkt_count++;
+
+    // Find the neuron of the source population that sent the key
+    uint32_t core = (key >> input.source_core_shift) & input.source_core_mask;
+    uint32_t neuron = core * input.source_atoms_per_core +
+            ((key & input.source_atom_mask) >> input.n_colour_bits);
+    // Games of other cores wrap round to large indices
+    uint32_t g = (neuron >> 1) - input.first_game;
+    if (g >= n_games) {
+        other_game_packets++;
+        return;
+    }
+
+    breakout_game_t *game = &games[g];
+    if (neuron & KEY_RIGHT) {
+        game->right_key_count += payload;
+        total_right_key_count += payload;
+    } else {
+        game->left_key_count += payload;
+        total_left_key_count += payload;
+    }
+}
+
+//----------------------------------------------------------------------------
+// Entry point
+//----------------------------------------------------------------------------
+void c_main(void)
+{
+    // Load DTCM data
+    uint32_t timer_period;
+    if (!initialize(&timer_period)) {
+        io_printf(IO_BUF, "Init error!\n");
+        rt_error(RTE_SWERR);
+        return;
+    }
+
+    // Set timer tick (in microseconds)
+    spin1_set_timer_tick(timer_period);
+
+    // Register callback
+    spin1_callback_on(TIMER_TICK, timer_callback, TIMER);
+    spin1_callback_on(MC_PACKET_RECEIVED, mc_packet_received_callback, MC);
+    spin1_callback_on(MCPL_PACKET_RECEIVED, mc_packet_received_callback, MC);
+
+    _time = UINT32_MAX;
+
+    simulation_run();
+}
@@ -38,6 +38,9 @@
 #include "random.h"
 
 #include <recording.h>
+#include "score_recording.h"
+#include "event_recording.h"
+#include "game_reset.h"
 
 //----------------------------------------------------------------------------
 // Macros
@@ -62,6 +65,9 @@
 // Frame delay (ms)
 #define FRAME_DELAY 20
 
+// Bat LHS x position at the start of the game, before subsampling
+#define BAT_START_X 32
+
 //----------------------------------------------------------------------------
 // Enumerations
 //----------------------------------------------------------------------------
@@ -70,6 +76,7 @@ typedef enum {
   REGION_BREAKOUT,
   REGION_RECORDING,
   REGION_PARAM,
+  REGION_PROVENANCE,
 } region_t;
 
 typedef enum {
@@ -92,10 +99,35 @@ typedef enum {
   SPECIAL_EVENT_MAX,
 } special_event_t;
 
+//! Episode events, in the order of BreakoutEvent
+typedef enum {
+  EVENT_LIFE_LOST,
+  EVENT_BRICKS_CLEARED,
+} episode_event_t;
+
 typedef enum callback_priorities {
     MC = -1, DMA = 0, USER = 0, SDP = 1, TIMER = 2
 } callback_priorities;
 
+//----------------------------------------------------------------------------
+// Structures
+//----------------------------------------------------------------------------
+//! Provenance data, in the order read by BreakoutMachineVertex
+struct breakout_provenance {
+    //! The number of multicast packets received
+    uint32_t packets_received;
+    //! The number of left key spikes received
+    uint32_t left_key_spikes;
+    //! The number of right key spikes received
+    uint32_t right_key_spikes;
+    //! The number of frames in which the bat moved left
+    uint32_t moves_left;
+    //! The number of frames in which the bat moved right
+    uint32_t moves_right;
+    //! The number of spikes sent
+    uint32_t spikes_sent;
+};
+
 //----------------------------------------------------------------------------
 // Globals
 //----------------------------------------------------------------------------
@@ -126,6 +158,9 @@ int x_factor = 1;
 int y_factor = 1;
 int bricking = 2;
 
+//! The parameter region, which is read again when the simulation resumes
+static address_t param_region;
+
 // ball position and velocity scale factor
 int FACT = 16;
 
@@ -134,7 +169,10 @@ int u = MAX_BALL_SPEED;// * FACT;
 int v = -MAX_BALL_SPEED;// * FACT;
 
 // bat LHS x position
-int x_bat = 32;
+int x_bat = BAT_START_X;
+
+// whether the bat must be drawn at the next frame update
+static bool redraw_bat = false;
 
 // bat length in pixels
 int bat_len = 32;
@@ -165,6 +203,9 @@ uint32_t simulation_ticks = 0;
 
 uint32_t left_key_count = 0;
 uint32_t right_key_count = 0;
+uint32_t total_left_key_count = 0;
+uint32_t total_right_key_count = 0;
+uint32_t spikes_sent = 0;
 uint32_t move_count_r = 0;
 uint32_t move_count_l = 0;
 uint32_t score_change_count=0;
@@ -181,6 +222,7 @@ static uint32_t x_ratio = UINT32_MAX / GAME_WIDTH_MAX;
 static inline void add_score_up_event(void)
 {
   spin1_send_mc_packet(key | (SPECIAL_EVENT_SCORE_UP), 0, NO_PAYLOAD);
+  spikes_sent++;
 //  io_printf(IO_BUF, "Score up\n");
   current_score++;
 }
@@ -188,6 +230,7 @@ static inline void add_score_up_event(void)
 static inline void add_score_down_event(void)
 {
   spin1_send_mc_packet(key | (SPECIAL_EVENT_SCORE_DOWN), 0, NO_PAYLOAD);
+  spikes_sent++;
 //  io_printf(IO_BUF, "Score down\n");
   current_score--;
 }
@@ -203,6 +246,7 @@ void add_event(int i, int j, colour_t col, bool bricked)
 //    		SPECIAL_EVENT_MAX + (i << (y_bits + colour_bit)) + (j << colour_bit) + colour_bit);
 
     spin1_send_mc_packet(spike_key, 0, NO_PAYLOAD);
+    spikes_sent++;
 }
 
 // gets pixel colour from within word
@@ -587,6 +631,7 @@ static void update_frame (uint32_t time)
                 out_of_play = OUT_OF_PLAY;
                 // Decrease score
                 number_of_lives--;
+                event_record(time, EVENT_LIFE_LOST);
 //                if (!number_of_lives && bricking){
 //                    for (int i=0; i<SCORE_DOWN_EVENTS_PER_DEATH; i++) {
 //                        add_score_down_event();
@@ -617,6 +662,23 @@ static void update_frame (uint32_t time)
     }
 }
 
+//! \brief Read the parameters that can be changed between runs
+static void read_parameters(void)
+{
+    bricking = param_region[2];
+}
+
+static void store_provenance_data(address_t provenance_region)
+{
+    struct breakout_provenance *prov = (void *) provenance_region;
+    prov->packets_received = pkt_count;
+    prov->left_key_spikes = total_left_key_count;
+    prov->right_key_spikes = total_right_key_count;
+    prov->moves_left = move_count_l;
+    prov->moves_right = move_count_r;
+    prov->spikes_sent = spikes_sent;
+}
+
 static bool initialize(uint32_t *timer_period)
 {
     io_printf(IO_BUF, "Initialise breakout: started\n");
@@ -635,6 +697,9 @@ static bool initialize(uint32_t *timer_period)
       &infinite_run, &_time, SDP, DMA)) {
         return false;
     }
+    simulation_set_provenance_function(
+        store_provenance_data,
+        data_specification_get_region(REGION_PROVENANCE, ds_regions));
 
     io_printf(IO_BUF, "simulation time = %u\n", simulation_ticks);
     io_printf(IO_BUF, "\tTimer period=%d\n", *timer_period);
@@ -651,15 +716,19 @@ static bool initialize(uint32_t *timer_period)
         REGION_RECORDING, ds_regions);
 
     // Read param region to initialise game parameters
-    address_t param_region = data_specification_get_region(REGION_PARAM, ds_regions);
+    param_region = data_specification_get_region(REGION_PARAM, ds_regions);
 
     x_factor = param_region[0];
     y_factor = param_region[1];
-    bricking = param_region[2];
+    read_parameters();
     kiss_seed[0] = param_region[3];
     kiss_seed[1] = param_region[4];
     kiss_seed[2] = param_region[5];
     kiss_seed[3] = param_region[6];
+    validate_mars_kiss64_seed(kiss_seed);
+    score_recording_initialise(param_region[7], 1);
+    // The game starts in its reset state anyway
+    take_reset_request(&param_region[8]);
 
     io_printf(IO_BUF, "x_factor = %d, y_factor = %d, bricking = %d, seed = [%d, %d, %d, %d]\n",
             x_factor, y_factor, bricking, kiss_seed[0], kiss_seed[1], kiss_seed[2], kiss_seed[3]);
@@ -723,8 +792,44 @@ static bool initialize(uint32_t *timer_period)
     return true;
 }
 
+//! \brief Put the game back into its starting state
+static void reset_game(void)
+{
+    init_frame();
+    number_of_lives = NUMBER_OF_LIVES;
+    current_score = 0;
+    out_of_play = 0;
+    keystate = 0;
+
+    // Serve the ball from the bat, back at its starting position
+    x_bat = BAT_START_X / x_factor;
+    x = x_bat + (bat_len / 2);
+    y = GAME_HEIGHT - 2;
+    v = -MAX_BALL_SPEED;
+    if (rand021() < 0.5) {
+        u = MAX_BALL_SPEED;
+    }
+    else {
+        u = -MAX_BALL_SPEED;
+    }
+    redraw_bat = true;
+    io_printf(IO_BUF, "Game reset\n");
+}
+
 void resume_callback(void)
 {
+    read_parameters();
+    uint32_t reset = take_reset_request(&param_region[8]);
+    if (reset & RESET_SEED) {
+        kiss_seed[0] = param_region[3];
+        kiss_seed[1] = param_region[4];
+        kiss_seed[2] = param_region[5];
+        kiss_seed[3] = param_region[6];
+        validate_mars_kiss64_seed(kiss_seed);
+    }
+    if (reset & RESET_GAME) {
+        reset_game();
+    }
     recording_reset();
 }
 
@@ -767,6 +872,7 @@ void timer_callback(uint unused, uint dummy)
         // io_printf(IO_BUF, "else time = %d\n", _time);
         if (_time % 20 == 0) {
             if (!current_number_of_bricks && bricking == 1) {
+                event_record(_time, EVENT_BRICKS_CLEARED);
                 for (int i =0; i<BRICKS_PER_COLUMN; i++) {
                     for (int j=0; j<BRICKS_PER_ROW; j++) {
                         bricks[i][j] = true;
@@ -802,7 +908,8 @@ void timer_callback(uint unused, uint dummy)
             }
             // If this is the first update, draw bat as
             // collision detection relies on this
-            if (_time == FRAME_DELAY) {
+            if (_time == FRAME_DELAY || redraw_bat) {
+                redraw_bat = false;
 //                io_printf(IO_BUF, "sets the bat for the first time bl:%d, xb:%, gh:%d\n",
 //                		bat_len, x_bat, GAME_HEIGHT);
                 // Draw bat
@@ -814,7 +921,7 @@ void timer_callback(uint unused, uint dummy)
             update_frame(_time);
             // Update recorded score every 1s
             if (score_change_count>=1000) {
-                bool record_check = recording_record(0, &current_score, 4);
+                bool record_check = score_record(_time, &current_score);
                 io_printf(IO_BUF, "record outcome %d when recording %d\n",
                     record_check, current_score);
                 score_change_count=0;
@@ -828,16 +935,19 @@ void mc_packet_received_callback(uint key, uint payload)
     // If no payload has been set, make sure the loop will run
     if (payload == 0) { payload = 1; }
 
+    pkt_count++;
     key = key >> n_colour_bits;
 
     for (uint count = payload; count > 0; count--) {
         // Right
         if (key & KEY_RIGHT) {
             right_key_count++;
+            total_right_key_count++;
         }
         // Left
         else {
             left_key_count++;
+            total_left_key_count++;
         }
     }
 }
@@ -0,0 +1,50 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Recording of episode events, such as a life being lost, as
+//!        (tick, event type) records in their own recording channel.
+
+#ifndef _EVENT_RECORDING_H_
+#define _EVENT_RECORDING_H_
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <recording.h>
+
+//! The recording channel of the events
+#define EVENT_CHANNEL 1
+
+//! An event record, as decoded by SpinnGymApplicationVertex
+typedef struct event_record_t {
+    //! The tick at which the event happened
+    uint32_t tick;
+    //! The game-specific type of the event
+    uint32_t event;
+} event_record_t;
+
+//! \brief Record an episode event
+//! \param[in] time: The tick at which the event happened
+//! \param[in] event: The game-specific type of the event
+//! \return Whether the event was recorded; false if the space reserved for
+//!         events has been used up
+static inline bool event_record(uint32_t time, uint32_t event) {
+    event_record_t record = {.tick = time, .event = event};
+    return recording_record(EVENT_CHANNEL, &record, sizeof(record));
+}
+
+#endif  // _EVENT_RECORDING_H_
@@ -0,0 +1,45 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Requests, made from the host between runs, to reset a game.
+//!
+//! A request is a word of flags in the parameter region, which the host
+//! writes before resuming the simulation.  The binary takes the request on
+//! resuming, clearing the word so that the game is reset only once.
+
+#ifndef _GAME_RESET_H_
+#define _GAME_RESET_H_
+
+#include <stdint.h>
+
+//! Reset the state of the game, including the score
+#define RESET_GAME 0x1
+
+//! Seed the random number generator again from the parameter region
+#define RESET_SEED 0x2
+
+//! \brief Take a reset request from the parameter region
+//! \param[in,out] request: The word of the request, which is cleared
+//! \return The flags of the request; 0 if no reset was requested
+static inline uint32_t take_reset_request(uint32_t *request) {
+    uint32_t flags = *request;
+    *request = 0;
+    return flags;
+}
+
+#endif  // _GAME_RESET_H_
@@ -0,0 +1,97 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Recording of game scores, either at every sample or only when the
+//!        score changes.
+//!
+//! When only changes are recorded, each record is the tick of the sample
+//! followed by the new score, and samples whose score matches the last
+//! record are skipped.
+
+#ifndef _SCORE_RECORDING_H_
+#define _SCORE_RECORDING_H_
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <recording.h>
+
+//! The recording channel of the score
+#define SCORE_CHANNEL 0
+
+//! The largest score a game records, in words; a game with a larger score
+//! defines this before including this header
+#ifndef MAX_SCORE_WORDS
+#define MAX_SCORE_WORDS 3
+#endif
+
+//! Whether to record only when the score changes
+static bool score_changes_only = false;
+
+//! Whether a score has been recorded yet
+static bool score_recorded = false;
+
+//! The size of the score, in words
+static uint32_t score_words = 1;
+
+//! The last score recorded
+static uint32_t last_score[MAX_SCORE_WORDS];
+
+//! \brief Set up score recording
+//! \param[in] changes_only: Non-zero to record only when the score changes
+//! \param[in] n_words: The size of the score, in words
+static inline void score_recording_initialise(
+        uint32_t changes_only, uint32_t n_words) {
+    score_changes_only = (changes_only != 0);
+    score_words = n_words;
+}
+
+//! \brief Record a sample of the score
+//! \param[in] time: The tick of the sample
+//! \param[in] score: The score, of the size given at initialisation
+//! \return Whether the sample was recorded or skipped successfully
+static inline bool score_record(uint32_t time, const void *score) {
+    const uint32_t *words = score;
+    if (!score_changes_only) {
+        return recording_record(
+            SCORE_CHANNEL, (void *) score, score_words * sizeof(uint32_t));
+    }
+
+    if (score_recorded) {
+        bool changed = false;
+        for (uint32_t i = 0; i < score_words; i++) {
+            if (words[i] != last_score[i]) {
+                changed = true;
+            }
+        }
+        if (!changed) {
+            return true;
+        }
+    }
+
+    uint32_t record[MAX_SCORE_WORDS + 1];
+    record[0] = time;
+    for (uint32_t i = 0; i < score_words; i++) {
+        last_score[i] = words[i];
+        record[i + 1] = words[i];
+    }
+    score_recorded = true;
+    return recording_record(
+        SCORE_CHANNEL, record, (score_words + 1) * sizeof(uint32_t));
+}
+
+#endif  // _SCORE_RECORDING_H_
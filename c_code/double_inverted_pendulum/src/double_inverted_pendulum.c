@@ -35,6 +35,8 @@
 #include <math.h>
 
 #include <recording.h>
+#include "score_recording.h"
+#include "game_reset.h"
 
 //----------------------------------------------------------------------------
 // Macros
@@ -67,6 +69,7 @@ typedef enum {
   REGION_PENDULUM,
   REGION_RECORDING,
   REGION_DATA,
+  REGION_PROVENANCE,
 } region_t;
 
 typedef enum {
@@ -91,6 +94,21 @@ typedef union {
    accum a;
 } uint_float_union;
 
+//----------------------------------------------------------------------------
+// Structures
+//----------------------------------------------------------------------------
+//! Provenance data, in the order read by DoublePendulumMachineVertex
+struct pendulum_provenance {
+    //! The number of multicast packets received
+    uint32_t packets_received;
+    //! The number of backward motor spikes received
+    uint32_t backward_spikes;
+    //! The number of forward motor spikes received
+    uint32_t forward_spikes;
+    //! The number of spikes sent
+    uint32_t spikes_sent;
+};
+
 //----------------------------------------------------------------------------
 // Globals
 //----------------------------------------------------------------------------
@@ -152,6 +170,9 @@ float bin_overlap = 2.5;
 float tau_force;
 uint_float_union temp_accum;
 
+//! The data region, which is read again when the simulation resumes
+static address_t pend_region;
+
 // if it's central that means perfectly central on the track and angle is the
 // lowest rate, else half
 int central = 1;
@@ -171,6 +192,10 @@ static uint32_t key;
 
 //! the number of timer ticks that this model should run for before exiting.
 uint32_t simulation_ticks = 0;
+uint32_t pkt_count = 0;
+uint32_t backward_count = 0;
+uint32_t forward_count = 0;
+uint32_t spikes_sent = 0;
 uint32_t score_change_count=0;
 
 //----------------------------------------------------------------------------
@@ -181,6 +206,7 @@ static inline void spike_angle(int bin)
     uint32_t mask;
     mask = (SPECIAL_EVENT_ANGLE * number_of_bins) + bin;
     spin1_send_mc_packet(key | (mask), 0, NO_PAYLOAD);
+    spikes_sent++;
 //    io_printf(IO_BUF, "spike_angle \t%d - \t%u\n", bin, mask);
 }
 
@@ -189,6 +215,7 @@ static inline void spike_angle_v(int bin)
     uint32_t mask;
     mask = (SPECIAL_EVENT_ANGLE_V * number_of_bins) + bin;
     spin1_send_mc_packet(key | (mask), 0, NO_PAYLOAD);
+    spikes_sent++;
 //    io_printf(IO_BUF, "spike_angle_v \t%d - \t%u\n", bin, mask);
 }
 
@@ -197,6 +224,7 @@ static inline void spike_angle_2(int bin)
     uint32_t mask;
     mask = (SPECIAL_EVENT_ANGLE_2 * number_of_bins) + bin;
     spin1_send_mc_packet(key | (mask), 0, NO_PAYLOAD);
+    spikes_sent++;
 //    io_printf(IO_BUF, "spike_angle \t%d - \t%u\n", bin, mask);
 }
 
@@ -205,6 +233,7 @@ static inline void spike_angle_2_v(int bin)
     uint32_t mask;
     mask = (SPECIAL_EVENT_ANGLE_2_V * number_of_bins) + bin;
     spin1_send_mc_packet(key | (mask), 0, NO_PAYLOAD);
+    spikes_sent++;
 //    io_printf(IO_BUF, "spike_angle_v \t%d - \t%u\n", bin, mask);
 }
 
@@ -213,6 +242,7 @@ static inline void spike_cart(int bin)
     uint32_t mask;
     mask = (SPECIAL_EVENT_CART * number_of_bins) + bin;
     spin1_send_mc_packet(key | (mask), 0, NO_PAYLOAD);
+    spikes_sent++;
 //    io_printf(IO_BUF, "spike_cart \t%d - \t%u\n", bin, mask);
 }
 
@@ -221,11 +251,59 @@ static inline void spike_cart_v(int bin)
     uint32_t mask;
     mask = (SPECIAL_EVENT_CART_V * number_of_bins) + bin;
     spin1_send_mc_packet(key | (mask), 0, NO_PAYLOAD);
+    spikes_sent++;
 //    io_printf(IO_BUF, "spike_cart_v \t%d - \t%u\n", bin, mask);
 }
 
+//! \brief Read the parameters that can be changed between runs
+static void read_parameters(void)
+{
+    encoding_scheme = pend_region[0];
+    force_increment = (float)((max_motor_force - min_motor_force) /
+            (float)pend_region[7]);
+    max_firing_rate = pend_region[8];
+    max_firing_prob = max_firing_rate * 0.001f;
+    central = pend_region[10];
+    temp_accum.u = pend_region[15];
+    bin_overlap = temp_accum.a;
+    temp_accum.u = pend_region[16];
+    tau_force = temp_accum.a;
+}
+
+//! \brief Put the cart and poles back into their starting state
+static void reset_game(void)
+{
+    cart_position = track_length * 0.5f;
+    cart_velocity = 0;
+    cart_acceleration = 0;
+    pole_angle = (pole_angle_accum.a / 180.0f) * M_PI;
+    pole_velocity = 0;
+    pole_acceleration = 0;
+    pole2_angle = (0.1f / 180.0f) * M_PI;
+    pole2_velocity = 0;
+    pole2_acceleration = 0;
+    motor_force = 0;
+    current_time = 0;
+    max_balance_time = 0;
+    in_bounds = true;
+    tick_in_frame = 0;
+    io_printf(IO_BUF, "Game reset\n");
+}
+
 void resume_callback(void)
 {
+    read_parameters();
+    uint32_t reset = take_reset_request(&pend_region[18]);
+    if (reset & RESET_SEED) {
+        kiss_seed[0] = pend_region[11];
+        kiss_seed[1] = pend_region[12];
+        kiss_seed[2] = pend_region[13];
+        kiss_seed[3] = pend_region[14];
+        validate_mars_kiss64_seed(kiss_seed);
+    }
+    if (reset & RESET_GAME) {
+        reset_game();
+    }
     recording_reset();
 }
 
@@ -239,6 +317,15 @@ void resume_callback(void)
 //  io_printf(IO_BUF, "%d, %d, %u, %08x\n", i, j, col, spike_key);
 //}
 
+static void store_provenance_data(address_t provenance_region)
+{
+    struct pendulum_provenance *prov = (void *) provenance_region;
+    prov->packets_received = pkt_count;
+    prov->backward_spikes = backward_count;
+    prov->forward_spikes = forward_count;
+    prov->spikes_sent = spikes_sent;
+}
+
 static bool initialize(uint32_t *timer_period)
 {
     io_printf(IO_BUF, "Initialise double inverted pendulum: started\n");
@@ -265,6 +352,9 @@ static bool initialize(uint32_t *timer_period)
     {
       return false;
     }
+    simulation_set_provenance_function(
+        store_provenance_data,
+        data_specification_get_region(REGION_PROVENANCE, address));
     io_printf(IO_BUF, "simulation time = %u\n", simulation_ticks);
 
 
@@ -288,9 +378,8 @@ static bool initialize(uint32_t *timer_period)
 
     cart_position = track_length * 0.5f;
 
-    address_t pend_region = data_specification_get_region(REGION_DATA, address);
+    pend_region = data_specification_get_region(REGION_DATA, address);
 //    encoding_scheme = pend_region[0]; // 0 rate
-    encoding_scheme = pend_region[0];
     time_increment = pend_region[1];
     half_pole_length_accum.u = pend_region[2];
     half_pole_length = half_pole_length_accum.a * 0.5f;
@@ -303,13 +392,9 @@ static bool initialize(uint32_t *timer_period)
     pole2_angle = 0.1; // pole_angle_accum.a;  // TODO: not sure what intended here
     pole2_angle = (pole2_angle / 180.0f) * M_PI;
     reward_based = pend_region[6];
-    force_increment = pend_region[7]; // (float)pend_region[5] / (float)0xffff;
-    max_firing_rate = pend_region[8];
     number_of_bins = pend_region[9];
-    central = pend_region[10];
 
     bin_width = 1.f / ((float)number_of_bins - 1.f);
-    max_firing_prob = max_firing_rate * 0.001f;
 //    accum
     // pass in random seeds
     kiss_seed[0] = pend_region[11];
@@ -318,12 +403,10 @@ static bool initialize(uint32_t *timer_period)
     kiss_seed[3] = pend_region[14];
     validate_mars_kiss64_seed(kiss_seed);
 
-    temp_accum.u = pend_region[15];
-    bin_overlap = temp_accum.a;
-    temp_accum.u = pend_region[16];
-    tau_force = temp_accum.a;
-
-    force_increment = (float)((max_motor_force - min_motor_force) / (float)force_increment);
+    score_recording_initialise(pend_region[17], reward_based ? 1 : 3);
+    // The game starts in its reset state anyway
+    take_reset_request(&pend_region[18]);
+    read_parameters();
 
     //TODO check this prints right, ybug read the address
 //    io_printf(IO_BUF, "r1 %d\n", (uint32_t *)pend_region[0]);
@@ -513,15 +596,18 @@ void mc_packet_received_callback(uint keyx, uint payload)
 //    io_printf(IO_BUF, "compare = %x\n", compare);
     // If no payload has been set, make sure the loop will run
     if (payload == 0) { payload = 1; }
+    pkt_count++;
 
     for (uint count = payload; count > 0; count--) {
         if (compare == BACKWARD_MOTOR) {
+            backward_count++;
             motor_force = motor_force - force_increment;
             if (motor_force < min_motor_force) {
                 motor_force = min_motor_force;
             }
         }
         else if (compare == FORWARD_MOTOR) {
+            forward_count++;
             motor_force = motor_force + force_increment;
             if (motor_force > max_motor_force) {
                 motor_force = max_motor_force;
@@ -669,10 +755,10 @@ void timer_callback(uint unused, uint dummy)
                 io_printf(IO_BUF, "values: %k %k %k \n", (accum) cart_position,
                 		(accum) pole_angle, (accum) pole2_angle);
                 if (reward_based == 0) {
-                    recording_record(0, &current_state, 12);
+                    score_record(_time, current_state);
                 }
                 else {
-                    recording_record(0, &max_balance_time, 4);
+                    score_record(_time, &max_balance_time);
                 }
                 score_change_count=0;
             }
@@ -34,6 +34,9 @@
 #include <math.h>
 
 #include <recording.h>
+#include "score_recording.h"
+#include "event_recording.h"
+#include "game_reset.h"
 
 //----------------------------------------------------------------------------
 // Enumerations
@@ -43,6 +46,7 @@ typedef enum {
   REGION_PENDULUM,
   REGION_RECORDING,
   REGION_DATA,
+  REGION_PROVENANCE,
 } region_t;
 
 typedef enum {
@@ -58,12 +62,32 @@ typedef enum {
   FORWARD_MOTOR  = 0x1,
 } arm_key_t;
 
+//! Episode events, in the order of PendulumEvent
+typedef enum {
+  EVENT_POLE_OUT_OF_BOUNDS,
+} episode_event_t;
+
 typedef union {
    uint32_t u;
    float f;
    accum a;
 } uint_float_union;
 
+//----------------------------------------------------------------------------
+// Structures
+//----------------------------------------------------------------------------
+//! Provenance data, in the order read by PendulumMachineVertex
+struct pendulum_provenance {
+    //! The number of multicast packets received
+    uint32_t packets_received;
+    //! The number of backward motor spikes received
+    uint32_t backward_spikes;
+    //! The number of forward motor spikes received
+    uint32_t forward_spikes;
+    //! The number of spikes sent
+    uint32_t spikes_sent;
+};
+
 //----------------------------------------------------------------------------
 // Globals
 //----------------------------------------------------------------------------
@@ -114,6 +138,9 @@ float bin_overlap = 2.5;
 float tau_force;
 uint_float_union temp_accum;
 
+//! The data region, which is read again when the simulation resumes
+static address_t pend_region;
+
 // if it's central that mean perfectly central on the track and angle is the
 // lowest rate, else half
 int central = 1;
@@ -137,6 +164,10 @@ static uint32_t key;
 
 //! the number of timer ticks that this model should run for before exiting.
 uint32_t simulation_ticks = 0;
+uint32_t pkt_count = 0;
+uint32_t backward_count = 0;
+uint32_t forward_count = 0;
+uint32_t spikes_sent = 0;
 uint32_t score_change_count = 0;
 
 //----------------------------------------------------------------------------
@@ -152,6 +183,7 @@ static inline void spike_angle(int bin)
         mask = SPECIAL_EVENT_ANGLE;
     }
     spin1_send_mc_packet(key | (mask), 0, NO_PAYLOAD);
+    spikes_sent++;
 //    io_printf(IO_BUF, "spike_angle \t%d - \t%u\n", bin, mask);
 }
 
@@ -165,6 +197,7 @@ static inline void spike_angle_v(int bin)
         mask = SPECIAL_EVENT_ANGLE_V;
     }
     spin1_send_mc_packet(key | (mask), 0, NO_PAYLOAD);
+    spikes_sent++;
 //    io_printf(IO_BUF, "spike_angle_v \t%d - \t%u\n", bin, mask);
 }
 
@@ -178,6 +211,7 @@ static inline void spike_cart(int bin)
         mask = SPECIAL_EVENT_CART;
     }
     spin1_send_mc_packet(key | (mask), 0, NO_PAYLOAD);
+    spikes_sent++;
 //    io_printf(IO_BUF, "spike_cart \t%d - \t%u\n", bin, mask);
 }
 
@@ -191,14 +225,68 @@ static inline void spike_cart_v(int bin)
         mask = SPECIAL_EVENT_CART_V;
     }
     spin1_send_mc_packet(key | (mask), 0, NO_PAYLOAD);
+    spikes_sent++;
 //    io_printf(IO_BUF, "spike_cart_v \t%d - \t%u\n", bin, mask);
 }
 
+//! \brief Read the parameters that can be changed between runs
+static void read_parameters(void)
+{
+    encoding_scheme = pend_region[0];
+    force_increment = (float)((max_motor_force - min_motor_force) /
+            (float)pend_region[5]);
+    max_firing_rate = pend_region[6];
+    max_firing_prob = max_firing_rate / 1000.f;
+    central = pend_region[8];
+    temp_accum.u = pend_region[13];
+    bin_overlap = temp_accum.a;
+    temp_accum.u = pend_region[14];
+    tau_force = temp_accum.a;
+}
+
+//! \brief Put the cart and pole back into their starting state
+static void reset_game(void)
+{
+    cart_position = track_length / 2;
+    cart_velocity = 0;
+    cart_acceleration = 0;
+    pole_angle = (pole_angle_accum.a / 180.0f) * M_PI;
+    pole_velocity = 0;
+    pole_acceleration = 0;
+    motor_force = 0;
+    current_time = 0;
+    max_balance_time = 0;
+    in_bounds = true;
+    tick_in_frame = 0;
+    io_printf(IO_BUF, "Game reset\n");
+}
+
 void resume_callback(void)
 {
+    read_parameters();
+    uint32_t reset = take_reset_request(&pend_region[16]);
+    if (reset & RESET_SEED) {
+        kiss_seed[0] = pend_region[9];
+        kiss_seed[1] = pend_region[10];
+        kiss_seed[2] = pend_region[11];
+        kiss_seed[3] = pend_region[12];
+        validate_mars_kiss64_seed(kiss_seed);
+    }
+    if (reset & RESET_GAME) {
+        reset_game();
+    }
     recording_reset();
 }
 
+static void store_provenance_data(address_t provenance_region)
+{
+    struct pendulum_provenance *prov = (void *) provenance_region;
+    prov->packets_received = pkt_count;
+    prov->backward_spikes = backward_count;
+    prov->forward_spikes = forward_count;
+    prov->spikes_sent = spikes_sent;
+}
+
 static bool initialize(uint32_t *timer_period)
 {
 	io_printf(IO_BUF, "Init inverted pendulum\n");
@@ -223,6 +311,9 @@ static bool initialize(uint32_t *timer_period)
             &infinite_run, &_time, 1, 0)) {
       return false;
     }
+    simulation_set_provenance_function(
+        store_provenance_data,
+        data_specification_get_region(REGION_PROVENANCE, address));
 //        io_printf(IO_BUF, "sim time = %u\n", simulation_ticks);
     // Read pendulum region
     address_t pendulum_region = data_specification_get_region(REGION_PENDULUM, address);
@@ -247,9 +338,8 @@ static bool initialize(uint32_t *timer_period)
 //    pole_velocity = 0; // angular/s
 //    pole_acceleration = 0; // angular/s^2
 
-    address_t pend_region = data_specification_get_region(REGION_DATA, address);
+    pend_region = data_specification_get_region(REGION_DATA, address);
 //    encoding_scheme = pend_region[0]; // 0 rate
-    encoding_scheme = pend_region[0];
     time_increment = pend_region[1];
     half_pole_length_accum.u = pend_region[2];
     half_pole_length = half_pole_length_accum.a / 2.0f;
@@ -257,13 +347,9 @@ static bool initialize(uint32_t *timer_period)
     pole_angle = pole_angle_accum.a;
     pole_angle = (pole_angle / 180.0f) * M_PI;
     reward_based = pend_region[4];
-    force_increment = pend_region[5];
-    max_firing_rate = pend_region[6];
     number_of_bins = pend_region[7];
-    central = pend_region[8];
 
     bin_width = 1.f / ((float)number_of_bins - 1.f);
-    max_firing_prob = max_firing_rate / 1000.f;
     // pass in random seeds
     kiss_seed[0] = pend_region[9];
     kiss_seed[1] = pend_region[10];
@@ -271,14 +357,12 @@ static bool initialize(uint32_t *timer_period)
     kiss_seed[3] = pend_region[12];
     validate_mars_kiss64_seed(kiss_seed);
 
-    temp_accum.u = pend_region[13];
-    bin_overlap = temp_accum.a;
-    temp_accum.u = pend_region[14];
-    tau_force = temp_accum.a;
+    score_recording_initialise(pend_region[15], reward_based ? 1 : 2);
+    // The game starts in its reset state anyway
+    take_reset_request(&pend_region[16]);
 
 //    io_printf(IO_BUF, "tau_force %f", tau_force);
-
-    force_increment = (float)((max_motor_force - min_motor_force) / (float)force_increment);
+    read_parameters();
 
 
     //Print variable for inspection if needed
@@ -397,15 +481,18 @@ void mc_packet_received_callback(uint keyx, uint payload)
 //    io_printf(IO_BUF, "compare = %x\n", compare);
     // If no payload has been set, make sure the loop will run
     if (payload == 0) { payload = 1; }
+    pkt_count++;
 
     for (uint count = payload; count > 0; count--) {
         if (compare == BACKWARD_MOTOR) {
+            backward_count++;
             motor_force = motor_force - force_increment;
             if (motor_force < min_motor_force) {
                 motor_force = min_motor_force;
             }
         }
         else if (compare == FORWARD_MOTOR) {
+            forward_count++;
             motor_force = motor_force + force_increment;
             if (motor_force > max_motor_force) {
                 motor_force = max_motor_force;
@@ -604,6 +691,9 @@ void timer_callback(uint unused, uint dummy)
 //                max_balance_time = (float)_time;
 //                max_balance_time = max_balance_time + 1;
                 in_bounds = update_state((float)time_increment / 1000.f);
+                if (!in_bounds) {
+                    event_record(_time, EVENT_POLE_OUT_OF_BOUNDS);
+                }
             }
 //            else{
 ////                io_printf(IO_BUF, "Pendulum out of bounds at time %k\n", (accum) current_time);
@@ -621,10 +711,10 @@ void timer_callback(uint unused, uint dummy)
                 if (reward_based == 0) {
                     current_state[0] = cart_position;
                     current_state[1] = pole_angle;
-                    recording_record(0, &current_state, 8);
+                    score_record(_time, current_state);
                 }
                 else{
-                    recording_record(0, &max_balance_time, 4);
+                    score_record(_time, &max_balance_time);
                 }
                 score_change_count=0;
             }
@@ -38,6 +38,8 @@
 #include "random.h"
 
 #include <recording.h>
+#include "score_recording.h"
+#include "game_reset.h"
 
 //----------------------------------------------------------------------------
 // Macros
@@ -54,6 +56,7 @@ typedef enum {
   REGION_LOGIC,
   REGION_RECORDING,
   REGION_DATA,
+  REGION_PROVENANCE,
 } region_t;
 
 typedef enum {
@@ -72,6 +75,23 @@ typedef enum {
   KEY_CHOICE_1  = 0x1
 } arm_key_t;
 
+//----------------------------------------------------------------------------
+// Structures
+//----------------------------------------------------------------------------
+//! Provenance data, in the order read by LogicMachineVertex
+struct logic_provenance {
+    //! The number of multicast packets received
+    uint32_t packets_received;
+    //! The number of spikes received choosing 0
+    uint32_t choice_0_spikes;
+    //! The number of spikes received choosing 1
+    uint32_t choice_1_spikes;
+    //! The number of times the choice was scored
+    uint32_t choices_scored;
+    //! The number of spikes sent
+    uint32_t spikes_sent;
+};
+
 //----------------------------------------------------------------------------
 // Globals
 //----------------------------------------------------------------------------
@@ -85,8 +105,12 @@ const int max_number_of_inputs = 8;
 
 uint32_t *input_sequence;
 
+//! The truth table, one bit per entry: entry i is bit i % 32 of word i / 32
 uint32_t *truth_table;
 
+//! The data region, which is read again when the simulation resumes
+static address_t logic_region;
+
 mars_kiss64_seed_t kiss_seed;
 
 int number_of_inputs;
@@ -113,6 +137,11 @@ static uint32_t key;
 
 //! the number of timer ticks that this model should run for before exiting.
 uint32_t simulation_ticks = 0;
+uint32_t pkt_count = 0;
+uint32_t total_choice_0_count = 0;
+uint32_t total_choice_1_count = 0;
+uint32_t choices_scored = 0;
+uint32_t spikes_sent = 0;
 uint32_t score_change_count = 0;
 
 //----------------------------------------------------------------------------
@@ -121,15 +150,70 @@ uint32_t score_change_count = 0;
 static inline void send_spike(int input)
 {
   spin1_send_mc_packet(key | (input), 0, NO_PAYLOAD);
+  spikes_sent++;
 //  io_printf(IO_BUF, "sending spike to key, input %d %d %d\n", key, input, key | (input));
 //  current_score++;
 }
 
+//! \brief Read the parameters that can be changed between runs
+static void read_parameters(void)
+{
+    score_delay = logic_region[0];
+    rate_on = logic_region[6];
+    rate_off = logic_region[7];
+    max_fire_prob_on = (float)rate_on / 1000.f;
+    max_fire_prob_off = (float)rate_off / 1000.f;
+    stochastic = logic_region[8];
+    input_sequence = (uint32_t *)&logic_region[11];
+    truth_table = (uint32_t *)&logic_region[11 + number_of_inputs];
+
+    uint32_t truth_table_index = 0;
+    for (int i=0; i<number_of_inputs; i++) {
+        truth_table_index |= (input_sequence[i] & 1) << i;
+        io_printf(IO_BUF, "%d: input %u, index %u\n",
+        		i, input_sequence[i], truth_table_index);
+    }
+    correct_output =
+            (truth_table[truth_table_index >> 5] >> (truth_table_index & 31)) & 1;
+}
+
+//! \brief Put the game back into its starting state
+static void reset_game(void)
+{
+    current_score = 0;
+    output_choice[0] = 0;
+    output_choice[1] = 0;
+    tick_in_frame = 0;
+    io_printf(IO_BUF, "Game reset\n");
+}
+
 void resume_callback(void)
 {
+    read_parameters();
+    uint32_t reset = take_reset_request(&logic_region[10]);
+    if (reset & RESET_SEED) {
+        kiss_seed[0] = logic_region[2];
+        kiss_seed[1] = logic_region[3];
+        kiss_seed[2] = logic_region[4];
+        kiss_seed[3] = logic_region[5];
+        validate_mars_kiss64_seed(kiss_seed);
+    }
+    if (reset & RESET_GAME) {
+        reset_game();
+    }
     recording_reset();
 }
 
+static void store_provenance_data(address_t provenance_region)
+{
+    struct logic_provenance *prov = (void *) provenance_region;
+    prov->packets_received = pkt_count;
+    prov->choice_0_spikes = total_choice_0_count;
+    prov->choice_1_spikes = total_choice_1_count;
+    prov->choices_scored = choices_scored;
+    prov->spikes_sent = spikes_sent;
+}
+
 static bool initialize(uint32_t *timer_period)
 {
     io_printf(IO_BUF, "Initialise logic: started\n");
@@ -148,6 +232,9 @@ static bool initialize(uint32_t *timer_period)
 			&infinite_run, &_time, 1, 0)) {
       return false;
     }
+    simulation_set_provenance_function(
+        store_provenance_data,
+        data_specification_get_region(REGION_PROVENANCE, address));
     io_printf(IO_BUF, "simulation time = %u\n", simulation_ticks);
 
 
@@ -168,21 +255,16 @@ static bool initialize(uint32_t *timer_period)
        return false;
     }
 
-    address_t logic_region = data_specification_get_region(REGION_DATA, address);
-    score_delay = logic_region[0];
+    logic_region = data_specification_get_region(REGION_DATA, address);
     number_of_inputs = logic_region[1];
 //    rand_seed = logic_region[2];
     kiss_seed[0] = logic_region[2];
     kiss_seed[1] = logic_region[3];
     kiss_seed[2] = logic_region[4];
     kiss_seed[3] = logic_region[5];
-    rate_on = logic_region[6];
-    rate_off = logic_region[7];
-    max_fire_prob_on = (float)rate_on / 1000.f;
-    max_fire_prob_off = (float)rate_off / 1000.f;
-    stochastic = logic_region[8];
-    input_sequence = (uint32_t *)&logic_region[9];
-    truth_table = (uint32_t *)&logic_region[9 + number_of_inputs];
+    score_recording_initialise(logic_region[9], 1);
+    // The game starts in its reset state anyway
+    take_reset_request(&logic_region[10]);
 //    double arm_probabilities[10] = {0}
 //    for (int i=1, i<number_of_inputs, i=i+1){
 //        io_printf(IO_BUF, "converting arm prob %d, stage \n", temp_arm_probabilities[i] i)
@@ -190,17 +272,7 @@ static bool initialize(uint32_t *timer_period)
 //        io_printf(IO_BUF, "probs after = %d\n", arm_probabilities)
 //    }
     validate_mars_kiss64_seed(kiss_seed);
-
-    int truth_table_index = 0;
-    for (int i=0; i<number_of_inputs; i++) {
-        truth_table_index = truth_table_index + (input_sequence[i] * (1 << i));
-        io_printf(IO_BUF, "%d: input %u, index %u, 2 %u\n",
-        		i, input_sequence[i], truth_table_index, 1 << i);
-    }
-    for (int i=0; i<(1 << number_of_inputs); i++){
-        io_printf(IO_BUF, "t%d: %u\n", i, truth_table[i]);
-    }
-    correct_output = truth_table[truth_table_index];
+    read_parameters();
 
 //    srand(rand_seed);
     // TODO check this prints right, ybug read the address
@@ -214,9 +286,7 @@ static bool initialize(uint32_t *timer_period)
     io_printf(IO_BUF, "stochastic %d\n", stochastic);
     io_printf(IO_BUF, "input seq 0 %u\n", input_sequence[0]);
     io_printf(IO_BUF, "input seq 1 %u\n", input_sequence[1]);
-    io_printf(IO_BUF, "tt 0 %d\n", truth_table[0]);
-    io_printf(IO_BUF, "tt 1 %d\n", truth_table[1]);
-    io_printf(IO_BUF, "tt 2 %d\n", truth_table[2]);
+    io_printf(IO_BUF, "tt word 0 0x%08x\n", truth_table[0]);
     io_printf(IO_BUF, "correct out %d\n", correct_output);
 
     io_printf(IO_BUF, "Initialise: completed successfully\n");
@@ -235,6 +305,7 @@ void was_it_correct(void ) // TODO: probably rename this function?
     }
 //    io_printf(IO_BUF, "c0 %u, c1 %u, c %u, score %u\n",
 //    		output_choice[0], output_choice[1], choice, current_score);
+    choices_scored++;
     if (choice == correct_output){
         current_score = current_score + 1;
     }
@@ -292,13 +363,16 @@ void mc_packet_received_callback(uint keyx, uint payload)
 //    io_printf(IO_BUF, "compare = %x\n", compare);
     // If no payload has been set, make sure the loop will run
     if (payload == 0) { payload = 1; }
+    pkt_count++;
 
     for (uint count = payload; count > 0; count--) {
         if (compare == KEY_CHOICE_0) {
             output_choice[0]++;
+            total_choice_0_count++;
         }
         else if (compare == KEY_CHOICE_1) {
             output_choice[1]++;
+            total_choice_1_count++;
         }
         else {
             io_printf(IO_BUF, "it broke key selection %d\n", key);
@@ -346,7 +420,7 @@ void timer_callback(uint unused, uint dummy)
 //            update_frame();
             // Update recorded score every 1s
             if (score_change_count >= 1000) {
-                recording_record(0, &current_score, 4);
+                score_record(_time, &current_score);
                 score_change_count = 0;
             }
         }
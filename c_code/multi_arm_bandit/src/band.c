@@ -38,6 +38,8 @@
 #include "random.h"
 
 #include <recording.h>
+#include "score_recording.h"
+#include "game_reset.h"
 
 //----------------------------------------------------------------------------
 // Macros
@@ -54,6 +56,7 @@ typedef enum {
   REGION_BANDIT,
   REGION_RECORDING,
   REGION_ARMS,
+  REGION_PROVENANCE,
 } region_t;
 
 typedef enum {
@@ -62,16 +65,52 @@ typedef enum {
   SPECIAL_EVENT_MAX,
 } special_event_t;
 
-typedef enum {
-  KEY_ARM_0  = 0x0,
-  KEY_ARM_1  = 0x1,
-  KEY_ARM_2  = 0x2,
-  KEY_ARM_3  = 0x3,
-  KEY_ARM_4  = 0x4,
-  KEY_ARM_5  = 0x5,
-  KEY_ARM_6  = 0x6,
-  KEY_ARM_7  = 0x7,
-} arm_key_t;
+//----------------------------------------------------------------------------
+// Structures
+//----------------------------------------------------------------------------
+//! How to find the neuron of a source vertex that sent a key
+typedef struct source_layout {
+    //! The key of the source, with the bits of its neurons clear
+    uint32_t key;
+    //! The mask of the key of the source
+    uint32_t mask;
+    //! The number of colour bits in the keys of the source
+    uint32_t n_colour_bits;
+    //! The bits of a source key that hold the neuron within its core
+    uint32_t atom_mask;
+    //! How far the index of the source core is shifted up in its keys
+    uint32_t core_shift;
+    //! The mask of the index of the source core, once shifted down
+    uint32_t core_mask;
+    //! The number of neurons on each source core
+    uint32_t atoms_per_core;
+} source_layout;
+
+//! The bandit region, as written by BanditMachineVertex
+struct bandit_region {
+    //! The key to send with
+    uint32_t key;
+    //! The number of sources whose spikes pull the arms
+    uint32_t n_sources;
+    //! How to find the neuron of each source that sent a key
+    source_layout sources[];
+};
+
+//! Provenance data, in the order read by BanditMachineVertex
+struct bandit_provenance {
+    //! The number of multicast packets received
+    uint32_t packets_received;
+    //! The number of spikes received
+    uint32_t spikes_received;
+    //! The number of spikes received that did not select a known arm
+    uint32_t invalid_spikes_received;
+    //! The number of times an arm pull was rewarded
+    uint32_t rewards;
+    //! The number of times an arm pull was not rewarded
+    uint32_t no_rewards;
+    //! The number of spikes sent
+    uint32_t spikes_sent;
+};
 
 //----------------------------------------------------------------------------
 // Globals
@@ -82,17 +121,25 @@ static uint32_t _time;
 //! Should simulation run for ever? 0 if not
 static uint32_t infinite_run;
 
-const int max_number_of_arms = 8;
-
 uint32_t *arm_probabilities;
 
+//! The arms region, which is read again when the simulation resumes
+static address_t arms_region;
+
 mars_kiss64_seed_t kiss_seed;
 
 int number_of_arms;
 
+//! The number of sources whose spikes pull the arms
+static uint32_t n_sources;
+
+//! How to find the arm that a key received from each source pulls, in DTCM
+static source_layout *sources;
+
 int rand_seed;
 
-int arm_choices[8] = {0};
+//! The spikes received for each arm since the last choice, in DTCM
+static int *arm_choices;
 
 int32_t current_score = 0;
 int32_t best_arm = -1;
@@ -117,6 +164,12 @@ static uint32_t key;
 
 //! the number of timer ticks that this model should run for before exiting.
 uint32_t simulation_ticks = 0;
+uint32_t pkt_count = 0;
+uint32_t spike_count = 0;
+uint32_t invalid_spike_count = 0;
+uint32_t reward_count = 0;
+uint32_t no_reward_count = 0;
+uint32_t spikes_sent = 0;
 uint32_t score_change_count=0;
 
 //----------------------------------------------------------------------------
@@ -125,21 +178,84 @@ uint32_t score_change_count=0;
 static inline void add_reward(void)
 {
   spin1_send_mc_packet(key | (SPECIAL_EVENT_REWARD), 0, NO_PAYLOAD);
+  spikes_sent++;
 //  io_printf(IO_BUF, "Got a reward\n");
 }
 
 static inline void add_no_reward(void)
 {
   spin1_send_mc_packet(key | (SPECIAL_EVENT_NO_REWARD), 0, NO_PAYLOAD);
+  spikes_sent++;
 //  io_printf(IO_BUF, "No reward\n");
 //  current_score--;
 }
 
+//! \brief Read the parameters that can be changed between runs
+static void read_parameters(void)
+{
+    reward_delay = arms_region[0];
+    reward_based = arms_region[6];
+    rate_on = arms_region[7];
+    rate_off = arms_region[8];
+    max_fire_prob_on = (float)rate_on / 1000.f;
+    max_fire_prob_off = (float)rate_off / 1000.f;
+    stochastic = arms_region[9];
+    constant_input = arms_region[10];
+    arm_probabilities = (uint32_t *)&arms_region[13];
+
+    uint32_t highest_prob = 0;
+    best_arm = 0;
+    for (int i=0; i<number_of_arms; i++) {
+        if (arm_probabilities[i] > highest_prob) {
+            best_arm = i;
+            highest_prob = arm_probabilities[i];
+        }
+    }
+    io_printf(IO_BUF, "best arm = %d with prob %u\n", best_arm, highest_prob);
+}
+
+//! \brief Put the game back into its starting state
+static void reset_game(void)
+{
+    for (int i=0; i<number_of_arms; i++) {
+        arm_choices[i] = 0;
+    }
+    current_score = 0;
+    correct_pulls = 0;
+    chose_well = false;
+    rewarding = false;
+    tick_in_frame = 0;
+    io_printf(IO_BUF, "Game reset\n");
+}
+
 void resume_callback(void)
 {
+    read_parameters();
+    uint32_t reset = take_reset_request(&arms_region[12]);
+    if (reset & RESET_SEED) {
+        kiss_seed[0] = arms_region[2];
+        kiss_seed[1] = arms_region[3];
+        kiss_seed[2] = arms_region[4];
+        kiss_seed[3] = arms_region[5];
+        validate_mars_kiss64_seed(kiss_seed);
+    }
+    if (reset & RESET_GAME) {
+        reset_game();
+    }
     recording_reset();
 }
 
+static void store_provenance_data(address_t provenance_region)
+{
+    struct bandit_provenance *prov = (void *) provenance_region;
+    prov->packets_received = pkt_count;
+    prov->spikes_received = spike_count;
+    prov->invalid_spikes_received = invalid_spike_count;
+    prov->rewards = reward_count;
+    prov->no_rewards = no_reward_count;
+    prov->spikes_sent = spikes_sent;
+}
+
 static bool initialize(uint32_t *timer_period)
 {
     io_printf(IO_BUF, "Initialise bandit: started\n");
@@ -158,11 +274,25 @@ static bool initialize(uint32_t *timer_period)
 			&infinite_run, &_time, 1, 0)) {
       return false;
     }
+    simulation_set_provenance_function(
+        store_provenance_data,
+        data_specification_get_region(REGION_PROVENANCE, address));
     io_printf(IO_BUF, "simulation time = %u\n", simulation_ticks);
 
     // Read bandit region
-    address_t bandit_region = data_specification_get_region(REGION_BANDIT, address);
-    key = bandit_region[0];
+    struct bandit_region *bandit_region =
+            data_specification_get_region(REGION_BANDIT, address);
+    key = bandit_region->key;
+    n_sources = bandit_region->n_sources;
+    sources = spin1_malloc(n_sources * sizeof(source_layout));
+    if (n_sources > 0 && sources == NULL) {
+        io_printf(IO_BUF, "Can't allocate the layouts of %u sources\n",
+                n_sources);
+        return false;
+    }
+    for (uint32_t s = 0; s < n_sources; s++) {
+        sources[s] = bandit_region->sources[s];
+    }
     io_printf(IO_BUF, "\tKey=%08x\n", key);
     io_printf(IO_BUF, "\tTimer period=%d\n", *timer_period);
 
@@ -178,22 +308,27 @@ static bool initialize(uint32_t *timer_period)
        return false;
     }
 
-    address_t arms_region = data_specification_get_region(REGION_ARMS, address);
-    reward_delay = arms_region[0];
+    arms_region = data_specification_get_region(REGION_ARMS, address);
     number_of_arms = arms_region[1];
+
+    arm_choices = spin1_malloc(number_of_arms * sizeof(int));
+    if (arm_choices == NULL) {
+        io_printf(IO_BUF, "Can't allocate the choices of %d arms\n",
+                number_of_arms);
+        return false;
+    }
+    for (int i=0; i<number_of_arms; i++) {
+        arm_choices[i] = 0;
+    }
 //    rand_seed = arms_region[2];
     kiss_seed[0] = arms_region[2];
     kiss_seed[1] = arms_region[3];
     kiss_seed[2] = arms_region[4];
     kiss_seed[3] = arms_region[5];
-    reward_based = arms_region[6];
-    rate_on = arms_region[7];
-    rate_off = arms_region[8];
-    max_fire_prob_on = (float)rate_on / 1000.f;
-    max_fire_prob_off = (float)rate_off / 1000.f;
-    stochastic = arms_region[9];
-    constant_input = arms_region[10];
-    arm_probabilities = (uint32_t *)&arms_region[11];
+    score_recording_initialise(arms_region[11], 1);
+    // The game starts in its reset state anyway
+    take_reset_request(&arms_region[12]);
+    read_parameters();
 //    double arm_probabilities[10] = {0}
 //    for (int i=1, i<number_of_arms, i=i+1){
 //        io_printf(IO_BUF, "converting arm prob %d, stage \n", temp_arm_probabilities[i] i)
@@ -204,7 +339,7 @@ static bool initialize(uint32_t *timer_period)
 //    srand(rand_seed);
     //TODO check this prints right, ybug read the address
     io_printf(IO_BUF, "reward delay %d\n", (uint32_t *)arms_region[0]);
-    io_printf(IO_BUF, "number of arms %d\n", (uint32_t *)arms_region[1]);
+    io_printf(IO_BUF, "number of arms %d\n", number_of_arms);
     io_printf(IO_BUF, "seed 0 %d\n", kiss_seed[0]);
     io_printf(IO_BUF, "seed 1 0x%x\n", kiss_seed[1]);
     io_printf(IO_BUF, "seed 2 0x%x\n", kiss_seed[2]);
@@ -220,16 +355,7 @@ static bool initialize(uint32_t *timer_period)
     io_printf(IO_BUF, "stochastic %d\n", stochastic);
     io_printf(IO_BUF, "constant input %d\n", constant_input);
 
-    float highest_prob = 0.f;
-    for (int i=0; i<number_of_arms; i++) {
-        if (arm_probabilities[i] > highest_prob) {
-            best_arm = i;
-            highest_prob = arm_probabilities[i];
-        }
-    }
-
     io_printf(IO_BUF, "Initialise: completed successfully\n");
-    io_printf(IO_BUF, "best arm = %d with prob %k\n", best_arm, (accum)highest_prob);
 
     return true;
 }
@@ -286,39 +412,27 @@ bool was_there_a_reward(void)
     int choice = -1; //mars_kiss64_seed(kiss_seed) % number_of_arms;
 //    int choice = rand() % number_of_arms;
     int highest_value = 0;
-    int min_spikes = 100000000;
-    for (int i=0; i<number_of_arms; i++) {
+    // Only spikes beyond those of the least chosen arm count, so find that
+    // first; the choice is then made in a single pass over the arms
+    int min_spikes = arm_choices[0];
+    for (int i=1; i<number_of_arms; i++) {
         if (arm_choices[i] < min_spikes) {
             min_spikes = arm_choices[i];
         }
     }
     for (int i=0; i<number_of_arms; i++) {
-        arm_choices[i] = arm_choices[i] - min_spikes;
-    }
-    if (arm_choices[0] > highest_value) {
-        choice = 0;
-        highest_value = arm_choices[0];
-    }
-//    io_printf(IO_BUF, "0 was spiked %d times, prob = %u\n",
-//    		arm_choices[0], arm_probabilities[0]);
-    arm_choices[0] = 0;
-    for (int i=1; i<number_of_arms; i++) {
-        if (arm_choices[i] >= highest_value && arm_choices[i] != 0) {
-            if (arm_choices[i] == highest_value) {
-                if (mars_kiss64_seed(kiss_seed) % 2 == 0) {
-//                if (rand() % 2 == 0){
-                    choice = i;
-                    highest_value = arm_choices[i];
-                }
-            }
-            else {
-                choice = i;
-                highest_value = arm_choices[i];
-            }
-        }
-//        io_printf(IO_BUF, "%d was spiked %d times, prob = %u\n",
-//        		i, arm_choices[i], arm_probabilities[i]);
+        int value = arm_choices[i] - min_spikes;
         arm_choices[i] = 0;
+        if (value == 0 || value < highest_value) {
+            continue;
+        }
+        // Ties with an earlier arm are broken at random
+        if (value == highest_value && i > 0
+                && mars_kiss64_seed(kiss_seed) % 2 != 0) {
+            continue;
+        }
+        choice = i;
+        highest_value = value;
     }
 //    io_printf(IO_BUF, "choice was %d and best arm was %d, score is %d, highest value: %d",
 //    		choice, best_arm, current_score, highest_value);
@@ -357,12 +471,17 @@ bool was_there_a_reward(void)
 
 void mc_packet_received_callback(uint keyx, uint payload)
 {
-    int compare;
-    int max_number_of_bits = 8;
-    compare = keyx & (max_number_of_bits - 1);
-    while (compare > number_of_arms) {
-        max_number_of_bits = max_number_of_bits / 2;
-        compare = keyx & (max_number_of_bits - 1);
+    // The arm is the index of the neuron of the source that sent the key;
+    // a key of no source pulls no arm
+    uint32_t arm = UINT32_MAX;
+    for (uint32_t s = 0; s < n_sources; s++) {
+        source_layout *source = &sources[s];
+        if ((keyx & source->mask) == source->key) {
+            uint32_t core = (keyx >> source->core_shift) & source->core_mask;
+            arm = core * source->atoms_per_core +
+                    ((keyx & source->atom_mask) >> source->n_colour_bits);
+            break;
+        }
     }
 //    io_printf(IO_BUF, "compare = %x\n", compare);
 //    io_printf(IO_BUF, "key = %x\n", key);
@@ -370,35 +489,15 @@ void mc_packet_received_callback(uint keyx, uint payload)
 
     // If no payload has been set, make sure the loop will run
     if (payload == 0) { payload = 1; }
+    pkt_count++;
+    spike_count += payload;
 
-    for (uint count = payload; count > 0; count--) {
-        if (compare == KEY_ARM_0) {
-            arm_choices[0]++;
-        }
-        else if (compare == KEY_ARM_1) {
-            arm_choices[1]++;
-        }
-        else if (compare == KEY_ARM_2) {
-            arm_choices[2]++;
-        }
-        else if (compare == KEY_ARM_3) {
-            arm_choices[3]++;
-        }
-        else if (compare == KEY_ARM_4) {
-            arm_choices[4]++;
-        }
-        else if (compare == KEY_ARM_5) {
-            arm_choices[5]++;
-        }
-        else if (compare == KEY_ARM_6) {
-            arm_choices[6]++;
-        }
-        else if (compare == KEY_ARM_7) {
-            arm_choices[7]++;
-        }
-        else {
-            io_printf(IO_BUF, "it broke arm selection %d\n", key);
-        }
+    if (arm < (uint32_t) number_of_arms) {
+        arm_choices[arm] += payload;
+    }
+    else {
+        invalid_spike_count += payload;
+        io_printf(IO_BUF, "it broke arm selection %d\n", keyx);
     }
 }
 
@@ -436,6 +535,7 @@ void timer_callback(uint unused, uint dummy)
         if (tick_in_frame == reward_delay) {
             if (was_there_a_reward()) {
                 rewarding = true;
+                reward_count++;
                 io_printf(IO_BUF, "Got a reward\n");
                 current_score++;
                 if (!constant_input) {
@@ -444,6 +544,7 @@ void timer_callback(uint unused, uint dummy)
             }
             else{
                 rewarding = false;
+                no_reward_count++;
                 io_printf(IO_BUF, "No reward\n");
 //                current_score--;
                 if (!constant_input) {
@@ -456,10 +557,10 @@ void timer_callback(uint unused, uint dummy)
             // Update recorded score every 1s
             if (score_change_count>=1000) {
                 if (reward_based == 0) {
-                    recording_record(0, &correct_pulls, 4);
+                    score_record(_time, &correct_pulls);
                 }
                 else {
-                    recording_record(0, &current_score, 4);
+                    score_record(_time, &current_score);
                 }
                 score_change_count=0;
             }
@@ -39,6 +39,8 @@
 #include "random.h"
 
 #include <recording.h>
+#include "score_recording.h"
+#include "game_reset.h"
 
 //----------------------------------------------------------------------------
 // Macros
@@ -55,6 +57,7 @@ typedef enum {
   REGION_LOGIC,
   REGION_RECORDING,
   REGION_DATA,
+  REGION_PROVENANCE,
 } region_t;
 
 typedef enum {
@@ -85,6 +88,21 @@ typedef union {
    accum a;
 } uint_float_union;
 
+//----------------------------------------------------------------------------
+// Structures
+//----------------------------------------------------------------------------
+//! Provenance data, in the order read by RecallMachineVertex
+struct recall_provenance {
+    //! The number of multicast packets received
+    uint32_t packets_received;
+    //! The number of spikes received choosing 0
+    uint32_t choice_0_spikes;
+    //! The number of spikes received choosing 1
+    uint32_t choice_1_spikes;
+    //! The number of spikes sent
+    uint32_t spikes_sent;
+};
+
 //----------------------------------------------------------------------------
 // Globals
 //----------------------------------------------------------------------------
@@ -114,6 +132,9 @@ float max_fire_prob_off;
 
 uint_float_union temp_accum;
 
+//! The data region, which is read again when the simulation resumes
+static address_t logic_region;
+
 float current_accuracy = 0.f;
 int32_t current_state = STATE_IDLE;
 int32_t current_value = 0;
@@ -131,6 +152,8 @@ static uint32_t key;
 
 //! the number of timer ticks that this model should run for before exiting.
 uint32_t simulation_ticks = 0;
+uint32_t pkt_count = 0;
+uint32_t spikes_sent = 0;
 uint32_t score_change_count=0;
 
 //----------------------------------------------------------------------------
@@ -139,6 +162,7 @@ uint32_t score_change_count=0;
 static inline void spike_value(int value, int pop_index)
 {
     spin1_send_mc_packet(key | ((value * pop_size) + pop_index), 0, NO_PAYLOAD);
+    spikes_sent++;
 //  io_printf(IO_BUF, "sending spike to value %d from %d\n",
 //		  value, ((input * pop_size) + pop_index));
 //  current_score++;
@@ -147,11 +171,13 @@ static inline void spike_value(int value, int pop_index)
 static inline void spike_recall(int pop_index)
 {
     spin1_send_mc_packet(key | ((SPECIAL_EVENT_RECALL * pop_size) + pop_index), 0, NO_PAYLOAD);
+    spikes_sent++;
 }
 
 static inline void spike_store(int pop_index)
 {
     spin1_send_mc_packet(key | ((SPECIAL_EVENT_STORE * pop_size) + pop_index), 0, NO_PAYLOAD);
+    spikes_sent++;
 }
 
 static inline void spike_forget(int pop_index)
@@ -160,11 +186,65 @@ static inline void spike_forget(int pop_index)
 //    spin1_send_mc_packet(key | ((SPECIAL_EVENT_FORGET * pop_size) + pop_index), 0, NO_PAYLOAD);
 }
 
+//! \brief Read the parameters that can be changed between runs
+static void read_parameters(void)
+{
+    time_period = logic_region[0];
+    rate_on = logic_region[6];
+    rate_off = logic_region[7];
+    max_fire_prob_on = (float)rate_on / 1000.f;
+    max_fire_prob_off = (float)rate_off / 1000.f;
+    stochastic = logic_region[8];
+    reward = logic_region[9];
+    temp_accum.u = logic_region[10];
+    prob_command = temp_accum.a;
+    temp_accum.u = logic_region[11];
+    prob_in_change = temp_accum.a;
+}
+
+//! \brief Put the game back into its starting state
+static void reset_game(void)
+{
+    current_score_0 = 0;
+    current_score_1 = 0;
+    number_of_trials = 0;
+    current_accuracy = 0.f;
+    current_state = STATE_IDLE;
+    current_value = 0;
+    stored_value = 0;
+    chose_0 = 0;
+    chose_1 = 0;
+    time_until_command = 0;
+    tick_in_frame = 0;
+    io_printf(IO_BUF, "Game reset\n");
+}
+
 void resume_callback(void)
 {
+    read_parameters();
+    uint32_t reset = take_reset_request(&logic_region[13]);
+    if (reset & RESET_SEED) {
+        kiss_seed[0] = logic_region[2];
+        kiss_seed[1] = logic_region[3];
+        kiss_seed[2] = logic_region[4];
+        kiss_seed[3] = logic_region[5];
+        validate_mars_kiss64_seed(kiss_seed);
+    }
+    if (reset & RESET_GAME) {
+        reset_game();
+    }
     recording_reset();
 }
 
+static void store_provenance_data(address_t provenance_region)
+{
+    struct recall_provenance *prov = (void *) provenance_region;
+    prov->packets_received = pkt_count;
+    prov->choice_0_spikes = chose_0;
+    prov->choice_1_spikes = chose_1;
+    prov->spikes_sent = spikes_sent;
+}
+
 static bool initialize(uint32_t *timer_period)
 {
     io_printf(IO_BUF, "Initialise logic: started\n");
@@ -184,6 +264,9 @@ static bool initialize(uint32_t *timer_period)
 			&infinite_run, &_time, 1, 0)) {
       return false;
     }
+    simulation_set_provenance_function(
+        store_provenance_data,
+        data_specification_get_region(REGION_PROVENANCE, address));
     io_printf(IO_BUF, "simulation time = %u\n", simulation_ticks);
 
 
@@ -204,24 +287,17 @@ static bool initialize(uint32_t *timer_period)
        return false;
     }
 
-    address_t logic_region = data_specification_get_region(REGION_DATA, address);
-    time_period = logic_region[0];
+    logic_region = data_specification_get_region(REGION_DATA, address);
     pop_size = logic_region[1];
 //    rand_seed = logic_region[2];
     kiss_seed[0] = logic_region[2];
     kiss_seed[1] = logic_region[3];
     kiss_seed[2] = logic_region[4];
     kiss_seed[3] = logic_region[5];
-    rate_on = logic_region[6];
-    rate_off = logic_region[7];
-    max_fire_prob_on = (float)rate_on / 1000.f;
-    max_fire_prob_off = (float)rate_off / 1000.f;
-    stochastic = logic_region[8];
-    reward = logic_region[9];
-    temp_accum.u = logic_region[10];
-    prob_command = temp_accum.a;
-    temp_accum.u = logic_region[11];
-    prob_in_change = temp_accum.a;
+    score_recording_initialise(logic_region[12], 3);
+    // The game starts in its reset state anyway
+    take_reset_request(&logic_region[13]);
+    read_parameters();
 
     validate_mars_kiss64_seed(kiss_seed);
 
@@ -330,6 +406,7 @@ void mc_packet_received_callback(uint keyx, uint payload)
 //    io_printf(IO_BUF, "payload = %x\n", payload);
     // If no payload has been set, make sure the loop will run
     if (payload == 0) { payload = 1; }
+    pkt_count++;
 
     for (uint count = payload; count > 0; count--) {
         if (compare == KEY_CHOICE_0) {
@@ -455,7 +532,7 @@ void timer_callback(uint unused, uint dummy)
 						(accum)current_accuracy, current_score_0,
 						current_score_1, number_of_trials);
 //                io_printf(IO_BUF, "state:%u, time:%u\n", current_state, _time);
-                recording_record(0, &progress, 12);
+                score_record(_time, progress);
                 score_change_count = 0;
             }
         }
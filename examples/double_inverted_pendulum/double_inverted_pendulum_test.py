@@ -142,18 +142,14 @@ arm_conns = [from_list_conn_left, from_list_conn_right]
 p.run(runtime)
 
 g_vertex = pendulum._vertex  # pylint: disable=protected-access
-_scores = g_vertex.get_recorded_data('score')
+scores = g_vertex.get_recorded_data('score')
 
-scores = []
-scores.append(_scores.tolist())
 if reward_based:
-    print(scores)
+    print(scores["max_balance_time"])
 else:
-    i = 0
-    print("cart  |  angle")
-    while i < len(scores[0]):
-        print(f"{scores[0][i]}\t{scores[0][i+1]}\t{scores[0][i+2]}")
-        i += 3
+    print("cart  |  angle  |  angle 2")
+    print(np.column_stack((scores["cart_position"], scores["pole_angle"],
+                           scores["pole2_angle"])))
 
 # spikes = []
 # v = []
@@ -119,18 +119,13 @@ arm_conns = [from_list_conn_left, from_list_conn_right]
 p.run(runtime)
 
 g_vertex = pendulum._vertex  # pylint: disable=protected-access
-_scores = g_vertex.get_recorded_data('score')
+scores = g_vertex.get_recorded_data('score')
 
-scores = []
-scores.append(_scores.tolist())
 if reward_based:
-    print(scores)
+    print(scores["max_balance_time"])
 else:
-    i = 0
     print("cart  \t\t|\t\t  angle")
-    while i < len(scores[0]):
-        print(f"{scores[0][i]:8}\t{scores[0][i+1]:8}")
-        i += 2
+    print(np.column_stack((scores["cart_position"], scores["pole_angle"])))
 
 spikes_n = null_pop.get_data('spikes').segments[0].spiketrains
 v_n = null_pop.get_data('v').segments[0].filter(name='v')[0]
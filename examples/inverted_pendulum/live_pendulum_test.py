@@ -0,0 +1,51 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# SpiNNaker imports
+import pyNN.spiNNaker as p
+import spinn_gym as gym
+from spinn_gym.games.live_environment import LiveEnvironment
+
+# The pendulum is simulated on the host, and the network on the machine
+runtime = 10000
+number_of_bins = 3
+weight = 0.1
+
+p.setup(timestep=1.0, min_delay=1, time_scale_factor=10)
+engine = gym.PendulumEngine(
+    1, encoding=1, pole_angle=2.6, force_increments=5,
+    max_firing_rate=1000, number_of_bins=number_of_bins, bin_overlap=3)
+
+# The even output pushes the cart back and the odd output pushes it forward
+output_pop = p.Population(
+    2, p.IF_cond_exp(
+        tau_m=0.5, tau_refrac=0, v_thresh=-64, tau_syn_E=1, tau_syn_I=1),
+    label='out')
+output_pop.record('spikes')
+environment = LiveEnvironment(engine, output_pop, label='pendulum_pop')
+
+# Push the cart the way the pole leans, from the bins of its angle
+back, forward = 0, 1
+p.Projection(environment.population, output_pop, p.FromListConnector(
+    [[0, back, weight, 1], [number_of_bins - 1, forward, weight, 1]]))
+
+p.run(runtime)
+
+print(f"longest balance {engine.max_balance_times[0]} ticks")
+print(f"the host stepped the pendulum {environment.n_steps} times in "
+      f"{environment.step_seconds:.3f} seconds")
+
+environment.close()
+p.end()
@@ -66,17 +66,13 @@ p.run(runtime)
 
 b_vertex = recall_pop._vertex  # pylint: disable=protected-access
 scores = b_vertex.get_recorded_data('score')
-scores = scores.tolist()
-print(scores)
 
-i = 0
 print("score 0 \t\t|\t score 1 \t|\t\t  trials")
-while i < len(scores):
-    print(f"{scores[i][0]:8}\t\t{scores[i + 1][0]:8}\t\t{scores[i + 2][0]:8}")
-    i += 3
+print(np.column_stack(
+    (scores["score_0"], scores["score_1"], scores["trials"])))
 
-accuracy = float(scores[len(scores)-2][0]+scores[len(scores)-3][0]) / float(
-    scores[len(scores)-1][0])
+accuracy = float(scores["score_0"][-1] + scores["score_1"][-1]) / float(
+    scores["trials"][-1])
 print("Accuracy:", accuracy)
 
 spikes_in = input_pop.get_data('spikes').segments[0].spiketrains
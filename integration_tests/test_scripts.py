@@ -52,5 +52,8 @@ class TestScripts(ScriptChecker):
     def test_examples_inverted_pendulum_inverted_pendulum_test(self):
         self.check_script("examples/inverted_pendulum/inverted_pendulum_test.py")
 
+    def test_examples_inverted_pendulum_live_pendulum_test(self):
+        self.check_script("examples/inverted_pendulum/live_pendulum_test.py")
+
     def test_examples_multi_arm_bandit_bandit_test(self):
         self.check_script("examples/multi_arm_bandit/bandit_test.py")
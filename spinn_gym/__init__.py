@@ -17,17 +17,32 @@ import os
 from spynnaker.pyNN.data import SpynnakerDataView
 
 from spinn_gym.games.breakout.breakout import Breakout
+from spinn_gym.games.breakout.breakout_machine_vertex import BreakoutEvent
+from spinn_gym.games.breakout.batched_breakout import BatchedBreakout
+from spinn_gym.games.breakout.breakout_engine import BreakoutEngine
 from spinn_gym.games.multi_arm_bandit.bandit import Bandit
+from spinn_gym.games.multi_arm_bandit.bandit_engine import BanditEngine
 from spinn_gym.games.inverted_pendulum.inverted_pendulum import Pendulum
+from spinn_gym.games.inverted_pendulum.inverted_pendulum_machine_vertex \
+    import PendulumEvent
+from spinn_gym.games.inverted_pendulum.pendulum_engine import PendulumEngine
 from spinn_gym.games.logic.logic import Logic
+from spinn_gym.games.logic.logic_engine import LogicEngine
 from spinn_gym.games.store_recall.store_recall import Recall
+from spinn_gym.games.store_recall.recall_engine import RecallEngine
 from spinn_gym.games.double_inverted_pendulum.double_pendulum \
     import DoublePendulum
+from spinn_gym.games.double_inverted_pendulum.double_pendulum_engine \
+    import DoublePendulumEngine
+from spinn_gym.games.vector_env import VectorEnv
 
 
 # Put model_binaries directory on path
 binary_path = os.path.join(os.path.split(__file__)[0], 'model_binaries')
 SpynnakerDataView.register_binary_search_path(binary_path)
 
-__all__ = ['Breakout', 'Bandit', 'Pendulum', 'Logic', 'Recall',
-           'DoublePendulum']
+__all__ = ['Breakout', 'BreakoutEvent', 'BatchedBreakout', 'BreakoutEngine',
+           'Bandit', 'BanditEngine', 'Pendulum', 'PendulumEvent',
+           'PendulumEngine', 'Logic', 'LogicEngine', 'Recall',
+           'RecallEngine', 'DoublePendulum', 'DoublePendulumEngine',
+           'VectorEnv']
@@ -12,8 +12,9 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
-
 from .spinn_gym_application_vertex import SpinnGymApplicationVertex
 from .spinn_gym_machine_vertex import SpinnGymMachineVertex
+from .spinn_gym_multi_instance_vertex import SpinnGymMultiInstanceVertex
 
-__all__ = ["SpinnGymApplicationVertex", "SpinnGymMachineVertex"]
+__all__ = ["SpinnGymApplicationVertex", "SpinnGymMachineVertex",
+           "SpinnGymMultiInstanceVertex"]
@@ -0,0 +1,135 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, List, Optional
+
+import numpy
+
+from spinn_utilities.overrides import overrides
+
+from pacman.model.graphs.common import Slice
+
+# common imports
+from spinn_gym.games.spinn_gym_multi_instance_vertex import (
+    SpinnGymMultiInstanceVertex)
+
+# Breakout imports
+from spinn_gym.games.breakout.batched_breakout_machine_vertex import \
+    BatchedBreakoutMachineVertex
+
+
+# ----------------------------------------------------------------------------
+# BatchedBreakout
+# ----------------------------------------------------------------------------
+class BatchedBreakout(SpinnGymMultiInstanceVertex):
+    """
+    Many independent games of Breakout, run several to a core.
+
+    Each game has the keys of a game of :py:class:`~spinn_gym.Breakout`,
+    offset by the game's index times :py:attr:`atoms_per_instance`, and is
+    controlled by a pair of neurons of the source vertex: neuron ``2g``
+    moves the bat of game ``g`` left and neuron ``2g + 1`` moves it right.
+    """
+
+    ONE_WEEK_IN_MS = 1000*60*60*24*7
+
+    #: The most games that one core can run
+    MAX_GAMES = BatchedBreakoutMachineVertex.MAX_GAMES
+
+    MACHINE_VERTEX_CLASS = BatchedBreakoutMachineVertex
+
+    __slots__ = ["__source_vertex", "__x_factor", "__y_factor",
+                 "__colour_bits", "__game_key_shift"]
+
+    def __init__(self, n_games, x_factor=16, y_factor=16, width=160,
+                 height=128, colour_bits=2, label="BatchedBreakout",
+                 simulation_duration_ms=ONE_WEEK_IN_MS, bricking=1,
+                 random_seed=None, record_changes_only=False,
+                 games_per_core=MAX_GAMES):
+        """
+        :param int n_games: The number of games to run
+        :param random_seed:
+            The seeds of the games; see
+            :py:func:`~spinn_gym.utilities.resolve_random_seeds`
+        :param bool record_changes_only:
+            Whether to record the scores, with the tick, only when one of
+            them changes
+        :param int games_per_core: The most games to run on each core
+        :raises ValueError: If more games are asked for on a core than it
+            can run
+        """
+        if not 0 < games_per_core <= self.MAX_GAMES:
+            raise ValueError(
+                f"A core can run between 1 and {self.MAX_GAMES} games, not "
+                f"{games_per_core}")
+
+        width_bits = numpy.uint32(numpy.ceil(numpy.log2(width/x_factor)))
+        height_bits = numpy.uint32(numpy.ceil(numpy.log2(height/y_factor)))
+        self.__game_key_shift = int(width_bits + height_bits + colour_bits)
+        self.__x_factor = x_factor
+        self.__y_factor = y_factor
+        self.__colour_bits = colour_bits
+
+        # Superclasses
+        super(BatchedBreakout, self).__init__(
+            label, n_games, 1 << self.__game_key_shift,
+            min(games_per_core, n_games), simulation_duration_ms,
+            random_seed, record_changes_only, {"bricking": bricking})
+        self.__source_vertex = None
+
+    @property
+    def n_games(self) -> int:
+        """
+        The number of games.
+
+        :rtype: int
+        """
+        return self.n_instances
+
+    @property
+    @overrides(SpinnGymMultiInstanceVertex.parameters)
+    def parameters(self) -> Dict[str, Any]:
+        parameters = super(BatchedBreakout, self).parameters
+        parameters.update(
+            x_factor=self.__x_factor, y_factor=self.__y_factor,
+            colour_bits=self.__colour_bits)
+        return parameters
+
+    @overrides(SpinnGymMultiInstanceVertex._create_instance_vertex)
+    def _create_instance_vertex(
+            self, vertex_slice: Slice, first_instance: int,
+            random_seeds: List[List[int]],
+            label: Optional[str]) -> BatchedBreakoutMachineVertex:
+        return BatchedBreakoutMachineVertex(
+            label, self, vertex_slice, self.simulation_duration_ms,
+            random_seeds, self.__x_factor, self.__y_factor,
+            self.__colour_bits, self.get_instance_parameter("bricking"),
+            self.__game_key_shift, first_instance, self.record_changes_only)
+
+    @property
+    @overrides(SpinnGymMultiInstanceVertex.score_format)
+    def score_format(self) -> type:
+        return numpy.int32
+
+    @property
+    def source_vertex(self):
+        return self.__source_vertex
+
+    @source_vertex.setter
+    def source_vertex(self, vertex):
+        """ Set the vertex that is the source of input; it must have two
+            neurons for each game
+        """
+        self.__source_vertex = vertex
@@ -0,0 +1,276 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from enum import Enum
+from typing import Any, cast, Dict, List, TYPE_CHECKING
+
+import numpy
+
+from spinn_utilities.overrides import overrides
+
+from pacman.model.placements import Placement
+
+# SpinnFrontEndCommon imports
+from spinn_front_end_common.utilities import helpful_functions
+from spinn_front_end_common.abstract_models.\
+    abstract_generates_data_specification \
+    import AbstractGeneratesDataSpecification
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from spinn_front_end_common.abstract_models.abstract_has_associated_binary \
+    import AbstractHasAssociatedBinary
+from spinn_front_end_common.interface.ds import (
+    DataSpecificationGenerator, DataType)
+
+from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
+
+# spinn_gym imports
+from spinn_gym.games import SpinnGymMachineVertex
+from spinn_gym.games.breakout.breakout_machine_vertex import (
+    BreakoutEvent, BreakoutMachineVertex)
+
+if TYPE_CHECKING:
+    from .batched_breakout import BatchedBreakout
+
+
+# ----------------------------------------------------------------------------
+# BatchedBreakoutMachineVertex
+# ----------------------------------------------------------------------------
+class BatchedBreakoutMachineVertex(SpinnGymMachineVertex):
+    """
+    Several independent games of Breakout, run by one core.
+    """
+
+    #: The most games one core can run; MAX_GAMES of the binary
+    MAX_GAMES = 32
+
+    #: The key of the first game, followed by how to find the game that
+    #: each key received controls
+    BREAKOUT_REGION_BYTES = 8 * BYTES_PER_WORD
+
+    _BREAKOUT_REGIONS = Enum(
+        value="_BREAKOUT_REGIONS",
+        names=[('SYSTEM', 0),
+               ('BREAKOUT', 1),
+               ('RECORDING', 2),
+               ('PARAMS', 3),
+               ('PROVENANCE', 4)])
+
+    PROVENANCE_ITEMS = BreakoutMachineVertex.PROVENANCE_ITEMS + (
+        "Other_game_packets",)
+
+    # The seed of each game follows the fields
+    PARAMETER_SCHEMA = (
+        ("x_factor", DataType.UINT32),
+        ("y_factor", DataType.UINT32),
+        ("bricking", DataType.UINT32),
+        ("n_games", DataType.UINT32),
+        ("record_changes_only", DataType.UINT32),
+        ("reset_flags", DataType.UINT32))
+
+    REWRITABLE_PARAMETERS = ("bricking",)
+
+    EVENT_TYPES = BreakoutEvent
+
+    #: The average time between the events of each game that the events
+    #: channel is sized for
+    EVENT_INTERVAL_MS = BreakoutMachineVertex.EVENT_INTERVAL_MS
+
+    __slots__ = ("_x_factor", "_y_factor", "_colour_bits", "_bricking",
+                 "_n_games", "_game_key_shift", "_first_game")
+
+    def __init__(
+            self, label, app_vertex: 'BatchedBreakout', vertex_slice,
+            simulation_duration_ms, random_seeds,
+            x_factor, y_factor, colour_bits, bricking, game_key_shift,
+            first_game=0, record_changes_only=False):
+        """
+        :param label: The optional name of the vertex
+        :type label: str or None
+        :param app_vertex:
+            The application vertex that caused this machine vertex to be
+            created.
+        :type app_vertex: BatchedBreakout
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The atoms, and so keys, of the games
+        :param float simulation_duration_ms:
+        :param list(list(int)) random_seeds:
+            The 4 values to seed the random number generator of each game
+            with; one seed per game
+        :param x_factor:
+        :param y_factor:
+        :param colour_bits:
+        :param bricking:
+        :param int game_key_shift:
+            How far the index of a game is shifted up in its keys
+        :param int first_game:
+            The index of the first game among those of the application
+            vertex
+        :param bool record_changes_only:
+            Whether to record the scores, with the tick, only when one of
+            them changes
+        :raises ValueError: If there are more games than a core can run
+        """
+        # The recording sizes depend on the number of games
+        self._n_games = len(random_seeds)
+        if not 0 < self._n_games <= self.MAX_GAMES:
+            raise ValueError(
+                f"A core can run between 1 and {self.MAX_GAMES} games, not "
+                f"{self._n_games}")
+
+        # Superclasses
+        super(BatchedBreakoutMachineVertex, self).__init__(
+            label, app_vertex, vertex_slice.n_atoms,
+            self.BREAKOUT_REGION_BYTES,
+            simulation_duration_ms, [list(seed) for seed in random_seeds],
+            record_changes_only, vertex_slice)
+
+        self._x_factor = x_factor
+        self._y_factor = y_factor
+        self._colour_bits = colour_bits
+        self._bricking = bricking
+        self._game_key_shift = game_key_shift
+        self._first_game = first_game
+
+    @property
+    @overrides(SpinnGymMachineVertex.app_vertex)
+    def app_vertex(self) -> 'BatchedBreakout':
+        # type checked by init
+        return cast('BatchedBreakout', self._app_vertex)
+
+    @property
+    def n_games(self) -> int:
+        """
+        The number of games run by the core.
+
+        :rtype: int
+        """
+        return self._n_games
+
+    @property
+    @overrides(SpinnGymMachineVertex.parameters)
+    def parameters(self) -> Dict[str, Any]:
+        parameters = super(BatchedBreakoutMachineVertex, self).parameters
+        parameters.update(
+            x_factor=self._x_factor, y_factor=self._y_factor,
+            colour_bits=self._colour_bits, bricking=self._bricking,
+            n_games=self._n_games, first_game=self._first_game)
+        return parameters
+
+    @overrides(SpinnGymMachineVertex._get_score_words)
+    def _get_score_words(self) -> int:
+        # Each sample is the score of every game
+        return self._n_games
+
+    @overrides(SpinnGymMachineVertex._get_events_sample_bytes)
+    def _get_events_sample_bytes(self) -> int:
+        # The events of every game
+        return self._n_games * self.EVENT_RECORD_BYTES
+
+    @overrides(SpinnGymMachineVertex._check_random_seed)
+    def _check_random_seed(self, random_seed: List[Any]) -> List[Any]:
+        if len(random_seed) != self._n_games or any(
+                len(seed) != 4 for seed in random_seed):
+            raise ValueError(
+                f"A seed of 4 values is needed for each of the "
+                f"{self._n_games} games, not {random_seed}")
+        return [list(seed) for seed in random_seed]
+
+    @overrides(SpinnGymMachineVertex.get_parameter_region_data)
+    def get_parameter_region_data(self) -> numpy.ndarray:
+        # The seed of each game follows the fields
+        return numpy.concatenate((
+            super(BatchedBreakoutMachineVertex,
+                  self).get_parameter_region_data(),
+            numpy.array(self._random_seed, dtype=numpy.uint32).ravel()))
+
+    # ------------------------------------------------------------------------
+    # AbstractGeneratesDataSpecification overrides
+    # ------------------------------------------------------------------------
+    @overrides(AbstractGeneratesDataSpecification.generate_data_specification)
+    def generate_data_specification(self, spec: DataSpecificationGenerator,
+                                    placement: Placement) -> None:
+        # pylint: disable=arguments-differ
+        vertex = placement.vertex
+
+        spec.comment("\n*** Spec for Batched Breakout Instance ***\n\n")
+        spec.comment("\nReserving memory space for data regions:\n\n")
+
+        # Reserve memory:
+        self.reserve_memory_regions(spec)
+
+        # Write setup region
+        spec.comment("\nWriting setup region:\n")
+        self.write_system_region(spec)
+
+        # Write breakout region containing the keys to transmit with and
+        # how to decode the keys received
+        spec.comment("\nWriting breakout region:\n")
+        spec.switch_write_focus(self._BREAKOUT_REGIONS.BREAKOUT.value)
+        routing_info = SpynnakerDataView.get_routing_infos()
+        spec.write_value(routing_info.get_key_from(
+            vertex, SPIKE_PARTITION_ID))
+        spec.write_value(self._game_key_shift)
+        spec.write_value(self._first_game)
+        source = self.app_vertex.source_vertex
+        if source is None:
+            raise ValueError(
+                "The breakout vertex doesn't have a source vertex!")
+        for value in self._get_source_key_layout(source):
+            spec.write_value(value)
+
+        # Write recording region for score and events
+        spec.comment("\nWriting breakout recording region:\n")
+        self.write_recording_region(spec)
+
+        spec.comment("\nWriting breakout param region:\n")
+        self.write_parameter_region(spec)
+
+        # End-of-Spec:
+        spec.end_specification()
+
+    @overrides(SpinnGymMachineVertex.get_recording_region_base_address)
+    def get_recording_region_base_address(self, placement: Placement) -> int:
+        return helpful_functions.locate_memory_region_for_placement(
+            placement, self._BREAKOUT_REGIONS.RECORDING.value)
+
+    @property
+    @overrides(SpinnGymMachineVertex._provenance_region_id)
+    def _provenance_region_id(self) -> int:
+        return self._BREAKOUT_REGIONS.PROVENANCE.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._parameter_region_id)
+    def _parameter_region_id(self) -> int:
+        return self._BREAKOUT_REGIONS.PARAMS.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._system_region_id)
+    def _system_region_id(self) -> int:
+        return self._BREAKOUT_REGIONS.SYSTEM.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._key_region_id)
+    def _key_region_id(self) -> int:
+        return self._BREAKOUT_REGIONS.BREAKOUT.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._recording_region_id)
+    def _recording_region_id(self) -> int:
+        return self._BREAKOUT_REGIONS.RECORDING.value
+
+    @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
+    def get_binary_file_name(self) -> str:
+        return "batched_breakout.aplx"
@@ -19,6 +19,7 @@ from spinn_utilities.overrides import overrides
 
 # common imports
 from spinn_gym.games import SpinnGymApplicationVertex
+from spinn_gym.utilities.seed_streams import resolve_random_seed
 
 # Breakout imports
 from spinn_gym.games.breakout.breakout_machine_vertex import \
@@ -31,19 +32,14 @@ from spinn_gym.games.breakout.breakout_machine_vertex import \
 class Breakout(SpinnGymApplicationVertex):
 
     ONE_WEEK_IN_MS = 1000*60*60*24*7
-    RANDOM_SEED = [numpy.random.randint(10000),
-                   numpy.random.randint(10000),
-                   numpy.random.randint(10000),
-                   numpy.random.randint(10000)]
 
     __slots__ = ["__source_vertex"]
 
     def __init__(self, x_factor=16, y_factor=16, width=160, height=128,
                  colour_bits=2, label="Breakout",
                  simulation_duration_ms=ONE_WEEK_IN_MS, bricking=1,
-                 random_seed=None):
-        if random_seed is None:
-            random_seed = list(self.RANDOM_SEED)
+                 random_seed=None, record_changes_only=False):
+        random_seed = resolve_random_seed(random_seed)
 
         width_bits = numpy.uint32(numpy.ceil(numpy.log2(width/x_factor)))
         height_bits = numpy.uint32(numpy.ceil(numpy.log2(height/y_factor)))
@@ -52,7 +48,8 @@ class Breakout(SpinnGymApplicationVertex):
 
         machne_vertex = BreakoutMachineVertex(
             label, self, n_neurons, simulation_duration_ms,
-            random_seed, x_factor, y_factor, colour_bits, bricking)
+            random_seed, x_factor, y_factor, colour_bits, bricking,
+            record_changes_only)
 
         # Superclasses
         super(Breakout, self).__init__(machne_vertex,  label, n_neurons)
@@ -0,0 +1,569 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import List, Optional, Tuple
+
+import numpy
+
+from spinn_gym.games.breakout.breakout_machine_vertex import BreakoutEvent
+from spinn_gym.utilities.kiss64 import Kiss64
+from spinn_gym.utilities.seed_streams import resolve_random_seeds
+
+
+def _c_divide(a: numpy.ndarray, b: int) -> numpy.ndarray:
+    """
+    Divide as C does, rounding towards zero.
+    """
+    quotient = numpy.abs(a) // b
+    return numpy.where(a < 0, -quotient, quotient)
+
+
+# ----------------------------------------------------------------------------
+# BreakoutEngine
+# ----------------------------------------------------------------------------
+class BreakoutEngine(object):
+    """
+    Many games of Breakout, played on the host with NumPy as ``bkout.c``
+    plays them on the machine.
+
+    All the games are stepped together, one frame per call of
+    :py:meth:`step`; given the same seeds and the same spikes, each game
+    sends the same keys and records the same events as the binary.  A
+    neuron ID is the key sent minus the key of the vertex, so it is the
+    atom of :py:class:`~spinn_gym.Breakout` that spikes.
+    """
+
+    NUMBER_OF_LIVES = 5
+    BRICKS_PER_ROW = 5
+    BRICKS_PER_COLUMN = 2
+    MAX_BALL_SPEED = 2
+
+    #: The frames that the ball is out of play for after a life is lost
+    OUT_OF_PLAY = 20
+
+    #: The time between frames, in ticks
+    FRAME_DELAY = 20
+
+    BAT_START_X = 32
+
+    #: The neuron IDs of the special events
+    SCORE_UP = 0
+    SCORE_DOWN = 1
+    SPECIAL_EVENT_MAX = 2
+
+    COLOUR_BACKGROUND = 0
+    COLOUR_BALL = 1
+    COLOUR_BAT = 2
+
+    # The size of the frame buffer of the binary, each row of which is a
+    # column of pixels
+    _FRAME_ROWS = 80
+    _FRAME_STRIDE = 128
+
+    # Rows of frame buffer either side of the game, where a ball that has
+    # left the screen is drawn
+    _FRAME_PADDING = 4
+
+    __slots__ = (
+        "__n_games", "__x_factor", "__bricking", "__width", "__height",
+        "__bat_len", "__brick_width", "__brick_height",
+        "__brick_layer_offset", "__y_bits", "__rng", "__frame_buffer",
+        "__bricks", "__n_bricks", "__x", "__y", "__u", "__v", "__x_bat",
+        "__out_of_play", "__lives", "__scores", "__redraw_bat", "__strayed",
+        "__tick")
+
+    def __init__(self, n_games: int, x_factor: int = 16, y_factor: int = 16,
+                 bricking: int = 1, random_seed=None):
+        """
+        :param int n_games: The number of games to play
+        :param int x_factor: How much the width of the screen is divided by
+        :param int y_factor: How much the height of the screen is divided by
+        :param int bricking: 1 to play with bricks, 0 to play without them
+        :param random_seed:
+            The seeds of the games; see
+            :py:func:`~spinn_gym.utilities.resolve_random_seeds`
+        :raises ValueError: If bricking is neither 0 nor 1
+        """
+        if bricking not in (0, 1):
+            raise ValueError(f"Bricking must be 0 or 1, not {bricking}")
+        self.__n_games = n_games
+        self.__x_factor = x_factor
+        self.__bricking = bricking
+
+        self.__width = 160 // x_factor
+        self.__height = 128 // y_factor
+        self.__bat_len = 32 // x_factor
+        self.__brick_width = self.__width // self.BRICKS_PER_ROW
+        self.__brick_height = 16 // y_factor
+        self.__brick_layer_offset = 16 // y_factor
+        # The binary takes the size of a bit field for the bits of a row
+        self.__y_bits = (self.__height + 31) >> 5
+
+        self.__rng = Kiss64(resolve_random_seeds(random_seed, n_games))
+
+        self.__frame_buffer = numpy.zeros(
+            (n_games, self.__width + 2 * self._FRAME_PADDING,
+             self._FRAME_STRIDE), dtype=numpy.int8)
+        self.__bricks = numpy.zeros(
+            (n_games, self.BRICKS_PER_COLUMN * self.BRICKS_PER_ROW),
+            dtype=bool)
+        self.__n_bricks = numpy.zeros(n_games, dtype=numpy.int32)
+        self.__x = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__y = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__u = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__v = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__x_bat = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__out_of_play = numpy.zeros(n_games, dtype=numpy.int32)
+        self.__lives = numpy.zeros(n_games, dtype=numpy.int32)
+        self.__scores = numpy.zeros(n_games, dtype=numpy.int32)
+        self.__redraw_bat = numpy.zeros(n_games, dtype=bool)
+        self.__strayed = numpy.zeros(n_games, dtype=bool)
+        self.__tick = 0
+
+        self.__x_bat[:] = self.BAT_START_X // x_factor
+        # The binary serves before it first clears the frame, and only
+        # draws the bat on the second frame
+        self.__serve(numpy.ones(n_games, dtype=bool))
+        self.__init_frame(numpy.ones(n_games, dtype=bool))
+        self.__lives[:] = self.NUMBER_OF_LIVES
+
+    @property
+    def n_games(self) -> int:
+        """
+        The number of games.
+
+        :rtype: int
+        """
+        return self.__n_games
+
+    @property
+    def n_neurons(self) -> int:
+        """
+        The number of neuron IDs that the games can send, as the number of
+        atoms of :py:class:`~spinn_gym.Breakout` with the same factors.
+
+        :rtype: int
+        """
+        width_bits = int(numpy.ceil(numpy.log2(self.__width)))
+        height_bits = int(numpy.ceil(numpy.log2(self.__height)))
+        return 1 << (width_bits + height_bits + 2)
+
+    @property
+    def tick(self) -> int:
+        """
+        The tick of the next frame.
+
+        :rtype: int
+        """
+        return self.__tick
+
+    @property
+    def scores(self) -> numpy.ndarray:
+        """
+        The score of each game.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__scores.copy()
+
+    @property
+    def lives(self) -> numpy.ndarray:
+        """
+        The lives left in each game; as in the binary, play goes on when
+        this goes below zero.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__lives.copy()
+
+    @property
+    def bricks(self) -> numpy.ndarray:
+        """
+        Which bricks of each game are still there, by row then column.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__bricks.reshape((
+            self.__n_games, self.BRICKS_PER_COLUMN,
+            self.BRICKS_PER_ROW)).copy()
+
+    @property
+    def ball_positions(self) -> numpy.ndarray:
+        """
+        The x and y coordinates of the ball of each game.
+
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.stack((self.__x, self.__y), axis=1)
+
+    @property
+    def bat_positions(self) -> numpy.ndarray:
+        """
+        The x coordinate of the left end of the bat of each game.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__x_bat.copy()
+
+    @property
+    def strayed(self) -> numpy.ndarray:
+        """
+        Whether each game has drawn the ball where the binary would read or
+        write outside its frame buffer, which it does when the ball goes
+        off the left of the screen.  From then on the game might not play
+        as it would on the machine, where that memory holds other data.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__strayed.copy()
+
+    def reset(self, games: Optional[numpy.ndarray] = None) -> None:
+        """
+        Put games back into their starting state, as a reset request does
+        between runs on the machine.
+
+        :param games:
+            Which games to reset, as a mask or indices; all if None
+        :type games: ~numpy.ndarray or None
+        """
+        mask = numpy.zeros(self.__n_games, dtype=bool)
+        if games is None:
+            mask[:] = True
+        else:
+            mask[games] = True
+        self.__init_frame(mask)
+        self.__lives[mask] = self.NUMBER_OF_LIVES
+        self.__scores[mask] = 0
+        self.__out_of_play[mask] = 0
+        self.__x_bat[mask] = self.BAT_START_X // self.__x_factor
+        self.__serve(mask)
+        self.__redraw_bat[mask] = True
+
+    def step(self, actions: numpy.ndarray) -> Tuple[
+            numpy.ndarray, numpy.ndarray]:
+        """
+        Play one frame of every game.
+
+        :param ~numpy.ndarray actions:
+            The number of spikes received by each game since the last
+            frame, from its left then its right neuron, as an array of
+            shape (n_games, 2)
+        :return: The neuron IDs sent by each game in the order they were
+            sent, padded with -1, and which of the
+            :py:class:`~spinn_gym.BreakoutEvent` happened in each game
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        actions = numpy.asarray(actions)
+        if actions.shape != (self.__n_games, 2):
+            raise ValueError(
+                f"Actions must have shape ({self.__n_games}, 2), not "
+                f"{actions.shape}")
+        sent: List[numpy.ndarray] = []
+        events = numpy.zeros((self.__n_games, len(BreakoutEvent)), dtype=bool)
+        height = self.__height
+        x, y = self.__x, self.__y
+
+        # Rebuild the wall once it has been cleared, and serve again
+        cleared = numpy.zeros(self.__n_games, dtype=bool)
+        if self.__bricking == 1:
+            cleared = self.__n_bricks == 0
+        events[:, BreakoutEvent.BRICKS_CLEARED] = cleared
+        self.__bricks[cleared] = True
+        self.__n_bricks[cleared] = self.__bricks.shape[1]
+        self.__set_pixel(sent, cleared, x, y, self.COLOUR_BACKGROUND)
+        self.__v[cleared] = -self.MAX_BALL_SPEED
+        self.__y[cleared] = height - 2
+        flip = cleared & (self.__rng.next(cleared) > 0x7FFFFFFF)
+        self.__u[flip] = -self.__u[flip]
+        self.__x[cleared] = self.__x_bat[cleared] + self.__bat_len // 2
+
+        # Show the bricks that are left
+        for i in range(self.BRICKS_PER_COLUMN):
+            for j in range(self.BRICKS_PER_ROW):
+                sent.append(numpy.where(
+                    self.__bricks[:, i * self.BRICKS_PER_ROW + j],
+                    self.__neuron_id(
+                        j * self.__brick_width,
+                        i * self.__brick_height + self.__brick_layer_offset,
+                        self.COLOUR_BALL, True), -1))
+
+        # Draw the bat on the first frame after the start and after resets
+        draw_bat = self.__redraw_bat.copy()
+        if self.__tick == self.FRAME_DELAY:
+            draw_bat[:] = True
+        self.__redraw_bat[:] = False
+        self.__draw_bat(sent, draw_bat)
+
+        self.__update_frame(sent, events, actions)
+        self.__tick += self.FRAME_DELAY
+
+        # Put what each game sent first, keeping the order
+        spikes = numpy.stack(sent, axis=1)
+        order = numpy.argsort(spikes < 0, axis=1, kind="stable")
+        return numpy.take_along_axis(spikes, order, axis=1), events
+
+    def __update_frame(
+            self, sent: List[numpy.ndarray], events: numpy.ndarray,
+            actions: numpy.ndarray) -> None:
+        """
+        Move the bat, and then the ball, as ``update_frame`` does.
+        """
+        width, height, bat_len = self.__width, self.__height, self.__bat_len
+        x_bat = self.__x_bat
+
+        # Move the bat, which the binary clamps rather oddly
+        old_x_bat = x_bat.copy()
+        left = actions[:, 0] > actions[:, 1]
+        right = actions[:, 1] > actions[:, 0]
+        x_bat[left] -= 1
+        x_bat[left & (x_bat < 0)] = 1
+        x_bat[right] += 1
+        x_bat[right & (x_bat > width - bat_len)] = width - bat_len - 1
+        moved = x_bat != old_x_bat
+        self.__draw_bat(sent, moved)
+        self.__set_pixel(
+            sent, moved, numpy.where(
+                x_bat > old_x_bat, old_x_bat, old_x_bat + bat_len - 1),
+            height - 1, self.COLOUR_BACKGROUND)
+
+        # The ball only moves every x_factor frames
+        waiting = self.__out_of_play != 0
+        self.__out_of_play[waiting] -= 1
+        moving = ~waiting
+        if self.__tick % (self.FRAME_DELAY * self.__x_factor) != 0:
+            moving[:] = False
+
+        self.__set_pixel(
+            sent, moving & (self.__pixel(moving, self.__x, self.__y) !=
+                            self.COLOUR_BAT),
+            self.__x, self.__y, self.COLOUR_BACKGROUND)
+
+        # Move in x and bounce off the sides
+        u, v = self.__u, self.__v
+        self.__x[moving] += u[moving]
+        flip = moving & (self.__x + u < 0)
+        u[flip] = -u[flip]
+        flip = moving & (self.__x + u >= width)
+        u[flip] = -u[flip]
+
+        # Move in y and bounce off the top
+        self.__y[moving] += v[moving]
+        self.__y[moving & (self.__y + v > height)] = height - 1
+        flip = moving & (self.__y + v < 0)
+        v[flip] = -v[flip]
+
+        # Hit a brick where the ball is, or else half a move on
+        hits = self.__hitting_a_brick(sent, moving, self.__x, self.__y)
+        hit = hits != 0
+        self.__set_pixel(
+            sent, hit, self.__x, self.__y, self.COLOUR_BACKGROUND)
+        self.__bounce_off_bricks(sent, hits)
+        ahead = moving & ~hit
+        half_u = _c_divide(u, 2)
+        half_v = _c_divide(v, 2)
+        hits = self.__hitting_a_brick(
+            sent, ahead, self.__x + half_u, self.__y + half_v)
+        hit = hits != 0
+        self.__x[hit] += half_u[hit]
+        self.__y[hit] += half_v[hit]
+        self.__bounce_off_bricks(sent, hits)
+
+        # Bounce off the bat, at an angle that depends on where it hits
+        x = self.__x
+        half_u = _c_divide(u, 2)
+        half_v = _c_divide(v, 2)
+        on_bat = moving & (
+            (self.__pixel(moving, x, self.__y) == self.COLOUR_BAT) |
+            (self.__pixel(moving, x + half_u, self.__y + half_v) ==
+             self.COLOUR_BAT) |
+            (self.__pixel(moving, x, self.__y + half_v) == self.COLOUR_BAT))
+        speeds = numpy.select(
+            [x < x_bat + bat_len // 4, x < x_bat + bat_len // 2,
+             x < x_bat + (3 * bat_len) // 4, x < x_bat + bat_len],
+            [-self.MAX_BALL_SPEED, -(self.MAX_BALL_SPEED // 2),
+             self.MAX_BALL_SPEED // 2, self.MAX_BALL_SPEED], 0)
+        bounce = on_bat & (x < x_bat + bat_len)
+        u[bounce] = speeds[bounce]
+        v[bounce] = -v[bounce]
+        score_up = numpy.zeros(self.__n_games, dtype=bool)
+        if not self.__bricking:
+            score_up = on_bat
+        self.__send_score(sent, score_up, self.SCORE_UP)
+
+        # Lose a life if the ball went past the bat, and serve again
+        lost = moving & (self.__y + v > height)
+        v[lost] = -self.MAX_BALL_SPEED
+        self.__x[lost] = x_bat[lost] + bat_len // 2
+        self.__y[lost] = height - 2
+        u[lost] = numpy.where(
+            self.__rng.next(lost) > 0x7FFFFFFF, -self.MAX_BALL_SPEED,
+            self.MAX_BALL_SPEED)[lost]
+        self.__out_of_play[lost] = self.OUT_OF_PLAY
+        self.__lives[lost] -= 1
+        events[:, BreakoutEvent.LIFE_LOST] = lost
+        self.__send_score(sent, lost, self.SCORE_DOWN)
+
+        # Otherwise draw the ball where it is now
+        drawn = moving & ~lost
+        self.__set_pixel(
+            sent, drawn & (self.__pixel(drawn, self.__x, self.__y) !=
+                           self.COLOUR_BAT),
+            self.__x, self.__y, self.COLOUR_BALL)
+
+    def __hitting_a_brick(
+            self, sent: List[numpy.ndarray], games: numpy.ndarray,
+            x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Look for bricks beside and above or below a point, in the
+        direction of the ball, as ``hitting_a_brick`` does.
+
+        :return: The directions in which bricks were hit, as the bits of
+            ``hitting_a_brick``
+        """
+        right = self.__u > 0
+        hit_x = self.__is_a_brick(
+            sent, games, numpy.where(right, x + 1, x - 1), y)
+        down = self.__v > 0
+        hit_y = self.__is_a_brick(
+            sent, games, x, numpy.where(down, y + 1, y - 1))
+        return (numpy.where(right, 1, 2) * hit_x +
+                numpy.where(down, 4, 8) * hit_y)
+
+    def __is_a_brick(
+            self, sent: List[numpy.ndarray], games: numpy.ndarray,
+            x: numpy.ndarray, y: numpy.ndarray) -> numpy.ndarray:
+        """
+        Knock out the bricks at a point, as ``is_a_brick`` does.
+
+        :return: Whether there was a brick at the point of each game
+        """
+        offset = self.__brick_layer_offset
+        in_layer = games & (
+            (x >= 0) & (y >= 0) & (x < self.__width - 1) &
+            (y < self.__height - 1) & (y >= offset) &
+            (y < offset + self.BRICKS_PER_COLUMN * self.__brick_height))
+        pos_x = numpy.where(in_layer, x, 0) // self.__brick_width
+        pos_y = numpy.where(in_layer, y - offset, 0) // self.__brick_height
+        index = pos_y * self.BRICKS_PER_ROW + pos_x
+        in_layer &= index < self.__bricks.shape[1]
+        index[~in_layer] = 0
+        games_index = numpy.arange(self.__n_games)
+        hit = in_layer & self.__bricks[games_index, index]
+        sent.append(numpy.where(hit, self.__neuron_id(
+            pos_x * self.__brick_width,
+            pos_y * self.__brick_height + offset,
+            self.COLOUR_BACKGROUND, True), -1))
+        self.__bricks[games_index[hit], index[hit]] = False
+        self.__n_bricks[hit] -= 1
+        return hit
+
+    def __bounce_off_bricks(
+            self, sent: List[numpy.ndarray], hits: numpy.ndarray) -> None:
+        """
+        Bounce the ball off the bricks it hit, scoring for each.
+        """
+        across = (hits & 3) != 0
+        self.__u[across] = -self.__u[across]
+        self.__send_score(sent, across, self.SCORE_UP)
+        up_down = (hits & 12) != 0
+        self.__v[up_down] = -self.__v[up_down]
+        self.__send_score(sent, up_down, self.SCORE_UP)
+
+    def __send_score(self, sent: List[numpy.ndarray], games: numpy.ndarray,
+                     event: int) -> None:
+        sent.append(numpy.where(games, event, -1))
+        if event == self.SCORE_UP:
+            self.__scores[games] += 1
+        else:
+            self.__scores[games] -= 1
+
+    def __serve(self, games: numpy.ndarray) -> None:
+        """
+        Put the ball of games above the middle of the bat, going up to
+        the left or right at random.
+        """
+        self.__x[games] = self.__x_bat[games] + self.__bat_len // 2
+        self.__y[games] = self.__height - 2
+        self.__v[games] = -self.MAX_BALL_SPEED
+        self.__u[games] = numpy.where(
+            self.__rng.rand021(games) < 0.5, self.MAX_BALL_SPEED,
+            -self.MAX_BALL_SPEED)[games]
+
+    def __init_frame(self, games: numpy.ndarray) -> None:
+        """
+        Clear the frame and put the bricks back, as ``init_frame`` does;
+        like it, this only clears the first few pixel columns.
+        """
+        rows = (self.__width // 4 + 3) // 4
+        padding = self._FRAME_PADDING
+        self.__frame_buffer[games, padding:padding + rows,
+                            :self.__height] = self.COLOUR_BACKGROUND
+        self.__bricks[games] = self.__bricking == 1
+        self.__n_bricks[games] = self.__bricks.shape[1]
+
+    def __draw_bat(
+            self, sent: List[numpy.ndarray], games: numpy.ndarray) -> None:
+        for i in range(self.__bat_len):
+            self.__set_pixel(sent, games, self.__x_bat + i,
+                             self.__height - 1, self.COLOUR_BAT)
+
+    def __frame_index(self, games: numpy.ndarray, x, y) -> Tuple[
+            numpy.ndarray, numpy.ndarray]:
+        """
+        Find pixels of games in the frame buffer as the binary does, so
+        that a coordinate beyond the end of a column runs into the next.
+
+        :return: The flat index of each pixel, and whether it is inside
+            the padded frame buffer
+        """
+        index = (x * self._FRAME_STRIDE + y) * numpy.ones(
+            self.__n_games, dtype=numpy.int64)
+        self.__strayed |= games & (
+            (index < 0) | (index >= self._FRAME_ROWS * self._FRAME_STRIDE))
+        index += self._FRAME_PADDING * self._FRAME_STRIDE
+        inside = (index >= 0) & (index < self.__frame_buffer[0].size)
+        return numpy.where(inside, index, 0), inside
+
+    def __pixel(self, games: numpy.ndarray, x: numpy.ndarray,
+                y: numpy.ndarray) -> numpy.ndarray:
+        index, inside = self.__frame_index(games, x, y)
+        frame = self.__frame_buffer.reshape(self.__n_games, -1)
+        return numpy.where(
+            inside, frame[numpy.arange(self.__n_games), index],
+            self.COLOUR_BACKGROUND)
+
+    def __set_pixel(self, sent: List[numpy.ndarray], games: numpy.ndarray,
+                    x, y, colour: int) -> None:
+        """
+        Colour a pixel of games, sending its neuron ID, as
+        ``set_pixel_col`` does.
+        """
+        index, inside = self.__frame_index(games, x, y)
+        frame = self.__frame_buffer.reshape(self.__n_games, -1)
+        drawn = games & inside
+        frame[numpy.flatnonzero(drawn), index[drawn]] = colour
+        sent.append(numpy.where(
+            games, self.__neuron_id(x, y, colour, False), -1))
+
+    def __neuron_id(self, i, j, colour: int, bricked: bool):
+        """
+        Get the neuron ID of a pixel, as ``add_event`` makes its key.
+        """
+        neuron_id = (
+            self.SPECIAL_EVENT_MAX + (numpy.asarray(i, dtype=numpy.int64) <<
+                                      (self.__y_bits + 2)) +
+            (numpy.asarray(j, dtype=numpy.int64) << 2) + (int(bricked) << 1) +
+            int(colour != self.COLOUR_BACKGROUND))
+        return neuron_id & 0xFFFFFFFF
@@ -13,8 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from enum import Enum
-from typing import cast, TYPE_CHECKING
+from enum import Enum, IntEnum
+from typing import Any, cast, Dict, TYPE_CHECKING
 
 from spinn_utilities.overrides import overrides
 
@@ -28,13 +28,8 @@ from spinn_front_end_common.abstract_models.\
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.abstract_models.abstract_has_associated_binary \
     import AbstractHasAssociatedBinary
-from spinn_front_end_common.interface.buffer_management \
-    import recording_utilities
 from spinn_front_end_common.interface.ds import (
     DataSpecificationGenerator, DataType)
-from spinn_front_end_common.interface.simulation import simulation_utilities
-from spinn_front_end_common.utilities import constants as \
-    front_end_common_constants
 
 from spynnaker.pyNN.data import SpynnakerDataView
 from spynnaker.pyNN.models.common import PopulationApplicationVertex
@@ -47,26 +42,56 @@ if TYPE_CHECKING:
     from .breakout import Breakout
 
 
+class BreakoutEvent(IntEnum):
+    """
+    The episode events recorded by Breakout.
+    """
+    #: The ball went past the bat
+    LIFE_LOST = 0
+    #: The last brick was hit and the wall was rebuilt
+    BRICKS_CLEARED = 1
+
+
 # ----------------------------------------------------------------------------
 # BreakoutMachineVertex
 # ----------------------------------------------------------------------------
 class BreakoutMachineVertex(SpinnGymMachineVertex):
     BREAKOUT_REGION_BYTES = 2 * BYTES_PER_WORD
-    PARAM_REGION_BYTES = 40
 
     _BREAKOUT_REGIONS = Enum(
         value="_BREAKOUT_REGIONS",
         names=[('SYSTEM', 0),
                ('BREAKOUT', 1),
                ('RECORDING', 2),
-               ('PARAMS', 3)])
+               ('PARAMS', 3),
+               ('PROVENANCE', 4)])
+
+    PROVENANCE_ITEMS = (
+        "Input_packets_received", "Left_key_spikes_received",
+        "Right_key_spikes_received", "Bat_moves_left", "Bat_moves_right",
+        "Spikes_sent")
+
+    PARAMETER_SCHEMA = (
+        ("x_factor", DataType.UINT32),
+        ("y_factor", DataType.UINT32),
+        ("bricking", DataType.UINT32),
+        *SpinnGymMachineVertex.RANDOM_SEED_SCHEMA,
+        ("record_changes_only", DataType.UINT32),
+        ("reset_flags", DataType.UINT32))
+
+    REWRITABLE_PARAMETERS = ("bricking",)
+
+    EVENT_TYPES = BreakoutEvent
+
+    EVENT_INTERVAL_MS = 1000
 
     __slots__ = ("_x_factor", "_y_factor", "_colour_bits", "_bricking")
 
     def __init__(
             self, label, app_vertex: 'Breakout', n_neurons,
             simulation_duration_ms, random_seed,
-            x_factor, y_factor, colour_bits, bricking):
+            x_factor, y_factor, colour_bits, bricking,
+            record_changes_only=False):
         """
 
         :param label: The optional name of the vertex
@@ -85,6 +110,9 @@ class BreakoutMachineVertex(SpinnGymMachineVertex):
         :param y_factor:
         :param colour_bits:
         :param bricking:
+        :param bool record_changes_only:
+            Whether to record the score, with the tick, only when it
+            changes
 
         :raise PacmanInvalidParameterException:
             If one of the constraints is not valid
@@ -95,8 +123,8 @@ class BreakoutMachineVertex(SpinnGymMachineVertex):
         # Superclasses
         super(BreakoutMachineVertex, self).__init__(
             label, app_vertex, n_neurons,
-            self.BREAKOUT_REGION_BYTES + self.PARAM_REGION_BYTES,
-            simulation_duration_ms, random_seed)
+            self.BREAKOUT_REGION_BYTES,
+            simulation_duration_ms, random_seed, record_changes_only)
 
         self._x_factor = x_factor
         self._y_factor = y_factor
@@ -109,6 +137,15 @@ class BreakoutMachineVertex(SpinnGymMachineVertex):
         # type checked by init
         return cast('Breakout', self._app_vertex)
 
+    @property
+    @overrides(SpinnGymMachineVertex.parameters)
+    def parameters(self) -> Dict[str, Any]:
+        parameters = super(BreakoutMachineVertex, self).parameters
+        parameters.update(
+            x_factor=self._x_factor, y_factor=self._y_factor,
+            colour_bits=self._colour_bits, bricking=self._bricking)
+        return parameters
+
     # ------------------------------------------------------------------------
     # AbstractGeneratesDataSpecification overrides
     # ------------------------------------------------------------------------
@@ -122,28 +159,11 @@ class BreakoutMachineVertex(SpinnGymMachineVertex):
         spec.comment("\nReserving memory space for data regions:\n\n")
 
         # Reserve memory:
-        spec.reserve_memory_region(
-            region=BreakoutMachineVertex._BREAKOUT_REGIONS.SYSTEM.value,
-            size=front_end_common_constants.SYSTEM_BYTES_REQUIREMENT,
-            label='setup')
-        spec.reserve_memory_region(
-            region=BreakoutMachineVertex._BREAKOUT_REGIONS.BREAKOUT.value,
-            size=self.BREAKOUT_REGION_BYTES, label='BreakoutKey')
-        # Reserve recording region
-        spec.reserve_memory_region(
-            BreakoutMachineVertex._BREAKOUT_REGIONS.RECORDING.value,
-            recording_utilities.get_recording_header_size(1))
-        spec.reserve_memory_region(
-            region=BreakoutMachineVertex._BREAKOUT_REGIONS.PARAMS.value,
-            size=self.PARAM_REGION_BYTES, label='Parameters')
+        self.reserve_memory_regions(spec)
 
         # Write setup region
         spec.comment("\nWriting setup region:\n")
-        spec.switch_write_focus(
-            BreakoutMachineVertex._BREAKOUT_REGIONS.SYSTEM.value)
-        assert isinstance(vertex, AbstractHasAssociatedBinary)
-        spec.write_array(simulation_utilities.get_simulation_header_array(
-            vertex.get_binary_file_name()))
+        self.write_system_region(spec)
 
         # Write breakout region containing routing key to transmit with
         spec.comment("\nWriting breakout region:\n")
@@ -163,21 +183,10 @@ class BreakoutMachineVertex(SpinnGymMachineVertex):
 
         # Write recording region for score
         spec.comment("\nWriting breakout recording region:\n")
-        spec.switch_write_focus(
-            BreakoutMachineVertex._BREAKOUT_REGIONS.RECORDING.value)
-        spec.write_array(recording_utilities.get_recording_header_array(
-            [self._recording_size]))
+        self.write_recording_region(spec)
 
         spec.comment("\nWriting breakout param region:\n")
-        spec.switch_write_focus(
-            BreakoutMachineVertex._BREAKOUT_REGIONS.PARAMS.value)
-        spec.write_value(self._x_factor, data_type=DataType.UINT32)
-        spec.write_value(self._y_factor, data_type=DataType.UINT32)
-        spec.write_value(self._bricking, data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[0], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[1], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[2], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[3], data_type=DataType.UINT32)
+        self.write_parameter_region(spec)
 
         # End-of-Spec:
         spec.end_specification()
@@ -187,6 +196,31 @@ class BreakoutMachineVertex(SpinnGymMachineVertex):
         return helpful_functions.locate_memory_region_for_placement(
             placement, self._BREAKOUT_REGIONS.RECORDING.value)
 
+    @property
+    @overrides(SpinnGymMachineVertex._provenance_region_id)
+    def _provenance_region_id(self) -> int:
+        return self._BREAKOUT_REGIONS.PROVENANCE.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._parameter_region_id)
+    def _parameter_region_id(self) -> int:
+        return self._BREAKOUT_REGIONS.PARAMS.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._system_region_id)
+    def _system_region_id(self) -> int:
+        return self._BREAKOUT_REGIONS.SYSTEM.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._key_region_id)
+    def _key_region_id(self) -> int:
+        return self._BREAKOUT_REGIONS.BREAKOUT.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._recording_region_id)
+    def _recording_region_id(self) -> int:
+        return self._BREAKOUT_REGIONS.RECORDING.value
+
     @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
     def get_binary_file_name(self) -> str:
         return "breakout.aplx"
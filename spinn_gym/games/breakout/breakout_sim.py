@@ -19,7 +19,7 @@ def get_scores(breakout_pop):
     b_vertex = breakout_pop._vertex  # pylint: disable=protected-access
     scores = b_vertex.get_recorded_data('score')
 
-    return scores.tolist()
+    return scores["Score"]
 
 
 def row_col_to_input_breakout(row, col, is_on_input, row_bits, event_bits=1,
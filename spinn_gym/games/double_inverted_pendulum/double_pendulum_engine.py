@@ -0,0 +1,480 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Optional, Tuple
+
+import numpy
+
+from spinn_gym.games.inverted_pendulum.pendulum_engine import (
+    push_motor_force, to_s1615)
+from spinn_gym.utilities.seed_streams import resolve_random_seeds
+from spinn_gym.utilities.spike_encoders import receptive_bins
+
+_f32 = numpy.float32
+
+# The resolution of the accum type that the binary takes sines in
+_ACCUM_SCALE = 32768.0
+
+
+def _accum_sin_cos(
+        angle: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Take the sine and cosine of angles through the accum type, as ``sink``
+    and ``cosk`` do in the binary, to within the rounding of their result.
+    """
+    angle = numpy.trunc(angle.astype(numpy.float64) * _ACCUM_SCALE) / \
+        _ACCUM_SCALE
+    sin = numpy.round(numpy.sin(angle) * _ACCUM_SCALE) / _ACCUM_SCALE
+    cos = numpy.round(numpy.cos(angle) * _ACCUM_SCALE) / _ACCUM_SCALE
+    return sin.astype(_f32), cos.astype(_f32)
+
+
+# ----------------------------------------------------------------------------
+# DoublePendulumEngine
+# ----------------------------------------------------------------------------
+class DoublePendulumEngine(object):
+    """
+    Many carts, each balancing two poles, simulated on the host with NumPy
+    as ``double_inverted_pendulum.c`` simulates one on the machine.
+
+    All the pendulums are stepped together, one tick per call of
+    :py:meth:`step`.  The spikes sent are counted for each neuron of
+    :py:class:`~spinn_gym.DoublePendulum` with the same parameters:
+    ``number_of_bins`` receptive bins for each variable of
+    :py:attr:`VARIABLES`, in that order.  The binary encodes with
+    receptive bins whatever the encoding, and draws their normal variates
+    from a generator that the host can't reproduce, so here they come from
+    a NumPy generator seeded with the seeds of all the pendulums.
+
+    Each pole may be given its own length and starting angle, so that a
+    whole sweep can be run at once.  The binary takes the sines of the
+    angles in fixed point, which is followed to within its rounding, and
+    starts the second pole at 0.1 degrees whatever ``pole2_angle`` is,
+    which here is only the default.
+    """
+
+    GRAVITY = _f32(-9.8)
+    MASS_CART = _f32(1)
+    MASS_POLE_PER_METRE = _f32(0.1)
+    FRICTION_CART_ON_TRACK = _f32(0.0005)
+    FRICTION_POLE_HINGE = _f32(0.000002)
+
+    TRACK_LENGTH = _f32(4.8)
+    MAX_MOTOR_FORCE = _f32(10)
+    MIN_MOTOR_FORCE = _f32(-10)
+    HIGHEND_CART_V = _f32(5)
+    HIGHEND_POLE_V = _f32(5)
+    MAX_POLE_ANGLE = _f32(_f32(0.2) * numpy.pi)
+    MIN_POLE_ANGLE = -MAX_POLE_ANGLE
+
+    #: The order of the variables of the state in the neuron IDs
+    VARIABLES = ("angle", "angle_2", "cart", "angle_v", "angle_2_v",
+                 "cart_v")
+
+    __slots__ = (
+        "__n_pendulums", "__time_increment", "__number_of_bins",
+        "__max_firing_prob", "__bin_overlap", "__half_pole_length",
+        "__half_pole2_length", "__initial_pole_angle",
+        "__initial_pole2_angle", "__force_increment", "__tau_force",
+        "__rng", "__cart_position", "__cart_velocity", "__pole_angle",
+        "__pole_velocity", "__pole2_angle", "__pole2_velocity",
+        "__motor_force", "__max_balance_time", "__in_bounds",
+        "__tick_in_frame", "__tick")
+
+    def __init__(self, n_pendulums: int, time_increment: int = 20,
+                 pole_length=1.0, pole_angle=0.1, pole2_length=0.1,
+                 pole2_angle=0.1, force_increments=100,
+                 max_firing_rate: int = 100, number_of_bins: int = 20,
+                 random_seed=None, bin_overlap: float = 2, tau_force=0):
+        """
+        :param int n_pendulums: The number of pendulums to simulate
+        :param int time_increment: The ticks between updates of the state
+        :param pole_length:
+            The length of the first pole in metres; a value for each
+            pendulum or one for all of them
+        :param pole_angle:
+            The starting angle of the first pole in degrees; a value for
+            each pendulum or one for all of them
+        :param pole2_length:
+            The length of the second pole in metres; a value for each
+            pendulum or one for all of them
+        :param pole2_angle:
+            The starting angle of the second pole in degrees; a value for
+            each pendulum or one for all of them
+        :param force_increments:
+            How many spikes it takes to go from the most backward to the
+            most forward force; a value for each pendulum or one for all
+        :param int max_firing_rate: The highest rate of a neuron, in Hz
+        :param int number_of_bins: The neurons of each variable
+        :param random_seed:
+            The seeds of the pendulums; see
+            :py:func:`~spinn_gym.utilities.resolve_random_seeds`
+        :param float bin_overlap: How much the bins overlap
+        :param tau_force:
+            The time constant of the motor force, or 0 to use each force
+            for a single update; a value for each pendulum or one for all
+        :raises ValueError: If a pole has no length
+        """
+        self.__n_pendulums = n_pendulums
+        self.__time_increment = time_increment
+        self.__number_of_bins = number_of_bins
+        self.__max_firing_prob = _f32(max_firing_rate) * _f32(0.001)
+        self.__bin_overlap = float(to_s1615(bin_overlap))
+
+        shape = (n_pendulums, )
+        self.__half_pole_length = self.__half_length(pole_length, shape)
+        self.__half_pole2_length = self.__half_length(pole2_length, shape)
+        self.__initial_pole_angle = numpy.broadcast_to(
+            (to_s1615(pole_angle) / _f32(180) * numpy.pi).astype(_f32),
+            shape).copy()
+        self.__initial_pole2_angle = numpy.broadcast_to(
+            (numpy.asarray(pole2_angle, dtype=_f32) / _f32(180) *
+             numpy.pi).astype(_f32), shape).copy()
+        self.__force_increment = numpy.broadcast_to(
+            (self.MAX_MOTOR_FORCE - self.MIN_MOTOR_FORCE) /
+            numpy.asarray(force_increments, dtype=_f32), shape).copy()
+        self.__tau_force = numpy.broadcast_to(
+            to_s1615(tau_force), shape).copy()
+
+        seeds = resolve_random_seeds(random_seed, n_pendulums)
+        self.__rng = numpy.random.default_rng(
+            numpy.array(seeds, dtype=numpy.uint32).ravel())
+
+        self.__cart_position = numpy.zeros(shape, dtype=_f32)
+        self.__cart_velocity = numpy.zeros(shape, dtype=_f32)
+        self.__pole_angle = numpy.zeros(shape, dtype=_f32)
+        self.__pole_velocity = numpy.zeros(shape, dtype=_f32)
+        self.__pole2_angle = numpy.zeros(shape, dtype=_f32)
+        self.__pole2_velocity = numpy.zeros(shape, dtype=_f32)
+        self.__motor_force = numpy.zeros(shape, dtype=_f32)
+        self.__max_balance_time = numpy.zeros(shape, dtype=_f32)
+        self.__in_bounds = numpy.zeros(shape, dtype=bool)
+        self.__tick_in_frame = numpy.zeros(shape, dtype=numpy.int64)
+        self.__tick = 0
+        self.reset()
+
+    @staticmethod
+    def __half_length(length, shape: Tuple[int]) -> numpy.ndarray:
+        """
+        Get half the length of a pole of each pendulum, as the binary
+        reads it.
+        """
+        half_length = to_s1615(length) * _f32(0.5)
+        if (half_length <= 0).any():
+            raise ValueError(f"Each pole must have a length, not {length}")
+        return numpy.broadcast_to(half_length, shape).copy()
+
+    @property
+    def n_pendulums(self) -> int:
+        """
+        The number of pendulums.
+
+        :rtype: int
+        """
+        return self.__n_pendulums
+
+    @property
+    def n_neurons(self) -> int:
+        """
+        The number of neurons that the pendulums spike from, as the number
+        of atoms of :py:class:`~spinn_gym.DoublePendulum` with the same
+        parameters.
+
+        :rtype: int
+        """
+        return len(self.VARIABLES) * self.__number_of_bins
+
+    @property
+    def tick(self) -> int:
+        """
+        The number of ticks simulated.
+
+        :rtype: int
+        """
+        return self.__tick
+
+    @property
+    def cart_positions(self) -> numpy.ndarray:
+        """
+        The position of each cart along the track, in metres.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__cart_position.copy()
+
+    @property
+    def cart_velocities(self) -> numpy.ndarray:
+        """
+        The velocity of each cart, in metres per second.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__cart_velocity.copy()
+
+    @property
+    def pole_angles(self) -> numpy.ndarray:
+        """
+        The angle of the first pole of each cart, in radians.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__pole_angle.copy()
+
+    @property
+    def pole_velocities(self) -> numpy.ndarray:
+        """
+        The angular velocity of the first pole of each cart, in radians
+        per second.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__pole_velocity.copy()
+
+    @property
+    def pole2_angles(self) -> numpy.ndarray:
+        """
+        The angle of the second pole of each cart, in radians.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__pole2_angle.copy()
+
+    @property
+    def pole2_velocities(self) -> numpy.ndarray:
+        """
+        The angular velocity of the second pole of each cart, in radians
+        per second.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__pole2_velocity.copy()
+
+    @property
+    def motor_forces(self) -> numpy.ndarray:
+        """
+        The force each motor is pushing its cart with.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__motor_force.copy()
+
+    @property
+    def max_balance_times(self) -> numpy.ndarray:
+        """
+        The tick of the last update of each pendulum while both its poles
+        were balanced; the score of a reward based pendulum.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__max_balance_time.copy()
+
+    @property
+    def in_bounds(self) -> numpy.ndarray:
+        """
+        Whether each pendulum is still in play; once the cart leaves the
+        track or either pole falls too far, the pendulum stops until
+        reset.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__in_bounds.copy()
+
+    def reset(self, pendulums: Optional[numpy.ndarray] = None) -> None:
+        """
+        Put pendulums back into their starting state, as a reset request
+        does between runs on the machine.
+
+        :param pendulums:
+            Which pendulums to reset, as a mask or indices; all if None
+        :type pendulums: ~numpy.ndarray or None
+        """
+        mask = numpy.zeros(self.__n_pendulums, dtype=bool)
+        if pendulums is None:
+            mask[:] = True
+        else:
+            mask[pendulums] = True
+        self.__cart_position[mask] = self.TRACK_LENGTH * _f32(0.5)
+        self.__cart_velocity[mask] = 0
+        self.__pole_angle[mask] = self.__initial_pole_angle[mask]
+        self.__pole_velocity[mask] = 0
+        self.__pole2_angle[mask] = self.__initial_pole2_angle[mask]
+        self.__pole2_velocity[mask] = 0
+        self.__motor_force[mask] = 0
+        self.__max_balance_time[mask] = 0
+        self.__in_bounds[mask] = True
+        self.__tick_in_frame[mask] = 0
+
+    def step(self, actions: numpy.ndarray) -> numpy.ndarray:
+        """
+        Simulate one tick of every pendulum.
+
+        :param ~numpy.ndarray actions:
+            The number of spikes received by each pendulum since the last
+            tick, from its backward then its forward motor neuron, as an
+            array of shape (n_pendulums, 2).  The backward spikes are
+            taken first; see :py:func:`.push_motor_force`.
+        :return: The number of spikes sent from each neuron of each
+            pendulum
+        :rtype: ~numpy.ndarray
+        """
+        actions = numpy.asarray(actions)
+        if actions.shape != (self.__n_pendulums, 2):
+            raise ValueError(
+                f"Actions must have shape ({self.__n_pendulums}, 2), not "
+                f"{actions.shape}")
+
+        push_motor_force(
+            self.__motor_force, actions, self.__force_increment,
+            self.MIN_MOTOR_FORCE, self.MAX_MOTOR_FORCE)
+
+        if self.__tick == 0:
+            self.__update_state(
+                numpy.ones(self.__n_pendulums, dtype=bool), _f32(0))
+
+        # Update the state at the end of each frame
+        self.__tick_in_frame += 1
+        frame = self.__tick_in_frame == self.__time_increment
+        update = frame & self.__in_bounds
+        self.__max_balance_time[update] = _f32(self.__tick)
+        self.__in_bounds &= self.__update_state(
+            update, _f32(self.__time_increment) / _f32(1000))
+        self.__tick_in_frame[frame] = 0
+
+        spiking = receptive_bins(
+            self._relative_state(), self.__number_of_bins,
+            self.__bin_overlap, self.__max_firing_prob, self.__rng)
+        spiking &= self.__in_bounds[:, None, None]
+        self.__tick += 1
+        return spiking.reshape(self.__n_pendulums, -1).astype(numpy.uint8)
+
+    def __pole_forces(
+            self, half_length: numpy.ndarray, velocity: numpy.ndarray,
+            sin: numpy.ndarray, cos: numpy.ndarray
+            ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Work out the two parts of the force that a pole puts on its cart,
+        and the mass that it adds to it.
+        """
+        mass_pole = self.MASS_POLE_PER_METRE * half_length
+        pole_angle_force = mass_pole * half_length * velocity * velocity * sin
+        angle_scalar = _f32(0.75) * mass_pole * cos
+        friction_and_gravity = (
+            (self.FRICTION_POLE_HINGE * velocity) /
+            (mass_pole * half_length) + self.GRAVITY * sin)
+        effective_pole_mass = mass_pole * (
+            _f32(1) - _f32(0.75) * cos * cos)
+        return (pole_angle_force, angle_scalar * friction_and_gravity,
+                effective_pole_mass)
+
+    def __pole_acceleration(
+            self, half_length: numpy.ndarray, velocity: numpy.ndarray,
+            sin: numpy.ndarray, cos: numpy.ndarray,
+            cart_acceleration: numpy.ndarray) -> numpy.ndarray:
+        """
+        Work out how fast a pole is turning faster.
+        """
+        mass_pole = self.MASS_POLE_PER_METRE * half_length
+        length_scalar = _f32(-3) / (_f32(4) * half_length)
+        return length_scalar * (
+            cart_acceleration * cos + self.GRAVITY * sin +
+            (self.FRICTION_POLE_HINGE * velocity) /
+            (mass_pole * half_length))
+
+    def __update_state(
+            self, which: numpy.ndarray, time_step: numpy.float32
+            ) -> numpy.ndarray:
+        """
+        Move some pendulums on by a time step, as ``update_state`` does.
+
+        :return: Whether each pendulum is still in bounds; True for those
+            not moved
+        """
+        half_length = self.__half_pole_length[which]
+        half_length2 = self.__half_pole2_length[which]
+        pole_velocity = self.__pole_velocity[which]
+        pole2_velocity = self.__pole2_velocity[which]
+        cart_velocity = self.__cart_velocity[which]
+        force = self.__motor_force[which]
+        sin, cos = _accum_sin_cos(self.__pole_angle[which])
+        sin2, cos2 = _accum_sin_cos(self.__pole2_angle[which])
+
+        angle_force, scaled_force, effective_pole_mass = self.__pole_forces(
+            half_length, pole_velocity, sin, cos)
+        effective_force = angle_force + scaled_force
+        angle_force, scaled_force, effective_pole2_mass = \
+            self.__pole_forces(half_length2, pole2_velocity, sin2, cos2)
+        effective_force = effective_force + angle_force + scaled_force
+        effective_pole_mass = effective_pole_mass + effective_pole2_mass
+
+        friction = numpy.where(
+            cart_velocity > 0, -self.FRICTION_CART_ON_TRACK,
+            self.FRICTION_CART_ON_TRACK)
+        cart_acceleration = (force + friction + effective_force) / (
+            self.MASS_CART + effective_pole_mass)
+
+        pole_velocity = self.__pole_acceleration(
+            half_length, pole_velocity, sin, cos, cart_acceleration
+            ) * time_step + pole_velocity
+        angle = pole_velocity * time_step + self.__pole_angle[which]
+        pole2_velocity = self.__pole_acceleration(
+            half_length2, pole2_velocity, sin2, cos2, cart_acceleration
+            ) * time_step + pole2_velocity
+        angle2 = pole2_velocity * time_step + self.__pole2_angle[which]
+        cart_velocity = cart_acceleration * time_step + cart_velocity
+        cart_position = cart_velocity * time_step + \
+            self.__cart_position[which]
+
+        tau_force = self.__tau_force[which]
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            force = numpy.where(
+                tau_force != 0,
+                force * numpy.exp(numpy.float64(time_step) / tau_force),
+                0).astype(_f32)
+
+        self.__pole_velocity[which] = pole_velocity
+        self.__pole_angle[which] = angle
+        self.__pole2_velocity[which] = pole2_velocity
+        self.__pole2_angle[which] = angle2
+        self.__cart_velocity[which] = cart_velocity
+        self.__cart_position[which] = cart_position
+        self.__motor_force[which] = force
+
+        in_bounds = numpy.ones(self.__n_pendulums, dtype=bool)
+        in_bounds[which] = ~(
+            (cart_position > self.TRACK_LENGTH) | (cart_position < 0) |
+            (angle > self.MAX_POLE_ANGLE) | (angle < self.MIN_POLE_ANGLE) |
+            (angle2 > self.MAX_POLE_ANGLE) | (angle2 < self.MIN_POLE_ANGLE))
+        return in_bounds
+
+    def _relative_state(self) -> numpy.ndarray:
+        """
+        Scale each variable of the state of each pendulum to between 0 and
+        1, as the receptive bins of the binary do.
+
+        :return: The variables, in the order of :py:attr:`VARIABLES`
+        :rtype: ~numpy.ndarray
+        """
+        max_angle = self.MAX_POLE_ANGLE
+        highend_pole_v = self.HIGHEND_POLE_V
+        return numpy.stack((
+            (self.__pole_angle + max_angle) / (_f32(2) * max_angle),
+            (self.__pole2_angle + max_angle) / (_f32(2) * max_angle),
+            self.__cart_position / self.TRACK_LENGTH,
+            (self.__pole_velocity + highend_pole_v) /
+            (_f32(2) * highend_pole_v),
+            (self.__pole2_velocity + highend_pole_v) /
+            (_f32(2) * highend_pole_v),
+            (self.__cart_velocity + self.HIGHEND_CART_V) /
+            (_f32(2) * self.HIGHEND_CART_V)), axis=1)
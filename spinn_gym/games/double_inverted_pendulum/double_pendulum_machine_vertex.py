@@ -14,6 +14,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from enum import Enum
+from typing import Any, Dict
 
 from spinn_utilities.overrides import overrides
 
@@ -23,13 +24,8 @@ from pacman.model.placements import Placement
 from spinn_front_end_common.utilities import helpful_functions
 from spinn_front_end_common.abstract_models.abstract_has_associated_binary \
     import AbstractHasAssociatedBinary
-from spinn_front_end_common.interface.buffer_management \
-    import recording_utilities
 from spinn_front_end_common.interface.ds import (
     DataSpecificationGenerator, DataType)
-from spinn_front_end_common.interface.simulation import simulation_utilities
-from spinn_front_end_common.utilities import constants as \
-    front_end_common_constants
 
 # sPyNNaker imports
 from spynnaker.pyNN.data import SpynnakerDataView
@@ -44,7 +40,37 @@ from spinn_gym.games import SpinnGymMachineVertex
 # ----------------------------------------------------------------------------
 class DoublePendulumMachineVertex(SpinnGymMachineVertex):
     PENDULUM_REGION_BYTES = 4
-    DATA_REGION_BYTES = 17 * 4
+
+    PROVENANCE_ITEMS = (
+        "Input_packets_received", "Backward_motor_spikes_received",
+        "Forward_motor_spikes_received", "Spikes_sent")
+
+    PARAMETER_SCHEMA = (
+        ("encoding", DataType.UINT32),
+        ("time_increment", DataType.UINT32),
+        ("pole_length", DataType.S1615),
+        ("pole_angle", DataType.S1615),
+        ("pole2_length", DataType.S1615),
+        ("pole2_angle", DataType.S1615),
+        ("reward_based", DataType.UINT32),
+        ("force_increments", DataType.UINT32),
+        ("max_firing_rate", DataType.UINT32),
+        ("number_of_bins", DataType.UINT32),
+        ("central", DataType.UINT32),
+        *SpinnGymMachineVertex.RANDOM_SEED_SCHEMA,
+        ("bin_overlap", DataType.S1615),
+        ("tau_force", DataType.S1615),
+        ("record_changes_only", DataType.UINT32),
+        ("reset_flags", DataType.UINT32))
+
+    # The encoding sets the number of neurons, and so the keys sent, and
+    # reward_based the layout of the score, so neither can be changed
+    # between runs
+    REWRITABLE_PARAMETERS = (
+        "force_increments", "max_firing_rate", "central", "bin_overlap",
+        "tau_force")
+
+    SCORE_INTERVAL_MS = 100
 
     __slots__ = (
         "_bin_overlap", "_central", "_encoding", "_force_increments",
@@ -57,14 +83,16 @@ class DoublePendulumMachineVertex(SpinnGymMachineVertex):
         names=[('SYSTEM', 0),
                ('PENDULUM', 1),
                ('RECORDING', 2),
-               ('DATA', 3)])
+               ('DATA', 3),
+               ('PROVENANCE', 4)])
 
     def __init__(
             self, label, app_vertex, n_neurons,
             simulation_duration_ms, random_seed,
             encoding, time_increment, pole_length, pole_angle, pole2_length,
             pole2_angle, reward_based, force_increments, max_firing_rate,
-            number_of_bins, central, bin_overlap, tau_force):
+            number_of_bins, central, bin_overlap, tau_force,
+            record_changes_only=False):
         """
 
         :param label: The optional name of the vertex
@@ -94,6 +122,9 @@ class DoublePendulumMachineVertex(SpinnGymMachineVertex):
         :param central:
         :param bin_overlap:
         :param tau_force:
+        :param bool record_changes_only:
+            Whether to record the score, with the tick, only when it
+            changes
 
         :raise PacmanInvalidParameterException:
             If one of the constraints is not valid
@@ -102,11 +133,14 @@ class DoublePendulumMachineVertex(SpinnGymMachineVertex):
             If a not None app_vertex is not an ApplicationVertex
         """
 
+        # The recording size depends on what is recorded
+        self._reward_based = reward_based
+
         # Superclasses
         super(DoublePendulumMachineVertex, self).__init__(
             label, app_vertex, n_neurons,
-            self.PENDULUM_REGION_BYTES + self.DATA_REGION_BYTES,
-            simulation_duration_ms,  random_seed)
+            self.PENDULUM_REGION_BYTES,
+            simulation_duration_ms,  random_seed, record_changes_only)
 
         self._encoding = encoding
 
@@ -118,7 +152,6 @@ class DoublePendulumMachineVertex(SpinnGymMachineVertex):
 
         self._force_increments = force_increments
         self._time_increment = time_increment
-        self._reward_based = reward_based
 
         self._max_firing_rate = max_firing_rate
         self._number_of_bins = number_of_bins
@@ -126,6 +159,26 @@ class DoublePendulumMachineVertex(SpinnGymMachineVertex):
         self._bin_overlap = bin_overlap
         self._tau_force = tau_force
 
+    @overrides(SpinnGymMachineVertex._get_score_words)
+    def _get_score_words(self) -> int:
+        # The cart position and both pole angles, unless rewarded
+        return 1 if self._reward_based else 3
+
+    @property
+    @overrides(SpinnGymMachineVertex.parameters)
+    def parameters(self) -> Dict[str, Any]:
+        parameters = super(DoublePendulumMachineVertex, self).parameters
+        parameters.update(
+            encoding=self._encoding, time_increment=self._time_increment,
+            pole_length=self._pole_length, pole_angle=self._pole_angle,
+            pole2_length=self._pole2_length, pole2_angle=self._pole2_angle,
+            reward_based=self._reward_based,
+            force_increments=self._force_increments,
+            max_firing_rate=self._max_firing_rate,
+            number_of_bins=self._number_of_bins, central=self._central,
+            bin_overlap=self._bin_overlap, tau_force=self._tau_force)
+        return parameters
+
     # ------------------------------------------------------------------------
     # AbstractGeneratesDataSpecification overrides
     # ------------------------------------------------------------------------
@@ -139,28 +192,11 @@ class DoublePendulumMachineVertex(SpinnGymMachineVertex):
         spec.comment("\nReserving memory space for data regions:\n\n")
 
         # Reserve memory:
-        spec.reserve_memory_region(
-            region=self._DOUBLE_PENDULUM_REGIONS.SYSTEM.value,
-            size=front_end_common_constants.SYSTEM_BYTES_REQUIREMENT,
-            label='setup')
-        spec.reserve_memory_region(
-            region=self._DOUBLE_PENDULUM_REGIONS.PENDULUM.value,
-            size=self.PENDULUM_REGION_BYTES, label='PendulumVertex')
-        # reserve recording region
-        spec.reserve_memory_region(
-            self._DOUBLE_PENDULUM_REGIONS.RECORDING.value,
-            recording_utilities.get_recording_header_size(1))
-        spec.reserve_memory_region(
-            region=self._DOUBLE_PENDULUM_REGIONS.DATA.value,
-            size=self.DATA_REGION_BYTES, label='PendulumData')
+        self.reserve_memory_regions(spec)
 
         # Write setup region
         spec.comment("\nWriting setup region:\n")
-        spec.switch_write_focus(
-            self._DOUBLE_PENDULUM_REGIONS.SYSTEM.value)
-        assert isinstance(vertex, AbstractHasAssociatedBinary)
-        spec.write_array(simulation_utilities.get_simulation_header_array(
-            vertex.get_binary_file_name()))
+        self.write_system_region(spec)
 
         # Write pendulum region containing routing key to transmit with
         spec.comment("\nWriting double pendulum region:\n")
@@ -172,32 +208,11 @@ class DoublePendulumMachineVertex(SpinnGymMachineVertex):
 
         # Write recording region for score
         spec.comment("\nWriting double pendulum recording region:\n")
-        spec.switch_write_focus(
-            self._DOUBLE_PENDULUM_REGIONS.RECORDING.value)
-        spec.write_array(recording_utilities.get_recording_header_array(
-            [self._recording_size]))
+        self.write_recording_region(spec)
 
         # Write probabilites for arms
         spec.comment("\nWriting double pendulum data region:\n")
-        spec.switch_write_focus(
-            self._DOUBLE_PENDULUM_REGIONS.DATA.value)
-        spec.write_value(self._encoding, data_type=DataType.UINT32)
-        spec.write_value(self._time_increment, data_type=DataType.UINT32)
-        spec.write_value(self._pole_length, data_type=DataType.S1615)
-        spec.write_value(self._pole_angle, data_type=DataType.S1615)
-        spec.write_value(self._pole2_length, data_type=DataType.S1615)
-        spec.write_value(self._pole2_angle, data_type=DataType.S1615)
-        spec.write_value(self._reward_based, data_type=DataType.UINT32)
-        spec.write_value(self._force_increments, data_type=DataType.UINT32)
-        spec.write_value(self._max_firing_rate, data_type=DataType.UINT32)
-        spec.write_value(self._number_of_bins, data_type=DataType.UINT32)
-        spec.write_value(self._central, data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[0], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[1], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[2], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[3], data_type=DataType.UINT32)
-        spec.write_value(self._bin_overlap, data_type=DataType.S1615)
-        spec.write_value(self._tau_force, data_type=DataType.S1615)
+        self.write_parameter_region(spec)
 
         # End-of-Spec:
         spec.end_specification()
@@ -207,6 +222,31 @@ class DoublePendulumMachineVertex(SpinnGymMachineVertex):
         return helpful_functions.locate_memory_region_for_placement(
             placement, self._DOUBLE_PENDULUM_REGIONS.RECORDING.value)
 
+    @property
+    @overrides(SpinnGymMachineVertex._provenance_region_id)
+    def _provenance_region_id(self) -> int:
+        return self._DOUBLE_PENDULUM_REGIONS.PROVENANCE.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._parameter_region_id)
+    def _parameter_region_id(self) -> int:
+        return self._DOUBLE_PENDULUM_REGIONS.DATA.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._system_region_id)
+    def _system_region_id(self) -> int:
+        return self._DOUBLE_PENDULUM_REGIONS.SYSTEM.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._key_region_id)
+    def _key_region_id(self) -> int:
+        return self._DOUBLE_PENDULUM_REGIONS.PENDULUM.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._recording_region_id)
+    def _recording_region_id(self) -> int:
+        return self._DOUBLE_PENDULUM_REGIONS.RECORDING.value
+
     @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
     def get_binary_file_name(self) -> str:
         return "double_inverted_pendulum.aplx"
@@ -19,6 +19,7 @@ from spinn_utilities.overrides import overrides
 
 # common imports
 from spinn_gym.games import SpinnGymApplicationVertex
+from spinn_gym.utilities.seed_streams import resolve_random_seed
 
 # Pendulum imports
 from spinn_gym.games.inverted_pendulum.inverted_pendulum_machine_vertex \
@@ -31,16 +32,15 @@ from spinn_gym.games.inverted_pendulum.inverted_pendulum_machine_vertex \
 class Pendulum(SpinnGymApplicationVertex):
 
     ONE_WEEK_IN_MS = 1000 * 60 * 60 * 24 * 7  # 1 week
-    RANDOM_SEED = [0, 1, 2, 3]
-
-    __slots__ = ()
+    __slots__ = ("__reward_based", )
 
     def __init__(self, encoding=0, time_increment=20,
                  pole_length=1.0, pole_angle=0.1, reward_based=1,
                  force_increments=100, max_firing_rate=100,
                  number_of_bins=20, central=1, random_seed=None,
                  bin_overlap=2, tau_force=0, label="pole",
-                 simulation_duration_ms=ONE_WEEK_IN_MS):
+                 simulation_duration_ms=ONE_WEEK_IN_MS,
+                 record_changes_only=False):
         """
 
         :param encoding: 0 rate, 1 receptive bins, 2 spike time, 3 rank
@@ -53,13 +53,19 @@ class Pendulum(SpinnGymApplicationVertex):
         :param number_of_bins:
         :param central:
         :param random_seed:
+            The 4 values of the seed, an int or
+            :py:class:`~numpy.random.SeedSequence` to derive one from, or
+            None to take the next seed from the default seed stream; see
+            :py:func:`~spinn_gym.utilities.set_root_seed`
         :param bin_overlap:
         :param tau_force:
         :param label:
         :param simulation_duration_ms:
+        :param bool record_changes_only:
+            Whether to record the score, with the tick, only when it
+            changes; see :py:meth:`get_score_series`
         """
-        if random_seed is None:
-            random_seed = list(self.RANDOM_SEED)
+        random_seed = resolve_random_seed(random_seed)
 
         # for rate based it's only 1 neuron per metric
         # (position, angle, velocity of both)
@@ -72,13 +78,26 @@ class Pendulum(SpinnGymApplicationVertex):
             label, self, n_neurons, simulation_duration_ms, random_seed,
             encoding, time_increment, pole_length, pole_angle,
             reward_based, force_increments, max_firing_rate,
-            number_of_bins, central, bin_overlap, tau_force)
+            number_of_bins, central, bin_overlap, tau_force,
+            record_changes_only)
 
         # Superclasses
         super(Pendulum, self).__init__(
            machine_vertex, label, n_neurons)
+        # reward_based isn't one of the rewritable parameters, so the layout
+        # of the score is fixed when the game is made
+        self.__reward_based = reward_based
 
     @property
     @overrides(SpinnGymApplicationVertex.score_format)
     def score_format(self) -> type:
         return numpy.float32
+
+    @property
+    @overrides(SpinnGymApplicationVertex.score_dtype)
+    def score_dtype(self) -> numpy.dtype:
+        if self.__reward_based:
+            return numpy.dtype([("max_balance_time", self.score_format)])
+        # Without reward the cart position and pole angle are recorded
+        return numpy.dtype([("cart_position", self.score_format),
+                            ("pole_angle", self.score_format)])
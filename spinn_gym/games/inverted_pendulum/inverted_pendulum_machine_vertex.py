@@ -13,7 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from enum import Enum
+from enum import Enum, IntEnum
+from typing import Any, Dict
 
 from spinn_utilities.overrides import overrides
 
@@ -23,16 +24,11 @@ from pacman.model.placements import Placement
 from spinn_front_end_common.utilities import helpful_functions
 from spinn_front_end_common.abstract_models.abstract_has_associated_binary \
     import AbstractHasAssociatedBinary
-from spinn_front_end_common.interface.buffer_management \
-    import recording_utilities
 from spinn_front_end_common.abstract_models \
     .abstract_generates_data_specification \
     import AbstractGeneratesDataSpecification
 from spinn_front_end_common.interface.ds import (
     DataSpecificationGenerator, DataType)
-from spinn_front_end_common.interface.simulation import simulation_utilities
-from spinn_front_end_common.utilities import constants as \
-    front_end_common_constants
 
 # sPyNNaker imports
 from spynnaker.pyNN.data import SpynnakerDataView
@@ -42,19 +38,62 @@ from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
 from spinn_gym.games import SpinnGymMachineVertex
 
 
+class PendulumEvent(IntEnum):
+    """
+    The episode events recorded by the Pendulum.
+    """
+    #: The pole or the cart went out of bounds, ending the episode
+    POLE_OUT_OF_BOUNDS = 0
+
+
 # ----------------------------------------------------------------------------
 # PendulumMachineVertex
 # ----------------------------------------------------------------------------
 class PendulumMachineVertex(SpinnGymMachineVertex):
     PENDULUM_REGION_BYTES = 4
-    DATA_REGION_BYTES = 15 * 4
 
     _PENDULUM_REGIONS = Enum(
         value="_PENDULUM_REGIONS",
         names=[('SYSTEM', 0),
                ('PENDULUM', 1),
                ('RECORDING', 2),
-               ('DATA', 3)])
+               ('DATA', 3),
+               ('PROVENANCE', 4)])
+
+    PROVENANCE_ITEMS = (
+        "Input_packets_received", "Backward_motor_spikes_received",
+        "Forward_motor_spikes_received", "Spikes_sent")
+
+    PARAMETER_SCHEMA = (
+        ("encoding", DataType.UINT32),
+        ("time_increment", DataType.UINT32),
+        ("pole_length", DataType.S1615),
+        ("pole_angle", DataType.S1615),
+        ("reward_based", DataType.UINT32),
+        ("force_increments", DataType.UINT32),
+        ("max_firing_rate", DataType.UINT32),
+        ("number_of_bins", DataType.UINT32),
+        ("central", DataType.UINT32),
+        *SpinnGymMachineVertex.RANDOM_SEED_SCHEMA,
+        ("bin_overlap", DataType.S1615),
+        ("tau_force", DataType.S1615),
+        ("record_changes_only", DataType.UINT32),
+        ("reset_flags", DataType.UINT32))
+
+    # The encoding sets the number of neurons, and so the keys sent, and
+    # reward_based the layout of the score, so neither can be changed
+    # between runs
+    REWRITABLE_PARAMETERS = (
+        "force_increments", "max_firing_rate", "central", "bin_overlap",
+        "tau_force")
+
+    EVENT_TYPES = PendulumEvent
+
+    # The episode ends when the pole leaves its bounds, so there is at most
+    # one event
+    EVENT_INTERVAL_MS = None
+
+    SCORE_INTERVAL_MS = 100
 
     __slots__ = ("_bin_overlap", "_central", "_encoding", "_force_increments",
                  "_max_firing_rate", "_number_of_bins", "_pole_angle",
@@ -65,7 +104,8 @@ class PendulumMachineVertex(SpinnGymMachineVertex):
                  simulation_duration_ms, random_seed,
                  encoding, time_increment, pole_length, pole_angle,
                  reward_based, force_increments, max_firing_rate,
-                 number_of_bins, central, bin_overlap, tau_force):
+                 number_of_bins, central, bin_overlap, tau_force,
+                 record_changes_only=False):
         """
 
         :param label: The optional name of the vertex
@@ -93,6 +133,9 @@ class PendulumMachineVertex(SpinnGymMachineVertex):
         :param central:
         :param bin_overlap:
         :param tau_force:
+        :param bool record_changes_only:
+            Whether to record the score, with the tick, only when it
+            changes
 
         :raise PacmanInvalidParameterException:
             If one of the constraints is not valid
@@ -101,11 +144,14 @@ class PendulumMachineVertex(SpinnGymMachineVertex):
             If a not None app_vertex is not an ApplicationVertex
         """
 
+        # The recording size depends on what is recorded
+        self._reward_based = reward_based
+
         # Superclasses
         super(PendulumMachineVertex, self).__init__(
             label, app_vertex, n_neurons,
-            self.PENDULUM_REGION_BYTES + self.DATA_REGION_BYTES,
-            simulation_duration_ms,  random_seed)
+            self.PENDULUM_REGION_BYTES,
+            simulation_duration_ms,  random_seed, record_changes_only)
 
         self._encoding = encoding
 
@@ -116,7 +162,6 @@ class PendulumMachineVertex(SpinnGymMachineVertex):
         self._force_increments = force_increments
 
         self._time_increment = time_increment
-        self._reward_based = reward_based
 
         self._max_firing_rate = max_firing_rate
         self._number_of_bins = number_of_bins
@@ -124,6 +169,25 @@ class PendulumMachineVertex(SpinnGymMachineVertex):
         self._bin_overlap = bin_overlap
         self._tau_force = tau_force
 
+    @property
+    @overrides(SpinnGymMachineVertex.parameters)
+    def parameters(self) -> Dict[str, Any]:
+        parameters = super(PendulumMachineVertex, self).parameters
+        parameters.update(
+            encoding=self._encoding, time_increment=self._time_increment,
+            pole_length=self._pole_length, pole_angle=self._pole_angle,
+            reward_based=self._reward_based,
+            force_increments=self._force_increments,
+            max_firing_rate=self._max_firing_rate,
+            number_of_bins=self._number_of_bins, central=self._central,
+            bin_overlap=self._bin_overlap, tau_force=self._tau_force)
+        return parameters
+
+    @overrides(SpinnGymMachineVertex._get_score_words)
+    def _get_score_words(self) -> int:
+        # The cart position and pole angle, unless rewarded
+        return 1 if self._reward_based else 2
+
     # ------------------------------------------------------------------------
     # AbstractGeneratesDataSpecification overrides
     # ------------------------------------------------------------------------
@@ -137,28 +201,11 @@ class PendulumMachineVertex(SpinnGymMachineVertex):
         spec.comment("\nReserving memory space for data regions:\n\n")
 
         # Reserve memory:
-        spec.reserve_memory_region(
-            region=self._PENDULUM_REGIONS.SYSTEM.value,
-            size=front_end_common_constants.SYSTEM_BYTES_REQUIREMENT,
-            label='setup')
-        spec.reserve_memory_region(
-            region=self._PENDULUM_REGIONS.PENDULUM.value,
-            size=self.PENDULUM_REGION_BYTES, label='PendulumVertex')
-        # reserve recording region
-        spec.reserve_memory_region(
-            self._PENDULUM_REGIONS.RECORDING.value,
-            recording_utilities.get_recording_header_size(1))
-        spec.reserve_memory_region(
-            region=self._PENDULUM_REGIONS.DATA.value,
-            size=self.DATA_REGION_BYTES, label='PendulumData')
+        self.reserve_memory_regions(spec)
 
         # Write setup region
         spec.comment("\nWriting setup region:\n")
-        spec.switch_write_focus(
-            self._PENDULUM_REGIONS.SYSTEM.value)
-        assert isinstance(vertex, AbstractHasAssociatedBinary)
-        spec.write_array(simulation_utilities.get_simulation_header_array(
-            vertex.get_binary_file_name()))
+        self.write_system_region(spec)
 
         # Write pendulum region containing routing key to transmit with
         spec.comment("\nWriting pendulum region:\n")
@@ -170,30 +217,11 @@ class PendulumMachineVertex(SpinnGymMachineVertex):
 
         # Write recording region for score
         spec.comment("\nWriting pendulum recording region:\n")
-        spec.switch_write_focus(
-            self._PENDULUM_REGIONS.RECORDING.value)
-        spec.write_array(recording_utilities.get_recording_header_array(
-            [self._recording_size]))
+        self.write_recording_region(spec)
 
         # Write pendulum data
         spec.comment("\nWriting pendulum data region:\n")
-        spec.switch_write_focus(
-            self._PENDULUM_REGIONS.DATA.value)
-        spec.write_value(self._encoding, data_type=DataType.UINT32)
-        spec.write_value(self._time_increment, data_type=DataType.UINT32)
-        spec.write_value(self._pole_length, data_type=DataType.S1615)
-        spec.write_value(self._pole_angle, data_type=DataType.S1615)
-        spec.write_value(self._reward_based, data_type=DataType.UINT32)
-        spec.write_value(self._force_increments, data_type=DataType.UINT32)
-        spec.write_value(self._max_firing_rate, data_type=DataType.UINT32)
-        spec.write_value(self._number_of_bins, data_type=DataType.UINT32)
-        spec.write_value(self._central, data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[0], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[1], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[2], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[3], data_type=DataType.UINT32)
-        spec.write_value(self._bin_overlap, data_type=DataType.S1615)
-        spec.write_value(self._tau_force, data_type=DataType.S1615)
+        self.write_parameter_region(spec)
 
         # End-of-Spec:
         spec.end_specification()
@@ -202,6 +230,31 @@ class PendulumMachineVertex(SpinnGymMachineVertex):
         return helpful_functions.locate_memory_region_for_placement(
             placement, self._PENDULUM_REGIONS.RECORDING.value)
 
+    @property
+    @overrides(SpinnGymMachineVertex._provenance_region_id)
+    def _provenance_region_id(self) -> int:
+        return self._PENDULUM_REGIONS.PROVENANCE.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._parameter_region_id)
+    def _parameter_region_id(self) -> int:
+        return self._PENDULUM_REGIONS.DATA.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._system_region_id)
+    def _system_region_id(self) -> int:
+        return self._PENDULUM_REGIONS.SYSTEM.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._key_region_id)
+    def _key_region_id(self) -> int:
+        return self._PENDULUM_REGIONS.PENDULUM.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._recording_region_id)
+    def _recording_region_id(self) -> int:
+        return self._PENDULUM_REGIONS.RECORDING.value
+
     @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
     def get_binary_file_name(self) -> str:
         return "inverted_pendulum.aplx"
@@ -0,0 +1,530 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import List, Optional, Tuple
+
+import numpy
+
+from spinn_front_end_common.interface.ds import DataType
+
+from spinn_gym.games.inverted_pendulum.inverted_pendulum_machine_vertex \
+    import PendulumEvent
+from spinn_gym.utilities.kiss64 import Kiss64
+from spinn_gym.utilities.seed_streams import resolve_random_seeds
+from spinn_gym.utilities.spike_encoders import (
+    RANK, RATE, RECEPTIVE_BINS, SPIKE_TIME, receptive_bins, spike_ranks,
+    spike_times)
+
+_f32 = numpy.float32
+
+
+def to_s1615(values) -> numpy.ndarray:
+    """
+    Get the values that a binary reads back from S1615 parameters.
+
+    :param values: The values given to the vertex
+    :rtype: ~numpy.ndarray
+    """
+    values = numpy.asarray(values, dtype=float)
+    words = [DataType.S1615.encode_as_int(value) for value in values.ravel()]
+    return (numpy.array(words, dtype=float).reshape(values.shape) /
+            float(DataType.S1615.scale)).astype(_f32)
+
+
+def push_motor_force(
+        force: numpy.ndarray, actions: numpy.ndarray,
+        increment: numpy.ndarray, minimum: numpy.float32,
+        maximum: numpy.float32) -> None:
+    """
+    Push the motor forces of pendulums one increment for each spike, as
+    the pendulum binaries do as each spike arrives: down for a backward
+    spike, stopping at the least force, and up for a forward spike,
+    stopping at the most.
+
+    Each spike is taken in turn, so the forces are rounded as the
+    binaries round them.  The binaries take the spikes in the order they
+    arrive, which the counts don't give, so all the backward spikes of a
+    tick are taken before the forward ones; a pendulum whose motors both
+    spike in a tick may then end up with a slightly different force, or a
+    different one if it reaches a limit.
+
+    :param ~numpy.ndarray force: The forces, which are updated
+    :param ~numpy.ndarray actions:
+        The number of backward and forward spikes of each pendulum, as an
+        array of shape (n_pendulums, 2)
+    :param ~numpy.ndarray increment: The increment of each pendulum
+    :param ~numpy.float32 minimum: The least force
+    :param ~numpy.float32 maximum: The most force
+    """
+    for spike in range(int(actions[:, 0].max(initial=0))):
+        pushing = actions[:, 0] > spike
+        numpy.subtract(force, increment, out=force, where=pushing)
+        numpy.maximum(force, minimum, out=force, where=pushing)
+    for spike in range(int(actions[:, 1].max(initial=0))):
+        pushing = actions[:, 1] > spike
+        numpy.add(force, increment, out=force, where=pushing)
+        numpy.minimum(force, maximum, out=force, where=pushing)
+
+
+# ----------------------------------------------------------------------------
+# PendulumEngine
+# ----------------------------------------------------------------------------
+class PendulumEngine(object):
+    """
+    Many inverted pendulums on carts, simulated on the host with NumPy as
+    ``inverted_pendulum.c`` simulates one on the machine.
+
+    All the pendulums are stepped together, one tick per call of
+    :py:meth:`step`.  The spikes sent are counted for each neuron of
+    :py:class:`~spinn_gym.Pendulum` with the same parameters: the angle,
+    cart position, angular velocity and cart velocity, in that order, each
+    as one neuron with the rate encoding or as ``number_of_bins`` neurons
+    otherwise.  The spikes received are counted too, so the order in which
+    they arrive in a tick is not known; see :py:func:`push_motor_force`.
+
+    With the rate encoding, a pendulum draws the same random numbers as
+    the binary with the same seed.  The binary draws the normal variates
+    of the receptive bins from a generator that the host can't
+    reproduce, so here they come from a NumPy generator seeded with the
+    seeds of all the pendulums.  The binary sends nothing with the spike
+    time and rank encodings; here a frame of ``time_increment`` ticks
+    starts when the state is updated.  With spike time encoding, each bin
+    near enough to its value spikes once in the frame, sooner the nearer
+    it is; with rank encoding, every bin spikes once, on the tick given by
+    how many bins are nearer to the value than it is.
+    """
+
+    GRAVITY = _f32(-9.8)
+    MASS_CART = _f32(1)
+    MASS_POLE = _f32(0.1)
+    FRICTION_CART_ON_TRACK = _f32(0.0005)
+    FRICTION_POLE_HINGE = _f32(0.000002)
+
+    TRACK_LENGTH = _f32(4.8)
+    MAX_MOTOR_FORCE = _f32(10)
+    MIN_MOTOR_FORCE = _f32(-10)
+    HIGHEND_CART_V = _f32(5)
+    HIGHEND_POLE_V = _f32(5)
+    MAX_POLE_ANGLE = _f32(_f32(36) / _f32(180) * numpy.pi)
+    MIN_POLE_ANGLE = -MAX_POLE_ANGLE
+
+    #: The order of the variables of the state in the neuron IDs
+    VARIABLES = ("angle", "cart", "angle_v", "cart_v")
+
+    __slots__ = (
+        "__n_pendulums", "__encoding", "__time_increment", "__central",
+        "__number_of_bins", "__max_firing_prob", "__bin_overlap",
+        "__half_pole_length", "__initial_pole_angle", "__force_increment",
+        "__tau_force", "__rng", "__normal_rng", "__cart_position",
+        "__cart_velocity", "__pole_angle", "__pole_velocity",
+        "__motor_force", "__current_time", "__max_balance_time",
+        "__in_bounds", "__tick_in_frame", "__tick")
+
+    def __init__(self, n_pendulums: int, encoding: int = RATE,
+                 time_increment: int = 20, pole_length=1.0, pole_angle=0.1,
+                 force_increments=100, max_firing_rate: int = 100,
+                 number_of_bins: int = 20, central: int = 1,
+                 random_seed=None, bin_overlap: float = 2, tau_force=0):
+        """
+        :param int n_pendulums: The number of pendulums to simulate
+        :param int encoding:
+            0 rate, 1 receptive bins, 2 spike time or 3 rank
+        :param int time_increment: The ticks between updates of the state
+        :param pole_length:
+            The length of the pole in metres; a value for each pendulum
+            or one for all of them
+        :param pole_angle:
+            The starting angle of the pole in degrees; a value for each
+            pendulum or one for all of them
+        :param force_increments:
+            How many spikes it takes to go from the most backward to the
+            most forward force; a value for each pendulum or one for all
+        :param int max_firing_rate: The highest rate of a neuron, in Hz
+        :param int number_of_bins: The neurons of each variable when the
+            encoding isn't rate
+        :param int central:
+            With the rate encoding, 1 to fire fastest away from the middle
+            of each range, or 0 to fire fastest at its top
+        :param random_seed:
+            The seeds of the pendulums; see
+            :py:func:`~spinn_gym.utilities.resolve_random_seeds`
+        :param float bin_overlap: How much the bins overlap
+        :param tau_force:
+            The time constant of the motor force, or 0 to use each force
+            for a single update; a value for each pendulum or one for all
+        :raises ValueError: If the encoding is not known
+        """
+        if encoding not in (RATE, RECEPTIVE_BINS, SPIKE_TIME, RANK):
+            raise ValueError(f"Unknown encoding {encoding}")
+        self.__n_pendulums = n_pendulums
+        self.__encoding = encoding
+        self.__time_increment = time_increment
+        self.__central = central
+        self.__number_of_bins = number_of_bins
+        self.__max_firing_prob = _f32(max_firing_rate) / _f32(1000)
+        self.__bin_overlap = float(to_s1615(bin_overlap))
+
+        shape = (n_pendulums, )
+        self.__half_pole_length = numpy.broadcast_to(
+            to_s1615(pole_length) / _f32(2), shape).copy()
+        self.__initial_pole_angle = numpy.broadcast_to(
+            (to_s1615(pole_angle) / _f32(180) * numpy.pi).astype(_f32),
+            shape).copy()
+        self.__force_increment = numpy.broadcast_to(
+            (self.MAX_MOTOR_FORCE - self.MIN_MOTOR_FORCE) /
+            numpy.asarray(force_increments, dtype=_f32), shape).copy()
+        self.__tau_force = numpy.broadcast_to(
+            to_s1615(tau_force), shape).copy()
+
+        seeds = resolve_random_seeds(random_seed, n_pendulums)
+        self.__rng = Kiss64(seeds)
+        self.__normal_rng = numpy.random.default_rng(
+            numpy.array(seeds, dtype=numpy.uint32).ravel())
+
+        self.__cart_position = numpy.zeros(shape, dtype=_f32)
+        self.__cart_velocity = numpy.zeros(shape, dtype=_f32)
+        self.__pole_angle = numpy.zeros(shape, dtype=_f32)
+        self.__pole_velocity = numpy.zeros(shape, dtype=_f32)
+        self.__motor_force = numpy.zeros(shape, dtype=_f32)
+        self.__current_time = numpy.zeros(shape, dtype=_f32)
+        self.__max_balance_time = numpy.zeros(shape, dtype=_f32)
+        self.__in_bounds = numpy.zeros(shape, dtype=bool)
+        self.__tick_in_frame = numpy.zeros(shape, dtype=numpy.int64)
+        self.__tick = 0
+        self.reset()
+
+    @property
+    def n_pendulums(self) -> int:
+        """
+        The number of pendulums.
+
+        :rtype: int
+        """
+        return self.__n_pendulums
+
+    @property
+    def n_neurons(self) -> int:
+        """
+        The number of neurons that the pendulums spike from, as the number
+        of atoms of :py:class:`~spinn_gym.Pendulum` with the same
+        parameters.
+
+        :rtype: int
+        """
+        if self.__encoding == RATE:
+            return len(self.VARIABLES)
+        return len(self.VARIABLES) * self.__number_of_bins
+
+    @property
+    def tick(self) -> int:
+        """
+        The number of ticks simulated.
+
+        :rtype: int
+        """
+        return self.__tick
+
+    @property
+    def cart_positions(self) -> numpy.ndarray:
+        """
+        The position of each cart along the track, in metres.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__cart_position.copy()
+
+    @property
+    def cart_velocities(self) -> numpy.ndarray:
+        """
+        The velocity of each cart, in metres per second.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__cart_velocity.copy()
+
+    @property
+    def pole_angles(self) -> numpy.ndarray:
+        """
+        The angle of each pole, in radians.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__pole_angle.copy()
+
+    @property
+    def pole_velocities(self) -> numpy.ndarray:
+        """
+        The angular velocity of each pole, in radians per second.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__pole_velocity.copy()
+
+    @property
+    def motor_forces(self) -> numpy.ndarray:
+        """
+        The force each motor is pushing its cart with.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__motor_force.copy()
+
+    @property
+    def max_balance_times(self) -> numpy.ndarray:
+        """
+        How long each pole has been balanced for, in ticks; the score of
+        a reward based pendulum.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__max_balance_time.copy()
+
+    @property
+    def in_bounds(self) -> numpy.ndarray:
+        """
+        Whether each pendulum is still in play; once the cart leaves the
+        track or the pole falls too far, the pendulum stops until reset.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__in_bounds.copy()
+
+    def reset(self, pendulums: Optional[numpy.ndarray] = None) -> None:
+        """
+        Put pendulums back into their starting state, as a reset request
+        does between runs on the machine.
+
+        :param pendulums:
+            Which pendulums to reset, as a mask or indices; all if None
+        :type pendulums: ~numpy.ndarray or None
+        """
+        mask = numpy.zeros(self.__n_pendulums, dtype=bool)
+        if pendulums is None:
+            mask[:] = True
+        else:
+            mask[pendulums] = True
+        self.__cart_position[mask] = self.TRACK_LENGTH / _f32(2)
+        self.__cart_velocity[mask] = 0
+        self.__pole_angle[mask] = self.__initial_pole_angle[mask]
+        self.__pole_velocity[mask] = 0
+        self.__motor_force[mask] = 0
+        self.__current_time[mask] = 0
+        self.__max_balance_time[mask] = 0
+        self.__in_bounds[mask] = True
+        self.__tick_in_frame[mask] = 0
+
+    def step(self, actions: numpy.ndarray) -> Tuple[
+            numpy.ndarray, numpy.ndarray]:
+        """
+        Simulate one tick of every pendulum.
+
+        :param ~numpy.ndarray actions:
+            The number of spikes received by each pendulum since the last
+            tick, from its backward then its forward motor neuron, as an
+            array of shape (n_pendulums, 2).  The backward spikes are
+            taken first; see :py:func:`push_motor_force`.
+        :return: The number of spikes sent from each neuron of each
+            pendulum, and which of the :py:class:`~spinn_gym.PendulumEvent`
+            happened to each pendulum
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        actions = numpy.asarray(actions)
+        if actions.shape != (self.__n_pendulums, 2):
+            raise ValueError(
+                f"Actions must have shape ({self.__n_pendulums}, 2), not "
+                f"{actions.shape}")
+        events = numpy.zeros(
+            (self.__n_pendulums, len(PendulumEvent)), dtype=bool)
+
+        push_motor_force(
+            self.__motor_force, actions, self.__force_increment,
+            self.MIN_MOTOR_FORCE, self.MAX_MOTOR_FORCE)
+
+        self.__current_time += _f32(1)
+        if self.__tick == 0:
+            self.__update_state(
+                numpy.ones(self.__n_pendulums, dtype=bool), _f32(0))
+
+        # Update the state at the end of each frame
+        self.__tick_in_frame += 1
+        frame = self.__tick_in_frame == self.__time_increment
+        update = frame & self.__in_bounds
+        numpy.maximum(
+            self.__max_balance_time,
+            numpy.where(update, self.__current_time, _f32(0)),
+            out=self.__max_balance_time)
+        out = update & ~self.__update_state(
+            update, _f32(self.__time_increment) / _f32(1000))
+        self.__in_bounds[out] = False
+        events[:, PendulumEvent.POLE_OUT_OF_BOUNDS] = out
+        self.__tick_in_frame[frame] = 0
+
+        spikes = self.__send_status()
+        self.__tick += 1
+        return spikes, events
+
+    def __update_state(
+            self, which: numpy.ndarray, time_step: numpy.float32
+            ) -> numpy.ndarray:
+        """
+        Move some pendulums on by a time step, as ``update_state`` does,
+        keeping to its mix of single and double precision.
+
+        :return: Whether each pendulum is still in bounds; True for those
+            not moved
+        """
+        half_length = self.__half_pole_length[which]
+        angle = self.__pole_angle[which]
+        pole_velocity = self.__pole_velocity[which]
+        cart_velocity = self.__cart_velocity[which]
+        force = self.__motor_force[which]
+        sin = numpy.sin(angle.astype(numpy.float64))
+        cos = numpy.cos(angle.astype(numpy.float64))
+        mass_pole = self.MASS_POLE
+        hinge = self.FRICTION_POLE_HINGE
+
+        pole_angle_force = (
+            mass_pole * half_length * pole_velocity * pole_velocity *
+            sin).astype(_f32)
+        angle_scalar = (_f32(0.75) * mass_pole * cos).astype(_f32)
+        friction_and_gravity = (
+            (hinge * pole_velocity) / (mass_pole * half_length) +
+            self.GRAVITY * sin).astype(_f32)
+        effective_pole_mass = (
+            mass_pole * (_f32(1) - _f32(0.75) * cos * cos)).astype(_f32)
+        effective_force = pole_angle_force + (
+            angle_scalar * friction_and_gravity)
+        friction = numpy.where(
+            cart_velocity > 0, -self.FRICTION_CART_ON_TRACK,
+            self.FRICTION_CART_ON_TRACK)
+        cart_acceleration = (force + friction + effective_force) / (
+            self.MASS_CART + effective_pole_mass)
+
+        length_scalar = _f32(-3) / (_f32(4) * half_length)
+        pole_acceleration = length_scalar * (
+            (cart_acceleration * cos).astype(_f32) +
+            (self.GRAVITY * sin).astype(_f32) +
+            (hinge * pole_velocity) / (mass_pole * half_length))
+
+        cart_velocity = cart_acceleration * time_step + cart_velocity
+        cart_position = cart_velocity * time_step + \
+            self.__cart_position[which]
+        pole_velocity = pole_acceleration * time_step + pole_velocity
+        angle = pole_velocity * time_step + angle
+
+        tau_force = self.__tau_force[which]
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            force = numpy.where(
+                tau_force != 0, force * numpy.exp(time_step / tau_force),
+                _f32(0))
+
+        self.__cart_velocity[which] = cart_velocity
+        self.__cart_position[which] = cart_position
+        self.__pole_velocity[which] = pole_velocity
+        self.__pole_angle[which] = angle
+        self.__motor_force[which] = force
+
+        in_bounds = numpy.ones(self.__n_pendulums, dtype=bool)
+        in_bounds[which] = ~(
+            (cart_position > self.TRACK_LENGTH) | (cart_position < 0) |
+            (angle > self.MAX_POLE_ANGLE) | (angle < self.MIN_POLE_ANGLE))
+        return in_bounds
+
+    def _relative_state(self) -> numpy.ndarray:
+        """
+        Scale each variable of the state of each pendulum to between 0 and
+        1, as the receptive bins of the binary do.
+
+        :return: The variables, in the order of :py:attr:`VARIABLES`
+        :rtype: ~numpy.ndarray
+        """
+        max_angle = self.MAX_POLE_ANGLE
+        return numpy.stack((
+            (self.__pole_angle + max_angle) / (_f32(2) * max_angle),
+            self.__cart_position / self.TRACK_LENGTH,
+            (self.__pole_velocity + self.HIGHEND_POLE_V) /
+            (_f32(2) * self.HIGHEND_POLE_V),
+            (self.__cart_velocity + self.HIGHEND_CART_V) /
+            (_f32(2) * self.HIGHEND_CART_V)), axis=1)
+
+    def __send_status(self) -> numpy.ndarray:
+        """
+        Spike the state of the pendulums still in bounds, as
+        ``send_status`` does.
+
+        :return: The number of spikes from each neuron of each pendulum
+        """
+        playing = self.__in_bounds
+        if self.__encoding == RATE:
+            return self.__rate_spikes(playing)
+
+        relative = self._relative_state()
+        bins = self.__number_of_bins
+        if self.__encoding == RECEPTIVE_BINS:
+            spiking = receptive_bins(
+                relative, bins, self.__bin_overlap, self.__max_firing_prob,
+                self.__normal_rng)
+        elif self.__encoding == SPIKE_TIME:
+            spiking = spike_times(
+                relative, bins, self.__bin_overlap, self.__time_increment
+                ) == self.__tick_in_frame[:, None, None]
+        else:
+            spiking = spike_ranks(relative, bins) == \
+                self.__tick_in_frame[:, None, None]
+        spiking &= playing[:, None, None]
+        return spiking.reshape(self.__n_pendulums, -1).astype(numpy.uint8)
+
+    def __rate_spikes(self, playing: numpy.ndarray) -> numpy.ndarray:
+        """
+        Spike each variable at a rate that rises with it, drawing from the
+        generators as the binary does.
+        """
+        angle = self.__pole_angle
+        pole_v = self.__pole_velocity
+        cart = self.__cart_position
+        cart_v = self.__cart_velocity
+        max_angle = self.MAX_POLE_ANGLE
+        if self.__central:
+            half_track = self.TRACK_LENGTH / _f32(2)
+            from_middle = cart - half_track
+            relative: List[numpy.ndarray] = [
+                numpy.where(angle > 0, angle, -angle) / max_angle,
+                numpy.where(pole_v > 0, pole_v, -pole_v) /
+                self.HIGHEND_POLE_V,
+                numpy.where(from_middle > 0, from_middle, -from_middle) /
+                half_track,
+                numpy.where(cart_v > 0, cart_v, -cart_v) /
+                self.HIGHEND_CART_V]
+        else:
+            relative = [
+                (angle + max_angle) / (max_angle + max_angle),
+                (pole_v + self.HIGHEND_POLE_V) /
+                (self.HIGHEND_POLE_V * _f32(2)),
+                cart / self.TRACK_LENGTH,
+                (cart_v + self.HIGHEND_CART_V) /
+                (self.HIGHEND_CART_V * _f32(2))]
+
+        # The binary divides the roll of the cart position by the relative
+        # cart velocity too
+        rolls = [self.__rng.rand021(playing) for _ in range(4)]
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            angle_spike, angle_v_spike, cart_spike, cart_v_spike = (
+                roll / divisor < self.__max_firing_prob
+                for roll, divisor in zip(rolls, (
+                    relative[0], relative[1], relative[3], relative[3])))
+        spikes = numpy.stack(
+            (angle_spike, cart_spike, angle_v_spike, cart_v_spike), axis=1)
+        spikes &= playing[:, None]
+        return spikes.astype(numpy.uint8)
@@ -0,0 +1,252 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+import numpy
+
+import pyNN.spiNNaker as p
+from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.models.populations import Population
+
+from spinn_gym.games.vector_env import Engine, VectorEnv
+
+
+# ----------------------------------------------------------------------------
+# LiveEnvironment
+# ----------------------------------------------------------------------------
+class LiveEnvironment(object):
+    """
+    A game engine played on the host by a network running on the machine,
+    in place of the game vertex.
+
+    The spikes of a population of the network are sent live to the host,
+    where they act on the games as the spikes sent to a game vertex do:
+    the population is split into a block of neurons for each game, and a
+    neuron takes the action given by its index in its block, modulo the
+    number of actions, so that with one game the even neurons move a bat
+    or cart one way and the odd neurons the other.  The spikes sent by the
+    games are injected back into the network by a
+    :py:class:`~spynnaker.pyNN.external_devices.SpikeInjector` population
+    with a block of :py:attr:`VectorEnv.n_neurons` atoms for each game,
+    laid out as the atoms of the game vertex.
+
+    The games are stepped from a thread that keeps them up with the
+    simulation, taking the ticks of the games to be those of the machine:
+    at least as far as the wall clock time since the simulation started
+    or resumed, in ticks of the hardware time step, and on past the tick
+    of the latest spikes received.  The spikes of a tick act on the first
+    step that starts after it, as they do on the game vertex; spikes that
+    arrive after that step has been taken, as they do when the network
+    falls behind the wall clock, act on the next step instead, and are
+    counted in :py:attr:`late_spikes`.
+
+    Must be created after ``setup`` and before ``run``.
+    """
+
+    __slots__ = (
+        "__env", "__label", "__block_size", "__population", "__connection",
+        "__lock", "__pending", "__received_tick", "__stepped_tick",
+        "__late_spikes", "__stop", "__thread", "__step_seconds",
+        "__n_steps")
+
+    def __init__(self, engine: Engine, actions: Population,
+                 label: str = "live_environment",
+                 local_port: Optional[int] = None):
+        """
+        :param engine: The engine whose games are played
+        :param ~spynnaker.pyNN.models.populations.Population actions:
+            The population of the network whose spikes act on the games
+        :param str label: The label of the population of the games
+        :param local_port:
+            The port to listen for the database on; any free port if None
+        :type local_port: int or None
+        :raises ValueError:
+            If the actions can't be split evenly between the games
+        """
+        self.__env = VectorEnv(engine)
+        n_envs = self.__env.n_envs
+        if actions.size % n_envs:
+            raise ValueError(
+                f"{actions.size} neurons can't act on each of {n_envs} games"
+                " equally")
+        self.__label = label
+        self.__block_size = actions.size // n_envs
+        self.__lock = threading.Lock()
+        # The actions received in each tick, until they are taken
+        self.__pending: Dict[int, numpy.ndarray] = {}
+        self.__received_tick = 0
+        self.__stepped_tick = engine.tick
+        self.__late_spikes = 0
+        self.__stop = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.__step_seconds = 0.0
+        self.__n_steps = 0
+
+        self.__connection = p.external_devices.SpynnakerLiveSpikesConnection(
+            receive_labels=[actions.label], send_labels=[label],
+            local_port=local_port)
+        self.__population = p.Population(
+            n_envs * self.__env.n_neurons,
+            p.external_devices.SpikeInjector(
+                database_notify_port_num=self.__connection.local_port),
+            label=label)
+        p.external_devices.activate_live_output_for(
+            actions, database_notify_port_num=self.__connection.local_port)
+        self.__connection.add_receive_callback(
+            actions.label, self.__receive_actions)
+        self.__connection.add_start_resume_callback(label, self.__start)
+        self.__connection.add_pause_stop_callback(label, self.__pause)
+
+    @property
+    def population(self) -> Population:
+        """
+        The population that injects the spikes of the games, to connect
+        to the network as the game vertex would be.
+
+        :rtype: ~spynnaker.pyNN.models.populations.Population
+        """
+        return self.__population
+
+    @property
+    def env(self) -> VectorEnv:
+        """
+        The environments of the games, whose engine holds their state.
+
+        :rtype: VectorEnv
+        """
+        return self.__env
+
+    @property
+    def n_steps(self) -> int:
+        """
+        The number of times the games have been stepped.
+
+        :rtype: int
+        """
+        return self.__n_steps
+
+    @property
+    def late_spikes(self) -> int:
+        """
+        The number of spikes received after the step they should have
+        acted on, which acted on the step after it instead.
+
+        :rtype: int
+        """
+        return self.__late_spikes
+
+    @property
+    def step_seconds(self) -> float:
+        """
+        The time spent stepping the games and sending their spikes, in
+        seconds, to weigh against the time the network runs for.
+
+        :rtype: float
+        """
+        return self.__step_seconds
+
+    def close(self) -> None:
+        """
+        Stop stepping the games and close the connection to the machine.
+        """
+        self.__pause(self.__label, self.__connection)
+        self.__connection.close()
+
+    def __receive_actions(
+            self, label: str, tick: int, neuron_ids: Iterable[int]) -> None:
+        """
+        Add up the actions spiked by the network in a tick.
+        """
+        # pylint: disable=unused-argument
+        neuron_ids = numpy.asarray(neuron_ids, dtype=numpy.int64)
+        n_envs, n_actions = self.__env.n_envs, self.__env.n_actions
+        counts = numpy.bincount(
+            neuron_ids // self.__block_size * n_actions +
+            neuron_ids % self.__block_size % n_actions,
+            minlength=n_envs * n_actions).reshape(n_envs, n_actions)
+        with self.__lock:
+            if tick < self.__stepped_tick:
+                self.__late_spikes += len(neuron_ids)
+            if tick in self.__pending:
+                self.__pending[tick] += counts
+            else:
+                self.__pending[tick] = counts
+            self.__received_tick = max(self.__received_tick, tick)
+
+    def __take_actions(self, tick: int) -> numpy.ndarray:
+        """
+        Take the actions received before the tick of a step.
+        """
+        actions = numpy.zeros(
+            (self.__env.n_envs, self.__env.n_actions), dtype=numpy.int64)
+        with self.__lock:
+            self.__stepped_tick = tick
+            for received in [t for t in self.__pending if t < tick]:
+                actions += self.__pending.pop(received)
+        return actions
+
+    def __start(self, label: str, connection) -> None:
+        """
+        Start stepping the games as the simulation starts or resumes.
+        """
+        # pylint: disable=unused-argument
+        self.__stop.clear()
+        self.__thread = threading.Thread(
+            target=self.__run, args=(time.perf_counter(), ), daemon=True,
+            name=f"{self.__label} steps")
+        self.__thread.start()
+
+    def __pause(self, label: str, connection) -> None:
+        """
+        Stop stepping the games as the simulation pauses or stops.
+        """
+        # pylint: disable=unused-argument
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self, started: float) -> None:
+        """
+        Step the games until the simulation stops.
+        """
+        engine = self.__env.engine
+        first_tick = engine.tick
+        seconds_per_tick = (
+            SpynnakerDataView.get_hardware_time_step_ms() / 1000.0)
+        while not self.__stop.is_set():
+            elapsed = int((time.perf_counter() - started) / seconds_per_tick)
+            with self.__lock:
+                target = max(first_tick + elapsed, self.__received_tick + 1)
+            if engine.tick >= target:
+                self.__stop.wait(seconds_per_tick)
+                continue
+            self.__step(self.__take_actions(engine.tick))
+
+    def __step(self, actions: numpy.ndarray) -> None:
+        """
+        Step the games once, and inject the spikes they send.
+        """
+        step_started = time.perf_counter()
+        observations, _, _ = self.__env.step(actions)
+        neuron_ids = numpy.repeat(
+            numpy.arange(observations.size), observations.ravel())
+        if len(neuron_ids):
+            self.__connection.send_spikes(self.__label, neuron_ids.tolist())
+        self.__step_seconds += time.perf_counter() - step_started
+        self.__n_steps += 1
@@ -19,15 +19,13 @@ from spinn_utilities.overrides import overrides
 
 # common imports
 from spinn_gym.games import SpinnGymApplicationVertex
+from spinn_gym.utilities.seed_streams import resolve_random_seed
 
 # Logic imports
-from spinn_gym.games.logic.logic_machine_vertex import LogicMachineVertex
+from spinn_gym.games.logic.logic_machine_vertex import (
+    Bad_Table, LogicMachineVertex)
 
-
-class Bad_Table(Exception):
-    """
-    table and input sequence are not compatible
-    """
+__all__ = ["Bad_Table", "Logic"]
 
 
 # ----------------------------------------------------------------------------
@@ -36,31 +34,23 @@ class Bad_Table(Exception):
 class Logic(SpinnGymApplicationVertex):
 
     ONE_DAY_IN_MS = 1000 * 60 * 60 * 24  # 1 day
-    RANDOM_SEED = [numpy.random.randint(10000),
-                   numpy.random.randint(10000),
-                   numpy.random.randint(10000),
-                   numpy.random.randint(10000)]
 
     __slots__ = ()
 
     def __init__(
             self, truth_table, input_sequence, rate_on=20.0, rate_off=5.0,
             score_delay=200.0, stochastic=1, label="Logic",
-            simulation_duration_ms=ONE_DAY_IN_MS,  random_seed=None):
-        if random_seed is None:
-            random_seed = list(self.RANDOM_SEED)
+            simulation_duration_ms=ONE_DAY_IN_MS,  random_seed=None,
+            record_changes_only=False):
+        random_seed = resolve_random_seed(random_seed)
 
         n_neurons = len(input_sequence)
-        if n_neurons != numpy.log2(len(truth_table)):
-            try:
-                raise Bad_Table('table and input sequence are not compatible')
-            except Bad_Table as e:
-                print("ERROR: ", e)
-                # TODO is it safe to continue ??????
+        # The machine vertex checks the table against the inputs, raising
+        # Bad_Table if they are not compatible
         machine_vertex = LogicMachineVertex(
             label, self, n_neurons, simulation_duration_ms,
             random_seed, truth_table, input_sequence, rate_on, rate_off,
-            score_delay, stochastic)
+            score_delay, stochastic, record_changes_only)
         # Superclasses
         super(Logic, self).__init__(machine_vertex, label, n_neurons)
 
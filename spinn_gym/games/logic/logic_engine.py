@@ -0,0 +1,261 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Optional
+
+import numpy
+
+from spinn_gym.games.logic.logic_machine_vertex import (
+    Bad_Table, LogicMachineVertex)
+from spinn_gym.utilities.kiss64 import Kiss64
+from spinn_gym.utilities.seed_streams import resolve_random_seeds
+
+_f32 = numpy.float32
+
+# The ticks between recordings of the score, after which the binary starts
+# counting the ticks of its regular spikes again
+_SCORE_RECORD_TICKS = 1000
+
+
+# ----------------------------------------------------------------------------
+# LogicEngine
+# ----------------------------------------------------------------------------
+class LogicEngine(object):
+    """
+    Many logic tasks, simulated on the host with NumPy as ``logic.c``
+    simulates one on the machine.
+
+    All the tasks are stepped together, one tick per call of
+    :py:meth:`step`, and a task makes the same random choices as the
+    binary given the same seed.  Each task spikes its inputs at
+    ``rate_on`` or ``rate_off``, and every ``score_delay`` ticks scores a
+    point if more of the spikes it was sent chose the output its truth
+    table gives for those inputs.  Each task may have its own truth table
+    and input sequence, so that many can be evaluated at once.
+    """
+
+    __slots__ = (
+        "__n_tasks", "__n_inputs", "__input_sequences", "__correct_outputs",
+        "__score_delay", "__stochastic", "__max_fire_prob_on",
+        "__max_fire_prob_off", "__period_on", "__period_off", "__rng",
+        "__output_choices", "__scores", "__trials", "__tick_in_frame",
+        "__score_change_count", "__tick")
+
+    def __init__(self, n_tasks: int, truth_table, input_sequence,
+                 rate_on: int = 20, rate_off: int = 5,
+                 score_delay: int = 200, stochastic: int = 1,
+                 random_seed=None):
+        """
+        :param int n_tasks: The number of tasks to simulate
+        :param truth_table:
+            The correct output for each combination of inputs, in any form
+            accepted by :py:meth:`LogicMachineVertex.convert_truth_table`,
+            for all the tasks; or an array with a row of entries for each
+            task
+        :type truth_table: list(int) or ~numpy.ndarray or callable
+        :param input_sequence:
+            The value of each input, for all the tasks or as an array with
+            a row for each task
+        :type input_sequence: list(int) or ~numpy.ndarray
+        :param int rate_on: The rate of an input that is 1, in Hz
+        :param int rate_off: The rate of an input that is 0, in Hz
+        :param int score_delay: The ticks between choices
+        :param int stochastic:
+            1 to spike at random at the rates, or 0 to spike regularly
+        :param random_seed:
+            The seeds of the tasks; see
+            :py:func:`~spinn_gym.utilities.resolve_random_seeds`
+        :raises Bad_Table:
+            If a truth table is not compatible with the inputs
+        :raises ValueError: If the rates can't be spiked regularly
+        """
+        inputs = numpy.asarray(input_sequence, dtype=numpy.uint32)
+        self.__n_tasks = n_tasks
+        self.__n_inputs = inputs.shape[-1]
+        self.__input_sequences = numpy.broadcast_to(
+            inputs, (n_tasks, self.__n_inputs)).copy()
+
+        if callable(truth_table) or numpy.ndim(truth_table) == 1:
+            tables = LogicMachineVertex.convert_truth_table(
+                truth_table, self.__n_inputs)[None, :]
+        else:
+            tables = numpy.array([
+                LogicMachineVertex.convert_truth_table(
+                    table, self.__n_inputs)
+                for table in truth_table])
+        if len(tables) not in (1, n_tasks):
+            raise Bad_Table(
+                f"There must be one truth table or {n_tasks}, not "
+                f"{len(tables)}")
+        index = (((self.__input_sequences & 1).astype(numpy.int64)) <<
+                 numpy.arange(self.__n_inputs)).sum(axis=1)
+        tables = numpy.broadcast_to(tables, (n_tasks, tables.shape[1]))
+        self.__correct_outputs = tables[numpy.arange(n_tasks), index]
+
+        self.__score_delay = int(score_delay)
+        self.__stochastic = stochastic
+        rate_on = int(rate_on)
+        rate_off = int(rate_off)
+        self.__max_fire_prob_on = _f32(rate_on) / _f32(1000)
+        self.__max_fire_prob_off = _f32(rate_off) / _f32(1000)
+        self.__period_on = 0
+        self.__period_off = 0
+        if not stochastic:
+            if not (0 < rate_on <= 1000 and 0 < rate_off <= 1000):
+                raise ValueError(
+                    "Regular rates must be between 1 and 1000 Hz, not "
+                    f"{rate_on} and {rate_off}")
+            self.__period_on = 1000 // rate_on
+            self.__period_off = 1000 // rate_off
+
+        self.__rng = Kiss64(resolve_random_seeds(random_seed, n_tasks))
+        shape = (n_tasks, )
+        self.__output_choices = numpy.zeros((n_tasks, 2), dtype=numpy.int64)
+        self.__scores = numpy.zeros(shape, dtype=numpy.int64)
+        self.__trials = numpy.zeros(shape, dtype=numpy.int64)
+        self.__tick_in_frame = numpy.zeros(shape, dtype=numpy.int64)
+        self.__score_change_count = numpy.zeros(shape, dtype=numpy.int64)
+        self.__tick = 0
+
+    @property
+    def n_tasks(self) -> int:
+        """
+        The number of tasks.
+
+        :rtype: int
+        """
+        return self.__n_tasks
+
+    @property
+    def n_neurons(self) -> int:
+        """
+        The number of neurons that the tasks spike from, one for each
+        input.
+
+        :rtype: int
+        """
+        return self.__n_inputs
+
+    @property
+    def tick(self) -> int:
+        """
+        The number of ticks simulated.
+
+        :rtype: int
+        """
+        return self.__tick
+
+    @property
+    def correct_outputs(self) -> numpy.ndarray:
+        """
+        The output that the truth table of each task gives for its inputs.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__correct_outputs.copy()
+
+    @property
+    def scores(self) -> numpy.ndarray:
+        """
+        The number of correct choices of each task.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__scores.copy()
+
+    @property
+    def trials(self) -> numpy.ndarray:
+        """
+        The number of choices scored by each task since it was reset.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__trials.copy()
+
+    def reset(self, tasks: Optional[numpy.ndarray] = None) -> None:
+        """
+        Put tasks back into their starting state, as a reset request does
+        between runs on the machine.
+
+        :param tasks:
+            Which tasks to reset, as a mask or indices; all if None
+        :type tasks: ~numpy.ndarray or None
+        """
+        mask = numpy.zeros(self.__n_tasks, dtype=bool)
+        if tasks is None:
+            mask[:] = True
+        else:
+            mask[tasks] = True
+        self.__output_choices[mask] = 0
+        self.__scores[mask] = 0
+        self.__trials[mask] = 0
+        self.__tick_in_frame[mask] = 0
+
+    def step(self, actions: numpy.ndarray) -> numpy.ndarray:
+        """
+        Simulate one tick of every task.
+
+        :param ~numpy.ndarray actions:
+            The number of spikes received by each task since the last tick
+            choosing output 0 and output 1, as an array of shape
+            (n_tasks, 2)
+        :return: The number of spikes sent from each input of each task
+        :rtype: ~numpy.ndarray
+        """
+        actions = numpy.asarray(actions)
+        if actions.shape != (self.__n_tasks, 2):
+            raise ValueError(
+                f"Actions must have shape ({self.__n_tasks}, 2), not "
+                f"{actions.shape}")
+        self.__output_choices += actions
+        self.__score_change_count += 1
+        self.__tick_in_frame += 1
+        spikes = self.__did_it_fire()
+
+        scoring = self.__tick_in_frame == self.__score_delay
+        if scoring.any():
+            choices = self.__output_choices
+            choice = numpy.where(
+                choices[:, 0] > choices[:, 1], 0,
+                numpy.where(choices[:, 1] > choices[:, 0], 1, -1))
+            self.__trials += scoring
+            self.__scores += scoring & (choice == self.__correct_outputs)
+            choices[scoring] = 0
+            self.__tick_in_frame[scoring] = 0
+            self.__score_change_count[
+                scoring &
+                (self.__score_change_count >= _SCORE_RECORD_TICKS)] = 0
+        self.__tick += 1
+        return spikes
+
+    def __did_it_fire(self) -> numpy.ndarray:
+        """
+        Spike the inputs of every task, as ``did_it_fire`` does.
+
+        :return: Whether each input of each task spiked
+        """
+        inputs = self.__input_sequences
+        if self.__stochastic:
+            spikes = numpy.empty(inputs.shape, dtype=bool)
+            for i in range(self.__n_inputs):
+                spikes[:, i] = self.__rng.rand021() < numpy.where(
+                    inputs[:, i] == 0, self.__max_fire_prob_off,
+                    self.__max_fire_prob_on)
+        else:
+            count = self.__score_change_count[:, None]
+            spikes = (
+                ((inputs == 0) & (count % self.__period_off == 0)) |
+                ((inputs == 1) & (count % self.__period_on == 0)))
+        return spikes.astype(numpy.uint8)
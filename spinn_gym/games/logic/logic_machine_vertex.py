@@ -14,6 +14,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from enum import Enum
+from typing import Any, Callable, Dict, Sequence, Tuple, Union
 import numpy
 
 from spinn_utilities.overrides import overrides
@@ -24,16 +25,11 @@ from pacman.model.placements import Placement
 from spinn_front_end_common.utilities import helpful_functions
 from spinn_front_end_common.abstract_models.abstract_has_associated_binary \
     import AbstractHasAssociatedBinary
-from spinn_front_end_common.interface.buffer_management \
-    import recording_utilities
 from spinn_front_end_common.abstract_models \
     .abstract_generates_data_specification \
     import AbstractGeneratesDataSpecification
 from spinn_front_end_common.interface.ds import (
     DataSpecificationGenerator, DataType)
-from spinn_front_end_common.interface.simulation import simulation_utilities
-from spinn_front_end_common.utilities import constants as \
-    front_end_common_constants
 
 # sPyNNaker imports
 from spynnaker.pyNN.data import SpynnakerDataView
@@ -43,19 +39,51 @@ from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
 from spinn_gym.games import SpinnGymMachineVertex
 
 
+class Bad_Table(ValueError):
+    """
+    table and input sequence are not compatible
+    """
+
+
 # ----------------------------------------------------------------------------
 # LogicMachineVertex
 # ----------------------------------------------------------------------------
 class LogicMachineVertex(SpinnGymMachineVertex):
     LOGIC_REGION_BYTES = 4
-    BASE_DATA_REGION_BYTES = 9 * 4
+
+    #: The most inputs a task can have; the truth table has an entry, of
+    #: one bit, for each combination of them
+    MAX_INPUTS = 24
+
+    #: How many entries of a truth table given by a function are found at
+    #: once
+    _TABLE_CHUNK_ENTRIES = 1 << 16
 
     _LOGIC_REGIONS = Enum(
         value="_LOGIC_REGIONS",
         names=[('SYSTEM', 0),
                ('LOGIC', 1),
                ('RECORDING', 2),
-               ('DATA', 3)])
+               ('DATA', 3),
+               ('PROVENANCE', 4)])
+
+    PROVENANCE_ITEMS = (
+        "Input_packets_received", "Choice_0_spikes_received",
+        "Choice_1_spikes_received", "Choices_scored", "Spikes_sent")
+
+    PARAMETER_SCHEMA = (
+        ("score_delay", DataType.UINT32),
+        ("no_inputs", DataType.UINT32),
+        *SpinnGymMachineVertex.RANDOM_SEED_SCHEMA,
+        ("rate_on", DataType.UINT32),
+        ("rate_off", DataType.UINT32),
+        ("stochastic", DataType.UINT32),
+        ("record_changes_only", DataType.UINT32),
+        ("reset_flags", DataType.UINT32))
+
+    REWRITABLE_PARAMETERS = (
+        "truth_table", "input_sequence", "score_delay", "rate_on", "rate_off",
+        "stochastic")
 
     __slots__ = ("_input_sequence", "_no_inputs", "_rate_on", "_rate_off",
                  "_score_delay", "_stochastic", "_truth_table")
@@ -63,7 +91,7 @@ class LogicMachineVertex(SpinnGymMachineVertex):
     def __init__(self, label, app_vertex, n_neurons,
                  simulation_duration_ms, random_seed,
                  truth_table, input_sequence, rate_on, rate_off,
-                 score_delay, stochastic):
+                 score_delay, stochastic, record_changes_only=False):
         """
 
         :param label: The optional name of the vertex
@@ -79,11 +107,18 @@ class LogicMachineVertex(SpinnGymMachineVertex):
         :param float simulation_duration_ms:
         :param list(int) random_seed: List of 4 vlaues to seed the c code
         :param truth_table:
+            The correct output for each combination of inputs, either as a
+            sequence of ``2 ** len(input_sequence)`` values of 0 or 1, or
+            as a function; see :py:meth:`convert_truth_table`
+        :type truth_table: list(int) or ~numpy.ndarray or callable
         :param input_sequence:
         :param rate_on:
         :param rate_off:
         :param score_delay:
         :param stochastic:
+        :param bool record_changes_only:
+            Whether to record the score, with the tick, only when it
+            changes
 
         :raise PacmanInvalidParameterException:
             If one of the constraints is not valid
@@ -95,18 +130,169 @@ class LogicMachineVertex(SpinnGymMachineVertex):
         # Superclasses
         super(LogicMachineVertex, self).__init__(
             label, app_vertex, n_neurons,
-            self.LOGIC_REGION_BYTES + self.BASE_DATA_REGION_BYTES,
-            simulation_duration_ms,  random_seed)
+            self.LOGIC_REGION_BYTES,
+            simulation_duration_ms,  random_seed, record_changes_only)
 
         # Pass in variables
-        self._truth_table = truth_table
+        self._input_sequence = input_sequence
+        self._no_inputs = len(input_sequence)
+        self._truth_table = self.pack_truth_table(
+            self.convert_truth_table(truth_table, self._no_inputs))
         self._rate_on = rate_on
         self._rate_off = rate_off
         self._stochastic = stochastic
-        self._input_sequence = input_sequence
-        self._no_inputs = len(input_sequence)
         self._score_delay = score_delay
 
+    @property
+    @overrides(SpinnGymMachineVertex.parameters)
+    def parameters(self) -> Dict[str, Any]:
+        parameters = super(LogicMachineVertex, self).parameters
+        # The truth table is archived as the binary reads it, as it has an
+        # entry for each of up to 2 ** MAX_INPUTS combinations of inputs
+        parameters.update(
+            truth_table_words=self._truth_table.tolist(),
+            input_sequence=list(self._input_sequence),
+            score_delay=self._score_delay, rate_on=self._rate_on,
+            rate_off=self._rate_off, stochastic=self._stochastic)
+        return parameters
+
+    @overrides(SpinnGymMachineVertex.get_parameter_value)
+    def get_parameter_value(self, name: str) -> Any:
+        if name == "truth_table":
+            return self.unpack_truth_table(
+                self._truth_table, self._no_inputs).tolist()
+        return super(LogicMachineVertex, self).get_parameter_value(name)
+
+    @classmethod
+    def convert_truth_table(
+            cls, truth_table: Union[Sequence[int], numpy.ndarray,
+                                    Callable[[Tuple[Any, ...]], Any]],
+            n_inputs: int) -> numpy.ndarray:
+        """
+        Check a truth table and turn it into an array of one entry for each
+        combination of the inputs.
+
+        Entry ``i`` is the correct output when input ``j`` is bit ``j`` of
+        ``i``.
+
+        A function is given the values of the inputs of many entries at
+        once, as a tuple of arrays of 0s and 1s, one for each input, and
+        should return an array of whether the output of each entry should
+        be 1, as ``lambda inputs: sum(inputs) % 2`` does.  A function that
+        can't be given arrays, because it raises an error or doesn't return
+        an output for each entry, is given the inputs of each entry in
+        turn, as a tuple of 0s and 1s, and returns whether its output
+        should be 1.
+
+        :param truth_table: The entries, or a function that gives them
+        :type truth_table: list(int) or ~numpy.ndarray or callable
+        :param int n_inputs: The number of inputs
+        :rtype: ~numpy.ndarray
+        :raises Bad_Table:
+            If there are too many inputs, or the table is the wrong size or
+            has entries other than 0 and 1
+        """
+        if n_inputs > cls.MAX_INPUTS:
+            raise Bad_Table(
+                f"A logic task can have at most {cls.MAX_INPUTS} inputs, "
+                f"not {n_inputs}")
+        n_entries = 1 << n_inputs
+        if callable(truth_table):
+            return cls.__evaluate_truth_table(truth_table, n_inputs)
+        table = numpy.asarray(truth_table)
+        if table.shape != (n_entries, ):
+            raise Bad_Table(
+                f"A truth table for {n_inputs} inputs needs {n_entries} "
+                f"entries, not {len(table)}")
+        if not numpy.all((table == 0) | (table == 1)):
+            raise Bad_Table(
+                "The entries of a truth table must be 0 or 1")
+        return table.astype(numpy.uint8)
+
+    @classmethod
+    def __evaluate_truth_table(
+            cls, function: Callable[[Tuple[Any, ...]], Any],
+            n_inputs: int) -> numpy.ndarray:
+        """
+        Find the entries of a truth table given by a function, a chunk of
+        entries at a time so that the inputs of every entry are never held
+        at once.
+        """
+        n_entries = 1 << n_inputs
+        table = numpy.zeros(n_entries, dtype=numpy.uint8)
+        shifts = numpy.arange(n_inputs)[:, None]
+        vectorised = True
+        for start in range(0, n_entries, cls._TABLE_CHUNK_ENTRIES):
+            entries = numpy.arange(
+                start, min(start + cls._TABLE_CHUNK_ENTRIES, n_entries))
+            inputs = tuple((entries >> shifts) & 1)
+            if vectorised:
+                try:
+                    outputs = numpy.asarray(function(inputs))
+                    vectorised = outputs.shape == entries.shape
+                except Exception:  # pylint: disable=broad-except
+                    vectorised = False
+            if not vectorised:
+                outputs = numpy.array([
+                    bool(function(row)) for row in zip(
+                        *(values.tolist() for values in inputs))])
+            table[entries] = outputs != 0
+        return table
+
+    @staticmethod
+    def pack_truth_table(table: numpy.ndarray) -> numpy.ndarray:
+        """
+        Pack the entries of a truth table as the binary reads them, with
+        entry ``i`` in bit ``i % 32`` of word ``i // 32``.
+
+        :param ~numpy.ndarray table: The entries, as 0s and 1s
+        :rtype: ~numpy.ndarray
+        """
+        bits = numpy.zeros(-(-len(table) // 32) * 32, dtype=numpy.uint8)
+        bits[:len(table)] = table
+        return numpy.packbits(
+            bits, bitorder="little").view("<u4").astype(numpy.uint32)
+
+    @staticmethod
+    def unpack_truth_table(
+            words: numpy.ndarray, n_inputs: int) -> numpy.ndarray:
+        """
+        Unpack the entries of a truth table packed by
+        :py:meth:`pack_truth_table`.
+
+        :param ~numpy.ndarray words: The packed words
+        :param int n_inputs: The number of inputs
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.unpackbits(
+            numpy.asarray(words, dtype="<u4").view(numpy.uint8),
+            count=1 << n_inputs, bitorder="little")
+
+    @overrides(SpinnGymMachineVertex._set_parameter_value)
+    def _set_parameter_value(self, name: str, value: Any) -> None:
+        if name == "truth_table":
+            value = self.pack_truth_table(
+                self.convert_truth_table(value, self._no_inputs))
+        super(LogicMachineVertex, self)._set_parameter_value(name, value)
+
+    def get_packed_truth_table(self) -> numpy.ndarray:
+        """
+        Get the truth table as the binary reads it; see
+        :py:meth:`pack_truth_table`.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self._truth_table
+
+    @overrides(SpinnGymMachineVertex.get_parameter_region_data)
+    def get_parameter_region_data(self) -> numpy.ndarray:
+        # The input sequence and then the packed truth table follow the
+        # fields
+        return numpy.concatenate((
+            super(LogicMachineVertex, self).get_parameter_region_data(),
+            numpy.array(self._input_sequence, dtype=numpy.uint32),
+            self.get_packed_truth_table()))
+
     # ------------------------------------------------------------------------
     # AbstractGeneratesDataSpecification overrides
     # ------------------------------------------------------------------------
@@ -120,30 +306,11 @@ class LogicMachineVertex(SpinnGymMachineVertex):
         spec.comment("\nReserving memory space for data regions:\n\n")
 
         # Reserve memory:
-        spec.reserve_memory_region(
-            region=self._LOGIC_REGIONS.SYSTEM.value,
-            size=front_end_common_constants.SYSTEM_BYTES_REQUIREMENT,
-            label='setup')
-        spec.reserve_memory_region(
-            region=self._LOGIC_REGIONS.LOGIC.value,
-            size=self.LOGIC_REGION_BYTES, label='LogicParams')
-        # reserve recording region
-        spec.reserve_memory_region(
-            self._LOGIC_REGIONS.RECORDING.value,
-            recording_utilities.get_recording_header_size(1))
-        spec.reserve_memory_region(
-            region=self._LOGIC_REGIONS.DATA.value,
-            size=self.BASE_DATA_REGION_BYTES+(self._no_inputs*4)+(
-                len(self._truth_table)*4),
-            label='LogicArms')
+        self.reserve_memory_regions(spec)
 
         # Write setup region
         spec.comment("\nWriting setup region:\n")
-        spec.switch_write_focus(
-            self._LOGIC_REGIONS.SYSTEM.value)
-        assert isinstance(vertex, AbstractHasAssociatedBinary)
-        spec.write_array(simulation_utilities.get_simulation_header_array(
-            vertex.get_binary_file_name()))
+        self.write_system_region(spec)
 
         # Write logic region containing routing key to transmit with
         spec.comment("\nWriting logic region:\n")
@@ -155,29 +322,11 @@ class LogicMachineVertex(SpinnGymMachineVertex):
 
         # Write recording region for score
         spec.comment("\nWriting logic recording region:\n")
-        spec.switch_write_focus(
-            self._LOGIC_REGIONS.RECORDING.value)
-        spec.write_array(recording_utilities.get_recording_header_array(
-            [self._recording_size]))
+        self.write_recording_region(spec)
 
         # Write logic data
         spec.comment("\nWriting logic data region:\n")
-        spec.switch_write_focus(
-            self._LOGIC_REGIONS.DATA.value)
-        spec.write_value(self._score_delay, data_type=DataType.UINT32)
-        spec.write_value(self._no_inputs, data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[0], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[1], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[2], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[3], data_type=DataType.UINT32)
-        spec.write_value(self._rate_on, data_type=DataType.UINT32)
-        spec.write_value(self._rate_off, data_type=DataType.UINT32)
-        spec.write_value(self._stochastic, data_type=DataType.UINT32)
-        # Write the data - Arrays must be 32-bit values, so convert
-        data = numpy.array(self._input_sequence, dtype=numpy.uint32)
-        spec.write_array(data.view(numpy.uint32))
-        data = numpy.array(self._truth_table, dtype=numpy.uint32)
-        spec.write_array(data.view(numpy.uint32))
+        self.write_parameter_region(spec)
 
         # End-of-Spec:
         spec.end_specification()
@@ -186,6 +335,31 @@ class LogicMachineVertex(SpinnGymMachineVertex):
         return helpful_functions.locate_memory_region_for_placement(
             placement, self._LOGIC_REGIONS.RECORDING.value)
 
+    @property
+    @overrides(SpinnGymMachineVertex._provenance_region_id)
+    def _provenance_region_id(self) -> int:
+        return self._LOGIC_REGIONS.PROVENANCE.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._parameter_region_id)
+    def _parameter_region_id(self) -> int:
+        return self._LOGIC_REGIONS.DATA.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._system_region_id)
+    def _system_region_id(self) -> int:
+        return self._LOGIC_REGIONS.SYSTEM.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._key_region_id)
+    def _key_region_id(self) -> int:
+        return self._LOGIC_REGIONS.LOGIC.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._recording_region_id)
+    def _recording_region_id(self) -> int:
+        return self._LOGIC_REGIONS.RECORDING.value
+
     @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
     def get_binary_file_name(self) -> str:
         return "logic.aplx"
@@ -19,6 +19,7 @@ from spinn_utilities.overrides import overrides
 
 # common imports
 from spinn_gym.games import SpinnGymApplicationVertex
+from spinn_gym.utilities.seed_streams import resolve_random_seed
 
 # Bandit imports
 from spinn_gym.games.multi_arm_bandit.bandit_machine_vertex import \
@@ -29,11 +30,17 @@ from spinn_gym.games.multi_arm_bandit.bandit_machine_vertex import \
 # Bandit
 # ----------------------------------------------------------------------------
 class Bandit(SpinnGymApplicationVertex):
+    """
+    A multi-armed bandit with any number of arms, up to
+    :py:attr:`BanditMachineVertex.MAX_ARMS`.
+
+    The arm pulled by a spike is the index of the neuron that sent it in
+    its population, decoded from its key however that population is split
+    between cores.  The spikes of up to
+    :py:attr:`BanditMachineVertex.MAX_SOURCES` populations may be sent to
+    a bandit.
+    """
     ONE_DAY_IN_MS = 1000 * 60 * 60 * 24  # 1 day
-    RANDOM_SEED = [numpy.random.randint(10000),
-                   numpy.random.randint(10000),
-                   numpy.random.randint(10000),
-                   numpy.random.randint(10000)]
     ARMS = [0.1, 0.9]
 
     __slots__ = ()
@@ -41,18 +48,18 @@ class Bandit(SpinnGymApplicationVertex):
     def __init__(self, arms=None, reward_delay=200.0, reward_based=1,
                  rate_on=20.0, rate_off=5.0, stochastic=1,
                  constant_input=0, label="Bandit",
-                 simulation_duration_ms=ONE_DAY_IN_MS, random_seed=None):
+                 simulation_duration_ms=ONE_DAY_IN_MS, random_seed=None,
+                 record_changes_only=False):
         if arms is None:
             arms = list(self.ARMS)
-        if random_seed is None:
-            random_seed = list(self.RANDOM_SEED)
+        random_seed = resolve_random_seed(random_seed)
 
         n_neurons = len(arms)
 
         machine_vertex = BanditMachineVertex(
             label, self, n_neurons, simulation_duration_ms, random_seed,
             arms, reward_delay, reward_based, rate_on,
-            rate_off, stochastic, constant_input)
+            rate_off, stochastic, constant_input, record_changes_only)
 
         # Superclasses
         super(Bandit, self).__init__(machine_vertex, label, n_neurons)
@@ -61,3 +68,13 @@ class Bandit(SpinnGymApplicationVertex):
     @overrides(SpinnGymApplicationVertex.score_format)
     def score_format(self) -> type:
         return numpy.int32
+
+    @property
+    @overrides(SpinnGymApplicationVertex.score_dtype)
+    def score_dtype(self) -> numpy.dtype:
+        # reward_based can be changed between runs, so the value the game
+        # will next run with is used
+        if self.machine_vertex.get_parameter_value("reward_based"):
+            return super(Bandit, self).score_dtype
+        # Without reward the number of pulls of the best arm is recorded
+        return numpy.dtype([("correct_pulls", self.score_format)])
@@ -0,0 +1,339 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Optional
+
+import numpy
+
+from spinn_gym.games.multi_arm_bandit.bandit import Bandit
+from spinn_gym.games.multi_arm_bandit.bandit_machine_vertex import \
+    BanditMachineVertex
+from spinn_gym.utilities.kiss64 import Kiss64
+from spinn_gym.utilities.seed_streams import resolve_random_seeds
+
+_f32 = numpy.float32
+
+
+# ----------------------------------------------------------------------------
+# BanditEngine
+# ----------------------------------------------------------------------------
+class BanditEngine(object):
+    """
+    Many multi-armed bandits, simulated on the host with NumPy as
+    ``band.c`` simulates one on the machine.
+
+    All the bandits are stepped together, one tick per call of
+    :py:meth:`step`, and a bandit makes the same random choices as the
+    binary given the same seed.  Every ``reward_delay`` ticks, each bandit
+    pulls the arm whose spikes most exceed those of the least spiked arm,
+    breaking ties at random, and rewards the pull with the probability of
+    that arm.
+
+    As well as the score, the expected regret of each bandit is kept: the
+    probability of a reward from the best arm less that from the arm
+    pulled, summed over every pull, counting a pull of no arm as a pull of
+    an arm that never rewards.
+    """
+
+    #: The neuron that spikes a reward
+    REWARD = 0
+    #: The neuron that spikes no reward
+    NO_REWARD = 1
+
+    __slots__ = (
+        "__n_bandits", "__n_arms", "__arm_probabilities", "__best_arm",
+        "__reward_delay", "__stochastic", "__constant_input",
+        "__max_fire_prob_on", "__max_fire_prob_off", "__period_on",
+        "__period_off", "__rng", "__arm_choices", "__scores",
+        "__correct_pulls", "__pulls", "__regrets", "__rewarding",
+        "__tick_in_frame", "__tick")
+
+    def __init__(self, n_bandits: int, arms=None, reward_delay: int = 200,
+                 rate_on: int = 20, rate_off: int = 5, stochastic: int = 1,
+                 constant_input: int = 0, random_seed=None):
+        """
+        :param int n_bandits: The number of bandits to simulate
+        :param arms:
+            The probability of a reward from each arm; one list for all
+            the bandits or one for each bandit.  The arms of
+            :py:class:`~spinn_gym.Bandit` if None.
+        :param int reward_delay: The ticks between pulls
+        :param int rate_on:
+            The rate of the neuron that tells of the last pull with
+            constant input, in Hz
+        :param int rate_off:
+            The rate of the other neuron with constant input, in Hz
+        :param int stochastic:
+            With constant input, 1 to spike at random at the rates, or 0
+            to spike regularly
+        :param int constant_input:
+            1 to spike the result of the last pull continually, or 0 to
+            spike it once on each pull
+        :param random_seed:
+            The seeds of the bandits; see
+            :py:func:`~spinn_gym.utilities.resolve_random_seeds`
+        :raises ValueError:
+            If the arms are not valid, or the rates can't be spiked
+            regularly
+        """
+        if arms is None:
+            arms = Bandit.ARMS
+        arms = numpy.asarray(arms, dtype=float)
+        if arms.ndim == 1:
+            arms = arms[None, :]
+        probabilities = numpy.array(
+            [BanditMachineVertex.convert_arms(row) for row in arms],
+            dtype=numpy.uint32)
+        self.__n_bandits = n_bandits
+        self.__n_arms = probabilities.shape[1]
+        self.__arm_probabilities = numpy.broadcast_to(
+            probabilities, (n_bandits, self.__n_arms)).copy()
+        self.__best_arm = numpy.argmax(self.__arm_probabilities, axis=1)
+
+        self.__reward_delay = int(reward_delay)
+        self.__stochastic = stochastic
+        self.__constant_input = constant_input
+        rate_on = int(rate_on)
+        rate_off = int(rate_off)
+        self.__max_fire_prob_on = _f32(rate_on) / _f32(1000)
+        self.__max_fire_prob_off = _f32(rate_off) / _f32(1000)
+        self.__period_on = 0
+        self.__period_off = 0
+        if constant_input and not stochastic:
+            if not (0 < rate_on <= 1000 and 0 < rate_off <= 1000):
+                raise ValueError(
+                    "Regular rates must be between 1 and 1000 Hz, not "
+                    f"{rate_on} and {rate_off}")
+            self.__period_on = 1000 // rate_on
+            self.__period_off = 1000 // rate_off
+
+        self.__rng = Kiss64(resolve_random_seeds(random_seed, n_bandits))
+        shape = (n_bandits, )
+        self.__arm_choices = numpy.zeros(
+            (n_bandits, self.__n_arms), dtype=numpy.int64)
+        self.__scores = numpy.zeros(shape, dtype=numpy.int64)
+        self.__correct_pulls = numpy.zeros(shape, dtype=numpy.int64)
+        self.__pulls = numpy.zeros(shape, dtype=numpy.int64)
+        self.__regrets = numpy.zeros(shape, dtype=float)
+        self.__rewarding = numpy.zeros(shape, dtype=bool)
+        self.__tick_in_frame = numpy.zeros(shape, dtype=numpy.int64)
+        self.__tick = 0
+
+    @property
+    def n_bandits(self) -> int:
+        """
+        The number of bandits.
+
+        :rtype: int
+        """
+        return self.__n_bandits
+
+    @property
+    def n_arms(self) -> int:
+        """
+        The number of arms of each bandit, and so of neurons that can pull
+        them.
+
+        :rtype: int
+        """
+        return self.__n_arms
+
+    @property
+    def n_neurons(self) -> int:
+        """
+        The number of neurons that the bandits spike from.
+
+        :rtype: int
+        """
+        return 2
+
+    @property
+    def tick(self) -> int:
+        """
+        The number of ticks simulated.
+
+        :rtype: int
+        """
+        return self.__tick
+
+    @property
+    def best_arms(self) -> numpy.ndarray:
+        """
+        The arm of each bandit most likely to reward a pull.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__best_arm.copy()
+
+    @property
+    def scores(self) -> numpy.ndarray:
+        """
+        The number of rewards that each bandit has given.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__scores.copy()
+
+    @property
+    def correct_pulls(self) -> numpy.ndarray:
+        """
+        The number of pulls of the best arm of each bandit.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__correct_pulls.copy()
+
+    @property
+    def pulls(self) -> numpy.ndarray:
+        """
+        The number of times each bandit has looked for a pull, whether or
+        not an arm was pulled.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__pulls.copy()
+
+    @property
+    def regrets(self) -> numpy.ndarray:
+        """
+        The expected regret of each bandit.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__regrets.copy()
+
+    @property
+    def rewarding(self) -> numpy.ndarray:
+        """
+        Whether the last pull of each bandit was rewarded.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__rewarding.copy()
+
+    def reset(self, bandits: Optional[numpy.ndarray] = None) -> None:
+        """
+        Put bandits back into their starting state, as a reset request
+        does between runs on the machine.
+
+        :param bandits:
+            Which bandits to reset, as a mask or indices; all if None
+        :type bandits: ~numpy.ndarray or None
+        """
+        mask = numpy.zeros(self.__n_bandits, dtype=bool)
+        if bandits is None:
+            mask[:] = True
+        else:
+            mask[bandits] = True
+        self.__arm_choices[mask] = 0
+        self.__scores[mask] = 0
+        self.__correct_pulls[mask] = 0
+        self.__pulls[mask] = 0
+        self.__regrets[mask] = 0
+        self.__rewarding[mask] = False
+        self.__tick_in_frame[mask] = 0
+
+    def step(self, actions: numpy.ndarray) -> numpy.ndarray:
+        """
+        Simulate one tick of every bandit.
+
+        :param ~numpy.ndarray actions:
+            The number of spikes received by each bandit since the last
+            tick for each arm, as an array of shape (n_bandits, n_arms)
+        :return: The number of spikes sent from each neuron of each
+            bandit, :py:attr:`REWARD` then :py:attr:`NO_REWARD`
+        :rtype: ~numpy.ndarray
+        """
+        actions = numpy.asarray(actions)
+        if actions.shape != (self.__n_bandits, self.__n_arms):
+            raise ValueError(
+                f"Actions must have shape ({self.__n_bandits}, "
+                f"{self.__n_arms}), not {actions.shape}")
+        self.__arm_choices += actions
+        spikes = numpy.zeros((self.__n_bandits, 2), dtype=numpy.uint8)
+
+        self.__tick_in_frame += 1
+        pulling = self.__tick_in_frame == self.__reward_delay
+        if pulling.any():
+            rewarded = self.__was_there_a_reward(pulling)
+            self.__rewarding[pulling] = rewarded[pulling]
+            self.__scores += rewarded
+            if not self.__constant_input:
+                spikes[rewarded, self.REWARD] += 1
+                spikes[pulling & ~rewarded, self.NO_REWARD] += 1
+            self.__tick_in_frame[pulling] = 0
+
+        if self.__constant_input:
+            self.__send_state(spikes)
+        self.__tick += 1
+        return spikes
+
+    def __was_there_a_reward(self, pulling: numpy.ndarray) -> numpy.ndarray:
+        """
+        Pull the arm of each pulling bandit that was spiked most, as
+        ``was_there_a_reward`` does, and roll for a reward.
+
+        :return: Whether each bandit gave a reward
+        """
+        values = self.__arm_choices - self.__arm_choices.min(
+            axis=1, keepdims=True)
+        self.__arm_choices[pulling] = 0
+        choice = numpy.full(self.__n_bandits, -1)
+        highest = numpy.zeros(self.__n_bandits, dtype=numpy.int64)
+
+        # Go through the arms in turn, as the binary does, as an arm that
+        # ties with the best so far takes its place only on a coin toss
+        for arm in range(self.__n_arms):
+            value = values[:, arm]
+            better = pulling & (value != 0) & (value >= highest)
+            tied = better & (value == highest)
+            if arm > 0 and tied.any():
+                better[tied] = self.__rng.next(tied)[tied] % 2 == 0
+            choice[better] = arm
+            highest[better] = value[better]
+
+        self.__pulls += pulling
+        self.__correct_pulls += pulling & (choice == self.__best_arm)
+        bandits = numpy.arange(self.__n_bandits)
+        probability = numpy.where(
+            choice >= 0, self.__arm_probabilities[bandits, choice], 0)
+        best_probability = self.__arm_probabilities[
+            bandits, self.__best_arm]
+        self.__regrets[pulling] += (
+            best_probability[pulling].astype(float) -
+            probability[pulling].astype(float)) / 0xFFFFFFFF
+
+        rolling = pulling & (highest != 0)
+        roll = self.__rng.next(rolling)
+        return rolling & (roll < probability)
+
+    def __send_state(self, spikes: numpy.ndarray) -> None:
+        """
+        Spike the result of the last pull of each bandit, as
+        ``send_state`` does.
+        """
+        rewarding = self.__rewarding
+        if self.__stochastic:
+            spike_off = self.__rng.rand021() < self.__max_fire_prob_off
+            spike_on = self.__rng.rand021() < self.__max_fire_prob_on
+        else:
+            spike_off = numpy.full(
+                self.__n_bandits, self.__tick % self.__period_off == 0)
+            spike_on = numpy.full(
+                self.__n_bandits, self.__tick % self.__period_on == 0)
+        spikes[spike_off & rewarding, self.NO_REWARD] += 1
+        spikes[spike_off & ~rewarding, self.REWARD] += 1
+        spikes[spike_on & rewarding, self.REWARD] += 1
+        spikes[spike_on & ~rewarding, self.NO_REWARD] += 1
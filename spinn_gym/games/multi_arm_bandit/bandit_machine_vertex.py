@@ -14,26 +14,24 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from enum import Enum
+from typing import Any, Dict, List, Tuple
 import numpy
 
 from spinn_utilities.overrides import overrides
 
+from pacman.model.graphs.application import ApplicationVertex
 from pacman.model.placements import Placement
 
 # SpinnFrontEndCommon imports
 from spinn_front_end_common.utilities import helpful_functions
 from spinn_front_end_common.abstract_models.abstract_has_associated_binary \
     import AbstractHasAssociatedBinary
-from spinn_front_end_common.interface.buffer_management \
-    import recording_utilities
 from spinn_front_end_common.abstract_models \
     .abstract_generates_data_specification \
     import AbstractGeneratesDataSpecification
 from spinn_front_end_common.interface.ds import (
     DataSpecificationGenerator, DataType)
-from spinn_front_end_common.interface.simulation import simulation_utilities
-from spinn_front_end_common.utilities import constants as \
-    front_end_common_constants
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 
 # sPyNNaker imports
 from spynnaker.pyNN.data import SpynnakerDataView
@@ -47,22 +45,53 @@ from spinn_gym.games import SpinnGymMachineVertex
 # BanditMachineVertex
 # ----------------------------------------------------------------------------
 class BanditMachineVertex(SpinnGymMachineVertex):
-    BANDIT_REGION_BYTES = 4
-    BASE_ARMS_REGION_BYTES = 11 * 4
+    #: The most vertices whose spikes can pull the arms of a bandit
+    MAX_SOURCES = 8
+
+    #: The key to send with, followed by how to find the arm that a key
+    #: received from each source pulls
+    BANDIT_REGION_BYTES = (2 + 7 * MAX_SOURCES) * BYTES_PER_WORD
+
+    #: The most arms a bandit can have; the binary counts the spikes for
+    #: each arm in DTCM
+    MAX_ARMS = 4096
 
     _BANDIT_REGIONS = Enum(
         value="_BANDIT_REGIONS",
         names=[('SYSTEM', 0),
                ('BANDIT', 1),
                ('RECORDING', 2),
-               ('ARMS', 3)])
+               ('ARMS', 3),
+               ('PROVENANCE', 4)])
+
+    PROVENANCE_ITEMS = (
+        "Input_packets_received", "Input_spikes_received",
+        "Invalid_arm_spikes_received", "Rewards_given", "Rewards_withheld",
+        "Spikes_sent")
+
+    PARAMETER_SCHEMA = (
+        ("reward_delay", DataType.UINT32),
+        ("no_arms", DataType.UINT32),
+        *SpinnGymMachineVertex.RANDOM_SEED_SCHEMA,
+        ("reward_based", DataType.UINT32),
+        ("rate_on", DataType.UINT32),
+        ("rate_off", DataType.UINT32),
+        ("stochastic", DataType.UINT32),
+        ("constant_input", DataType.UINT32),
+        ("record_changes_only", DataType.UINT32),
+        ("reset_flags", DataType.UINT32))
+
+    REWRITABLE_PARAMETERS = (
+        "arms", "reward_delay", "reward_based", "rate_on", "rate_off",
+        "stochastic", "constant_input")
 
     __slots__ = ("_arms", "_constant_input", "_no_arms", "_rate_off",
                  "_rate_on", "_reward_based", "_reward_delay", "_stochastic")
 
     def __init__(self, label, app_vertex, n_neurons, simulation_duration_ms,
                  random_seed, arms, reward_delay, reward_based, rate_on,
-                 rate_off, stochastic, constant_input):
+                 rate_off, stochastic, constant_input,
+                 record_changes_only=False):
         """
 
         :param label: The optional name of the vertex
@@ -87,6 +116,9 @@ class BanditMachineVertex(SpinnGymMachineVertex):
         :param rate_off:
         :param stochastic:
         :param constant_input:
+        :param bool record_changes_only:
+            Whether to record the score, with the tick, only when it
+            changes
 
         :raise PacmanInvalidParameterException:
             If one of the constraints is not valid
@@ -99,16 +131,12 @@ class BanditMachineVertex(SpinnGymMachineVertex):
         # Superclasses
         super(BanditMachineVertex, self).__init__(
             label, app_vertex, n_neurons,
-            self.BANDIT_REGION_BYTES + self.BASE_ARMS_REGION_BYTES,
-            simulation_duration_ms,  random_seed)
+            self.BANDIT_REGION_BYTES,
+            simulation_duration_ms,  random_seed, record_changes_only)
 
         # Pass in variables
-        arms_list = []
-        for arm in arms:
-            arms_list.append(numpy.uint32(arm*0xffffffff))
-        self._arms = arms_list
-
-        self._no_arms = len(arms)
+        self._arms = self.convert_arms(arms)
+        self._no_arms = len(self._arms)
 
         self._reward_delay = reward_delay
         self._reward_based = reward_based
@@ -118,6 +146,91 @@ class BanditMachineVertex(SpinnGymMachineVertex):
         self._stochastic = stochastic
         self._constant_input = constant_input
 
+    @property
+    @overrides(SpinnGymMachineVertex.parameters)
+    def parameters(self) -> Dict[str, Any]:
+        parameters = super(BanditMachineVertex, self).parameters
+        parameters.update(
+            arms=[int(arm) / 0xffffffff for arm in self._arms],
+            reward_delay=self._reward_delay, reward_based=self._reward_based,
+            rate_on=self._rate_on, rate_off=self._rate_off,
+            stochastic=self._stochastic,
+            constant_input=self._constant_input)
+        return parameters
+
+    @classmethod
+    def convert_arms(cls, arms) -> List[numpy.uint32]:
+        """
+        Check the reward probabilities of the arms and convert them to the
+        form the binary compares random numbers with.
+
+        :param list(float) arms: The probability of a reward from each arm
+        :rtype: list(~numpy.uint32)
+        :raises ValueError:
+            If there are no arms or too many, or a probability is not
+            between 0 and 1
+        """
+        if not 0 < len(arms) <= cls.MAX_ARMS:
+            raise ValueError(
+                f"A bandit must have between 1 and {cls.MAX_ARMS} arms, not "
+                f"{len(arms)}")
+        probabilities = numpy.asarray(arms, dtype=float)
+        if not numpy.all((probabilities >= 0) & (probabilities <= 1)):
+            raise ValueError(
+                f"The arm probabilities must be between 0 and 1: {arms}")
+        return [numpy.uint32(arm*0xffffffff) for arm in probabilities]
+
+    @overrides(SpinnGymMachineVertex._set_parameter_value)
+    def _set_parameter_value(self, name: str, value: Any) -> None:
+        if name == "arms":
+            value = self.convert_arms(value)
+        super(BanditMachineVertex, self)._set_parameter_value(name, value)
+
+    @overrides(SpinnGymMachineVertex.get_parameter_region_data)
+    def get_parameter_region_data(self) -> numpy.ndarray:
+        # The arm probabilities follow the fields
+        return numpy.concatenate((
+            super(BanditMachineVertex, self).get_parameter_region_data(),
+            numpy.array(self._arms, dtype=numpy.uint32)))
+
+    def _get_source_vertices(self) -> List[ApplicationVertex]:
+        """
+        Find the vertices whose spikes pull the arms, which include the
+        bandit itself when its own spikes are sent back to it.
+
+        :rtype: list(~pacman.model.graphs.application.ApplicationVertex)
+        :raises ValueError: If there are more than :py:attr:`MAX_SOURCES`
+        """
+        sources: List[ApplicationVertex] = []
+        for partition in SpynnakerDataView.iterate_partitions():
+            if (partition.identifier == SPIKE_PARTITION_ID and
+                    partition.pre_vertex not in sources and any(
+                        edge.post_vertex is self.app_vertex
+                        for edge in partition.edges)):
+                sources.append(partition.pre_vertex)
+        if len(sources) > self.MAX_SOURCES:
+            raise ValueError(
+                f"The arms of {self.label} can be pulled by at most "
+                f"{self.MAX_SOURCES} populations, not by {len(sources)}")
+        return sources
+
+    def _get_arm_key_layouts(self) -> List[Tuple[int, ...]]:
+        """
+        Get how to find the arm that a key received pulls, which is the
+        index of the neuron that sent it in its source.
+
+        :return: For each source, its key and mask, followed by the layout
+            given by :py:meth:`_get_source_key_layout`
+        :rtype: list(tuple(int, ...))
+        """
+        routing_infos = SpynnakerDataView.get_routing_infos()
+        layouts: List[Tuple[int, ...]] = []
+        for source in self._get_source_vertices():
+            r_info = routing_infos.get_info_from(source, SPIKE_PARTITION_ID)
+            layouts.append((r_info.key, r_info.mask,
+                            *self._get_source_key_layout(source)))
+        return layouts
+
     # ------------------------------------------------------------------------
     # AbstractGeneratesDataSpecification overrides
     # ------------------------------------------------------------------------
@@ -131,63 +244,33 @@ class BanditMachineVertex(SpinnGymMachineVertex):
         spec.comment("\nReserving memory space for data regions:\n\n")
 
         # Reserve memory:
-        spec.reserve_memory_region(
-            region=self._BANDIT_REGIONS.SYSTEM.value,
-            size=front_end_common_constants.SYSTEM_BYTES_REQUIREMENT,
-            label='setup')
-        spec.reserve_memory_region(
-            region=self._BANDIT_REGIONS.BANDIT.value,
-            size=self.BANDIT_REGION_BYTES, label='BanditParams')
-        # reserve recording region
-        spec.reserve_memory_region(
-            self._BANDIT_REGIONS.RECORDING.value,
-            recording_utilities.get_recording_header_size(1))
-        spec.reserve_memory_region(
-            region=self._BANDIT_REGIONS.ARMS.value,
-            size=self.BASE_ARMS_REGION_BYTES+(self._no_arms*4),
-            label='BanditArms')
+        self.reserve_memory_regions(spec)
 
         # Write setup region
         spec.comment("\nWriting setup region:\n")
-        spec.switch_write_focus(
-            self._BANDIT_REGIONS.SYSTEM.value)
-        assert isinstance(vertex, AbstractHasAssociatedBinary)
-        spec.write_array(simulation_utilities.get_simulation_header_array(
-            vertex.get_binary_file_name()))
+        self.write_system_region(spec)
 
-        # Write bandit region containing routing key to transmit with
+        # Write bandit region containing routing key to transmit with and
+        # how to decode the keys received
         spec.comment("\nWriting bandit region:\n")
         spec.switch_write_focus(
             self._BANDIT_REGIONS.BANDIT.value)
         routing_info = SpynnakerDataView.get_routing_infos()
         spec.write_value(routing_info.get_key_from(
             vertex, SPIKE_PARTITION_ID))
+        layouts = self._get_arm_key_layouts()
+        spec.write_value(len(layouts))
+        for layout in layouts:
+            for value in layout:
+                spec.write_value(value)
 
         # Write recording region for score
         spec.comment("\nWriting bandit recording region:\n")
-        spec.switch_write_focus(
-            self._BANDIT_REGIONS.RECORDING.value)
-        spec.write_array(recording_utilities.get_recording_header_array(
-            [self._recording_size]))
+        self.write_recording_region(spec)
 
         # Write probabilites for arms
         spec.comment("\nWriting arm probability region:\n")
-        spec.switch_write_focus(
-            self._BANDIT_REGIONS.ARMS.value)
-        spec.write_value(self._reward_delay, data_type=DataType.UINT32)
-        spec.write_value(self._no_arms, data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[0], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[1], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[2], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[3], data_type=DataType.UINT32)
-        spec.write_value(self._reward_based, data_type=DataType.UINT32)
-        spec.write_value(self._rate_on, data_type=DataType.UINT32)
-        spec.write_value(self._rate_off, data_type=DataType.UINT32)
-        spec.write_value(self._stochastic, data_type=DataType.UINT32)
-        spec.write_value(self._constant_input, data_type=DataType.UINT32)
-        # Write the data - Arrays must be 32-bit values, so convert
-        data = numpy.array(self._arms, dtype=numpy.uint32)
-        spec.write_array(data.view(numpy.uint32))
+        self.write_parameter_region(spec)
 
         # End-of-Spec:
         spec.end_specification()
@@ -196,6 +279,31 @@ class BanditMachineVertex(SpinnGymMachineVertex):
         return helpful_functions.locate_memory_region_for_placement(
             placement, self._BANDIT_REGIONS.RECORDING.value)
 
+    @property
+    @overrides(SpinnGymMachineVertex._provenance_region_id)
+    def _provenance_region_id(self) -> int:
+        return self._BANDIT_REGIONS.PROVENANCE.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._parameter_region_id)
+    def _parameter_region_id(self) -> int:
+        return self._BANDIT_REGIONS.ARMS.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._system_region_id)
+    def _system_region_id(self) -> int:
+        return self._BANDIT_REGIONS.SYSTEM.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._key_region_id)
+    def _key_region_id(self) -> int:
+        return self._BANDIT_REGIONS.BANDIT.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._recording_region_id)
+    def _recording_region_id(self) -> int:
+        return self._BANDIT_REGIONS.RECORDING.value
+
     @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
     def get_binary_file_name(self) -> str:
         return "bandit.aplx"
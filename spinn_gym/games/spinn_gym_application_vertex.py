@@ -13,6 +13,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from typing import List
+
 import numpy
 
 from spinn_utilities.abstract_base import abstractmethod
@@ -23,14 +25,23 @@ from pacman.model.graphs.application.abstract import (
     AbstractOneAppOneMachineVertex)
 
 # sPyNNaker imports
-from spynnaker.pyNN.models.common import PopulationApplicationVertex
+from spynnaker.pyNN.models.common import (
+    ParameterHolder, PopulationApplicationVertex)
 from spynnaker.pyNN.data import SpynnakerDataView
 
+from spinn_gym.utilities.score_changes import expand_score_changes
+from spinn_gym.utilities.seed_streams import resolve_random_seed
+from .spinn_gym_machine_vertex import SpinnGymMachineVertex
+
 
 class SpinnGymApplicationVertex(
-        AbstractOneAppOneMachineVertex,
+        AbstractOneAppOneMachineVertex[SpinnGymMachineVertex],
         PopulationApplicationVertex):
 
+    #: The structured numpy dtype of one record in the events channel
+    EVENT_DTYPE = numpy.dtype(
+        [("tick", numpy.uint32), ("event", numpy.uint32)])
+
     __slots__ = ()
 
     def __init__(self, machine_vertex, label, n_atoms):
@@ -47,31 +58,134 @@ class SpinnGymApplicationVertex(
         super(SpinnGymApplicationVertex, self).__init__(
             machine_vertex, label, n_atoms)
 
+    @property
+    def parameters(self):
+        """
+        The parameters the game was built with; see
+        :py:attr:`SpinnGymMachineVertex.parameters`.
+
+        :rtype: dict(str, object)
+        """
+        return self.machine_vertex.parameters
+
     @overrides(PopulationApplicationVertex.get_units)
     def get_units(self, name: str) -> str:
-        if name == "score":
+        if name in ("score", "events"):
             return ""
         return super(SpinnGymApplicationVertex, self).get_units(name)
 
+    @overrides(PopulationApplicationVertex.get_parameters)
+    def get_parameters(self) -> List[str]:
+        return list(self.machine_vertex.REWRITABLE_PARAMETERS)
+
+    @overrides(PopulationApplicationVertex.get_parameter_values)
+    def get_parameter_values(self, names, selector=None):
+        self._check_parameters(names, self.get_parameters())
+        return ParameterHolder(
+            names,
+            lambda name, _: self.machine_vertex.get_parameter_value(name),
+            selector)
+
+    @overrides(PopulationApplicationVertex.set_parameter_values)
+    def set_parameter_values(self, name, value, selector=None):
+        if selector is not None:
+            raise KeyError(
+                f"{name} is a parameter of the whole game so can't be set "
+                "for a selection of it")
+        self.machine_vertex.set_parameter_value(name, value)
+
+    def reset(self, seed=None):
+        """
+        Reset the game to its starting state, score included, at the start
+        of the next run, without loading the simulation again.
+
+        :param seed:
+            4 values to seed the game's random number generator with again,
+            an int or :py:class:`~numpy.random.SeedSequence` to derive them
+            from, or None to carry on with the current random sequence
+        :type seed: list(int), int, ~numpy.random.SeedSequence or None
+        :raises ValueError: If the seed is a list but not of 4 values
+        """
+        if seed is not None:
+            seed = resolve_random_seed(seed)
+        self.machine_vertex.request_reset(seed)
+
+    def get_recorded_channels(self) -> List[str]:
+        """
+        The names of the channels that this game records, each of which
+        can be passed to :py:meth:`get_recorded_data`.
+
+        :rtype: list(str)
+        """
+        if self.machine_vertex.EVENT_TYPES is None:
+            return ["score"]
+        return ["score", "events"]
+
     def get_recorded_data(self, name):
-        if name != "score":
+        channels = self.get_recorded_channels()
+        if name not in channels:
             raise KeyError(f"{name} was not recorded")
 
-        vertex = self.machine_vertices.pop()
-        placement = SpynnakerDataView.get_placement_of_vertex(vertex)
+        placement = SpynnakerDataView.get_placement_of_vertex(
+            self.machine_vertex)
         buffer_manager = SpynnakerDataView.get_buffer_manager()
 
         # Read the data recorded
-        data_values, _ = buffer_manager.get_recording(placement, 0)
-        data = data_values
+        data_values, _ = buffer_manager.get_recording(
+            placement, channels.index(name))
+
+        if name == "events":
+            return self.decode_events(data_values)
+        return self.decode_scores(data_values)
+
+    def decode_scores(self, data):
+        """
+        Decode the raw bytes recorded for the score channel.
 
-        numpy_format = list()
-        numpy_format.append(("Score", self.score_format))
+        The result is a view onto ``data`` (no copy is made) with one
+        record per recorded sample and one named field per value that the
+        game writes for each sample; see :py:attr:`recorded_score_dtype`.
 
-        output_data = numpy.array(data, dtype=numpy.uint8).view(numpy_format)
+        :param data: The raw recorded bytes
+        :type data: bytes or bytearray
+        :rtype: ~numpy.ndarray
+        """
+        dtype = self.recorded_score_dtype
+        return numpy.frombuffer(
+            data, dtype=dtype, count=len(data) // dtype.itemsize)
+
+    def decode_events(self, data):
+        """
+        Decode the raw bytes recorded for the events channel.
 
-        # return formatted_data
-        return output_data
+        The result is a view onto ``data`` with a ``tick`` and an ``event``
+        field per event, in the order they happened; the event values are
+        those of the machine vertex's ``EVENT_TYPES``.
+
+        :param data: The raw recorded bytes
+        :type data: bytes or bytearray
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.frombuffer(
+            data, dtype=self.EVENT_DTYPE,
+            count=len(data) // self.EVENT_DTYPE.itemsize)
+
+    def get_score_series(self, ticks) -> numpy.ndarray:
+        """
+        Get the score at each of a series of ticks of the last run, from a
+        game that only recorded the score when it changed.
+
+        :param ticks: The ticks to get the score at
+        :type ticks: int or ~numpy.ndarray
+        :return: The score at each tick; see :py:attr:`score_dtype`
+        :rtype: ~numpy.ndarray
+        :raises ValueError:
+            If the game recorded the score at every sample
+        """
+        if not self.machine_vertex.record_changes_only:
+            raise ValueError(
+                f"{self} recorded every sample; use get_recorded_data")
+        return expand_score_changes(self.get_recorded_data("score"), ticks)
 
     def describe(self):
         """ Get a human-readable description of the cell or synapse type.
@@ -99,6 +213,30 @@ class SpinnGymApplicationVertex(
         """
         raise NotImplementedError
 
+    @property
+    def score_dtype(self) -> numpy.dtype:
+        """
+        The structured numpy dtype of one recorded score sample.
+
+        By default this is a single ``Score`` field of
+        :py:attr:`score_format`; games that record more than one value per
+        sample override this to name each value.
+        """
+        return numpy.dtype([("Score", self.score_format)])
+
+    @property
+    def recorded_score_dtype(self) -> numpy.dtype:
+        """
+        The structured numpy dtype of one record in the score channel.
+
+        This is :py:attr:`score_dtype`, preceded by a ``tick`` field if the
+        game only records the score when it changes.
+        """
+        if self.machine_vertex.record_changes_only:
+            return numpy.dtype(
+                [("tick", numpy.uint32)] + self.score_dtype.descr)
+        return self.score_dtype
+
     def __str__(self):
         return f"{self._label} with {self.n_atoms} atoms"
 
@@ -13,16 +13,25 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from enum import IntEnum
+from functools import lru_cache
 import math
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import numpy
+
+from spinn_utilities.abstract_base import abstractmethod
 from spinn_utilities.overrides import overrides
 from spinnman.model.enums import ExecutableType
 
 # PACMAN imports
+from pacman.model.graphs.application import ApplicationVertex
 from pacman.model.graphs.common import Slice
 
 from pacman.model.graphs.machine import MachineVertex
-from pacman.model.resources import ConstantSDRAM
+from pacman.model.placements import Placement
+from pacman.model.resources import VariableSDRAM
+from pacman.model.routing_info import AppVertexRoutingInfo
 
 # SpinnFrontEndCommon imports
 from spinn_front_end_common.interface.buffer_management.buffer_models.\
@@ -32,23 +41,136 @@ from spinn_front_end_common.abstract_models.\
     import AbstractGeneratesDataSpecification
 from spinn_front_end_common.abstract_models.abstract_has_associated_binary \
     import AbstractHasAssociatedBinary
+from spinn_front_end_common.abstract_models.\
+    abstract_rewrites_data_specification import \
+    AbstractRewritesDataSpecification
+from spinn_front_end_common.interface.buffer_management import (
+    recording_utilities)
+from spinn_front_end_common.interface.ds import (
+    DataSpecificationBase, DataSpecificationGenerator,
+    DataSpecificationReloader, DataType)
+from spinn_front_end_common.interface.provenance import (
+    ProvidesProvenanceDataFromMachineImpl, ProvenanceWriter)
+from spinn_front_end_common.interface.simulation import simulation_utilities
+from spinn_front_end_common.utilities.constants import (
+    BYTES_PER_WORD, SYSTEM_BYTES_REQUIREMENT)
+
+# sPyNNaker imports
+from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.models.common import PopulationApplicationVertex
+from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
+
+#: The names of the random seed fields of a parameter schema
+_RANDOM_SEED_FIELDS = tuple(f"random_seed_{i}" for i in range(4))
+
+#: Flags of the reset_flags field of a parameter schema, as read by
+#: game_reset.h
+_RESET_GAME = 0x1
+_RESET_SEED = 0x2
+
+
+@lru_cache(maxsize=256)
+def _pack_parameter_fields(
+        schema: Tuple[Tuple[str, DataType], ...],
+        values: Tuple[Union[int, float], ...]) -> bytes:
+    """
+    Pack the fields of a parameter schema, checking each value.
+
+    Games built with the same parameters share the result, so this is only
+    done once for each distinct configuration.
+
+    :param tuple(tuple(str,DataType)) schema: The fields to pack
+    :param tuple(int or float) values: The value of each field
+    :rtype: bytes
+    :raises ValueError: If a value doesn't fit its data type
+    """
+    data = bytearray()
+    for (_, data_type), value in zip(schema, values):
+        data_type.check_value(value)
+        data += data_type.as_bytes(value)
+    return bytes(data)
+
+
+@lru_cache(maxsize=None)
+def _random_seed_words(
+        schema: Tuple[Tuple[str, DataType], ...]
+        ) -> Tuple[Tuple[int, int], ...]:
+    """
+    Find the words of a parameter schema that hold the random seed.
+
+    :param tuple(tuple(str,DataType)) schema: The fields of the schema
+    :return: For each seed field present, the index of its word and of the
+        value of the seed it holds
+    :rtype: tuple(tuple(int, int))
+    """
+    words = []
+    offset = 0
+    for field, data_type in schema:
+        if field in _RANDOM_SEED_FIELDS:
+            words.append((offset // BYTES_PER_WORD,
+                          _RANDOM_SEED_FIELDS.index(field)))
+        offset += data_type.size
+    return tuple(words)
 
 
 # pylint: disable=abstract-method
 class SpinnGymMachineVertex(MachineVertex, AbstractGeneratesDataSpecification,
+                            AbstractRewritesDataSpecification,
                             AbstractReceiveBuffersToHost,
-                            AbstractHasAssociatedBinary):
+                            AbstractHasAssociatedBinary,
+                            ProvidesProvenanceDataFromMachineImpl):
+
+    #: The names of the counters the binary writes to the provenance region
+    #: after the system provenance, in the order they are written
+    PROVENANCE_ITEMS: Tuple[str, ...] = ()
+
+    #: The layout of the parameter region: each field in the order the
+    #: binary reads it, with the data type it is written as.  The value of a
+    #: field is the attribute of the same name with a leading underscore,
+    #: except for the seed fields of :py:attr:`RANDOM_SEED_SCHEMA`
+    PARAMETER_SCHEMA: Tuple[Tuple[str, DataType], ...] = ()
+
+    #: The parameters that can be changed between runs; the binary reads
+    #: these again from the parameter region when it resumes
+    REWRITABLE_PARAMETERS: Tuple[str, ...] = ()
+
+    #: The four words of the random seed, as they appear in a schema
+    RANDOM_SEED_SCHEMA = tuple(
+        (field, DataType.UINT32) for field in _RANDOM_SEED_FIELDS)
+
+    #: The episode events the binary records in the events channel, or None
+    #: if the game has no events channel
+    EVENT_TYPES: Optional[Type[IntEnum]] = None
+
+    #: The size of an event record; the tick and the event type
+    EVENT_RECORD_BYTES = 2 * BYTES_PER_WORD
+
+    #: The least time between the samples of the score that the binary
+    #: records
+    SCORE_INTERVAL_MS = 1000
+
+    #: The average time between the events that the events channel is sized
+    #: for, or None if there is at most one event in a run
+    EVENT_INTERVAL_MS: Optional[int] = None
 
     __slots__ = (
         # list of 4 numbers to be the random seeds for the c code
         "_random_seed",
-        # size of recording region
-        "_recording_size",
-        # sdram needed for this vertex
-        "_sdram_required")
+        # size of the region holding the routing key and the like
+        "_key_region_bytes",
+        # the duration the recording region was sized for
+        "_simulation_duration_ms",
+        # whether the score is only recorded when it changes
+        "_record_changes_only",
+        # whether parameters have changed since the region was written
+        "_parameters_changed",
+        # the reset requested of the binary when it next resumes
+        "_reset_flags")
 
     def __init__(self, label, app_vertex, n_neurons,
-                 region_bytes, simulation_duration_ms, random_seed):
+                 region_bytes, simulation_duration_ms, random_seed,
+                 record_changes_only=False,
+                 vertex_slice: Optional[Slice] = None):
         """
         :param label: The optional name of the vertex
         :type label: str or None
@@ -61,9 +183,17 @@ class SpinnGymMachineVertex(MachineVertex, AbstractGeneratesDataSpecification,
         :param int n_neurons:
             The number of neurons to be used to create the slice of the
             application vertex that this machine vertex implements.
-        :param int region_bytes: The bytes needed other than recording
+        :param int region_bytes:
+            The size of the region holding the routing key and any other
+            values only known once the graph has been mapped
         :param float simulation_duration_ms:
         :param list(int) random_seed: List of 4 vlaues to seed the c code
+        :param bool record_changes_only:
+            Whether to record the score, with the tick, only when it changes
+        :param vertex_slice:
+            The atoms of the application vertex that this machine vertex
+            implements, if not the first ``n_neurons``
+        :type vertex_slice: ~pacman.model.graphs.common.Slice or None
 
         :raise PacmanInvalidParameterException:
             If one of the constraints is not valid
@@ -73,29 +203,460 @@ class SpinnGymMachineVertex(MachineVertex, AbstractGeneratesDataSpecification,
 
         """
 
-        vertex_slice = Slice(0, n_neurons - 1)
+        if vertex_slice is None:
+            vertex_slice = Slice(0, n_neurons - 1)
 
         # Superclasses
         MachineVertex.__init__(self, label, app_vertex, vertex_slice)
 
-        # Define size of recording region
-        self._recording_size = int(math.ceil(
-            simulation_duration_ms/10000.) * 4)
-
-        self._sdram_required = ConstantSDRAM(
-            region_bytes + self._recording_size)
+        self._record_changes_only = bool(record_changes_only)
 
+        self._key_region_bytes = region_bytes
         self._random_seed = random_seed
+        self._simulation_duration_ms = simulation_duration_ms
+        self._parameters_changed = False
+        self._reset_flags = 0
+
+    @property
+    def record_changes_only(self) -> bool:
+        """
+        Whether the score is recorded, with the tick, only when it changes
+        rather than at every sample.
+
+        :rtype: bool
+        """
+        return self._record_changes_only
+
+    def _get_score_words(self) -> int:
+        """
+        Get the size of each sample of the score, in words.
+
+        Games that record more than one word per sample override this; it
+        is called before the constructor of the game's vertex sets up
+        anything but what it depends on.
+
+        :rtype: int
+        """
+        return 1
+
+    def _get_events_sample_bytes(self) -> int:
+        """
+        Get the size of the events recorded every
+        :py:attr:`EVENT_INTERVAL_MS`.
+
+        :rtype: int
+        """
+        return self.EVENT_RECORD_BYTES
+
+    def _get_recording_channels(self) -> List[Tuple[int, Optional[int]]]:
+        """
+        Get how each recording channel fills up as the game runs.
+
+        :return:
+            For each channel, the size of a sample and the least ticks
+            between samples, or None if there is at most one sample in a run
+        :rtype: list(tuple(int, int or None))
+        """
+        # Each change also records its tick, so in the worst case (the
+        # score changes at every sample) each sample is a word longer
+        n_words = self._get_score_words() + int(self._record_changes_only)
+        channels: List[Tuple[int, Optional[int]]] = [
+            (n_words * BYTES_PER_WORD, self.SCORE_INTERVAL_MS)]
+        if self.EVENT_TYPES is not None:
+            channels.append(
+                (self._get_events_sample_bytes(), self.EVENT_INTERVAL_MS))
+        return channels
+
+    def get_recording_sizes(self, n_ticks: int) -> List[int]:
+        """
+        Get the size of each recording region for a run of a number of
+        ticks, indexed by channel.
+
+        :param int n_ticks: The number of ticks run before the recording is
+            extracted
+        :rtype: list(int)
+        """
+        return [
+            sample_bytes if interval is None else
+            int(math.ceil(n_ticks / interval)) * sample_bytes
+            for sample_bytes, interval in self._get_recording_channels()]
+
+    @property
+    def recording_sizes(self) -> List[int]:
+        """
+        The size of each recording region, indexed by channel.
+
+        The regions are sized for the simulation duration, or for the ticks
+        run between extractions of the recording if that is fewer.
+
+        :rtype: list(int)
+        """
+        n_ticks = int(math.ceil(self._simulation_duration_ms))
+        if SpynnakerDataView.has_max_run_time_steps():
+            n_ticks = min(
+                n_ticks, SpynnakerDataView.get_max_run_time_steps())
+        return self.get_recording_sizes(n_ticks)
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """
+        The parameters this instance of the game was built with.
+
+        Games extend this with their own parameters; the values are plain
+        Python or numpy scalars and lists so they can be archived with the
+        recorded data.
+
+        :rtype: dict(str, object)
+        """
+        return {
+            "random_seed": list(self._random_seed),
+            "simulation_duration_ms": self._simulation_duration_ms,
+            "record_changes_only": self._record_changes_only}
+
+    @classmethod
+    def get_parameter_schema_bytes(cls) -> int:
+        """
+        Get the size of the fields of :py:attr:`PARAMETER_SCHEMA`.
+
+        :rtype: int
+        """
+        return sum(data_type.size for _, data_type in cls.PARAMETER_SCHEMA)
+
+    def _get_parameter_value(self, field: str) -> Union[int, float]:
+        """
+        Get the value of a field of :py:attr:`PARAMETER_SCHEMA`.
+
+        :param str field: The name of the field
+        :rtype: int or float
+        """
+        if field in _RANDOM_SEED_FIELDS:
+            return self._random_seed[_RANDOM_SEED_FIELDS.index(field)]
+        return getattr(self, "_" + field)
+
+    def get_parameter_region_data(self) -> numpy.ndarray:
+        """
+        Pack the parameter region as described by :py:attr:`PARAMETER_SCHEMA`.
+
+        The fields other than the random seed are packed once for each
+        distinct set of values and shared between all the games that have
+        them; only the seed is then written into a copy.
+
+        Games with variable length data after the fields extend this to
+        append it.
+
+        :return: The words of the parameter region
+        :rtype: ~numpy.ndarray
+        :raises ValueError: If a value doesn't fit its data type
+        """
+        schema = self.PARAMETER_SCHEMA
+        values = tuple(
+            0 if field in _RANDOM_SEED_FIELDS
+            else self._get_parameter_value(field)
+            for field, _ in schema)
+        data = numpy.frombuffer(
+            _pack_parameter_fields(schema, values), dtype=numpy.uint32).copy()
+        for word, index in _random_seed_words(schema):
+            value = self._random_seed[index]
+            DataType.UINT32.check_value(value)
+            data[word] = value
+        return data
+
+    def write_parameter_region(self, spec: DataSpecificationBase) -> None:
+        """
+        Write the packed parameter region with a single write.
+
+        :param ~data_specification.DataSpecificationBase spec:
+            The specification to write to
+        """
+        spec.switch_write_focus(self._parameter_region_id)
+        spec.write_array(self.get_parameter_region_data())
+
+    @property
+    @abstractmethod
+    def _parameter_region_id(self) -> int:
+        """
+        The index of the parameter region.
+        """
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def _system_region_id(self) -> int:
+        """
+        The index of the system region.
+        """
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def _key_region_id(self) -> int:
+        """
+        The index of the region holding the routing key.
+        """
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def _recording_region_id(self) -> int:
+        """
+        The index of the region holding the recording header.
+        """
+        raise NotImplementedError
+
+    def get_region_sizes(self) -> Dict[int, int]:
+        """
+        Get the size of each region that
+        :py:meth:`reserve_memory_regions` reserves, as rounded up to whole
+        words by the data specification.
+
+        :return: The size of each region, indexed by region
+        :rtype: dict(int, int)
+        """
+        sizes = {
+            self._system_region_id: SYSTEM_BYTES_REQUIREMENT,
+            self._key_region_id: self._key_region_bytes,
+            self._recording_region_id:
+                recording_utilities.get_recording_header_size(
+                    len(self.recording_sizes)),
+            self._parameter_region_id:
+                self.get_parameter_region_data().nbytes,
+            self._provenance_region_id: self.get_provenance_data_size(
+                self._n_additional_data_items)}
+        return {region: -(-size // BYTES_PER_WORD) * BYTES_PER_WORD
+                for region, size in sizes.items()}
+
+    def reserve_memory_regions(
+            self, spec: DataSpecificationGenerator) -> None:
+        """
+        Reserve all the regions of the vertex.
+
+        :param ~data_specification.DataSpecificationGenerator spec:
+            The specification to reserve the regions in
+        """
+        sizes = self.get_region_sizes()
+        spec.reserve_memory_region(
+            region=self._system_region_id,
+            size=sizes[self._system_region_id], label='setup')
+        spec.reserve_memory_region(
+            region=self._key_region_id,
+            size=sizes[self._key_region_id], label='Keys')
+        spec.reserve_memory_region(
+            region=self._recording_region_id,
+            size=sizes[self._recording_region_id], label='Recording')
+        spec.reserve_memory_region(
+            region=self._parameter_region_id,
+            size=sizes[self._parameter_region_id], label='Parameters')
+        self.reserve_provenance_data_region(spec)
+
+    def write_system_region(self, spec: DataSpecificationBase) -> None:
+        """
+        Write the simulation header to the system region.
+
+        :param ~data_specification.DataSpecificationBase spec:
+            The specification to write to
+        """
+        spec.switch_write_focus(self._system_region_id)
+        spec.write_array(simulation_utilities.get_simulation_header_array(
+            self.get_binary_file_name()))
+
+    def write_recording_region(self, spec: DataSpecificationBase) -> None:
+        """
+        Write the recording header, sized for every channel.
+
+        :param ~data_specification.DataSpecificationBase spec:
+            The specification to write to
+        """
+        spec.switch_write_focus(self._recording_region_id)
+        spec.write_array(recording_utilities.get_recording_header_array(
+            self.recording_sizes))
+
+    @staticmethod
+    def _get_source_key_layout(
+            source: ApplicationVertex) -> Tuple[int, int, int, int, int]:
+        """
+        Get how to find the neuron of a source vertex that sent a key, as
+        the binaries that take actions from spikes decode it.
+
+        :param ~pacman.model.graphs.application.ApplicationVertex source:
+            The vertex whose spikes are received
+        :return: The number of colour bits, the mask of the bits for the
+            neuron within its core, the shift and mask of the index of the
+            core, and the number of neurons on each core
+        :rtype: tuple(int, int, int, int, int)
+        """
+        n_colour_bits = 0
+        if isinstance(source, PopulationApplicationVertex):
+            n_colour_bits = source.n_colour_bits
+        r_info = SpynnakerDataView.get_routing_infos().get_info_from(
+            source, SPIKE_PARTITION_ID)
+        if not isinstance(r_info, AppVertexRoutingInfo):
+            # All the neurons are on one core
+            return n_colour_bits, ~r_info.mask & 0xFFFFFFFF, 0, 0, 0
+        core_shift = r_info.n_bits_atoms
+        return (
+            n_colour_bits, (1 << core_shift) - 1, core_shift,
+            (r_info.machine_mask & ~r_info.mask) >> core_shift,
+            min(source.get_max_atoms_per_core(), source.n_atoms))
+
+    def get_parameter_value(self, name: str) -> Any:
+        """
+        Get the value of one of :py:attr:`REWRITABLE_PARAMETERS`, in the
+        form it is set in.
+
+        By default this is the value in :py:attr:`parameters`; games that
+        archive a value in another form override this.
+
+        :param str name: The name of the parameter
+        :rtype: object
+        """
+        return self.parameters[name]
+
+    def _set_parameter_value(self, name: str, value: Any) -> None:
+        """
+        Store a new value of one of :py:attr:`REWRITABLE_PARAMETERS`.
+
+        By default this is stored in the attribute of the same name with a
+        leading underscore; games that convert a value override this.
+
+        :param str name: The name of the parameter
+        :param value: The new value
+        """
+        setattr(self, "_" + name, value)
+
+    def set_parameter_value(self, name: str, value: Any) -> None:
+        """
+        Change one of :py:attr:`REWRITABLE_PARAMETERS`.
+
+        The parameter region is written again before the next run, and the
+        binary reads the new value when it resumes.
+
+        :param str name: The name of the parameter
+        :param value: The new value
+        :raises KeyError: If the parameter can't be changed between runs
+        :raises ValueError:
+            If the value doesn't fit its data type, or would change the size
+            of the parameter region
+        """
+        if name not in self.REWRITABLE_PARAMETERS:
+            raise KeyError(f"{name} can't be changed between runs")
+        n_words = len(self.get_parameter_region_data())
+        old_value = getattr(self, "_" + name)
+        self._set_parameter_value(name, value)
+        try:
+            if len(self.get_parameter_region_data()) != n_words:
+                raise ValueError(
+                    f"Changing {name} would change the size of the parameter "
+                    "region")
+        except ValueError:
+            setattr(self, "_" + name, old_value)
+            raise
+        self._parameters_changed = True
+
+    def _check_random_seed(self, random_seed: List[int]) -> List[int]:
+        """
+        Check that a new random seed is the right shape for the game.
+
+        :param list(int) random_seed: The seed to check
+        :return: A copy of the seed
+        :rtype: list(int)
+        :raises ValueError: If the seed isn't 4 values
+        """
+        if len(random_seed) != 4:
+            raise ValueError(
+                f"A random seed must be 4 values, not {random_seed}")
+        return list(random_seed)
+
+    def request_reset(self, random_seed: Optional[List[int]] = None) -> None:
+        """
+        Ask the binary to put the game back into its starting state, score
+        included, when it resumes at the start of the next run.
+
+        :param random_seed:
+            4 values to seed the random number generator with again, or
+            None to carry on with the current random sequence
+        :type random_seed: list(int) or None
+        :raises ValueError: If the seed isn't 4 values
+        """
+        flags = _RESET_GAME
+        if random_seed is not None:
+            self._random_seed = self._check_random_seed(random_seed)
+            flags |= _RESET_SEED
+        self._reset_flags = flags
+        self._parameters_changed = True
+
+    @overrides(AbstractRewritesDataSpecification.reload_required)
+    def reload_required(self) -> bool:
+        return self._parameters_changed
+
+    @overrides(AbstractRewritesDataSpecification.set_reload_required)
+    def set_reload_required(self, new_value: bool) -> None:
+        self._parameters_changed = new_value
+        if not new_value:
+            # The binary has been given the request, and clears it once
+            # taken, so later rewrites of the region must not repeat it
+            self._reset_flags = 0
+
+    @overrides(AbstractRewritesDataSpecification.regenerate_data_specification)
+    def regenerate_data_specification(
+            self, spec: DataSpecificationReloader,
+            placement: Placement) -> None:
+        self.write_parameter_region(spec)
+        spec.end_specification()
 
     @property
     @overrides(MachineVertex.sdram_required)
-    def sdram_required(self) -> ConstantSDRAM:
-        return self._sdram_required
+    def sdram_required(self) -> VariableSDRAM:
+        # The reserved regions, plus the space the binary allocates for
+        # each recording channel when it starts; that is a sample rounded
+        # up and then a share of a sample for each tick
+        channels = self._get_recording_channels()
+        return VariableSDRAM(
+            sum(self.get_region_sizes().values()) +
+            sum(sample_bytes for sample_bytes, _ in channels) +
+            recording_utilities.get_recording_data_constant_size(
+                len(channels)),
+            sum(sample_bytes / interval
+                for sample_bytes, interval in channels
+                if interval is not None))
 
     @overrides(AbstractReceiveBuffersToHost.get_recorded_region_ids)
     def get_recorded_region_ids(self) -> List[int]:
-        return [0]
+        return list(range(len(self.recording_sizes)))
 
     @overrides(AbstractHasAssociatedBinary.get_binary_start_type)
     def get_binary_start_type(self) -> ExecutableType:
         return ExecutableType.USES_SIMULATION_INTERFACE
+
+    @property
+    @overrides(ProvidesProvenanceDataFromMachineImpl._n_additional_data_items)
+    def _n_additional_data_items(self) -> int:
+        return len(self.PROVENANCE_ITEMS)
+
+    @overrides(ProvidesProvenanceDataFromMachineImpl.
+               parse_extra_provenance_items)
+    def parse_extra_provenance_items(
+            self, label: str, x: int, y: int, p: int,
+            provenance_data: Sequence[int]) -> None:
+        with ProvenanceWriter() as db:
+            for name, value in zip(self.PROVENANCE_ITEMS, provenance_data):
+                db.insert_core(x, y, p, name, value)
+
+    def get_provenance_counters(
+            self, placement: Optional[Placement] = None) -> Dict[str, int]:
+        """
+        Read the game's provenance counters from the machine.
+
+        The counters are written by the binary when it pauses, so this
+        reads the values from the end of the last run.
+
+        :param placement:
+            Where this vertex is placed; looked up if not given
+        :type placement: ~pacman.model.placements.Placement or None
+        :return: The value of each of :py:attr:`PROVENANCE_ITEMS`
+        :rtype: dict(str, int)
+        """
+        if placement is None:
+            placement = SpynnakerDataView.get_placement_of_vertex(self)
+        provenance_data = self._get_extra_provenance_words(
+            self._read_provenance_data(placement))
+        return dict(zip(self.PROVENANCE_ITEMS, provenance_data))
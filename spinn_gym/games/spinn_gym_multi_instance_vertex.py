@@ -0,0 +1,446 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import numpy
+
+from spinn_utilities.abstract_base import abstractmethod
+from spinn_utilities.overrides import overrides
+
+# PACMAN imports
+from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.common import Slice
+from pacman.model.partitioner_interfaces import LegacyPartitionerAPI
+from pacman.model.partitioner_splitters import SplitterFixedLegacy
+from pacman.model.resources import AbstractSDRAM
+
+# sPyNNaker imports
+from spynnaker.pyNN.models.common import (
+    ParameterHolder, PopulationApplicationVertex)
+from spynnaker.pyNN.data import SpynnakerDataView
+
+from spinn_gym.utilities.score_changes import expand_score_changes
+from spinn_gym.utilities.seed_streams import resolve_random_seeds
+from .spinn_gym_machine_vertex import SpinnGymMachineVertex
+
+
+class SpinnGymMultiInstanceVertex(
+        PopulationApplicationVertex, LegacyPartitionerAPI):
+    """
+    Many instances of a game, which the partitioner splits across as many
+    cores as are needed.
+
+    Each instance has the same number of atoms, and so of keys, and its own
+    random seed.  Each machine vertex runs a contiguous range of instances,
+    with its own keys, recording regions and seeds.  Its binary records the
+    score of each of its instances in every sample, and records the index
+    of the instance, within the vertex, in the upper half of the event type
+    of each event.
+    """
+
+    #: The structured numpy dtype of one event, as recorded by a core
+    VERTEX_EVENT_DTYPE = numpy.dtype(
+        [("tick", numpy.uint32), ("event", numpy.uint16),
+         ("instance", numpy.uint16)])
+
+    #: The structured numpy dtype of one event of the whole vertex
+    EVENT_DTYPE = numpy.dtype(
+        [("tick", numpy.uint32), ("event", numpy.uint32),
+         ("instance", numpy.uint32)])
+
+    #: The type of the machine vertices that run the instances
+    MACHINE_VERTEX_CLASS: Type[SpinnGymMachineVertex] = SpinnGymMachineVertex
+
+    __slots__ = ("__n_instances", "__atoms_per_instance", "__random_seeds",
+                 "__record_changes_only", "__simulation_duration_ms",
+                 "__instance_parameters")
+
+    def __init__(self, label, n_instances, atoms_per_instance,
+                 instances_per_core, simulation_duration_ms,
+                 random_seed=None, record_changes_only=False,
+                 instance_parameters=None):
+        """
+        :param str label: The name of the vertex
+        :param int n_instances: The number of instances of the game
+        :param int atoms_per_instance:
+            The number of atoms, and so of keys, of each instance
+        :param int instances_per_core:
+            The most instances that one core runs
+        :param float simulation_duration_ms:
+        :param random_seed:
+            The seeds of the instances; see
+            :py:func:`~spinn_gym.utilities.resolve_random_seeds`
+        :param bool record_changes_only:
+            Whether to record the scores, with the tick, only when one of
+            them changes
+        :param instance_parameters:
+            The values of the :py:attr:`REWRITABLE_PARAMETERS` of the
+            machine vertices, shared by all the instances
+        :type instance_parameters: dict(str, object) or None
+        """
+        super(SpinnGymMultiInstanceVertex, self).__init__(
+            label, max_atoms_per_core=instances_per_core * atoms_per_instance,
+            splitter=SplitterFixedLegacy())
+        self.__n_instances = n_instances
+        self.__atoms_per_instance = atoms_per_instance
+        self.__random_seeds = resolve_random_seeds(random_seed, n_instances)
+        self.__record_changes_only = bool(record_changes_only)
+        self.__simulation_duration_ms = simulation_duration_ms
+        self.__instance_parameters = dict(instance_parameters or {})
+
+    @property
+    @overrides(ApplicationVertex.n_atoms)
+    def n_atoms(self) -> int:
+        return self.__n_instances * self.__atoms_per_instance
+
+    @property
+    def n_instances(self) -> int:
+        """
+        The number of instances of the game.
+
+        :rtype: int
+        """
+        return self.__n_instances
+
+    @property
+    def atoms_per_instance(self) -> int:
+        """
+        The number of atoms, and so of keys, of each instance.
+
+        :rtype: int
+        """
+        return self.__atoms_per_instance
+
+    @property
+    def record_changes_only(self) -> bool:
+        """
+        Whether the scores are recorded, with the tick, only when one of
+        them changes.
+
+        :rtype: bool
+        """
+        return self.__record_changes_only
+
+    @property
+    def simulation_duration_ms(self) -> float:
+        """
+        The duration the recording regions are sized for.
+
+        :rtype: float
+        """
+        return self.__simulation_duration_ms
+
+    @property
+    def random_seeds(self) -> List[List[int]]:
+        """
+        The current seed of each instance.
+
+        :rtype: list(list(int))
+        """
+        return [list(seed) for seed in self.__random_seeds]
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """
+        The parameters the instances were built with, for archiving with
+        the recorded data.
+
+        :rtype: dict(str, object)
+        """
+        parameters = dict(self.__instance_parameters)
+        parameters.update(
+            n_instances=self.__n_instances,
+            random_seed=self.random_seeds,
+            simulation_duration_ms=self.__simulation_duration_ms,
+            record_changes_only=self.__record_changes_only)
+        return parameters
+
+    def get_instance_parameter(self, name: str) -> Any:
+        """
+        Get the value of one of :py:attr:`REWRITABLE_PARAMETERS`.
+
+        :param str name: The name of the parameter
+        """
+        return self.__instance_parameters[name]
+
+    def get_instances(self, vertex_slice: Slice) -> Tuple[int, int]:
+        """
+        Get the instances that run on the atoms of a slice.
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+        :return: The index of the first instance and the number of them
+        :rtype: tuple(int, int)
+        """
+        return (vertex_slice.lo_atom // self.__atoms_per_instance,
+                vertex_slice.n_atoms // self.__atoms_per_instance)
+
+    @abstractmethod
+    def _create_instance_vertex(
+            self, vertex_slice: Slice, first_instance: int,
+            random_seeds: List[List[int]],
+            label: Optional[str]) -> SpinnGymMachineVertex:
+        """
+        Create a machine vertex that runs some of the instances.
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The atoms of the instances
+        :param int first_instance: The index of the first instance
+        :param list(list(int)) random_seeds: The seed of each instance
+        :param label: The name of the machine vertex
+        :type label: str or None
+        :rtype: SpinnGymMachineVertex
+        """
+        raise NotImplementedError
+
+    def __create_vertex(
+            self, vertex_slice: Slice,
+            label: Optional[str]) -> SpinnGymMachineVertex:
+        first, n_instances = self.get_instances(vertex_slice)
+        return self._create_instance_vertex(
+            vertex_slice, first,
+            self.__random_seeds[first:first + n_instances], label)
+
+    @overrides(LegacyPartitionerAPI.get_sdram_used_by_atoms)
+    def get_sdram_used_by_atoms(self, vertex_slice: Slice) -> AbstractSDRAM:
+        # What a vertex needs depends on all its parameters, so the easiest
+        # way to find it out is to make one
+        return self.__create_vertex(vertex_slice, None).sdram_required
+
+    @overrides(LegacyPartitionerAPI.create_machine_vertex)
+    def create_machine_vertex(
+            self, vertex_slice: Slice, sdram: AbstractSDRAM,
+            label: Optional[str] = None) -> SpinnGymMachineVertex:
+        return self.__create_vertex(vertex_slice, label)
+
+    def __instance_vertices(self) -> List[Tuple[int, SpinnGymMachineVertex]]:
+        """
+        Get the machine vertices with the first instance of each, in the
+        order of the instances.
+        """
+        return sorted(
+            ((self.get_instances(vertex.vertex_slice)[0], vertex)
+             for vertex in self.machine_vertices),
+            key=lambda first_vertex: first_vertex[0])
+
+    @overrides(PopulationApplicationVertex.get_units)
+    def get_units(self, name: str) -> str:
+        if name in ("score", "events"):
+            return ""
+        return super(SpinnGymMultiInstanceVertex, self).get_units(name)
+
+    @overrides(PopulationApplicationVertex.get_parameters)
+    def get_parameters(self) -> List[str]:
+        return list(self.MACHINE_VERTEX_CLASS.REWRITABLE_PARAMETERS)
+
+    @overrides(PopulationApplicationVertex.get_parameter_values)
+    def get_parameter_values(self, names, selector=None):
+        self._check_parameters(names, self.get_parameters())
+        return ParameterHolder(
+            names, lambda name, _: self.__instance_parameters[name],
+            selector)
+
+    @overrides(PopulationApplicationVertex.set_parameter_values)
+    def set_parameter_values(self, name, value, selector=None):
+        if selector is not None:
+            raise KeyError(
+                f"{name} is a parameter of every instance so can't be set "
+                "for a selection of them")
+        self._check_parameters(name, self.get_parameters())
+        for vertex in self.machine_vertices:
+            vertex.set_parameter_value(name, value)
+        self.__instance_parameters[name] = value
+
+    def reset(self, seed=None):
+        """
+        Reset every instance to its starting state, score included, at the
+        start of the next run, without loading the simulation again.
+
+        :param seed:
+            The new seeds of the instances, in any form accepted by
+            :py:func:`~spinn_gym.utilities.resolve_random_seeds`, or None
+            to carry on with the current random sequences
+        :raises ValueError: If the wrong number of seeds is given
+        """
+        if seed is not None:
+            self.__random_seeds = resolve_random_seeds(
+                seed, self.__n_instances)
+        for first, vertex in self.__instance_vertices():
+            seeds = None
+            if seed is not None:
+                n_instances = self.get_instances(vertex.vertex_slice)[1]
+                seeds = self.__random_seeds[first:first + n_instances]
+            vertex.request_reset(seeds)
+
+    def get_recorded_channels(self) -> List[str]:
+        """
+        The names of the channels that the instances record, each of which
+        can be passed to :py:meth:`get_recorded_data`.
+
+        :rtype: list(str)
+        """
+        if self.MACHINE_VERTEX_CLASS.EVENT_TYPES is None:
+            return ["score"]
+        return ["score", "events"]
+
+    def get_recorded_data(self, name):
+        """
+        Get what all the instances recorded in a channel, merged.
+
+        The scores have a ``Score`` field with the score of every instance
+        in each sample; see :py:attr:`recorded_score_dtype`.  The events of
+        all the instances are in tick order, with the ``instance`` each
+        happened in.
+
+        :param str name: The channel to read
+        :rtype: ~numpy.ndarray
+        :raises KeyError: If the channel is not recorded
+        """
+        channels = self.get_recorded_channels()
+        if name not in channels:
+            raise KeyError(f"{name} was not recorded")
+
+        buffer_manager = SpynnakerDataView.get_buffer_manager()
+        recorded = []
+        for first, vertex in self.__instance_vertices():
+            placement = SpynnakerDataView.get_placement_of_vertex(vertex)
+            data_values, _ = buffer_manager.get_recording(
+                placement, channels.index(name))
+            recorded.append((first, vertex, data_values))
+
+        if name == "events":
+            return self.merge_events(
+                [(first, data) for first, _, data in recorded])
+        return self.merge_scores(
+            [self.__decode_scores(vertex, data)
+             for _, vertex, data in recorded])
+
+    def __decode_scores(self, vertex, data) -> numpy.ndarray:
+        n_instances = self.get_instances(vertex.vertex_slice)[1]
+        dtype = self.__get_recorded_score_dtype(n_instances)
+        return numpy.frombuffer(
+            data, dtype=dtype, count=len(data) // dtype.itemsize)
+
+    def merge_scores(self, scores: List[numpy.ndarray]) -> numpy.ndarray:
+        """
+        Merge the scores recorded by each core into scores of all the
+        instances.
+
+        If every sample was recorded, each core recorded at the same ticks,
+        so the samples are lined up; any core that recorded fewer samples
+        limits the number merged.  If only changes were recorded, there is
+        a record at each tick at which any core recorded a change.
+
+        :param list(~numpy.ndarray) scores:
+            The decoded scores of each core, in the order of the instances
+        :rtype: ~numpy.ndarray
+        """
+        dtype = self.recorded_score_dtype
+        if not self.__record_changes_only:
+            n_samples = min(len(core_scores) for core_scores in scores)
+            merged = numpy.zeros(n_samples, dtype=dtype)
+            merged["Score"] = numpy.concatenate(
+                [core_scores["Score"][:n_samples] for core_scores in scores],
+                axis=1)
+            return merged
+
+        ticks = numpy.unique(numpy.concatenate(
+            [core_scores["tick"] for core_scores in scores]))
+        merged = numpy.zeros(len(ticks), dtype=dtype)
+        merged["tick"] = ticks
+        merged["Score"] = numpy.concatenate(
+            [expand_score_changes(core_scores, ticks)["Score"]
+             for core_scores in scores], axis=1)
+        return merged
+
+    def merge_events(self, events) -> numpy.ndarray:
+        """
+        Merge the raw events recorded by each core into events of all the
+        instances, in tick order.
+
+        :param events:
+            The index of the first instance of each core, with the raw bytes
+            it recorded
+        :type events: list(tuple(int, bytes))
+        :rtype: ~numpy.ndarray
+        """
+        merged = []
+        for first, data in events:
+            core_events = numpy.frombuffer(
+                data, dtype=self.VERTEX_EVENT_DTYPE,
+                count=len(data) // self.VERTEX_EVENT_DTYPE.itemsize)
+            instance_events = numpy.zeros(
+                len(core_events), dtype=self.EVENT_DTYPE)
+            instance_events["tick"] = core_events["tick"]
+            instance_events["event"] = core_events["event"]
+            instance_events["instance"] = core_events["instance"] + first
+            merged.append(instance_events)
+        if not merged:
+            return numpy.zeros(0, dtype=self.EVENT_DTYPE)
+        merged_events = numpy.concatenate(merged)
+        return merged_events[
+            numpy.argsort(merged_events["tick"], kind="stable")]
+
+    def get_score_series(self, ticks) -> numpy.ndarray:
+        """
+        Get the score of every instance at each of a series of ticks of the
+        last run, when only changes were recorded.
+
+        :param ticks: The ticks to get the scores at
+        :type ticks: int or ~numpy.ndarray
+        :rtype: ~numpy.ndarray
+        :raises ValueError: If every sample was recorded
+        """
+        if not self.__record_changes_only:
+            raise ValueError(
+                f"{self} recorded every sample; use get_recorded_data")
+        return expand_score_changes(self.get_recorded_data("score"), ticks)
+
+    @property
+    @abstractmethod
+    def score_format(self) -> type:
+        """
+        The numpy format of the score of an instance
+        """
+        raise NotImplementedError
+
+    def __get_recorded_score_dtype(self, n_instances: int) -> numpy.dtype:
+        score = [("Score", self.score_format, (n_instances, ))]
+        if self.__record_changes_only:
+            return numpy.dtype([("tick", numpy.uint32)] + score)
+        return numpy.dtype(score)
+
+    @property
+    def recorded_score_dtype(self) -> numpy.dtype:
+        """
+        The structured numpy dtype of one record of the merged scores: a
+        ``Score`` field with the score of every instance, preceded by a
+        ``tick`` field if only changes are recorded.
+        """
+        return self.__get_recorded_score_dtype(self.__n_instances)
+
+    def describe(self):
+        """ Get a human-readable description of the cell or synapse type.
+
+        :rtype: dict(str, ...)
+        """
+        return {"name": self.__class__.__name__}
+
+    def __str__(self):
+        return (f"{self._label} with {self.__n_instances} instances of "
+                f"{self.__atoms_per_instance} atoms")
+
+    def __repr__(self):
+        return self.__str__()
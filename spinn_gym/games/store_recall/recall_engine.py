@@ -0,0 +1,348 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Optional
+
+import numpy
+
+from spinn_gym.games.inverted_pendulum.pendulum_engine import to_s1615
+from spinn_gym.utilities.kiss64 import Kiss64
+from spinn_gym.utilities.seed_streams import resolve_random_seeds
+
+_f32 = numpy.float32
+
+# The ticks between recordings of the score
+_SCORE_RECORD_TICKS = 1000
+
+
+# ----------------------------------------------------------------------------
+# RecallEngine
+# ----------------------------------------------------------------------------
+class RecallEngine(object):
+    """
+    Many store-recall tasks, simulated on the host with NumPy as
+    ``store_recall.c`` simulates one on the machine.
+
+    All the tasks are stepped together, one tick per call of
+    :py:meth:`step`, and a task makes the same random choices as the
+    binary given the same seed.  Every ``time_period`` ticks, the value of
+    a task may change, and it moves through its states: idle, storing the
+    value, holding it, recalling it and forgetting it.  At each recall it
+    scores a point, counted apart for each stored value, if more of all
+    the spikes it has been sent chose the stored value.  As in the binary,
+    the spikes choosing each value are counted from the last reset, not
+    from the last recall.
+
+    The spikes sent are counted for each neuron of
+    :py:class:`~spinn_gym.Recall` with the same ``pop_size``: the
+    population of value 0, then of value 1, of store and of recall.  The
+    binary reads, but never uses, ``rate_off`` and ``reward``, so they are
+    left out here.
+    """
+
+    STATE_IDLE = 0
+    STATE_STORING = 1
+    STATE_STORED = 2
+    STATE_RECALLING = 3
+    STATE_FORGET = 4
+    _N_STATES = 5
+
+    #: The population of each kind of spike, in the order of the neurons
+    VALUE_0, VALUE_1, STORE, RECALL = range(4)
+
+    __slots__ = (
+        "__n_tasks", "__pop_size", "__prob_command", "__prob_in_change",
+        "__time_period", "__stochastic", "__max_fire_prob_on",
+        "__period_on", "__rng", "__chose", "__scores", "__trials",
+        "__state", "__value", "__stored_value", "__time_until_command",
+        "__tick_in_frame", "__score_change_count", "__tick")
+
+    def __init__(self, n_tasks: int, rate_on: int = 50, pop_size: int = 1,
+                 prob_command=1.0 / 6.0, prob_in_change=1.0 / 2.0,
+                 time_period: int = 200, stochastic: int = 1,
+                 random_seed=None):
+        """
+        :param int n_tasks: The number of tasks to simulate
+        :param int rate_on: The rate of each neuron that is on, in Hz
+        :param int pop_size: The neurons in each population
+        :param prob_command:
+            Above a half, a recall of the wrong value loses a point; a
+            value for each task or one for all of them
+        :param prob_in_change:
+            The probability of the value changing each time period; a
+            value for each task or one for all of them
+        :param int time_period: The ticks between changes of state
+        :param int stochastic:
+            1 to spike at random at the rate, or 0 to spike regularly
+        :param random_seed:
+            The seeds of the tasks; see
+            :py:func:`~spinn_gym.utilities.resolve_random_seeds`
+        :raises ValueError: If the rate can't be spiked regularly
+        """
+        self.__n_tasks = n_tasks
+        self.__pop_size = pop_size
+        shape = (n_tasks, )
+        self.__prob_command = numpy.broadcast_to(
+            to_s1615(prob_command), shape).copy()
+        self.__prob_in_change = numpy.broadcast_to(
+            to_s1615(prob_in_change), shape).copy()
+        self.__time_period = int(time_period)
+        self.__stochastic = stochastic
+        rate_on = int(rate_on)
+        self.__max_fire_prob_on = _f32(rate_on) / _f32(1000)
+        self.__period_on = 0
+        if not stochastic:
+            if not 0 < rate_on <= 1000:
+                raise ValueError(
+                    "A regular rate must be between 1 and 1000 Hz, not "
+                    f"{rate_on}")
+            self.__period_on = 1000 // rate_on
+
+        self.__rng = Kiss64(resolve_random_seeds(random_seed, n_tasks))
+        self.__chose = numpy.zeros((n_tasks, 2), dtype=numpy.int64)
+        self.__scores = numpy.zeros((n_tasks, 2), dtype=numpy.int64)
+        self.__trials = numpy.zeros(shape, dtype=numpy.int64)
+        self.__state = numpy.zeros(shape, dtype=numpy.int64)
+        self.__value = numpy.zeros(shape, dtype=numpy.int64)
+        self.__stored_value = numpy.zeros(shape, dtype=numpy.int64)
+        self.__time_until_command = numpy.zeros(shape, dtype=numpy.int64)
+        self.__tick_in_frame = numpy.zeros(shape, dtype=numpy.int64)
+        self.__score_change_count = numpy.zeros(shape, dtype=numpy.int64)
+        self.__tick = 0
+
+    @property
+    def n_tasks(self) -> int:
+        """
+        The number of tasks.
+
+        :rtype: int
+        """
+        return self.__n_tasks
+
+    @property
+    def n_neurons(self) -> int:
+        """
+        The number of neurons that the tasks spike from, as the number of
+        atoms of :py:class:`~spinn_gym.Recall` with the same ``pop_size``.
+
+        :rtype: int
+        """
+        return self.__pop_size * 4
+
+    @property
+    def tick(self) -> int:
+        """
+        The number of ticks simulated.
+
+        :rtype: int
+        """
+        return self.__tick
+
+    @property
+    def states(self) -> numpy.ndarray:
+        """
+        The state of each task, one of the ``STATE_`` values.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__state.copy()
+
+    @property
+    def values(self) -> numpy.ndarray:
+        """
+        The value of each task, 0 or 1.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__value.copy()
+
+    @property
+    def stored_values(self) -> numpy.ndarray:
+        """
+        The value each task last stored.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__stored_value.copy()
+
+    @property
+    def scores(self) -> numpy.ndarray:
+        """
+        The score of each task for recalls of a stored 0 and of a stored
+        1, as recorded by the binary as ``score_0`` and ``score_1``.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__scores.copy()
+
+    @property
+    def trials(self) -> numpy.ndarray:
+        """
+        The number of recalls of each task.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__trials.copy()
+
+    @property
+    def accuracies(self) -> numpy.ndarray:
+        """
+        The score of each task for both values over its recalls, as the
+        binary works it out; NaN before the first recall.
+
+        :rtype: ~numpy.ndarray
+        """
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            return (self.__scores.sum(axis=1).astype(_f32) /
+                    self.__trials.astype(_f32))
+
+    def reset(self, tasks: Optional[numpy.ndarray] = None) -> None:
+        """
+        Put tasks back into their starting state, as a reset request does
+        between runs on the machine.
+
+        :param tasks:
+            Which tasks to reset, as a mask or indices; all if None
+        :type tasks: ~numpy.ndarray or None
+        """
+        mask = numpy.zeros(self.__n_tasks, dtype=bool)
+        if tasks is None:
+            mask[:] = True
+        else:
+            mask[tasks] = True
+        self.__chose[mask] = 0
+        self.__scores[mask] = 0
+        self.__trials[mask] = 0
+        self.__state[mask] = self.STATE_IDLE
+        self.__value[mask] = 0
+        self.__stored_value[mask] = 0
+        self.__time_until_command[mask] = 0
+        self.__tick_in_frame[mask] = 0
+
+    def step(self, actions: numpy.ndarray) -> numpy.ndarray:
+        """
+        Simulate one tick of every task.
+
+        :param ~numpy.ndarray actions:
+            The number of spikes received by each task since the last tick
+            choosing value 0 and value 1, as an array of shape
+            (n_tasks, 2)
+        :return: The number of spikes sent from each neuron of each task
+        :rtype: ~numpy.ndarray
+        """
+        actions = numpy.asarray(actions)
+        if actions.shape != (self.__n_tasks, 2):
+            raise ValueError(
+                f"Actions must have shape ({self.__n_tasks}, 2), not "
+                f"{actions.shape}")
+        self.__chose += actions
+        self.__score_change_count += 1
+        self.__tick_in_frame += 1
+        spikes = self.__send_state()
+
+        updating = self.__tick_in_frame == self.__time_period
+        if updating.any():
+            self.__update_state(updating)
+            self.__tick_in_frame[updating] = 0
+            self.__score_change_count[
+                updating &
+                (self.__score_change_count >= _SCORE_RECORD_TICKS)] = 0
+        self.__tick += 1
+        return spikes.reshape(self.__n_tasks, -1)
+
+    def __spiking(self, which: numpy.ndarray) -> numpy.ndarray:
+        """
+        Decide whether each neuron of a population spikes, as the binary
+        does for each neuron in turn.
+
+        :param ~numpy.ndarray which: The tasks whose populations may spike
+        :return: Whether each neuron of the population of each task spikes
+        """
+        spiking = numpy.zeros((self.__n_tasks, self.__pop_size), dtype=bool)
+        if self.__stochastic:
+            for i in range(self.__pop_size):
+                spiking[:, i] = which & (
+                    self.__rng.rand021(which) < self.__max_fire_prob_on)
+        elif self.__tick % self.__period_on == 0:
+            spiking[which] = True
+        return spiking
+
+    def __send_state(self) -> numpy.ndarray:
+        """
+        Spike the value and the command of every task, as ``send_state``
+        does.
+
+        :return: The number of spikes from each neuron of each population
+            of each task
+        """
+        state = self.__state
+        spikes = numpy.zeros(
+            (self.__n_tasks, 4, self.__pop_size), dtype=numpy.uint8)
+        tasks = numpy.arange(self.__n_tasks)
+
+        sending_value = state != self.STATE_RECALLING
+        spikes[tasks, self.__value] = self.__spiking(sending_value)
+
+        # Forgetting draws as storing and recalling do, but sends nothing
+        command = numpy.where(
+            state == self.STATE_STORING, self.STORE, self.RECALL)
+        sending_command = (
+            (state == self.STATE_RECALLING) |
+            (state == self.STATE_STORING) | (state == self.STATE_FORGET))
+        spiking = self.__spiking(sending_command)
+        spiking[state == self.STATE_FORGET] = False
+        spikes[tasks, command] |= spiking
+        return spikes
+
+    def __update_state(self, updating: numpy.ndarray) -> None:
+        """
+        Move on the state of some tasks, as ``update_state`` does.
+        """
+        changing = updating & (
+            self.__rng.rand021(updating) < self.__prob_in_change)
+        self.__value[changing] ^= 1
+
+        state = self.__state
+        recalling = updating & (state == self.STATE_RECALLING)
+        storing = updating & (state == self.STATE_STORING)
+        waited = updating & ~recalling & ~storing & (
+            self.__time_until_command == 0)
+        waiting = updating & ~recalling & ~storing & ~waited
+        self.__did_it_store_correctly(recalling)
+        self.__time_until_command[recalling] = 5
+        self.__time_until_command[storing] = 3
+        self.__time_until_command[waiting] -= 1
+        moving = recalling | storing | waited
+        state[moving] = (state[moving] + 1) % self._N_STATES
+
+        stored = updating & (state == self.STATE_STORING)
+        self.__stored_value[stored] = self.__value[stored]
+
+    def __did_it_store_correctly(self, recalling: numpy.ndarray) -> None:
+        """
+        Score the recall of some tasks, as ``did_it_store_correctly``
+        does.
+        """
+        self.__trials += recalling
+        chose_0 = self.__chose[:, 0]
+        chose_1 = self.__chose[:, 1]
+        stored = self.__stored_value
+        penalised = self.__prob_command > 0.5
+        for value, right, wrong in (
+                (0, chose_0 > chose_1, chose_0 < chose_1),
+                (1, chose_1 > chose_0, chose_1 < chose_0)):
+            recalled = recalling & (stored == value)
+            self.__scores[:, value] += recalled & right
+            self.__scores[:, value] -= recalled & wrong & penalised
@@ -19,6 +19,7 @@ from spinn_utilities.overrides import overrides
 
 # common imports
 from spinn_gym.games import SpinnGymApplicationVertex
+from spinn_gym.utilities.seed_streams import resolve_random_seed
 
 # Recall imports
 from spinn_gym.games.store_recall.store_recall_machine_vertex import \
@@ -31,10 +32,6 @@ from spinn_gym.games.store_recall.store_recall_machine_vertex import \
 class Recall(SpinnGymApplicationVertex):
 
     ONE_DAY_IN_MS = 1000 * 60 * 60 * 24  # 1 day
-    RANDOM_SEED = [numpy.random.randint(10000),
-                   numpy.random.randint(10000),
-                   numpy.random.randint(10000),
-                   numpy.random.randint(10000)]
 
     __slots__ = ()
 
@@ -42,16 +39,17 @@ class Recall(SpinnGymApplicationVertex):
             self, rate_on=50.0, rate_off=0.0, pop_size=1, prob_command=1.0/6.0,
             prob_in_change=1.0/2.0, time_period=200.0, stochastic=1,
             reward=0, label="Recall",
-            simulation_duration_ms=ONE_DAY_IN_MS,  random_seed=None):
-        if random_seed is None:
-            random_seed = list(self.RANDOM_SEED)
+            simulation_duration_ms=ONE_DAY_IN_MS,  random_seed=None,
+            record_changes_only=False):
+        random_seed = resolve_random_seed(random_seed)
 
         n_neurons = pop_size * 4
 
         machine_vertex = RecallMachineVertex(
             label, self, n_neurons, simulation_duration_ms, random_seed,
             rate_on, rate_off, pop_size, prob_command,
-            prob_in_change, time_period, stochastic, reward)
+            prob_in_change, time_period, stochastic, reward,
+            record_changes_only)
         # Superclasses
         super(Recall, self).__init__(machine_vertex, label, n_neurons)
 
@@ -59,3 +57,10 @@ class Recall(SpinnGymApplicationVertex):
     @overrides(SpinnGymApplicationVertex.score_format)
     def score_format(self) -> type:
         return numpy.int32
+
+    @property
+    @overrides(SpinnGymApplicationVertex.score_dtype)
+    def score_dtype(self) -> numpy.dtype:
+        return numpy.dtype([("score_0", self.score_format),
+                            ("score_1", self.score_format),
+                            ("trials", self.score_format)])
@@ -14,6 +14,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from enum import Enum
+from typing import Any, Dict
 
 from spinn_utilities.overrides import overrides
 
@@ -23,16 +24,11 @@ from pacman.model.placements import Placement
 from spinn_front_end_common.utilities import helpful_functions
 from spinn_front_end_common.abstract_models.abstract_has_associated_binary \
     import AbstractHasAssociatedBinary
-from spinn_front_end_common.interface.buffer_management \
-    import recording_utilities
 from spinn_front_end_common.abstract_models \
     .abstract_generates_data_specification \
     import AbstractGeneratesDataSpecification
 from spinn_front_end_common.interface.ds import (
     DataSpecificationGenerator, DataType)
-from spinn_front_end_common.interface.simulation import simulation_utilities
-from spinn_front_end_common.utilities import constants as \
-    front_end_common_constants
 
 # sPyNNaker imports
 from spynnaker.pyNN.data import SpynnakerDataView
@@ -47,14 +43,35 @@ from spinn_gym.games import SpinnGymMachineVertex
 # ----------------------------------------------------------------------------
 class RecallMachineVertex(SpinnGymMachineVertex):
     RECALL_REGION_BYTES = 4
-    DATA_REGION_BYTES = 12 * 4
 
     _RECALL_REGIONS = Enum(
         value="_RECALL_REGIONS",
         names=[('SYSTEM', 0),
                ('RECALL', 1),
                ('RECORDING', 2),
-               ('DATA', 3)])
+               ('DATA', 3),
+               ('PROVENANCE', 4)])
+
+    PROVENANCE_ITEMS = (
+        "Input_packets_received", "Choice_0_spikes_received",
+        "Choice_1_spikes_received", "Spikes_sent")
+
+    PARAMETER_SCHEMA = (
+        ("time_period", DataType.UINT32),
+        ("pop_size", DataType.UINT32),
+        *SpinnGymMachineVertex.RANDOM_SEED_SCHEMA,
+        ("rate_on", DataType.UINT32),
+        ("rate_off", DataType.UINT32),
+        ("stochastic", DataType.UINT32),
+        ("reward", DataType.UINT32),
+        ("prob_command", DataType.S1615),
+        ("prob_in_change", DataType.S1615),
+        ("record_changes_only", DataType.UINT32),
+        ("reset_flags", DataType.UINT32))
+
+    REWRITABLE_PARAMETERS = (
+        "time_period", "rate_on", "rate_off", "stochastic", "reward",
+        "prob_command", "prob_in_change")
 
     __slots__ = ("_prob_command", "_prob_in_change", "_pop_size",
                  "_rate_off", "_rate_on", "_reward", "_stochastic",
@@ -63,7 +80,8 @@ class RecallMachineVertex(SpinnGymMachineVertex):
     def __init__(self, label,  app_vertex, n_neurons,
                  simulation_duration_ms, random_seed,
                  rate_on, rate_off, pop_size, prob_command,
-                 prob_in_change, time_period, stochastic, reward):
+                 prob_in_change, time_period, stochastic, reward,
+                 record_changes_only=False):
         """
 
         :param label: The optional name of the vertex
@@ -86,6 +104,9 @@ class RecallMachineVertex(SpinnGymMachineVertex):
         :param time_period:
         :param stochastic:
         :param reward:
+        :param bool record_changes_only:
+            Whether to record the score, with the tick, only when it
+            changes
 
         :raise PacmanInvalidParameterException:
             If one of the constraints is not valid
@@ -98,8 +119,8 @@ class RecallMachineVertex(SpinnGymMachineVertex):
         # Superclasses
         super(RecallMachineVertex, self).__init__(
             label, app_vertex, n_neurons,
-            self.RECALL_REGION_BYTES + self.DATA_REGION_BYTES,
-            simulation_duration_ms,  random_seed)
+            self.RECALL_REGION_BYTES,
+            simulation_duration_ms,  random_seed, record_changes_only)
         # Pass in variables
         self._rate_on = rate_on
         self._rate_off = rate_off
@@ -110,8 +131,22 @@ class RecallMachineVertex(SpinnGymMachineVertex):
         self._prob_in_change = prob_in_change
         self._time_period = time_period
 
-        # used to define size of recording region
-        self._recording_size = int((simulation_duration_ms / 1000.) * 4)
+    @overrides(SpinnGymMachineVertex._get_score_words)
+    def _get_score_words(self) -> int:
+        # Both scores and the number of trials
+        return 3
+
+    @property
+    @overrides(SpinnGymMachineVertex.parameters)
+    def parameters(self) -> Dict[str, Any]:
+        parameters = super(RecallMachineVertex, self).parameters
+        parameters.update(
+            time_period=self._time_period, pop_size=self._pop_size,
+            rate_on=self._rate_on, rate_off=self._rate_off,
+            stochastic=self._stochastic, reward=self._reward,
+            prob_command=self._prob_command,
+            prob_in_change=self._prob_in_change)
+        return parameters
 
     # ------------------------------------------------------------------------
     # AbstractGeneratesDataSpecification overrides
@@ -126,28 +161,11 @@ class RecallMachineVertex(SpinnGymMachineVertex):
         spec.comment("\nReserving memory space for data regions:\n\n")
 
         # Reserve memory:
-        spec.reserve_memory_region(
-            region=self._RECALL_REGIONS.SYSTEM.value,
-            size=front_end_common_constants.SYSTEM_BYTES_REQUIREMENT,
-            label='setup')
-        spec.reserve_memory_region(
-            region=self._RECALL_REGIONS.RECALL.value,
-            size=self.RECALL_REGION_BYTES, label='RecallParams')
-        # reserve recording region
-        spec.reserve_memory_region(
-            self._RECALL_REGIONS.RECORDING.value,
-            recording_utilities.get_recording_header_size(1))
-        spec.reserve_memory_region(
-            region=self._RECALL_REGIONS.DATA.value,
-            size=self.DATA_REGION_BYTES, label='RecallArms')
+        self.reserve_memory_regions(spec)
 
         # Write setup region
         spec.comment("\nWriting setup region:\n")
-        spec.switch_write_focus(
-            self._RECALL_REGIONS.SYSTEM.value)
-        assert isinstance(vertex, AbstractHasAssociatedBinary)
-        spec.write_array(simulation_utilities.get_simulation_header_array(
-            vertex.get_binary_file_name()))
+        self.write_system_region(spec)
 
         # Write recall region containing routing key to transmit with
         spec.comment("\nWriting recall region:\n")
@@ -159,27 +177,11 @@ class RecallMachineVertex(SpinnGymMachineVertex):
 
         # Write recording region for score
         spec.comment("\nWriting recall recording region:\n")
-        spec.switch_write_focus(
-            self._RECALL_REGIONS.RECORDING.value)
-        spec.write_array(recording_utilities.get_recording_header_array(
-            [self._recording_size]))
+        self.write_recording_region(spec)
 
         # Write probabilites for arms
         spec.comment("\nWriting recall data region:\n")
-        spec.switch_write_focus(
-            self._RECALL_REGIONS.DATA.value)
-        spec.write_value(self._time_period, data_type=DataType.UINT32)
-        spec.write_value(self._pop_size, data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[0], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[1], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[2], data_type=DataType.UINT32)
-        spec.write_value(self._random_seed[3], data_type=DataType.UINT32)
-        spec.write_value(self._rate_on, data_type=DataType.UINT32)
-        spec.write_value(self._rate_off, data_type=DataType.UINT32)
-        spec.write_value(self._stochastic, data_type=DataType.UINT32)
-        spec.write_value(self._reward, data_type=DataType.UINT32)
-        spec.write_value(self._prob_command, data_type=DataType.S1615)
-        spec.write_value(self._prob_in_change, data_type=DataType.S1615)
+        self.write_parameter_region(spec)
 
         # End-of-Spec:
         spec.end_specification()
@@ -188,6 +190,31 @@ class RecallMachineVertex(SpinnGymMachineVertex):
         return helpful_functions.locate_memory_region_for_placement(
             placement, self._RECALL_REGIONS.RECORDING.value)
 
+    @property
+    @overrides(SpinnGymMachineVertex._provenance_region_id)
+    def _provenance_region_id(self) -> int:
+        return self._RECALL_REGIONS.PROVENANCE.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._parameter_region_id)
+    def _parameter_region_id(self) -> int:
+        return self._RECALL_REGIONS.DATA.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._system_region_id)
+    def _system_region_id(self) -> int:
+        return self._RECALL_REGIONS.SYSTEM.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._key_region_id)
+    def _key_region_id(self) -> int:
+        return self._RECALL_REGIONS.RECALL.value
+
+    @property
+    @overrides(SpinnGymMachineVertex._recording_region_id)
+    def _recording_region_id(self) -> int:
+        return self._RECALL_REGIONS.RECORDING.value
+
     @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
     def get_binary_file_name(self) -> str:
         return "store_recall.aplx"
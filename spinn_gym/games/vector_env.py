@@ -0,0 +1,207 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Optional, Tuple, Union
+
+import numpy
+
+from spinn_gym.games.breakout.breakout_engine import BreakoutEngine
+from spinn_gym.games.double_inverted_pendulum.double_pendulum_engine import (
+    DoublePendulumEngine)
+from spinn_gym.games.inverted_pendulum.pendulum_engine import PendulumEngine
+from spinn_gym.games.logic.logic_engine import LogicEngine
+from spinn_gym.games.multi_arm_bandit.bandit_engine import BanditEngine
+from spinn_gym.games.store_recall.recall_engine import RecallEngine
+
+#: The engines that can be stepped as a vector environment
+Engine = Union[BreakoutEngine, PendulumEngine, DoublePendulumEngine,
+               BanditEngine, LogicEngine, RecallEngine]
+
+
+# ----------------------------------------------------------------------------
+# VectorEnv
+# ----------------------------------------------------------------------------
+class VectorEnv(object):
+    """
+    The games of an engine, as a batch of environments that are reset and
+    stepped together, as reinforcement learning libraries expect.
+
+    The observation of each environment is the number of spikes sent from
+    each neuron of the matching vertex during the step, indexed by the
+    neuron ID, so that a network trained here sees what it would on the
+    machine.  The reward is how much the score went up during the step:
+    the score of a Breakout game, bandit or logic task; the sum of both
+    scores of a store-recall task; or the ticks a pendulum has been
+    balanced for.  A Breakout game is done when it runs out of lives and
+    a pendulum when it falls; the other games go on for ever.
+
+    The observations, rewards and dones are written into the same arrays
+    on every call, so they must be copied to be kept past the next call.
+    Environments that are done are not reset until asked to be.
+    """
+
+    __slots__ = (
+        "__engine", "__n_envs", "__ticks_per_step", "__n_actions",
+        "__observations", "__rewards", "__dones", "__scores",
+        "__no_actions", "__flat_ids")
+
+    def __init__(self, engine: Engine, ticks_per_step: int = 1):
+        """
+        :param engine: The engine whose games are the environments
+        :param int ticks_per_step:
+            The ticks of the engine to run for each step, or frames for
+            Breakout; the actions are received on the first of them
+        :raises ValueError: If there are no ticks in a step
+        """
+        if ticks_per_step < 1:
+            raise ValueError(
+                f"A step must be at least one tick, not {ticks_per_step}")
+        self.__engine = engine
+        self.__ticks_per_step = ticks_per_step
+        self.__scores = self.__score()
+        self.__n_envs = len(self.__scores)
+        self.__n_actions = (
+            engine.n_arms if isinstance(engine, BanditEngine) else 2)
+
+        self.__observations = numpy.zeros(
+            (self.__n_envs, engine.n_neurons), dtype=numpy.uint32)
+        self.__rewards = numpy.zeros(self.__n_envs, dtype=float)
+        self.__dones = numpy.zeros(self.__n_envs, dtype=bool)
+        self.__no_actions = numpy.zeros(
+            (self.__n_envs, self.__n_actions), dtype=numpy.int64)
+        self.__flat_ids = (
+            numpy.arange(self.__n_envs)[:, None] * engine.n_neurons)
+
+    @property
+    def engine(self) -> Engine:
+        """
+        The engine that runs the environments.
+        """
+        return self.__engine
+
+    @property
+    def n_envs(self) -> int:
+        """
+        The number of environments.
+
+        :rtype: int
+        """
+        return self.__n_envs
+
+    @property
+    def n_neurons(self) -> int:
+        """
+        The size of the observation of each environment.
+
+        :rtype: int
+        """
+        return self.__observations.shape[1]
+
+    @property
+    def n_actions(self) -> int:
+        """
+        The number of neurons that can spike to act on each environment:
+        the arms of a bandit, or two for the other games.
+
+        :rtype: int
+        """
+        return self.__n_actions
+
+    def reset(self, envs: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Put environments back into their starting state.
+
+        :param envs:
+            Which environments to reset, as a mask or indices; all if None
+        :type envs: ~numpy.ndarray or None
+        :return: The observations, which are no spikes for the
+            environments reset
+        :rtype: ~numpy.ndarray
+        """
+        mask = numpy.zeros(self.__n_envs, dtype=bool)
+        if envs is None:
+            mask[:] = True
+        else:
+            mask[envs] = True
+        self.__engine.reset(mask)
+        self.__scores[mask] = self.__score()[mask]
+        self.__observations[mask] = 0
+        self.__rewards[mask] = 0
+        self.__dones[mask] = False
+        return self.__observations
+
+    def step(self, actions: numpy.ndarray) -> Tuple[
+            numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Step every environment.
+
+        :param ~numpy.ndarray actions:
+            The number of spikes sent to each environment from each of its
+            action neurons, as an array of shape (n_envs, n_actions)
+        :return: The observations, rewards and dones of the environments
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+        """
+        observations = self.__observations
+        observations[:] = 0
+        for tick in range(self.__ticks_per_step):
+            result = self.__engine.step(
+                actions if tick == 0 else self.__no_actions)
+            spikes = result[0] if isinstance(result, tuple) else result
+            if isinstance(self.__engine, BreakoutEngine):
+                self.__count_neuron_ids(spikes)
+            else:
+                observations += spikes
+
+        scores = self.__score()
+        numpy.subtract(scores, self.__scores, out=self.__rewards)
+        self.__scores = scores
+        self.__dones[:] = self.__done()
+        return observations, self.__rewards, self.__dones
+
+    def __count_neuron_ids(self, neuron_ids: numpy.ndarray) -> None:
+        """
+        Add up the neuron IDs sent by each Breakout game.  A ball that has
+        strayed off the screen can be sent with an ID that is no neuron's,
+        which is left out.
+        """
+        n_neurons = self.n_neurons
+        sent = (neuron_ids >= 0) & (neuron_ids < n_neurons)
+        counts = numpy.bincount(
+            (neuron_ids + self.__flat_ids)[sent],
+            minlength=self.__n_envs * n_neurons)
+        self.__observations += counts.reshape(
+            self.__n_envs, n_neurons).astype(numpy.uint32)
+
+    def __score(self) -> numpy.ndarray:
+        """
+        Get the score of each environment.
+        """
+        engine = self.__engine
+        if isinstance(engine, (PendulumEngine, DoublePendulumEngine)):
+            return engine.max_balance_times.astype(float)
+        if isinstance(engine, RecallEngine):
+            return engine.scores.sum(axis=1).astype(float)
+        return engine.scores.astype(float)
+
+    def __done(self) -> numpy.ndarray:
+        """
+        Get whether each environment has finished.
+        """
+        engine = self.__engine
+        if isinstance(engine, (PendulumEngine, DoublePendulumEngine)):
+            return ~engine.in_bounds
+        if isinstance(engine, BreakoutEngine):
+            return engine.lives <= 0
+        return numpy.zeros(self.__n_envs, dtype=bool)
@@ -0,0 +1,31 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from .run_archive import (
+    ArchivedRun, ConcatenatedChannel, load_run, RunArchive, save_game_run,
+    save_run)
+from .kiss64 import Kiss64
+from .parameter_sweep import ParameterSweep
+from .score_changes import expand_score_changes
+from .seed_streams import (
+    get_root_seed, resolve_random_seed, resolve_random_seeds,
+    seed_from_sequence, SeedStream, set_root_seed)
+from .spike_encoders import SpikeEncoder, spike_source_times
+
+__all__ = ["ArchivedRun", "ConcatenatedChannel", "expand_score_changes",
+           "get_root_seed", "Kiss64", "load_run", "ParameterSweep",
+           "resolve_random_seed", "resolve_random_seeds", "RunArchive",
+           "save_game_run", "save_run", "seed_from_sequence", "SeedStream",
+           "set_root_seed", "SpikeEncoder", "spike_source_times"]
@@ -0,0 +1,135 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Optional, Sequence
+
+import numpy
+
+_MASK_32 = numpy.uint64(0xFFFFFFFF)
+_MULTIPLIER_0 = numpy.uint64(314527869)
+_INCREMENT_0 = numpy.uint64(1234567)
+_MULTIPLIER_2 = numpy.uint64(4294584393)
+_SHIFT_32 = numpy.uint64(32)
+
+# The values validate_mars_kiss64_seed uses to fix up a seed
+_DEFAULT_SEED_1 = 13031301
+_SEED_3_MODULUS = 698769068
+
+# The divisor of rand021 in the binaries, as a float
+_RAND021_DIVISOR = numpy.float32(0xFFFFFFFF)
+
+
+class Kiss64(object):
+    """
+    A batch of the KISS64 random number generators of the binaries, one
+    per game, stepped together.
+
+    Each generator draws exactly the numbers that ``mars_kiss64_seed`` of
+    spinn_common draws from the same seed, so a game run on the host makes
+    the same random choices as on the machine.
+    """
+
+    __slots__ = ("__seeds", )
+
+    def __init__(self, random_seeds: Sequence[Sequence[int]],
+                 validate: bool = True):
+        """
+        :param list(list(int)) random_seeds:
+            The 4 values of the seed of each generator
+        :param bool validate:
+            Whether to fix up the seeds as ``validate_mars_kiss64_seed``
+            does, as the binaries do when they load them
+        :raises ValueError: If a seed is not 4 values
+        """
+        seeds = numpy.array(random_seeds, dtype=numpy.uint64)
+        if seeds.ndim != 2 or seeds.shape[1] != 4:
+            raise ValueError(
+                f"Each random seed must be 4 values, not {random_seeds}")
+        seeds &= _MASK_32
+        if validate:
+            seeds[seeds[:, 1] == 0, 1] = _DEFAULT_SEED_1
+            seeds[:, 3] = seeds[:, 3] % _SEED_3_MODULUS + 1
+        self.__seeds = seeds
+
+    @property
+    def n_generators(self) -> int:
+        """
+        The number of generators.
+
+        :rtype: int
+        """
+        return len(self.__seeds)
+
+    @property
+    def seeds(self) -> numpy.ndarray:
+        """
+        The current state of each generator, as 4 values per generator.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__seeds.astype(numpy.uint32)
+
+    def next(self, which: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Draw the next 32-bit value from each generator.
+
+        :param which:
+            Which generators to draw from, as a mask or indices; the
+            others are left as they were.  All of them if None.
+        :type which: ~numpy.ndarray or None
+        :return: The value drawn by each generator; 0 for those not drawn
+            from
+        :rtype: ~numpy.ndarray
+        """
+        seeds = self.__seeds
+        state = seeds if which is None else seeds[which]
+
+        seed_0 = (_MULTIPLIER_0 * state[:, 0] + _INCREMENT_0) & _MASK_32
+
+        seed_1 = state[:, 1].astype(numpy.uint32)
+        seed_1 ^= seed_1 << numpy.uint32(5)
+        seed_1 ^= seed_1 >> numpy.uint32(7)
+        seed_1 ^= seed_1 << numpy.uint32(22)
+
+        t = _MULTIPLIER_2 * state[:, 2] + state[:, 3]
+        seed_3 = t >> _SHIFT_32
+        seed_2 = t & _MASK_32
+
+        new_state = numpy.stack(
+            (seed_0, seed_1.astype(numpy.uint64), seed_2, seed_3), axis=1)
+        if which is None:
+            self.__seeds = new_state
+        else:
+            seeds[which] = new_state
+        drawn = ((seed_0 + new_state[:, 1] + seed_2) & _MASK_32).astype(
+            numpy.uint32)
+        if which is None:
+            return drawn
+        values = numpy.zeros(len(seeds), dtype=numpy.uint32)
+        values[which] = drawn
+        return values
+
+    def rand021(
+            self, which: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Draw a value between 0 and 1 from each generator, as ``rand021``
+        of the binaries does.
+
+        :param which:
+            Which generators to draw from; all of them if None
+        :type which: ~numpy.ndarray or None
+        :rtype: ~numpy.ndarray
+        """
+        return self.next(which).astype(numpy.float32) / _RAND021_DIVISOR
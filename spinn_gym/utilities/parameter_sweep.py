@@ -0,0 +1,313 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Sweeps of the parameters of games over a process pool.
+
+Every point of a grid of parameters is scored by a function, such as one
+that plays a game engine with those parameters, in a pool of processes.
+The scores are written by the processes straight into shared memory, and
+the scores so far are written to a directory as the sweep goes, so that a
+sweep that is stopped can be run again to score only the points that are
+left.
+"""
+
+import itertools
+import json
+import multiprocessing
+import os
+from multiprocessing.shared_memory import SharedMemory
+from typing import (
+    Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple)
+
+import numpy
+
+from .run_archive import _json_default
+from .seed_streams import SeedStream
+
+#: The name of the file describing a sweep in its directory
+SWEEP_FILE = "sweep.json"
+
+_SCORES_FILE = "scores.npy"
+_DONE_FILE = "done.npy"
+
+# What each process of the pool scores with, set up as it starts
+_worker: Dict[str, Any] = {}
+
+
+def _start_worker(evaluate: Callable[..., float], scores_name: str,
+                  done_name: str, n_points: int) -> None:
+    """
+    Attach a process of the pool to the shared scores.
+    """
+    scores_memory = SharedMemory(name=scores_name)
+    done_memory = SharedMemory(name=done_name)
+    _worker.update(
+        evaluate=evaluate, memory=(scores_memory, done_memory),
+        scores=numpy.ndarray(
+            (n_points, ), dtype=float, buffer=scores_memory.buf),
+        done=numpy.ndarray(
+            (n_points, ), dtype=bool, buffer=done_memory.buf))
+
+
+def _score_point(point: Tuple[int, Dict[str, Any], List[int]]) -> int:
+    """
+    Score one point of a sweep in a process of the pool.
+
+    :return: The index of the point
+    """
+    index, parameters, seed = point
+    _worker["scores"][index] = _worker["evaluate"](
+        random_seed=seed, **parameters)
+    _worker["done"][index] = True
+    return index
+
+
+def _save_array(directory: str, name: str, array: numpy.ndarray) -> None:
+    """
+    Write an array so that it replaces the old one all at once, so that an
+    interrupted sweep never leaves a partly written file.
+    """
+    path = os.path.join(directory, name)
+    with open(path + ".tmp", "wb") as f:
+        numpy.save(f, array)
+    os.replace(path + ".tmp", path)
+
+
+# ----------------------------------------------------------------------------
+# ParameterSweep
+# ----------------------------------------------------------------------------
+class ParameterSweep(object):
+    """
+    Scores every combination of some parameters, in a pool of processes,
+    keeping the scores in a directory so that the sweep can be resumed.
+
+    The scoring function is called with one value of each parameter, by
+    name, and a ``random_seed``, and returns a number; for example::
+
+        def balance_time(random_seed, encoding, number_of_bins):
+            engine = PendulumEngine(
+                1, encoding=encoding, number_of_bins=number_of_bins,
+                random_seed=[random_seed])
+            ...
+            return engine.max_balance_times[0]
+
+        sweep = ParameterSweep(
+            balance_time, {"encoding": [0, 1, 2, 3],
+                           "number_of_bins": [10, 20, 40]}, "sweeps/bins")
+        scores = sweep.run()
+
+    The function must be picklable, so defined at the top level of a
+    module.  The seed of each point is spawned from the root seed of the
+    sweep, so a point gets the same seed however the sweep is split up or
+    resumed.
+    """
+
+    __slots__ = (
+        "__evaluate", "__names", "__values", "__directory", "__root_seed",
+        "__scores", "__done")
+
+    def __init__(self, evaluate: Callable[..., float],
+                 grid: Mapping[str, Sequence[Any]],
+                 directory: Optional[str] = None,
+                 root_seed: Optional[int] = None):
+        """
+        :param callable evaluate: Scores a point of the grid
+        :param grid: The values to sweep, by parameter name
+        :type grid: dict(str, list)
+        :param directory:
+            Where to keep the scores; the sweep already there is resumed.
+            If None, the scores are only kept in memory.
+        :type directory: str or None
+        :param root_seed:
+            The seed to spawn the seeds of the points from; if None, that
+            of the sweep being resumed or fresh entropy
+        :type root_seed: int or None
+        :raises ValueError:
+            If the directory holds a sweep of other parameters or seeds
+        """
+        self.__evaluate = evaluate
+        self.__names = list(grid)
+        self.__values = [list(grid[name]) for name in self.__names]
+        self.__directory = directory
+        n_points = int(numpy.prod(self.shape))
+        self.__scores = numpy.full(n_points, numpy.nan)
+        self.__done = numpy.zeros(n_points, dtype=bool)
+
+        self.__root_seed = SeedStream(root_seed).root_seed
+        if directory is not None and os.path.exists(
+                os.path.join(directory, SWEEP_FILE)):
+            self.__resume(directory, root_seed)
+
+    @property
+    def names(self) -> List[str]:
+        """
+        The names of the parameters, in the order of the axes of the
+        scores.
+
+        :rtype: list(str)
+        """
+        return list(self.__names)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        The number of values of each parameter.
+
+        :rtype: tuple(int)
+        """
+        return tuple(len(values) for values in self.__values)
+
+    @property
+    def root_seed(self) -> int:
+        """
+        The seed that the seeds of the points are spawned from.
+
+        :rtype: int
+        """
+        return self.__root_seed
+
+    @property
+    def points(self) -> List[Dict[str, Any]]:
+        """
+        The parameters of each point, in the order of the flattened
+        scores.
+
+        :rtype: list(dict(str, object))
+        """
+        return [dict(zip(self.__names, values))
+                for values in itertools.product(*self.__values)]
+
+    @property
+    def scores(self) -> numpy.ndarray:
+        """
+        The score of each point, with an axis for each parameter; NaN
+        where a point has not been scored.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__scores.reshape(self.shape).copy()
+
+    @property
+    def completed(self) -> numpy.ndarray:
+        """
+        Whether each point has been scored, with an axis for each
+        parameter.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__done.reshape(self.shape).copy()
+
+    def run(self, n_processes: Optional[int] = None, chunk_size: int = 1,
+            checkpoint_every: int = 1) -> numpy.ndarray:
+        """
+        Score every point that has not been scored yet.
+
+        If the sweep is stopped, the points scored so far are kept, as
+        long as the scores were checkpointed.
+
+        :param n_processes:
+            How many processes to score with; one per CPU if None
+        :type n_processes: int or None
+        :param int chunk_size: How many points to give a process at once
+        :param int checkpoint_every:
+            How many points to score between writes of the scores to the
+            directory
+        :return: The scores, as :py:attr:`scores`
+        :rtype: ~numpy.ndarray
+        """
+        seeds = SeedStream(self.__root_seed).spawn(len(self.__done))
+        points = [(index, parameters, seeds[index])
+                  for index, parameters in enumerate(self.points)
+                  if not self.__done[index]]
+        if self.__directory is not None:
+            self.__save_description()
+            self.__checkpoint(self.__scores, self.__done)
+
+        scores_memory = SharedMemory(create=True, size=self.__scores.nbytes)
+        done_memory = SharedMemory(create=True, size=self.__done.nbytes)
+        try:
+            scores = numpy.ndarray(
+                self.__scores.shape, dtype=float, buffer=scores_memory.buf)
+            done = numpy.ndarray(
+                self.__done.shape, dtype=bool, buffer=done_memory.buf)
+            scores[:] = self.__scores
+            done[:] = self.__done
+            try:
+                with multiprocessing.Pool(
+                        n_processes, _start_worker,
+                        (self.__evaluate, scores_memory.name,
+                         done_memory.name, len(done))) as pool:
+                    for n_scored, _ in enumerate(pool.imap_unordered(
+                            _score_point, points, chunk_size), 1):
+                        if n_scored % checkpoint_every == 0:
+                            self.__checkpoint(scores, done)
+            finally:
+                self.__checkpoint(scores, done)
+                del scores, done
+        finally:
+            scores_memory.close()
+            scores_memory.unlink()
+            done_memory.close()
+            done_memory.unlink()
+        return self.scores
+
+    def __resume(self, directory: str, root_seed: Optional[int]) -> None:
+        """
+        Read back the scores of the sweep already in the directory.
+        """
+        with open(os.path.join(directory, SWEEP_FILE),
+                  encoding="utf-8") as f:
+            description = json.load(f)
+        if root_seed is not None and root_seed != description["root_seed"]:
+            raise ValueError(
+                f"The sweep in {directory} has root seed "
+                f"{description['root_seed']}, not {root_seed}")
+        if description["grid"] != json.loads(self.__grid_json()):
+            raise ValueError(
+                f"The sweep in {directory} is of other parameters")
+        self.__root_seed = description["root_seed"]
+        self.__scores[:] = numpy.load(os.path.join(directory, _SCORES_FILE))
+        self.__done[:] = numpy.load(os.path.join(directory, _DONE_FILE))
+
+    def __checkpoint(self, scores: numpy.ndarray,
+                     done: numpy.ndarray) -> None:
+        """
+        Copy the scores out of shared memory, and write them to the
+        directory if there is one.
+        """
+        self.__done[:] = done
+        self.__scores[:] = scores
+        if self.__directory is not None:
+            _save_array(self.__directory, _SCORES_FILE, self.__scores)
+            _save_array(self.__directory, _DONE_FILE, self.__done)
+
+    def __grid_json(self) -> str:
+        """
+        The values swept, as they are described in the directory.
+        """
+        return json.dumps(dict(zip(self.__names, self.__values)),
+                          default=_json_default)
+
+    def __save_description(self) -> None:
+        """
+        Write what is being swept to the directory.
+        """
+        assert self.__directory is not None
+        os.makedirs(self.__directory, exist_ok=True)
+        description = {"grid": json.loads(self.__grid_json()),
+                       "root_seed": self.__root_seed}
+        with open(os.path.join(self.__directory, SWEEP_FILE), "w",
+                  encoding="utf-8") as f:
+            json.dump(description, f, indent=2)
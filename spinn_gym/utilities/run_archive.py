@@ -0,0 +1,455 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Archiving of recorded game runs.
+
+A run is stored as a directory holding one ``.npy`` file per recorded
+channel plus a ``metadata.json`` file describing the run (the game, its
+parameters and seeds, and how long it ran for).  Channels keep the
+structured dtype they were recorded with, so they can be memory-mapped
+back without decoding; a :py:class:`RunArchive` stitches the same channel
+of many runs together without reading any of them into memory until the
+data is actually indexed.
+"""
+
+import json
+import os
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Literal, Mapping,
+    Optional, Sequence)
+
+import numpy
+
+from spynnaker.pyNN.data import SpynnakerDataView
+from spynnaker.pyNN.models.populations import Population
+
+from .seed_streams import get_root_seed
+
+#: The name of the file holding the description of an archived run
+METADATA_FILE = "metadata.json"
+
+#: The version of the layout written by :py:func:`save_run`
+FORMAT_VERSION = 1
+
+_CHANNEL_SUFFIX = ".npy"
+
+_MmapMode = Optional[Literal["r+", "r", "w+", "c"]]
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Convert the numpy values found in game parameters to JSON types.
+    """
+    if isinstance(value, numpy.ndarray):
+        return value.tolist()
+    if isinstance(value, numpy.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} {value!r} can not be archived")
+
+
+def _channel_path(directory: str, name: str) -> str:
+    if not name or os.sep in name or name.startswith("."):
+        raise ValueError(f"{name!r} is not a valid channel name")
+    return os.path.join(directory, name + _CHANNEL_SUFFIX)
+
+
+def save_run(directory: str, channels: Mapping[str, numpy.ndarray],
+             metadata: Optional[Mapping[str, Any]] = None) -> None:
+    """
+    Write the recorded channels of one run, and its metadata, to a
+    directory.
+
+    :param str directory:
+        Where to write the run; created if it does not exist
+    :param channels: The recorded data of each channel, by channel name
+    :type channels: dict(str, ~numpy.ndarray)
+    :param metadata: JSON serialisable description of the run
+    :type metadata: dict(str, object) or None
+    :raises ValueError: If a channel name can not be used as a file name
+    """
+    os.makedirs(directory, exist_ok=True)
+    for name, data in channels.items():
+        numpy.save(_channel_path(directory, name), numpy.asarray(data),
+                   allow_pickle=False)
+    record = {
+        "format_version": FORMAT_VERSION,
+        "channels": list(channels),
+        "metadata": dict(metadata or {})}
+    with open(os.path.join(directory, METADATA_FILE), "w",
+              encoding="utf-8") as f:
+        json.dump(record, f, indent=2, default=_json_default)
+
+
+def save_game_run(directory: str, game,
+                  extra_metadata: Optional[Mapping[str, Any]] = None
+                  ) -> None:
+    """
+    Write everything recorded by a game during the current simulation to
+    a directory, along with the parameters and seeds the game was run
+    with and the root seed of the default seed stream, from which the
+    seeds of games created without one were drawn.
+
+    Must be called after ``run`` and before ``end``.
+
+    :param str directory:
+        Where to write the run; created if it does not exist
+    :param game: The game, or the Population holding it
+    :type game: SpinnGymApplicationVertex, SpinnGymMultiInstanceVertex or
+        ~spynnaker.pyNN.models.populations.Population
+    :param extra_metadata:
+        Anything else to store with the run, such as the parameters of the
+        network playing the game
+    :type extra_metadata: dict(str, object) or None
+    """
+    if isinstance(game, Population):
+        game = game._vertex  # pylint: disable=protected-access
+    metadata = {
+        "game": type(game).__name__,
+        "label": game.label,
+        "n_atoms": game.n_atoms,
+        "run_time_ms": SpynnakerDataView.get_current_run_time_ms(),
+        "parameters": game.parameters,
+        "root_seed": get_root_seed()}
+    metadata.update(extra_metadata or {})
+    channels = {name: game.get_recorded_data(name)
+                for name in game.get_recorded_channels()}
+    save_run(directory, channels, metadata)
+
+
+class ArchivedRun(object):
+    """
+    One run read back from the directory written by :py:func:`save_run`.
+
+    Channels are only opened when first accessed, and are memory-mapped
+    unless ``mmap_mode`` is None.
+    """
+
+    __slots__ = ("__channel_names", "__channels", "__directory",
+                 "__metadata", "__mmap_mode")
+
+    def __init__(self, directory: str, mmap_mode: _MmapMode = "r"):
+        """
+        :param str directory: The directory the run was saved to
+        :param mmap_mode:
+            How to memory-map the channels; see :py:func:`numpy.load`
+        :type mmap_mode: str or None
+        """
+        with open(os.path.join(directory, METADATA_FILE),
+                  encoding="utf-8") as f:
+            record = json.load(f)
+        if record.get("format_version") != FORMAT_VERSION:
+            raise ValueError(
+                f"{directory} has unsupported archive format "
+                f"{record.get('format_version')}")
+        self.__directory = directory
+        self.__metadata: Dict[str, Any] = record["metadata"]
+        self.__channel_names: List[str] = record["channels"]
+        self.__channels: Dict[str, numpy.ndarray] = dict()
+        self.__mmap_mode = mmap_mode
+
+    @property
+    def directory(self) -> str:
+        """
+        The directory the run was loaded from.
+
+        :rtype: str
+        """
+        return self.__directory
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        The metadata stored with the run.
+
+        :rtype: dict(str, object)
+        """
+        return self.__metadata
+
+    @property
+    def channel_names(self) -> List[str]:
+        """
+        The names of the channels stored for the run.
+
+        :rtype: list(str)
+        """
+        return list(self.__channel_names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__channel_names
+
+    def __getitem__(self, name: str) -> numpy.ndarray:
+        if name not in self.__channel_names:
+            raise KeyError(f"{name} was not recorded in {self.__directory}")
+        if name not in self.__channels:
+            self.__channels[name] = numpy.load(
+                _channel_path(self.__directory, name),
+                mmap_mode=self.__mmap_mode, allow_pickle=False)
+        return self.__channels[name]
+
+    def __repr__(self):
+        return f"ArchivedRun({self.__directory!r})"
+
+
+def load_run(directory: str, mmap_mode: _MmapMode = "r") -> ArchivedRun:
+    """
+    Read back a run written by :py:func:`save_run`.
+
+    :param str directory: The directory the run was saved to
+    :param mmap_mode:
+        How to memory-map the channels; see :py:func:`numpy.load`
+    :type mmap_mode: str or None
+    :rtype: ArchivedRun
+    """
+    return ArchivedRun(directory, mmap_mode)
+
+
+class ConcatenatedChannel(object):
+    """
+    One channel of many runs, indexed as if it were a single array
+    concatenated along the first axis.
+
+    Indexing only touches the runs that hold the requested samples, so
+    large archives can be sliced without reading all of them.
+    """
+
+    __slots__ = ("__dtype", "__name", "__offsets", "__runs", "__shape")
+
+    def __init__(self, runs: Sequence[ArchivedRun], name: str):
+        """
+        :param list(ArchivedRun) runs: The runs to concatenate, in order
+        :param str name: The channel to read from each run
+        :raises ValueError:
+            If there are no runs, or the runs recorded the channel with
+            different dtypes or sample shapes
+        """
+        if not runs:
+            raise ValueError("There are no runs to concatenate")
+        first = runs[0][name]
+        for run in runs[1:]:
+            data = run[name]
+            if data.dtype != first.dtype or data.shape[1:] != first.shape[1:]:
+                raise ValueError(
+                    f"{name} in {run.directory} does not match {name} in "
+                    f"{runs[0].directory}")
+        self.__runs = list(runs)
+        self.__name = name
+        self.__dtype = first.dtype
+        self.__shape = first.shape[1:]
+        self.__offsets = numpy.concatenate(
+            ([0], numpy.cumsum([len(run[name]) for run in runs]))).astype(
+                numpy.intp)
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        """
+        The dtype of the channel.
+
+        :rtype: ~numpy.dtype
+        """
+        return self.__dtype
+
+    @property
+    def shape(self):
+        """
+        The shape the channel would have if concatenated.
+
+        :rtype: tuple(int)
+        """
+        return (len(self),) + self.__shape
+
+    @property
+    def offsets(self) -> numpy.ndarray:
+        """
+        The index of the first sample of each run, followed by the total
+        number of samples.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__offsets.copy()
+
+    def run_of(self, index):
+        """
+        Get which run each of the given sample indices falls in.
+
+        :param index: Non-negative sample indices
+        :type index: int or ~numpy.ndarray
+        :rtype: int or ~numpy.ndarray
+        """
+        return numpy.searchsorted(self.__offsets, index, side="right") - 1
+
+    def chunks(self) -> Iterator[numpy.ndarray]:
+        """
+        Iterate over the channel one run at a time, without concatenating.
+
+        :rtype: iterable(~numpy.ndarray)
+        """
+        for run in self.__runs:
+            yield run[self.__name]
+
+    def __len__(self) -> int:
+        return int(self.__offsets[-1])
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, numpy.integer)):
+            index = int(key)
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(f"index {key} is out of range")
+            run = int(self.run_of(index))
+            return self.__runs[run][self.__name][
+                index - self.__offsets[run]]
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self.__contiguous(start, stop)
+            key = numpy.arange(start, stop, step)
+        return self.__gather(numpy.asarray(key))
+
+    def __contiguous(self, start: int, stop: int) -> numpy.ndarray:
+        if stop <= start:
+            return numpy.empty((0,) + self.__shape, dtype=self.__dtype)
+        first = int(self.run_of(start))
+        last = int(self.run_of(stop - 1))
+        parts = []
+        for run in range(first, last + 1):
+            offset = self.__offsets[run]
+            parts.append(self.__runs[run][self.__name][
+                max(start - offset, 0):stop - offset])
+        return numpy.concatenate(parts)
+
+    def __gather(self, indices: numpy.ndarray) -> numpy.ndarray:
+        if indices.dtype == bool:
+            if indices.shape != (len(self),):
+                raise IndexError("boolean index does not match the channel")
+            indices = numpy.flatnonzero(indices)
+        elif indices.size == 0:
+            indices = indices.astype(numpy.intp)
+        elif not numpy.issubdtype(indices.dtype, numpy.integer):
+            raise IndexError("only integer or boolean arrays are valid "
+                             "indices")
+        indices = numpy.where(indices < 0, indices + len(self), indices)
+        if indices.size and (indices.min() < 0 or
+                             indices.max() >= len(self)):
+            raise IndexError("index is out of range")
+        result = numpy.empty(indices.shape + self.__shape, dtype=self.__dtype)
+        runs = self.run_of(indices)
+        for run in numpy.unique(runs):
+            in_run = runs == run
+            result[in_run] = self.__runs[run][self.__name][
+                indices[in_run] - self.__offsets[run]]
+        return result
+
+    def __array__(self, dtype=None, copy=None):
+        # pylint: disable=unused-argument
+        data = self.__contiguous(0, len(self))
+        if dtype is not None:
+            return data.astype(dtype)
+        return data
+
+    def __repr__(self):
+        return (f"ConcatenatedChannel({self.__name!r}, "
+                f"{len(self.__runs)} runs, {len(self)} samples)")
+
+
+class RunArchive(object):
+    """
+    A collection of archived runs, to be analysed together.
+    """
+
+    __slots__ = ("__mmap_mode", "__runs")
+
+    def __init__(self, directories: Iterable[str],
+                 mmap_mode: _MmapMode = "r"):
+        """
+        :param iterable(str) directories:
+            The directories the runs were saved to, in the order they
+            should be concatenated
+        :param mmap_mode:
+            How to memory-map the channels; see :py:func:`numpy.load`
+        :type mmap_mode: str or None
+        """
+        self.__mmap_mode = mmap_mode
+        self.__runs = [ArchivedRun(directory, mmap_mode)
+                       for directory in directories]
+
+    @classmethod
+    def from_directory(cls, root: str,
+                       mmap_mode: _MmapMode = "r") -> "RunArchive":
+        """
+        Open every run saved in the sub-directories of a directory, in
+        sorted order of sub-directory name.
+
+        :param str root: The directory holding one directory per run
+        :param mmap_mode:
+            How to memory-map the channels; see :py:func:`numpy.load`
+        :type mmap_mode: str or None
+        :rtype: RunArchive
+        """
+        return cls(
+            (os.path.join(root, name) for name in sorted(os.listdir(root))
+             if os.path.isfile(os.path.join(root, name, METADATA_FILE))),
+            mmap_mode)
+
+    @property
+    def runs(self) -> List[ArchivedRun]:
+        """
+        The runs in the archive.
+
+        :rtype: list(ArchivedRun)
+        """
+        return list(self.__runs)
+
+    @property
+    def metadata(self) -> List[Dict[str, Any]]:
+        """
+        The metadata of each run in the archive.
+
+        :rtype: list(dict(str, object))
+        """
+        return [run.metadata for run in self.__runs]
+
+    def select(self, predicate: Callable[[Dict[str, Any]], bool]
+               ) -> "RunArchive":
+        """
+        Get the runs whose metadata matches a condition.
+
+        :param callable predicate:
+            Called with the metadata of each run; the run is kept if this
+            returns True
+        :rtype: RunArchive
+        """
+        return RunArchive(
+            (run.directory for run in self.__runs
+             if predicate(run.metadata)), self.__mmap_mode)
+
+    def channel(self, name: str) -> ConcatenatedChannel:
+        """
+        Get one channel of every run, lazily concatenated.
+
+        :param str name: The channel to read
+        :rtype: ConcatenatedChannel
+        """
+        return ConcatenatedChannel(self.__runs, name)
+
+    def __len__(self) -> int:
+        return len(self.__runs)
+
+    def __iter__(self) -> Iterator[ArchivedRun]:
+        return iter(self.__runs)
+
+    def __repr__(self):
+        return f"RunArchive({len(self.__runs)} runs)"
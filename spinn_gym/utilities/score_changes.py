@@ -0,0 +1,44 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy
+
+
+def expand_score_changes(changes: numpy.ndarray, ticks) -> numpy.ndarray:
+    """
+    Expand scores recorded only when they changed back into the score at
+    each of a series of ticks.
+
+    A recorded score is in force from its own tick until the tick of the
+    next record; before the first record every field is zero.
+
+    :param ~numpy.ndarray changes:
+        The recorded changes, in tick order; a ``tick`` field followed by
+        the fields of the score
+    :param ticks: The ticks to get the score at
+    :type ticks: int or ~numpy.ndarray
+    :return: The score at each tick, with the fields of ``changes`` other
+        than ``tick``
+    :rtype: ~numpy.ndarray
+    """
+    ticks = numpy.asarray(ticks)
+    names = [name for name in changes.dtype.names or () if name != "tick"]
+    scores = numpy.zeros(
+        ticks.shape, dtype=[(name, changes.dtype[name]) for name in names])
+    index = numpy.searchsorted(changes["tick"], ticks, side="right") - 1
+    recorded = index >= 0
+    for name in names:
+        scores[name][recorded] = changes[name][index[recorded]]
+    return scores
@@ -0,0 +1,186 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from typing import Any, cast, List, Optional, Sequence, Union
+
+import numpy
+
+
+class SeedStream(object):
+    """
+    An endless, reproducible series of independent seeds for the KISS64
+    random number generator of the binaries, spawned from one root seed
+    with a :py:class:`numpy.random.SeedSequence`.
+
+    Each seed is 4 arbitrary 32-bit values; the binaries make any such
+    seed valid for KISS64 as they load it.
+
+    Two streams with the same root seed hand out the same seeds in the
+    same order, so a root seed is all that is needed to repeat a set of
+    games.
+    """
+
+    __slots__ = ("__sequence", )
+
+    def __init__(self, root_seed: Optional[int] = None):
+        """
+        :param root_seed:
+            The seed to spawn from, or None to use fresh entropy from the
+            operating system
+        :type root_seed: int or None
+        """
+        self.__sequence = numpy.random.SeedSequence(root_seed)
+
+    @property
+    def root_seed(self) -> int:
+        """
+        The seed this stream spawns from; if none was given, the entropy
+        that was picked, which can be passed back in to repeat the stream.
+
+        :rtype: int
+        """
+        return cast(int, self.__sequence.entropy)
+
+    @property
+    def n_spawned(self) -> int:
+        """
+        How many seeds the stream has handed out so far.
+
+        :rtype: int
+        """
+        return self.__sequence.n_children_spawned
+
+    def next_seed(self) -> List[int]:
+        """
+        Get the next seed in the stream.
+
+        :rtype: list(int)
+        """
+        return self.spawn(1)[0]
+
+    def spawn(self, n_seeds: int) -> List[List[int]]:
+        """
+        Get the next few seeds in the stream.
+
+        :param int n_seeds: How many seeds to get
+        :rtype: list(list(int))
+        """
+        return [seed_from_sequence(child)
+                for child in self.__sequence.spawn(n_seeds)]
+
+
+def seed_from_sequence(
+        sequence: Union[int, numpy.random.SeedSequence]) -> List[int]:
+    """
+    Derive a single seed from a seed sequence or an integer.
+
+    :param sequence: Where to get the seed from
+    :type sequence: int or ~numpy.random.SeedSequence
+    :rtype: list(int)
+    """
+    if not isinstance(sequence, numpy.random.SeedSequence):
+        sequence = numpy.random.SeedSequence(int(sequence))
+    return sequence.generate_state(4, numpy.uint32).tolist()
+
+
+# The stream that games draw from when not given a seed
+_default_stream = SeedStream()
+
+
+def set_root_seed(root_seed: Optional[int]) -> None:
+    """
+    Start the stream of seeds given to games that are created without one
+    again from a new root seed.
+
+    :param root_seed:
+        The seed to spawn from, or None to use fresh entropy
+    :type root_seed: int or None
+    """
+    global _default_stream  # pylint: disable=global-statement
+    _default_stream = SeedStream(root_seed)
+
+
+def get_root_seed() -> int:
+    """
+    The root seed of the stream of seeds given to games that are created
+    without one.
+
+    :rtype: int
+    """
+    return _default_stream.root_seed
+
+
+def resolve_random_seed(
+        random_seed: Union[
+            None, int, numpy.random.SeedSequence, Sequence[int]]
+        ) -> List[int]:
+    """
+    Turn any of the ways a game can be given a random seed into the 4
+    values to write to the machine.
+
+    An int or a :py:class:`~numpy.random.SeedSequence` gives the seed of
+    the first of a set of games given it, as
+    :py:func:`resolve_random_seeds` spawns them, so that a single game and
+    a set of games given the same int start alike.
+
+    :param random_seed:
+        None to take the next seed from the default stream, an int or a
+        :py:class:`~numpy.random.SeedSequence` to spawn a seed from, or
+        the 4 values of the seed itself
+    :type random_seed: None, int, ~numpy.random.SeedSequence or list(int)
+    :rtype: list(int)
+    :raises ValueError: If the seed is a list but not of 4 values
+    """
+    if random_seed is None:
+        return _default_stream.next_seed()
+    if isinstance(random_seed, (int, numpy.integer,
+                                numpy.random.SeedSequence)):
+        return resolve_random_seeds(random_seed, 1)[0]
+    if len(random_seed) != 4:
+        raise ValueError(
+            f"A random seed must be 4 values, not {random_seed}")
+    return [int(word) for word in random_seed]
+
+
+def resolve_random_seeds(
+        random_seeds: Union[
+            None, int, numpy.random.SeedSequence, Sequence[Any]],
+        n_seeds: int) -> List[List[int]]:
+    """
+    Turn any of the ways a set of games can be given their random seeds
+    into the 4 values of the seed of each game.
+
+    :param random_seeds:
+        None to take the next seeds from the default stream, an int or a
+        :py:class:`~numpy.random.SeedSequence` to spawn the seeds from, or
+        a seed for each game, in any form accepted by
+        :py:func:`resolve_random_seed`
+    :type random_seeds:
+        None, int, ~numpy.random.SeedSequence or list
+    :param int n_seeds: The number of seeds needed
+    :rtype: list(list(int))
+    :raises ValueError: If the number of seeds given is wrong
+    """
+    if random_seeds is None:
+        return _default_stream.spawn(n_seeds)
+    if isinstance(random_seeds, (int, numpy.integer)):
+        random_seeds = numpy.random.SeedSequence(int(random_seeds))
+    if isinstance(random_seeds, numpy.random.SeedSequence):
+        return [seed_from_sequence(child)
+                for child in random_seeds.spawn(n_seeds)]
+    if len(random_seeds) != n_seeds:
+        raise ValueError(
+            f"{n_seeds} random seeds are needed, not {len(random_seeds)}")
+    return [resolve_random_seed(seed) for seed in random_seeds]
@@ -0,0 +1,302 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Encodings of continuous values as spikes, as the pendulum binaries encode
+their state.
+
+Each value is first scaled to between 0 and 1.  The rate encoding spikes
+one neuron at random, more often the higher the value; the others share
+the range between ``number_of_bins`` neurons, one centred on each bin.
+Receptive bins spike at random near the value; with spike time encoding,
+each bin near enough to the value spikes once in a frame, sooner the
+nearer it is; with rank encoding, every bin spikes once in a frame, on
+the tick given by how many bins are nearer to the value than it is.
+
+The functions take arrays of any shape, whose last axis is the variables,
+so that a batch of states is encoded in one call.
+"""
+
+from typing import List, Optional
+
+import numpy
+
+from .seed_streams import resolve_random_seed
+
+_f32 = numpy.float32
+
+#: The encodings of continuous values
+RATE, RECEPTIVE_BINS, SPIKE_TIME, RANK = range(4)
+
+
+def to_relative(values, minimum, maximum) -> numpy.ndarray:
+    """
+    Scale values to between 0 and 1, as they are before being encoded.
+
+    :param values: The values, with the variables on the last axis
+    :param minimum: The least value of each variable, or of all of them
+    :param maximum: The greatest value of each variable, or of all of them
+    :rtype: ~numpy.ndarray
+    """
+    minimum = numpy.asarray(minimum, dtype=_f32)
+    return ((numpy.asarray(values, dtype=_f32) - minimum) /
+            (numpy.asarray(maximum, dtype=_f32) - minimum))
+
+
+def _separations(
+        relative: numpy.ndarray, number_of_bins: int) -> numpy.ndarray:
+    """
+    Find how far each value is from the centre of each of its bins.
+
+    :return: The separations, with an extra last axis for the bins
+    """
+    bin_width = _f32(1) / (_f32(number_of_bins) - _f32(1))
+    return numpy.abs(
+        relative[..., None] -
+        bin_width * numpy.arange(number_of_bins, dtype=_f32))
+
+
+def rate_spikes(relative: numpy.ndarray, max_firing_prob: numpy.float32,
+                rng: numpy.random.Generator) -> numpy.ndarray:
+    """
+    Spike at random at a rate that rises with each value.
+
+    :param ~numpy.ndarray relative: The values, each between 0 and 1
+    :param ~numpy.float32 max_firing_prob:
+        The probability of a spike in a tick of a value of 1
+    :param ~numpy.random.Generator rng: Where to draw the spikes from
+    :return: Whether each value spikes, in the shape of the values
+    :rtype: ~numpy.ndarray
+    """
+    relative = numpy.asarray(relative, dtype=_f32)
+    return rng.random(relative.shape) < relative * max_firing_prob
+
+
+def receptive_bins(
+        relative: numpy.ndarray, number_of_bins: int, bin_overlap: float,
+        max_firing_prob: numpy.float32, rng: numpy.random.Generator
+        ) -> numpy.ndarray:
+    """
+    Spike at random in the bins near each value, as ``firing_prob`` of the
+    pendulum binaries does.
+
+    A bin spikes with the maximum probability when a normal variate, with
+    a deviation of the width of a bin divided by the overlap, lands further
+    from the centre of the bin than the value is.
+
+    :param ~numpy.ndarray relative: The values, each between 0 and 1
+    :param int number_of_bins: The number of bins of each variable
+    :param float bin_overlap: How much the bins overlap
+    :param ~numpy.float32 max_firing_prob:
+        The probability of a spike in a tick
+    :param ~numpy.random.Generator rng: Where to draw the variates from
+    :return: Whether each bin of each value spikes, with an extra last
+        axis for the bins
+    :rtype: ~numpy.ndarray
+    """
+    bin_width = _f32(1) / (_f32(number_of_bins) - _f32(1))
+    separation = _separations(relative, number_of_bins)
+    shape = separation.shape
+    norm = numpy.abs(rng.normal(0, bin_width / bin_overlap, shape))
+    return (norm > separation) & (rng.random(shape) < max_firing_prob)
+
+
+def spike_times(
+        relative: numpy.ndarray, number_of_bins: int, bin_overlap: float,
+        frame_length: int) -> numpy.ndarray:
+    """
+    Find when in a frame each bin near each value spikes; the nearer the
+    bin, the sooner it spikes, and bins further away than the width of a
+    bin times the overlap don't spike at all.
+
+    :param ~numpy.ndarray relative: The values, each between 0 and 1
+    :param int number_of_bins: The number of bins of each variable
+    :param float bin_overlap: How much the bins overlap
+    :param int frame_length: The number of ticks in a frame
+    :return: The tick of the frame in which each bin of each value
+        spikes, or -1 if it doesn't, with an extra last axis for the bins
+    :rtype: ~numpy.ndarray
+    """
+    bin_width = _f32(1) / (_f32(number_of_bins) - _f32(1))
+    field = bin_width * _f32(bin_overlap)
+    separation = _separations(relative, number_of_bins)
+    ticks = numpy.floor(separation / field * frame_length).astype(numpy.int64)
+    return numpy.where(separation < field, ticks, -1)
+
+
+def spike_ranks(
+        relative: numpy.ndarray, number_of_bins: int) -> numpy.ndarray:
+    """
+    Rank the bins of each value by how near they are to it, the nearest
+    first; each bin spikes on the tick of the frame given by its rank.
+
+    :param ~numpy.ndarray relative: The values, each between 0 and 1
+    :param int number_of_bins: The number of bins of each variable
+    :return: The rank of each bin of each value, with an extra last axis
+        for the bins
+    :rtype: ~numpy.ndarray
+    """
+    order = numpy.argsort(
+        _separations(relative, number_of_bins), axis=-1, kind="stable")
+    return numpy.argsort(order, axis=-1, kind="stable")
+
+
+def spike_source_times(
+        raster: numpy.ndarray, timestep: float = 1.0,
+        start: float = 0.0) -> List[numpy.ndarray]:
+    """
+    Get the times at which each neuron of a raster spikes, as the
+    ``spike_times`` of a ``SpikeSourceArray``.
+
+    :param ~numpy.ndarray raster:
+        The spikes of each neuron in each tick, with the ticks on the
+        first axis; the other axes are flattened into the neurons
+    :param float timestep: The time of a tick, in ms
+    :param float start: The time of the first tick, in ms
+    :return: The times of the spikes of each neuron, in ms
+    :rtype: list(~numpy.ndarray)
+    """
+    raster = numpy.asarray(raster)
+    by_neuron = raster.reshape(raster.shape[0], -1).T
+    neurons, ticks = numpy.nonzero(by_neuron)
+    # A neuron that spikes more than once in a tick spikes at that time
+    # only once, as a spike source can
+    times = start + ticks * timestep
+    return numpy.split(times, numpy.cumsum(
+        numpy.bincount(neurons, minlength=len(by_neuron)))[:-1])
+
+
+# ----------------------------------------------------------------------------
+# SpikeEncoder
+# ----------------------------------------------------------------------------
+class SpikeEncoder(object):
+    """
+    Encodes batches of continuous states as rasters of spikes, as a
+    pendulum with the same parameters would spike its state.
+
+    Each state is held for a frame of ``frame_length`` ticks; with the
+    rate and receptive bin encodings every tick of the frame is drawn
+    anew, and with the others each bin spikes at its time in the frame.
+    The random encodings draw from a generator seeded once, so an encoder
+    made with the same seed encodes the same states the same way.
+    """
+
+    __slots__ = (
+        "__encoding", "__number_of_bins", "__bin_overlap",
+        "__max_firing_prob", "__frame_length", "__rng")
+
+    def __init__(self, encoding: int = RECEPTIVE_BINS,
+                 number_of_bins: int = 20, bin_overlap: float = 2,
+                 max_firing_rate: int = 100, frame_length: int = 20,
+                 random_seed=None):
+        """
+        :param int encoding:
+            0 rate, 1 receptive bins, 2 spike time or 3 rank
+        :param int number_of_bins:
+            The neurons of each variable when the encoding isn't rate
+        :param float bin_overlap: How much the bins overlap
+        :param int max_firing_rate: The highest rate of a neuron, in Hz
+        :param int frame_length: The ticks that each state is held for
+        :param random_seed:
+            The seed of the generator of the random encodings; see
+            :py:func:`~spinn_gym.utilities.resolve_random_seed`
+        :raises ValueError: If the encoding is not known
+        """
+        if encoding not in (RATE, RECEPTIVE_BINS, SPIKE_TIME, RANK):
+            raise ValueError(f"Unknown encoding {encoding}")
+        self.__encoding = encoding
+        self.__number_of_bins = number_of_bins
+        self.__bin_overlap = bin_overlap
+        self.__max_firing_prob = _f32(max_firing_rate) / _f32(1000)
+        self.__frame_length = frame_length
+        self.__rng = numpy.random.default_rng(
+            resolve_random_seed(random_seed))
+
+    @property
+    def neurons_per_variable(self) -> int:
+        """
+        The number of neurons that each variable is encoded by.
+
+        :rtype: int
+        """
+        return 1 if self.__encoding == RATE else self.__number_of_bins
+
+    def encode(self, relative: numpy.ndarray,
+               tick_in_frame: Optional[int] = None) -> numpy.ndarray:
+        """
+        Encode states for a single tick.
+
+        :param ~numpy.ndarray relative:
+            The values of the states, each between 0 and 1, with the
+            variables on the last axis
+        :param tick_in_frame:
+            The tick of the frame to spike; needed by the spike time and
+            rank encodings
+        :type tick_in_frame: int or None
+        :return: Whether each neuron spikes, in the shape of the states
+            with the neurons of all their variables on the last axis
+        :rtype: ~numpy.ndarray
+        :raises ValueError: If the tick of the frame is needed but not given
+        """
+        relative = numpy.asarray(relative, dtype=_f32)
+        if self.__encoding == RATE:
+            return rate_spikes(
+                relative, self.__max_firing_prob, self.__rng)
+        if self.__encoding == RECEPTIVE_BINS:
+            spiking = receptive_bins(
+                relative, self.__number_of_bins, self.__bin_overlap,
+                self.__max_firing_prob, self.__rng)
+        elif tick_in_frame is None:
+            raise ValueError("The tick of the frame is needed")
+        elif self.__encoding == SPIKE_TIME:
+            spiking = spike_times(
+                relative, self.__number_of_bins, self.__bin_overlap,
+                self.__frame_length) == tick_in_frame
+        else:
+            spiking = spike_ranks(
+                relative, self.__number_of_bins) == tick_in_frame
+        return spiking.reshape(*relative.shape[:-1], -1)
+
+    def raster(self, relative: numpy.ndarray) -> numpy.ndarray:
+        """
+        Encode a series of states, each held for a frame.
+
+        :param ~numpy.ndarray relative:
+            The values of the states of each frame, each between 0 and 1,
+            with the frames on the first axis and the variables on the last
+        :return: The spikes of each neuron in each tick, with the ticks of
+            all the frames on the first axis and the neurons of all the
+            variables on the last
+        :rtype: ~numpy.ndarray
+        """
+        relative = numpy.asarray(relative, dtype=_f32)
+        frames = numpy.repeat(relative, self.__frame_length, axis=0)
+        if self.__encoding == RATE:
+            spiking = rate_spikes(frames, self.__max_firing_prob, self.__rng)
+        elif self.__encoding == RECEPTIVE_BINS:
+            spiking = receptive_bins(
+                frames, self.__number_of_bins, self.__bin_overlap,
+                self.__max_firing_prob, self.__rng)
+        else:
+            if self.__encoding == SPIKE_TIME:
+                ticks = spike_times(
+                    relative, self.__number_of_bins, self.__bin_overlap,
+                    self.__frame_length)
+            else:
+                ticks = spike_ranks(relative, self.__number_of_bins)
+            ticks = numpy.repeat(ticks, self.__frame_length, axis=0)
+            tick_in_frame = numpy.arange(len(frames)) % self.__frame_length
+            spiking = ticks == tick_in_frame.reshape(
+                (-1, ) + (1, ) * (ticks.ndim - 1))
+        return spiking.reshape(*frames.shape[:-1], -1).astype(numpy.uint8)
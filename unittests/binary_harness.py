@@ -0,0 +1,85 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+""" Build the binary of a game for the host, and run it, to check that the
+    host engines play as the binaries do
+"""
+
+import os
+import shutil
+import subprocess
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_HARNESS = os.path.join(_HERE, "c_harness")
+_C_CODE = os.path.join(os.path.dirname(_HERE), "c_code")
+
+
+def build_binary(game, output_dir):
+    """ Build the source of a game, in c_code/<game>/src, with the harness
+
+    :return: The path to the executable, or None if there is no compiler
+    """
+    compiler = shutil.which("gcc")
+    if compiler is None:
+        return None
+    src_dir = os.path.join(_C_CODE, game, "src")
+    sources = [os.path.join(src_dir, name)
+               for name in sorted(os.listdir(src_dir))
+               if name.endswith(".c")]
+    executable = os.path.join(output_dir, game)
+    subprocess.run(
+        [compiler, "-std=gnu99", "-O1", "-w", "-I", _HARNESS,
+         "-I", os.path.join(_C_CODE, "common"), *sources,
+         os.path.join(_HARNESS, "harness.c"), "-o", executable, "-lm"],
+        check=True)
+    return executable
+
+
+def run_binary(executable, regions, keys_per_tick, with_provenance=False):
+    """ Run a binary built by build_binary for a tick per item of
+        keys_per_tick
+
+    :param list(list(int)) regions: The words of each region
+    :param list(list(int)) keys_per_tick:
+        The keys received before each tick
+    :param bool with_provenance:
+        Whether to also return the provenance words written at the end
+    :return: The (tick, key) of each packet sent, and the
+        (tick, channel, words) of each record recorded, and the
+        provenance words if asked for
+    """
+    lines = [str(len(keys_per_tick)), str(len(regions))]
+    for words in regions:
+        lines.append(" ".join(str(int(word)) for word in [len(words), *words]))
+    for keys in keys_per_tick:
+        lines.append(" ".join(str(int(key)) for key in [len(keys), *keys]))
+    output = subprocess.run(
+        [executable], input="\n".join(lines), capture_output=True,
+        text=True, check=True).stdout
+    packets = []
+    records = []
+    provenance = []
+    for line in output.splitlines():
+        fields = line.split()
+        if fields[0] == "P":
+            packets.append((int(fields[1]), int(fields[2])))
+        elif fields[0] == "V":
+            provenance = [int(word) for word in fields[1:]]
+        else:
+            records.append((int(fields[1]), int(fields[2]),
+                            [int(word) for word in fields[3:]]))
+    if with_provenance:
+        return packets, records, provenance
+    return packets, records
@@ -0,0 +1,28 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#ifndef _HARNESS_BIT_FIELD_H_
+#define _HARNESS_BIT_FIELD_H_
+
+#include <stdint.h>
+
+//! The number of words in a bit field of n bits
+static inline uint32_t get_bit_field_size(uint32_t n) {
+    return (n + 31) >> 5;
+}
+
+#endif  // _HARNESS_BIT_FIELD_H_
@@ -0,0 +1,30 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#ifndef _HARNESS_DATA_SPECIFICATION_H_
+#define _HARNESS_DATA_SPECIFICATION_H_
+
+#include <spin1_api.h>
+
+typedef struct data_specification_metadata_t data_specification_metadata_t;
+
+data_specification_metadata_t *data_specification_get_data_address(void);
+bool data_specification_read_header(data_specification_metadata_t *ds_regions);
+void *data_specification_get_region(
+    uint32_t region, data_specification_metadata_t *ds_regions);
+
+#endif  // _HARNESS_DATA_SPECIFICATION_H_
@@ -0,0 +1,26 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#ifndef _HARNESS_DEBUG_H_
+#define _HARNESS_DEBUG_H_
+
+#define log_info(...) do {} while (0)
+#define log_debug(...) do {} while (0)
+#define log_warning(...) do {} while (0)
+#define log_error(...) do {} while (0)
+
+#endif  // _HARNESS_DEBUG_H_
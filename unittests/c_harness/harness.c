@@ -0,0 +1,230 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Runs the binary of a game on the host, for testing.
+//!
+//! Reads from standard input the number of ticks to run for, then the
+//! number of regions and the words of each region, each as a count
+//! followed by the words, and then for each tick the keys received before
+//! it, as a count followed by the keys.  Writes to standard output a line
+//! "P tick key" for each packet sent and a line "R tick channel words..."
+//! for each record recorded, and at the end a line "V words..." of the
+//! provenance words written by the binary.
+
+#include <stdarg.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include <spin1_api.h>
+#include <data_specification.h>
+#include <random.h>
+#include <recording.h>
+#include <simulation.h>
+
+#define MAX_REGIONS 8
+#define MAX_PROVENANCE_WORDS 64
+
+void c_main(void);
+
+static uint32_t *regions[MAX_REGIONS];
+static uint32_t n_ticks;
+static uint32_t tick;
+static callback_t timer_callback;
+static callback_t packet_callback;
+static prov_callback_t provenance_callback;
+
+static uint32_t read_word(void) {
+    unsigned long word;
+    if (scanf("%lu", &word) != 1) {
+        fprintf(stderr, "Input ended early\n");
+        exit(2);
+    }
+    return (uint32_t) word;
+}
+
+uint spin1_send_mc_packet(uint key, uint data, uint load) {
+    use(data);
+    use(load);
+    printf("P %u %u\n", tick, key);
+    return 1;
+}
+
+void spin1_callback_on(uint event_id, callback_t cback, int priority) {
+    use(priority);
+    if (event_id == TIMER_TICK) {
+        timer_callback = cback;
+    } else {
+        packet_callback = cback;
+    }
+}
+
+void spin1_set_timer_tick(uint time) {
+    use(time);
+}
+
+void *spin1_malloc(uint bytes) {
+    return malloc(bytes);
+}
+
+void rt_error(uint code, ...) {
+    fprintf(stderr, "rt_error %u\n", code);
+    exit(1);
+}
+
+void io_printf(int stream, const char *format, ...) {
+    use(stream);
+    use(format);
+}
+
+data_specification_metadata_t *data_specification_get_data_address(void) {
+    return NULL;
+}
+
+bool data_specification_read_header(data_specification_metadata_t *ds) {
+    use(ds);
+    return true;
+}
+
+void *data_specification_get_region(
+        uint32_t region, data_specification_metadata_t *ds) {
+    use(ds);
+    return regions[region];
+}
+
+bool simulation_initialise(
+        address_t address, uint32_t expected_app_magic_number,
+        uint32_t *timer_period, uint32_t *simulation_ticks_pointer,
+        uint32_t *infinite_run_pointer, uint32_t *time_pointer,
+        int sdp_packet_callback_priority,
+        int dma_transfer_done_callback_priority) {
+    use(address);
+    use(expected_app_magic_number);
+    use(time_pointer);
+    use(sdp_packet_callback_priority);
+    use(dma_transfer_done_callback_priority);
+    *timer_period = 1000;
+    *simulation_ticks_pointer = n_ticks;
+    *infinite_run_pointer = 0;
+    return true;
+}
+
+void simulation_set_provenance_function(
+        prov_callback_t provenance_function,
+        address_t provenance_data_address) {
+    use(provenance_data_address);
+    provenance_callback = provenance_function;
+}
+
+//! \brief Write the provenance words of the binary, as many as it writes
+static void print_provenance(void) {
+    // A word is written if it is changed from either of two fillers
+    uint32_t filled_a[MAX_PROVENANCE_WORDS];
+    uint32_t filled_5[MAX_PROVENANCE_WORDS];
+    for (uint32_t i = 0; i < MAX_PROVENANCE_WORDS; i++) {
+        filled_a[i] = 0xAAAAAAAA;
+        filled_5[i] = 0x55555555;
+    }
+    provenance_callback(filled_a);
+    provenance_callback(filled_5);
+    uint32_t n_words = 0;
+    for (uint32_t i = 0; i < MAX_PROVENANCE_WORDS; i++) {
+        if (filled_a[i] != 0xAAAAAAAA || filled_5[i] != 0x55555555) {
+            n_words = i + 1;
+        }
+    }
+    printf("V");
+    for (uint32_t i = 0; i < n_words; i++) {
+        printf(" %u", filled_a[i]);
+    }
+    printf("\n");
+}
+
+void simulation_handle_pause_resume(resume_callback_t callback) {
+    use(callback);
+}
+
+void simulation_ready_to_read(void) {
+}
+
+void simulation_run(void) {
+    for (tick = 0; tick < n_ticks; tick++) {
+        uint32_t n_keys = read_word();
+        for (uint32_t i = 0; i < n_keys; i++) {
+            packet_callback(read_word(), 0);
+        }
+        timer_callback(0, 0);
+    }
+    if (provenance_callback != NULL) {
+        print_provenance();
+    }
+}
+
+bool recording_initialize(
+        void **recording_data_address, uint32_t *recording_flags) {
+    use(recording_data_address);
+    use(recording_flags);
+    return true;
+}
+
+bool recording_record(uint8_t channel, void *data, uint32_t size_bytes) {
+    const uint32_t *words = data;
+    printf("R %u %u", tick, channel);
+    for (uint32_t i = 0; i < size_bytes / sizeof(uint32_t); i++) {
+        printf(" %u", words[i]);
+    }
+    printf("\n");
+    return true;
+}
+
+void recording_finalise(void) {
+}
+
+void recording_reset(void) {
+}
+
+uint32_t mars_kiss64_seed(mars_kiss64_seed_t seed) {
+    seed[0] = 314527869 * seed[0] + 1234567;
+    seed[1] ^= (seed[1] << 5);
+    seed[1] ^= (seed[1] >> 7);
+    seed[1] ^= (seed[1] << 22);
+    uint64_t t = 4294584393ULL * seed[2] + seed[3];
+    seed[3] = t >> 32;
+    seed[2] = t;
+    return seed[0] + seed[1] + seed[2];
+}
+
+void validate_mars_kiss64_seed(mars_kiss64_seed_t seed) {
+    if (seed[1] == 0) {
+        seed[1] = 13031301;
+    }
+    seed[3] = seed[3] % 698769068 + 1;
+}
+
+int main(void) {
+    n_ticks = read_word();
+    uint32_t n_regions = read_word();
+    for (uint32_t r = 0; r < n_regions && r < MAX_REGIONS; r++) {
+        uint32_t n_words = read_word();
+        regions[r] = calloc(n_words + 1, sizeof(uint32_t));
+        for (uint32_t i = 0; i < n_words; i++) {
+            regions[r][i] = read_word();
+        }
+    }
+    c_main();
+    return 0;
+}
@@ -0,0 +1,29 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#ifndef _HARNESS_RECORDING_H_
+#define _HARNESS_RECORDING_H_
+
+#include <spin1_api.h>
+
+bool recording_initialize(void **recording_data_address,
+                          uint32_t *recording_flags);
+bool recording_record(uint8_t channel, void *data, uint32_t size_bytes);
+void recording_finalise(void);
+void recording_reset(void);
+
+#endif  // _HARNESS_RECORDING_H_
@@ -0,0 +1,40 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#ifndef _HARNESS_SIMULATION_H_
+#define _HARNESS_SIMULATION_H_
+
+#include <spin1_api.h>
+
+#define APPLICATION_NAME_HASH 0
+
+typedef void (*resume_callback_t)(void);
+typedef void (*prov_callback_t)(address_t);
+
+bool simulation_initialise(
+    address_t address, uint32_t expected_app_magic_number,
+    uint32_t *timer_period, uint32_t *simulation_ticks_pointer,
+    uint32_t *infinite_run_pointer, uint32_t *time_pointer,
+    int sdp_packet_callback_priority,
+    int dma_transfer_done_callback_priority);
+void simulation_set_provenance_function(
+    prov_callback_t provenance_function, address_t provenance_data_address);
+void simulation_handle_pause_resume(resume_callback_t callback);
+void simulation_ready_to_read(void);
+void simulation_run(void);
+
+#endif  // _HARNESS_SIMULATION_H_
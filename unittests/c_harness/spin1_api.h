@@ -0,0 +1,59 @@
+/*
+ * Copyright (c) 2026 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief The parts of the SpiNNaker API used by the games, for building
+//!        a binary to run on the host in tests.
+
+#ifndef _HARNESS_SPIN1_API_H_
+#define _HARNESS_SPIN1_API_H_
+
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+
+typedef unsigned int uint;
+typedef uint32_t *address_t;
+typedef void (*callback_t)(uint, uint);
+
+// The host has no fixed point types.  This lets games that only print an
+// accum, or read one through a union, be built; an accum read so is taken
+// as a float, so tests give such parameters as the bits of a float.  Those
+// that compute with accums include stdfix.h, which the host lacks, so still
+// can't be.
+typedef float accum;
+
+#define NO_PAYLOAD 0
+#define WITH_PAYLOAD 1
+
+#define TIMER_TICK 0
+#define MC_PACKET_RECEIVED 1
+#define MCPL_PACKET_RECEIVED 2
+
+#define RTE_SWERR 1
+#define IO_BUF 0
+
+#define use(x) do {} while ((x) != (x))
+
+uint spin1_send_mc_packet(uint key, uint data, uint load);
+void spin1_callback_on(uint event_id, callback_t cback, int priority);
+void spin1_set_timer_tick(uint time);
+void *spin1_malloc(uint bytes);
+void rt_error(uint code, ...);
+void io_printf(int stream, const char *format, ...);
+
+#endif  // _HARNESS_SPIN1_API_H_
@@ -0,0 +1,229 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from collections import defaultdict
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy
+
+import pyNN.spiNNaker as p
+
+from pacman.model.placements import Placement
+from pacman.model.routing_info import (
+    AppVertexRoutingInfo, BaseKeyAndMask, MachineVertexRoutingInfo,
+    RoutingInfo)
+from pacman_test_objects import SimpleTestVertex
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
+
+from spinn_gym import Bandit, BanditEngine
+from spinn_gym.games.multi_arm_bandit.bandit_machine_vertex import \
+    BanditMachineVertex
+from spinn_gym.utilities import SeedStream
+
+from binary_harness import build_binary, run_binary
+
+
+class TestBanditEngine(unittest.TestCase):
+
+    def test_matches_binary(self):
+        with tempfile.TemporaryDirectory() as build_dir:
+            binary = build_binary("multi_arm_bandit", build_dir)
+            if binary is None:
+                self.skipTest("No C compiler to build the binary with")
+            for arms, delay, stochastic, constant_input in (
+                    ([0.1, 0.9], 20, 1, 0), ([0.1, 0.9], 20, 1, 1),
+                    ([0.3, 0.5, 0.5, 0.2], 10, 0, 1),
+                    ([0.5, 0.5, 0.5], 3, 1, 1)):
+                seeds = SeedStream(delay).spawn(3)
+                engine = BanditEngine(
+                    3, arms, reward_delay=delay, rate_on=50, rate_off=20,
+                    stochastic=stochastic, constant_input=constant_input,
+                    random_seed=seeds)
+                actions = numpy.random.default_rng(delay).integers(
+                    0, 2, (2000, 3, len(arms)))
+                spikes = []
+                scores = []
+                for tick_actions in actions:
+                    spikes.append(engine.step(tick_actions))
+                    scores.append(engine.scores)
+
+                probabilities = BanditMachineVertex.convert_arms(arms)
+                for bandit, seed in enumerate(seeds):
+                    # Each arm is pulled by the key of its index
+                    keys = [
+                        [arm for arm, count in enumerate(tick_actions[bandit])
+                         for _ in range(count)]
+                        for tick_actions in actions]
+                    packets, records, provenance = run_binary(binary, [
+                        [], [0, 1, 0, 0, 0, 0xFFFFFFFF, 0, 0, 0], [],
+                        [delay, len(arms), *seed, 1, 50, 20, stochastic,
+                         constant_input, 0, 0, *probabilities], []], keys,
+                        with_provenance=True)
+                    binary_spikes = numpy.zeros((2000, 2), dtype=int)
+                    for tick, key in packets:
+                        binary_spikes[tick, key] += 1
+                    self.assertEqual(
+                        binary_spikes.tolist(),
+                        [tick_spikes[bandit].tolist()
+                         for tick_spikes in spikes])
+                    self.assertEqual(
+                        [(tick, words[0]) for tick, _, words in records],
+                        [(tick, scores[tick][bandit])
+                         for tick, _, _ in records])
+
+                    # The provenance is written in the order it is read
+                    self.assertEqual(
+                        len(BanditMachineVertex.PROVENANCE_ITEMS),
+                        len(provenance))
+                    counters = dict(zip(
+                        BanditMachineVertex.PROVENANCE_ITEMS, provenance))
+                    self.assertEqual(
+                        sum(map(len, keys)),
+                        counters["Input_packets_received"])
+                    self.assertEqual(len(packets), counters["Spikes_sent"])
+
+    def test_split_source(self):
+        with tempfile.TemporaryDirectory() as build_dir:
+            binary = build_binary("multi_arm_bandit", build_dir)
+            if binary is None:
+                self.skipTest("No C compiler to build the binary with")
+            arms = [0.1, 0.2, 0.9, 0.4, 0.3]
+            params = [10, len(arms), 1, 2, 3, 4, 1, 50, 20, 1, 1, 0, 0,
+                      *BanditMachineVertex.convert_arms(arms)]
+            actions = numpy.random.default_rng(5).integers(
+                0, 2, (500, len(arms)))
+            arm_keys = [
+                [arm for arm, count in enumerate(tick_actions)
+                 for _ in range(count)] for tick_actions in actions]
+            expected = run_binary(binary, [
+                [], [0, 1, 0, 0, 0, 0xFFFFFFFF, 0, 0, 0], [], params, []],
+                arm_keys)
+
+            # The first source has 2 neurons on each core, with 2 colour
+            # bits below them and the core above them; the second has its
+            # neurons on one core, and pulls the arms of even ticks
+            split_keys = [
+                [0x1000 | arm // 2 << 6 | arm % 2 << 2 | 3 if tick % 2 else
+                 0x2000 | arm for arm in keys]
+                for tick, keys in enumerate(arm_keys)]
+            # Keys of neither source pull no arm
+            split_keys[0].append(0x3001)
+            packets, records, provenance = run_binary(binary, [
+                [], [0, 2, 0x1000, 0xFFFFF000, 2, 0x3F, 6, 0x3, 2,
+                     0x2000, 0xFFFFFF00, 0, 0xFF, 0, 0, 0], [],
+                params, []], split_keys, with_provenance=True)
+            self.assertEqual(expected, (packets, records))
+            counters = dict(zip(
+                BanditMachineVertex.PROVENANCE_ITEMS, provenance))
+            self.assertEqual(1, counters["Invalid_arm_spikes_received"])
+
+    def test_example_wiring(self):
+        """ The spikes of an input population and of the bandit itself are
+            sent to the bandit, as in the bandit example
+        """
+        unittest_setup()
+        writer = SpynnakerDataWriter.mock()
+        input_vertex = SimpleTestVertex(6, max_atoms_per_core=4)
+        game = Bandit(arms=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6])
+        vertex = game.machine_vertex
+        writer.add_vertex(input_vertex)
+        writer.add_vertex(game)
+        p.external_devices.activate_live_output_to(
+            mock.Mock(_vertex=input_vertex), game)
+        p.external_devices.activate_live_output_to(
+            mock.Mock(_vertex=game), game)
+        self.assertEqual(
+            [input_vertex, game], vertex._get_source_vertices())
+
+        routing_infos = RoutingInfo()
+        routing_infos.add_routing_info(AppVertexRoutingInfo(
+            BaseKeyAndMask(0x10000000, 0xFFFFFFF8), SPIKE_PARTITION_ID,
+            input_vertex, 0xFFFFFFFC, 2, 1))
+        routing_infos.add_routing_info(AppVertexRoutingInfo(
+            BaseKeyAndMask(0x20000000, 0xFFFFFFF0), SPIKE_PARTITION_ID,
+            game, 0xFFFFFFF0, 4, 0))
+        routing_infos.add_routing_info(MachineVertexRoutingInfo(
+            BaseKeyAndMask(0x20000000, 0xFFFFFFF0), SPIKE_PARTITION_ID,
+            vertex, 0))
+        writer.set_routing_infos(routing_infos)
+
+        written = defaultdict(list)
+        spec = mock.Mock()
+        spec.switch_write_focus.side_effect = (
+            lambda region: setattr(spec, "region", region))
+        spec.write_value.side_effect = (
+            lambda value, **_: written[spec.region].append(value))
+        vertex.generate_data_specification(spec, Placement(vertex, 0, 0, 1))
+        self.assertEqual(
+            [0x20000000, 2,
+             0x10000000, 0xFFFFFFF8, 0, 0x3, 2, 0x1, 4,
+             0x20000000, 0xFFFFFFF0, 0, 0xF, 4, 0, 6],
+            written[BanditMachineVertex._BANDIT_REGIONS.BANDIT.value])
+
+        # More sources than the bandit has room for are refused
+        for _ in range(BanditMachineVertex.MAX_SOURCES - 1):
+            source = SimpleTestVertex(1)
+            writer.add_vertex(source)
+            p.external_devices.activate_live_output_to(
+                mock.Mock(_vertex=source), game)
+        with self.assertRaises(ValueError):
+            vertex._get_source_vertices()
+
+    def test_regret(self):
+        engine = BanditEngine(
+            3, [[0.2, 0.8], [0.8, 0.2], [0.5, 0.5]], reward_delay=10,
+            random_seed=1)
+        for _ in range(1000):
+            engine.step(numpy.array([[0, 1], [0, 1], [1, 0]]))
+        self.assertEqual([100, 100, 100], engine.pulls.tolist())
+        self.assertEqual([100, 0, 100], engine.correct_pulls.tolist())
+        self.assertTrue(numpy.allclose([0, 60, 0], engine.regrets))
+        self.assertEqual([1, 0, 0], engine.best_arms.tolist())
+        self.assertTrue(60 < engine.scores[0] < 100)
+        self.assertTrue(0 < engine.scores[1] < 40)
+
+        # Pulling no arm gets nothing, and regrets the best arm
+        engine.step(numpy.zeros((3, 2), dtype=int))
+        spikes = engine.step(numpy.zeros((3, 2), dtype=int))
+        for _ in range(8):
+            spikes += engine.step(numpy.zeros((3, 2), dtype=int))
+        self.assertEqual([[0, 1]] * 3, spikes.tolist())
+        self.assertTrue(numpy.allclose([0.8, 60.8, 0.5], engine.regrets))
+
+    def test_reset(self):
+        engine = BanditEngine(2, reward_delay=5, random_seed=2)
+        for _ in range(100):
+            engine.step(numpy.array([[0, 3], [1, 0]]))
+        engine.reset([0])
+        self.assertEqual(0, engine.scores[0])
+        self.assertEqual([0, 20], engine.pulls.tolist())
+        self.assertEqual(100, engine.tick)
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            BanditEngine(2, [0.5, 1.5])
+        with self.assertRaises(ValueError):
+            BanditEngine(2, stochastic=0, constant_input=1, rate_off=0)
+        with self.assertRaises(ValueError):
+            BanditEngine(2).step(numpy.zeros((2, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
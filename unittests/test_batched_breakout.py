@@ -0,0 +1,160 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+import unittest
+
+import numpy
+
+from pacman.model.graphs.common import Slice
+
+from spinn_gym import BatchedBreakout, BreakoutEngine
+from spinn_gym.utilities import SeedStream
+
+from binary_harness import build_binary, run_binary
+from test_breakout_engine import play
+
+
+def make_vertices(game):
+    """ Split a game by hand, as the partitioner would
+    """
+    vertices = []
+    per_core = game.get_max_atoms_per_core()
+    for lo_atom in range(0, game.n_atoms, per_core):
+        vertex_slice = Slice(
+            lo_atom, min(lo_atom + per_core, game.n_atoms) - 1)
+        vertex = game.create_machine_vertex(
+            vertex_slice, game.get_sdram_used_by_atoms(vertex_slice),
+            game.label)
+        game.remember_machine_vertex(vertex)
+        vertices.append(vertex)
+    return vertices
+
+
+class TestBatchedBreakout(unittest.TestCase):
+
+    def test_matches_engine(self):
+        with tempfile.TemporaryDirectory() as build_dir:
+            binary = build_binary("batched_breakout", build_dir)
+            if binary is None:
+                self.skipTest("No C compiler to build the binary with")
+            for bricking in (0, 1):
+                game = BatchedBreakout(4, bricking=bricking,
+                                       random_seed=bricking)
+                vertex, = make_vertices(game)
+                engine = BreakoutEngine(4, bricking=bricking,
+                                        random_seed=game.random_seeds)
+                actions = numpy.random.default_rng(bricking).integers(
+                    0, 3, (1000, 4, 2))
+                sent, events = play(engine, actions)
+
+                # Neuron 2g of the source moves the bat of game g left and
+                # neuron 2g + 1 moves it right; all the spikes of a frame
+                # arrive just before it
+                keys = []
+                for frame_actions in actions:
+                    keys.append([
+                        2 * game_index + right
+                        for game_index, counts in enumerate(frame_actions)
+                        for right, count in enumerate(counts)
+                        for _ in range(count)])
+                    keys.extend([[]] * 19)
+                # The source is on one core, and each game sends its
+                # neuron IDs with its index above them
+                game_key_shift = 16
+                packets, records, provenance = run_binary(binary, [
+                    [], [0, game_key_shift, 0, 0, 0xFFFF, 0, 0, 0], [],
+                    vertex.get_parameter_region_data().tolist(), []], keys,
+                    with_provenance=True)
+                counters = dict(zip(vertex.PROVENANCE_ITEMS, provenance))
+                self.assertEqual(len(vertex.PROVENANCE_ITEMS), len(provenance))
+                self.assertEqual(0, counters["Other_game_packets"])
+                self.assertEqual(len(packets), counters["Spikes_sent"])
+
+                for game_index in range(4):
+                    n_frames = len(sent[game_index])
+                    self.assertGreater(n_frames, 100)
+                    binary_sent = [[] for _ in range(n_frames)]
+                    for tick, key in packets:
+                        if (key >> game_key_shift == game_index and
+                                tick // 20 < n_frames):
+                            binary_sent[tick // 20].append(
+                                key & ((1 << game_key_shift) - 1))
+                    self.assertEqual(sent[game_index], binary_sent)
+                    self.assertEqual(events[game_index], [
+                        (tick, words[1] & 0xFFFF)
+                        for tick, channel, words in records
+                        if channel == 1 and words[1] >> 16 == game_index
+                        and tick // 20 < n_frames])
+
+    def test_parameters(self):
+        game = BatchedBreakout(3, random_seed=11)
+        [vertex] = make_vertices(game)
+        seeds = SeedStream(11).spawn(3)
+        self.assertEqual(seeds, vertex.parameters["random_seed"])
+        data = vertex.get_parameter_region_data()
+        self.assertEqual([16, 16, 1, 3, 0, 0], data[:6].tolist())
+        self.assertEqual(sum(seeds, []), data[6:].tolist())
+        self.assertEqual(3 * game.atoms_per_instance, game.n_atoms)
+
+    def test_recording_sizes(self):
+        game = BatchedBreakout(
+            4, simulation_duration_ms=10000, record_changes_only=True)
+        [vertex] = make_vertices(game)
+        # 10 samples of a tick and 4 scores; 10 events of each game
+        self.assertEqual([200, 320], vertex.recording_sizes)
+        self.assertEqual((4, ), game.recorded_score_dtype["Score"].shape)
+
+    def test_reset(self):
+        game = BatchedBreakout(2)
+        [vertex] = make_vertices(game)
+        game.reset(seed=[[1, 2, 3, 4], [5, 6, 7, 8]])
+        self.assertEqual(
+            [0, 3, 1, 2, 3, 4, 5, 6, 7, 8],
+            vertex.get_parameter_region_data()[4:].tolist())
+        with self.assertRaises(ValueError):
+            game.reset(seed=[[1, 2, 3, 4]])
+
+    def test_too_many_games(self):
+        with self.assertRaises(ValueError):
+            BatchedBreakout(3, games_per_core=BatchedBreakout.MAX_GAMES + 1)
+
+    def test_split(self):
+        game = BatchedBreakout(70, random_seed=3)
+        vertices = make_vertices(game)
+        self.assertEqual(
+            [0, 32, 64], [v.parameters["first_game"] for v in vertices])
+        self.assertEqual([32, 32, 6], [v.n_games for v in vertices])
+        self.assertEqual(
+            game.random_seeds[64:], vertices[2].parameters["random_seed"])
+        game.set_parameter_values("bricking", 0)
+        self.assertEqual(
+            [0, 0, 0], [v.parameters["bricking"] for v in vertices])
+
+    def test_merge(self):
+        game = BatchedBreakout(5, games_per_core=2)
+        scores = [numpy.zeros(2, dtype=[("Score", "<i4", (n, ))])
+                  for n in (2, 2, 1)]
+        self.assertEqual(
+            (5, ), game.merge_scores(scores).dtype["Score"].shape)
+        events = numpy.array(
+            [(5, 1, 1), (2, 0, 0)], dtype=game.VERTEX_EVENT_DTYPE).tobytes()
+        merged = game.merge_events([(0, events), (2, events)])
+        self.assertEqual([2, 2, 5, 5], merged["tick"].tolist())
+        self.assertEqual([0, 2, 1, 3], merged["instance"].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
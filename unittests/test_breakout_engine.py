@@ -0,0 +1,196 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+import unittest
+
+import numpy
+
+from spinn_gym import Breakout, BreakoutEngine, BreakoutEvent
+from spinn_gym.games.breakout.breakout_machine_vertex import (
+    BreakoutMachineVertex)
+from spinn_gym.utilities import SeedStream
+
+from binary_harness import build_binary, run_binary
+
+
+def play(engine, actions):
+    """ Play frames of every game, stopping each game before it strays
+        outside the frame buffer
+
+    :return: The neuron IDs sent by each game in each frame, and the
+        (tick, event) of the events of each game
+    """
+    sent = [[] for _ in range(engine.n_games)]
+    events = [[] for _ in range(engine.n_games)]
+    playing = numpy.ones(engine.n_games, dtype=bool)
+    for frame_actions in actions:
+        tick = engine.tick
+        spikes, frame_events = engine.step(frame_actions)
+        playing &= ~engine.strayed
+        for game in numpy.flatnonzero(playing):
+            sent[game].append(spikes[game][spikes[game] >= 0].tolist())
+            events[game].extend(
+                (tick, int(event))
+                for event in numpy.flatnonzero(frame_events[game]))
+    return sent, events
+
+
+class TestBreakoutEngine(unittest.TestCase):
+
+    def test_matches_binary(self):
+        with tempfile.TemporaryDirectory() as build_dir:
+            binary = build_binary("breakout", build_dir)
+            if binary is None:
+                self.skipTest("No C compiler to build the binary with")
+            for bricking in (0, 1):
+                # The seeds are any 32-bit words, which the binary makes
+                # valid as it loads them, even a zero second word
+                seeds = SeedStream(bricking).spawn(4)
+                seeds[3][1] = 0
+                engine = BreakoutEngine(4, bricking=bricking,
+                                        random_seed=seeds)
+                actions = numpy.random.default_rng(bricking).integers(
+                    0, 3, (1000, 4, 2))
+                sent, events = play(engine, actions)
+                for game, seed in enumerate(seeds):
+                    n_frames = len(sent[game])
+                    self.assertGreater(n_frames, 100)
+
+                    # Left is key 0 and right is key 1; all the spikes of a
+                    # frame arrive just before it
+                    keys = []
+                    for left, right in actions[:n_frames, game]:
+                        keys.append([0] * left + [1] * right)
+                        keys.extend([[]] * 19)
+                    packets, records, provenance = run_binary(binary, [
+                        [], [0, 0], [],
+                        [16, 16, bricking, *seed, 0, 0], []], keys,
+                        with_provenance=True)
+
+                    binary_sent = [[] for _ in range(n_frames)]
+                    for tick, key in packets:
+                        binary_sent[tick // 20].append(key)
+                    self.assertEqual(binary_sent, sent[game])
+                    self.assertEqual(
+                        [(tick, words[1]) for tick, channel, words in records
+                         if channel == 1], events[game])
+
+                    # The provenance is written in the order it is read
+                    self.assertEqual(
+                        len(BreakoutMachineVertex.PROVENANCE_ITEMS),
+                        len(provenance))
+                    counters = dict(zip(
+                        BreakoutMachineVertex.PROVENANCE_ITEMS, provenance))
+                    self.assertEqual(
+                        actions[:n_frames, game].sum(axis=0).tolist(),
+                        [counters["Left_key_spikes_received"],
+                         counters["Right_key_spikes_received"]])
+                    self.assertEqual(
+                        actions[:n_frames, game].sum(),
+                        counters["Input_packets_received"])
+                    self.assertEqual(len(packets), counters["Spikes_sent"])
+
+    def test_decode_events(self):
+        with tempfile.TemporaryDirectory() as build_dir:
+            binary = build_binary("breakout", build_dir)
+            if binary is None:
+                self.skipTest("No C compiler to build the binary with")
+            seed = SeedStream(15).spawn(1)[0]
+            engine = BreakoutEngine(1, bricking=1, random_seed=[seed])
+
+            # Follow the ball, one step a frame, which keeps it in play
+            # long enough to clear the bricks but still loses lives
+            actions = []
+            for _ in range(900):
+                ball_x = engine.ball_positions[0, 0]
+                middle = engine.bat_positions[0] + 1
+                actions.append([[int(ball_x < middle), int(ball_x > middle)]])
+                engine.step(actions[-1])
+            actions = numpy.array(actions)
+            _, events = play(
+                BreakoutEngine(1, bricking=1, random_seed=[seed]), actions)
+            self.assertFalse(engine.strayed[0])
+            self.assertIn(BreakoutEvent.LIFE_LOST, dict(events[0]).values())
+            self.assertIn(
+                BreakoutEvent.BRICKS_CLEARED, dict(events[0]).values())
+
+            keys = []
+            for left, right in actions[:, 0]:
+                keys.append([0] * left + [1] * right)
+                keys.extend([[]] * 19)
+            _, records = run_binary(binary, [
+                [], [0, 0], [], [16, 16, 1, *seed, 0, 0], []], keys)
+            data = b"".join(
+                numpy.array(words, dtype="<u4").tobytes()
+                for _, channel, words in records if channel == 1)
+
+            game = Breakout(simulation_duration_ms=len(keys))
+            decoded = game.decode_events(data)
+            self.assertEqual(
+                events[0], list(zip(decoded["tick"].tolist(),
+                                    decoded["event"].tolist())))
+            # The events fit in the space recorded on the events channel
+            self.assertLessEqual(
+                len(data), game.machine_vertex.recording_sizes[1])
+
+    def test_events_recording_size(self):
+        # Room for an event a second, however long the run
+        for duration, n_events in ((1, 1), (1000, 1), (1001, 2),
+                                   (60000, 60)):
+            vertex = Breakout(simulation_duration_ms=duration).machine_vertex
+            self.assertEqual(
+                n_events * Breakout.EVENT_DTYPE.itemsize,
+                vertex.recording_sizes[1])
+
+    def test_scores_and_lives(self):
+        engine = BreakoutEngine(16, bricking=1, random_seed=5)
+        actions = numpy.random.default_rng(5).integers(0, 3, (2000, 16, 2))
+        scores = numpy.zeros(16, dtype=int)
+        lives_lost = numpy.zeros(16, dtype=int)
+        for frame_actions in actions:
+            spikes, events = engine.step(frame_actions)
+            scores += (spikes == engine.SCORE_UP).sum(axis=1)
+            scores -= (spikes == engine.SCORE_DOWN).sum(axis=1)
+            lives_lost += events[:, BreakoutEvent.LIFE_LOST]
+        self.assertEqual(scores.tolist(), engine.scores.tolist())
+        self.assertEqual((engine.NUMBER_OF_LIVES - lives_lost).tolist(),
+                         engine.lives.tolist())
+        self.assertTrue(lives_lost.any())
+
+    def test_reset(self):
+        engine = BreakoutEngine(3, random_seed=7)
+        start = engine.ball_positions
+        for _ in range(100):
+            engine.step(numpy.array([[2, 0], [0, 2], [1, 1]]))
+        lives = engine.lives
+        engine.reset([0, 2])
+        self.assertEqual([5, lives[1], 5], engine.lives.tolist())
+        self.assertEqual([0, 0], engine.scores[[0, 2]].tolist())
+        self.assertEqual(start[[0, 2]].tolist(),
+                         engine.ball_positions[[0, 2]].tolist())
+        self.assertEqual([2, 2], engine.bat_positions[[0, 2]].tolist())
+        self.assertTrue(engine.bricks[[0, 2]].all())
+
+    def test_bad_actions(self):
+        engine = BreakoutEngine(2)
+        with self.assertRaises(ValueError):
+            engine.step(numpy.zeros((3, 2)))
+        with self.assertRaises(ValueError):
+            BreakoutEngine(2, bricking=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
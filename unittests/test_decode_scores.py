@@ -0,0 +1,101 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy
+
+from spinn_gym import (
+    Bandit, Breakout, DoublePendulum, Logic, Pendulum, Recall)
+
+
+class TestDecodeScores(unittest.TestCase):
+
+    def __decode(self, game, words):
+        """ Decode the bytes of some words as a game records them, checking
+            that the scores are not copied
+        """
+        raw = bytearray(numpy.array(words).tobytes())
+        scores = game.decode_scores(raw)
+        self.assertTrue(numpy.shares_memory(
+            scores, numpy.frombuffer(raw, dtype=numpy.uint8)))
+        return scores
+
+    def test_single_score(self):
+        for game in (Breakout(), Bandit(), Logic(
+                truth_table=[0, 1, 1, 0], input_sequence=[0, 1])):
+            scores = self.__decode(
+                game, numpy.array([3, -2, 7], dtype=numpy.int32))
+            self.assertEqual(("Score", ), scores.dtype.names)
+            self.assertEqual([3, -2, 7], scores["Score"].tolist())
+
+    def test_recall(self):
+        scores = self.__decode(Recall(), numpy.array(
+            [1, 0, 2, 3, -1, 5], dtype=numpy.int32))
+        self.assertEqual(("score_0", "score_1", "trials"),
+                         scores.dtype.names)
+        self.assertEqual([1, 3], scores["score_0"].tolist())
+        self.assertEqual([0, -1], scores["score_1"].tolist())
+        self.assertEqual([2, 5], scores["trials"].tolist())
+
+    def test_pendulums(self):
+        values = numpy.array(
+            [2.4, 0.1, 2.5, -0.25, 1.0, 0.5], dtype=numpy.float32)
+        scores = self.__decode(Pendulum(reward_based=1), values)
+        self.assertEqual(("max_balance_time", ), scores.dtype.names)
+        self.assertEqual(values.tolist(), scores["max_balance_time"].tolist())
+
+        scores = self.__decode(Pendulum(reward_based=0), values)
+        self.assertEqual(("cart_position", "pole_angle"), scores.dtype.names)
+        self.assertEqual(values[0::2].tolist(),
+                         scores["cart_position"].tolist())
+        self.assertEqual(values[1::2].tolist(),
+                         scores["pole_angle"].tolist())
+
+        scores = self.__decode(DoublePendulum(reward_based=0), values)
+        self.assertEqual(("cart_position", "pole_angle", "pole2_angle"),
+                         scores.dtype.names)
+        self.assertEqual(values[0::3].tolist(),
+                         scores["cart_position"].tolist())
+        self.assertEqual(values[2::3].tolist(),
+                         scores["pole2_angle"].tolist())
+
+    def test_bandit_without_reward(self):
+        scores = self.__decode(
+            Bandit(reward_based=0), numpy.array([4, 9], dtype=numpy.int32))
+        self.assertEqual(("correct_pulls", ), scores.dtype.names)
+        self.assertEqual([4, 9], scores["correct_pulls"].tolist())
+
+    def test_changes_only(self):
+        raw = numpy.array([1000, 2.4, 0.1, 3000, 2.5, -0.25],
+                          dtype=numpy.float32)
+        raw[[0, 3]] = numpy.array([1000, 3000], dtype=numpy.uint32).view(
+            numpy.float32)
+        scores = self.__decode(
+            Pendulum(reward_based=0, record_changes_only=True), raw)
+        self.assertEqual(("tick", "cart_position", "pole_angle"),
+                         scores.dtype.names)
+        self.assertEqual([1000, 3000], scores["tick"].tolist())
+        self.assertEqual(raw[[2, 5]].tolist(), scores["pole_angle"].tolist())
+
+    def test_partial_record(self):
+        # A trailing partial record is left out
+        raw = numpy.array([1, 2, 3, 4], dtype=numpy.int32).tobytes()[:-2]
+        self.assertEqual([1, 2, 3], Breakout().decode_scores(raw)[
+            "Score"].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy
+
+from spinn_gym import DoublePendulumEngine
+
+
+class TestDoublePendulumEngine(unittest.TestCase):
+
+    def test_sweep(self):
+        lengths, angles = numpy.meshgrid([0.1, 0.5], [-2, 0.1, 2])
+        engine = DoublePendulumEngine(
+            6, pole2_length=lengths.ravel(), pole2_angle=angles.ravel(),
+            number_of_bins=5, random_seed=1)
+        self.assertEqual(30, engine.n_neurons)
+        fell = numpy.full(6, -1)
+        for tick in range(3000):
+            spikes = engine.step(numpy.zeros((6, 2), dtype=int))
+            self.assertEqual((6, 30), spikes.shape)
+            self.assertFalse(spikes[~engine.in_bounds].any())
+            fell[(fell < 0) & ~engine.in_bounds] = tick
+        self.assertFalse(engine.in_bounds.any())
+        self.assertEqual(fell.tolist(),
+                         engine.max_balance_times.tolist())
+
+        # The second poles start leaning each way
+        angles2 = DoublePendulumEngine(
+            6, pole2_angle=angles.ravel()).pole2_angles
+        self.assertTrue(numpy.allclose(
+            [-2, -2, 0.1, 0.1, 2, 2], numpy.degrees(angles2)))
+
+    def test_same_seeds_same_spikes(self):
+        spikes = []
+        for _ in range(2):
+            engine = DoublePendulumEngine(3, random_seed=2)
+            spikes.append([engine.step(numpy.ones((3, 2), dtype=int))
+                           for _ in range(50)])
+        self.assertTrue(numpy.array_equal(*spikes))
+        self.assertTrue(numpy.any(spikes[0]))
+
+    def test_reset(self):
+        engine = DoublePendulumEngine(2, pole_angle=30, random_seed=3)
+        for _ in range(1000):
+            engine.step(numpy.zeros((2, 2), dtype=int))
+        self.assertFalse(engine.in_bounds.any())
+        engine.reset(numpy.array([True, False]))
+        self.assertEqual([True, False], engine.in_bounds.tolist())
+        self.assertEqual(0, engine.pole_velocities[0])
+        self.assertAlmostEqual(2.4, engine.cart_positions[0], places=6)
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            DoublePendulumEngine(2, pole2_length=0)
+        with self.assertRaises(ValueError):
+            DoublePendulumEngine(2).step(numpy.zeros(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import time
+import unittest
+from unittest import mock
+
+import numpy
+
+from spynnaker.pyNN.data import SpynnakerDataView
+
+from spinn_gym import BanditEngine
+from spinn_gym.games import live_environment
+from spinn_gym.games.live_environment import LiveEnvironment
+from spinn_gym.games.vector_env import VectorEnv
+
+
+class TestLiveEnvironment(unittest.TestCase):
+
+    def setUp(self):
+        # The connection to the machine is a stub, and the wall clock is
+        # held still until a test moves it on
+        patches = [
+            mock.patch.object(live_environment, "p"),
+            mock.patch.object(live_environment, "time"),
+            mock.patch.object(SpynnakerDataView, "get_hardware_time_step_ms",
+                              return_value=1.0)]
+        self.p, clock, _ = [patch.start() for patch in patches]
+        for patch in patches:
+            self.addCleanup(patch.stop)
+        self.clock = clock.perf_counter
+        self.clock.return_value = 0.0
+        self.connection = \
+            self.p.external_devices.SpynnakerLiveSpikesConnection.return_value
+
+        # Each step's actions are recorded as they are taken
+        self.steps = []
+        step = VectorEnv.step
+
+        def record_step(env, actions):
+            self.steps.append(actions.tolist())
+            return step(env, actions)
+
+        patch = mock.patch.object(VectorEnv, "step", autospec=True,
+                                  side_effect=record_step)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+        # 2 bandits of 2 arms, acted on by 3 neurons each
+        actions = mock.Mock(size=6)
+        actions.label = "actions"
+        self.env = LiveEnvironment(
+            BanditEngine(2, [0.1, 0.9], random_seed=1), actions)
+        self.receive = self.connection.add_receive_callback.call_args[0][1]
+        self.start = \
+            self.connection.add_start_resume_callback.call_args[0][1]
+        self.pause = self.connection.add_pause_stop_callback.call_args[0][1]
+        self.addCleanup(self.env.close)
+
+    def __wait_for_steps(self, n_steps):
+        """ Wait for the games to have been stepped a number of times, and
+            check they go no further
+        """
+        for _ in range(1000):
+            if self.env.n_steps >= n_steps:
+                break
+            time.sleep(0.001)
+        time.sleep(0.01)
+        self.assertEqual(n_steps, self.env.n_steps)
+
+    def test_wiring(self):
+        self.assertEqual(
+            4, self.p.Population.call_args[0][0])
+        self.assertIs(self.p.Population.return_value, self.env.population)
+        self.assertEqual("actions",
+                         self.connection.add_receive_callback.call_args[0][0])
+        with self.assertRaises(ValueError):
+            LiveEnvironment(BanditEngine(4), mock.Mock(size=6))
+
+    def test_actions(self):
+        # The neurons of each game's block take its actions in turn
+        self.receive("actions", 0, [0, 1, 2, 2, 4, 5, 5])
+        self.start("live_environment", self.connection)
+        self.__wait_for_steps(1)
+        self.receive("actions", 1, [3])
+        self.__wait_for_steps(2)
+        self.pause("live_environment", self.connection)
+        self.assertEqual(
+            [[[0, 0], [0, 0]], [[3, 1], [2, 1]]], self.steps)
+        self.assertEqual(0, self.env.late_spikes)
+
+    def test_pacing(self):
+        # The games keep up with the latest spikes received
+        self.start("live_environment", self.connection)
+        self.__wait_for_steps(1)
+        self.receive("actions", 4, [1])
+        self.__wait_for_steps(5)
+
+        # and with the wall clock
+        self.clock.return_value = 0.008
+        self.__wait_for_steps(8)
+        self.pause("live_environment", self.connection)
+        self.assertEqual(8, self.env.env.engine.tick)
+
+        # The spikes of tick 4 acted on the step after it
+        actions = numpy.zeros((8, 2, 2), dtype=int)
+        actions[5, 0, 1] = 1
+        self.assertEqual(actions.tolist(), self.steps)
+
+    def test_late_spikes(self):
+        self.start("live_environment", self.connection)
+        self.clock.return_value = 0.005
+        self.__wait_for_steps(5)
+
+        # Spikes of a tick whose step has been taken act on the next step
+        self.receive("actions", 2, [0, 4])
+        self.receive("actions", 5, [1])
+        self.clock.return_value = 0.006
+        self.__wait_for_steps(6)
+        self.assertEqual(2, self.env.late_spikes)
+        self.assertEqual([[1, 0], [0, 1]], self.steps[5])
+
+        # Spikes of later ticks wait for their step
+        self.clock.return_value = 0.007
+        self.__wait_for_steps(7)
+        self.pause("live_environment", self.connection)
+        self.assertEqual([[0, 1], [0, 0]], self.steps[6])
+        self.assertEqual(2, self.env.late_spikes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+import unittest
+
+import numpy
+
+from spinn_gym import LogicEngine
+from spinn_gym.games.logic.logic import Bad_Table
+from spinn_gym.games.logic.logic_machine_vertex import LogicMachineVertex
+from spinn_gym.utilities import SeedStream
+
+from binary_harness import build_binary, run_binary
+
+
+def pack(table):
+    """ Pack a truth table as the binary reads it
+    """
+    bits = numpy.zeros(-(-len(table) // 32) * 32, dtype=numpy.uint8)
+    bits[:len(table)] = table
+    return numpy.packbits(bits, bitorder="little").view("<u4").tolist()
+
+
+class TestLogicEngine(unittest.TestCase):
+
+    def test_matches_binary(self):
+        with tempfile.TemporaryDirectory() as build_dir:
+            binary = build_binary("logic", build_dir)
+            if binary is None:
+                self.skipTest("No C compiler to build the binary with")
+            for n_inputs, delay, stochastic in (
+                    (2, 200, 1), (3, 7, 1), (5, 30, 0)):
+                rng = numpy.random.default_rng(delay)
+                seeds = SeedStream(delay).spawn(3)
+                tables = rng.integers(0, 2, (3, 1 << n_inputs))
+                inputs = rng.integers(0, 2, (3, n_inputs))
+                engine = LogicEngine(
+                    3, tables, inputs, rate_on=50, rate_off=20,
+                    score_delay=delay, stochastic=stochastic,
+                    random_seed=seeds)
+                actions = rng.integers(0, 3, (2500, 3, 2))
+                spikes = []
+                scores = []
+                for tick_actions in actions:
+                    spikes.append(engine.step(tick_actions))
+                    scores.append(engine.scores)
+
+                for task, seed in enumerate(seeds):
+                    # Output 0 is key 0 and output 1 is key 1
+                    keys = [[0] * tick_actions[task][0] +
+                            [1] * tick_actions[task][1]
+                            for tick_actions in actions]
+                    packets, records, provenance = run_binary(binary, [
+                        [], [0], [],
+                        [delay, n_inputs, *seed, 50, 20, stochastic, 0, 0,
+                         *inputs[task], *pack(tables[task])], []], keys,
+                        with_provenance=True)
+                    binary_spikes = numpy.zeros((2500, n_inputs), dtype=int)
+                    for tick, key in packets:
+                        binary_spikes[tick, key] += 1
+                    self.assertEqual(
+                        binary_spikes.tolist(),
+                        [tick_spikes[task].tolist()
+                         for tick_spikes in spikes])
+                    self.assertTrue(records)
+                    self.assertEqual(
+                        [(tick, words[0]) for tick, _, words in records],
+                        [(tick, scores[tick][task])
+                         for tick, _, _ in records])
+
+                    # The provenance is written in the order it is read
+                    self.assertEqual(
+                        len(LogicMachineVertex.PROVENANCE_ITEMS),
+                        len(provenance))
+                    counters = dict(zip(
+                        LogicMachineVertex.PROVENANCE_ITEMS, provenance))
+                    self.assertEqual(
+                        actions[:, task].sum(axis=0).tolist(),
+                        [counters["Choice_0_spikes_received"],
+                         counters["Choice_1_spikes_received"]])
+                    self.assertEqual(len(packets), counters["Spikes_sent"])
+
+    def test_scoring(self):
+        # Exclusive or of each pair of inputs
+        engine = LogicEngine(
+            4, lambda inputs: inputs[0] != inputs[1],
+            [[0, 0], [0, 1], [1, 0], [1, 1]], score_delay=10,
+            random_seed=1)
+        self.assertEqual([0, 1, 1, 0], engine.correct_outputs.tolist())
+        actions = numpy.array([[2, 1], [2, 1], [0, 1], [1, 1]])
+        spikes = numpy.zeros((4, 2), dtype=int)
+        for _ in range(1000):
+            spikes += engine.step(actions)
+        self.assertEqual([100] * 4, engine.trials.tolist())
+        self.assertEqual([100, 0, 100, 0], engine.scores.tolist())
+
+        # Inputs that are 1 spike faster
+        self.assertGreater(spikes[3].min(), spikes[0].max())
+
+    def test_tables(self):
+        engine = LogicEngine(
+            2, [[0, 1, 1, 1], [0, 0, 0, 1]], [1, 0], random_seed=2)
+        self.assertEqual([1, 0], engine.correct_outputs.tolist())
+        with self.assertRaises(Bad_Table):
+            LogicEngine(2, [0, 1], [1, 0])
+        with self.assertRaises(Bad_Table):
+            LogicEngine(3, [[0, 1, 1, 1], [0, 0, 0, 1]], [1, 0])
+        with self.assertRaises(ValueError):
+            LogicEngine(2, [0, 1], [1], stochastic=0, rate_on=0)
+
+    def test_reset(self):
+        engine = LogicEngine(2, [0, 1], [1], score_delay=5, random_seed=3)
+        for _ in range(100):
+            engine.step(numpy.array([[0, 1], [1, 0]]))
+        self.assertEqual([20, 0], engine.scores.tolist())
+        engine.reset(numpy.array([True, False]))
+        self.assertEqual([0, 0], engine.scores.tolist())
+        self.assertEqual([0, 20], engine.trials.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
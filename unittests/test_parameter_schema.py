@@ -0,0 +1,140 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy
+
+from spinn_gym import Bandit, Breakout, Logic, Pendulum
+from spinn_gym.games.logic.logic import Bad_Table
+from spinn_gym.games.logic.logic_machine_vertex import LogicMachineVertex
+from spinn_gym.games.multi_arm_bandit.bandit_machine_vertex import (
+    BanditMachineVertex)
+from spinn_gym.games.spinn_gym_machine_vertex import _pack_parameter_fields
+
+
+class TestParameterSchema(unittest.TestCase):
+
+    def test_breakout(self):
+        game = Breakout(x_factor=8, y_factor=16, bricking=1,
+                        random_seed=[1, 2, 3, 4], record_changes_only=True)
+        vertex = game.machine_vertex
+        data = vertex.get_parameter_region_data()
+        self.assertEqual(vertex.get_parameter_schema_bytes(), data.nbytes)
+        self.assertEqual([8, 16, 1, 1, 2, 3, 4, 1, 0], data.tolist())
+
+    def test_shared_template(self):
+        games = [Breakout(random_seed=[i, 2, 3, 4]) for i in range(3)]
+        _pack_parameter_fields.cache_clear()
+        data = [game.machine_vertex.get_parameter_region_data()
+                for game in games]
+        # The games differ only in their seeds, so are packed only once
+        info = _pack_parameter_fields.cache_info()
+        self.assertEqual((1, 2), (info.misses, info.hits))
+        # Each game gets its own copy, with its own seed
+        data[0][0] = 99
+        self.assertEqual(
+            [[16, 16, 1, i, 2, 3, 4, 0, 0] for i in range(3)],
+            [game.machine_vertex.get_parameter_region_data().tolist()
+             for game in games])
+
+    def test_fixed_point(self):
+        game = Pendulum(pole_length=0.5, pole_angle=-0.25)
+        data = game.machine_vertex.get_parameter_region_data()
+        self.assertEqual(0.5 * 2 ** 15, data[2])
+        self.assertEqual(-0.25 * 2 ** 15, data[3].view(numpy.int32))
+
+    def test_trailing_data(self):
+        game = Bandit(arms=[0.25, 0.75, 1])
+        vertex = game.machine_vertex
+        data = vertex.get_parameter_region_data()
+        self.assertEqual(
+            vertex.get_parameter_schema_bytes() + 3 * 4, data.nbytes)
+        self.assertEqual(3, data[1])
+        self.assertEqual(0xffffffff, data[-1])
+
+    def test_many_arms(self):
+        arms = numpy.linspace(0, 1, 500)
+        game = Bandit(arms=arms)
+        data = game.machine_vertex.get_parameter_region_data()
+        self.assertEqual(500, data[1])
+        self.assertEqual(0xffffffff, data[-1])
+        with self.assertRaises(ValueError):
+            Bandit(arms=[0.5] * (BanditMachineVertex.MAX_ARMS + 1))
+        with self.assertRaises(ValueError):
+            Bandit(arms=[0.5, 1.5])
+        with self.assertRaises(ValueError):
+            game.set_parameter_values("arms", [-0.1] * 500)
+
+    def test_packed_truth_table(self):
+        # The parity of 16 inputs, from a function
+        game = Logic(truth_table=lambda inputs: sum(inputs) % 2,
+                     input_sequence=[1, 0] * 8)
+        vertex = game.machine_vertex
+        data = vertex.get_parameter_region_data()
+        n_fields = vertex.get_parameter_schema_bytes() // 4
+        self.assertEqual(n_fields + 16 + 2 ** 16 // 32, len(data))
+        # Entries 0 to 31 are 0, 1, 1, 0, 1, 0, 0, 1, ...
+        self.assertEqual(0x96696996, data[n_fields + 16])
+
+        game = Logic(truth_table=[0, 1, 1, 0], input_sequence=[0, 1])
+        self.assertEqual(
+            0b0110, game.machine_vertex.get_parameter_region_data()[-1])
+        with self.assertRaises(Bad_Table):
+            Logic(truth_table=[0, 1, 2, 0], input_sequence=[0, 1])
+
+    def test_truth_table_function(self):
+        # A function that can't take arrays is given each entry in turn,
+        # and gives the same table as one that can
+        def majority(inputs):
+            return 1 if sum(inputs) > 2 else 0
+
+        table = LogicMachineVertex.convert_truth_table(
+            lambda inputs: sum(inputs) > 2, 5)
+        self.assertEqual(
+            table.tolist(),
+            LogicMachineVertex.convert_truth_table(majority, 5).tolist())
+        self.assertEqual(
+            [int(bin(i).count("1") > 2) for i in range(32)], table.tolist())
+        self.assertEqual(
+            [1] * 4, LogicMachineVertex.convert_truth_table(
+                lambda inputs: 1, 2).tolist())
+
+        # A table of many inputs is found a chunk of entries at a time
+        calls = []
+
+        def parity(inputs):
+            calls.append(len(inputs[0]))
+            return sum(inputs) % 2
+
+        words = LogicMachineVertex.pack_truth_table(
+            LogicMachineVertex.convert_truth_table(parity, 20))
+        self.assertEqual(2 ** 20 // 32, len(words))
+        self.assertEqual(
+            [LogicMachineVertex._TABLE_CHUNK_ENTRIES] * (
+                2 ** 20 // LogicMachineVertex._TABLE_CHUNK_ENTRIES), calls)
+        self.assertEqual({0x96696996, 0x69969669}, set(words.tolist()))
+        self.assertEqual(
+            [bin(i).count("1") % 2 for i in range(2 ** 20)],
+            LogicMachineVertex.unpack_truth_table(words, 20).tolist())
+
+    def test_out_of_range(self):
+        game = Pendulum(pole_angle=2 ** 17)
+        with self.assertRaises(ValueError):
+            game.machine_vertex.get_parameter_region_data()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+import unittest
+
+import numpy
+
+from spinn_gym import BanditEngine
+from spinn_gym.utilities import ParameterSweep
+
+
+def pull_first_arm(random_seed, arms, reward_delay):
+    engine = BanditEngine(
+        1, arms, reward_delay=reward_delay, random_seed=[random_seed])
+    actions = numpy.zeros((1, len(arms)), dtype=int)
+    actions[0, 0] = 1
+    for _ in range(1000):
+        engine.step(actions)
+    return engine.scores[0]
+
+
+def fail_on_last_arm(random_seed, arms, reward_delay):
+    if arms[0] == 0.9:
+        raise RuntimeError("Interrupted")
+    return pull_first_arm(random_seed, arms, reward_delay)
+
+
+def minus_one(random_seed, arms, reward_delay):
+    # pylint: disable=unused-argument
+    return -1
+
+
+GRID = {"arms": [[0.1, 0.9], [0.5, 0.5], [0.9, 0.1]],
+        "reward_delay": [5, 10]}
+
+
+class TestParameterSweep(unittest.TestCase):
+
+    def test_sweep(self):
+        sweep = ParameterSweep(pull_first_arm, GRID, root_seed=1)
+        self.assertEqual((3, 2), sweep.shape)
+        self.assertEqual(["arms", "reward_delay"], sweep.names)
+        self.assertFalse(sweep.completed.any())
+        scores = sweep.run(n_processes=2)
+        self.assertTrue(sweep.completed.all())
+        # Each pull of the first arm scores with its probability
+        expected = numpy.array([[0.1], [0.5], [0.9]]) * [200, 100]
+        self.assertTrue((numpy.abs(scores - expected) < expected / 2).all())
+
+        # The same root seed gives the same scores, however it is run
+        again = ParameterSweep(pull_first_arm, GRID, root_seed=1)
+        self.assertEqual(
+            scores.tolist(), again.run(n_processes=1, chunk_size=4).tolist())
+
+    def test_resume(self):
+        with tempfile.TemporaryDirectory() as directory:
+            sweep = ParameterSweep(fail_on_last_arm, GRID, directory)
+            with self.assertRaises(RuntimeError):
+                sweep.run(n_processes=1)
+            self.assertEqual(
+                [[True, True], [True, True], [False, False]],
+                sweep.completed.tolist())
+
+            resumed = ParameterSweep(minus_one, GRID, directory)
+            self.assertEqual(sweep.root_seed, resumed.root_seed)
+            self.assertEqual(
+                sweep.completed.tolist(), resumed.completed.tolist())
+            scores = resumed.run(n_processes=2)
+            self.assertTrue(resumed.completed.all())
+            self.assertEqual([[-1, -1]], scores[2:].tolist())
+            self.assertEqual(
+                ParameterSweep(pull_first_arm, GRID, root_seed=sweep.root_seed
+                               ).run()[:2].tolist(),
+                scores[:2].tolist())
+
+            with self.assertRaises(ValueError):
+                ParameterSweep(minus_one, {"arms": GRID["arms"]}, directory)
+            with self.assertRaises(ValueError):
+                ParameterSweep(
+                    minus_one, GRID, directory,
+                    root_seed=sweep.root_seed + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy
+
+from spinn_gym import PendulumEngine, PendulumEvent
+from spinn_gym.games.inverted_pendulum.pendulum_engine import (
+    push_motor_force)
+
+
+class TestPendulumEngine(unittest.TestCase):
+
+    def test_falls_without_help(self):
+        engine = PendulumEngine(3, pole_angle=[0.1, -5, 10], random_seed=1)
+        self.assertEqual(4, engine.n_neurons)
+        fell = numpy.full(3, -1)
+        for tick in range(2000):
+            _, events = engine.step(numpy.zeros((3, 2), dtype=int))
+            fell[events[:, PendulumEvent.POLE_OUT_OF_BOUNDS]] = tick
+        self.assertFalse(engine.in_bounds.any())
+        self.assertTrue((fell % 20 == 19).all())
+
+        # The further the pole starts from upright, the sooner it falls
+        self.assertGreater(fell[0], fell[2])
+        self.assertGreater(fell[1], fell[2])
+        self.assertEqual((fell + 1).tolist(),
+                         engine.max_balance_times.tolist())
+        self.assertTrue(engine.pole_angles[1] < 0 < engine.pole_angles[2])
+
+    def test_forces(self):
+        engine = PendulumEngine(
+            2, force_increments=[100, 10], tau_force=1, random_seed=2)
+        engine.step(numpy.array([[3, 5], [0, 50]]))
+        self.assertTrue(numpy.allclose([0.4, 10], engine.motor_forces))
+
+        # Without a time constant, a force lasts until the next update
+        engine = PendulumEngine(1, random_seed=2)
+        engine.step(numpy.array([[0, 0]]))
+        engine.step(numpy.array([[0, 50]]))
+        self.assertAlmostEqual(10, engine.motor_forces[0], places=5)
+        for _ in range(18):
+            engine.step(numpy.array([[0, 0]]))
+        self.assertEqual(0, engine.motor_forces[0])
+        self.assertGreater(engine.cart_velocities[0], 0)
+
+    def test_force_per_spike(self):
+        """ Each spike is taken in turn, as the binary takes it, rounding
+            and stopping at the limits after each
+        """
+        f32 = numpy.float32
+        increment = f32(20) / f32(7)
+        actions = numpy.array([[0, 9], [4, 1], [11, 0], [3, 3]])
+        force = numpy.array([9, 0.3, -1, -9.5], dtype=f32)
+        expected = []
+        for value, (backward, forward) in zip(force, actions):
+            for _ in range(backward):
+                value = max(f32(value - increment), f32(-10))
+            for _ in range(forward):
+                value = min(f32(value + increment), f32(10))
+            expected.append(value)
+        push_motor_force(force, actions, numpy.full(4, increment),
+                         f32(-10), f32(10))
+        self.assertEqual(expected, force.tolist())
+        self.assertEqual(10, force[0])
+        self.assertEqual(-10, force[2])
+
+    def test_encodings(self):
+        for encoding in range(4):
+            engine = PendulumEngine(
+                2, encoding=encoding, number_of_bins=10, random_seed=3,
+                max_firing_rate=1000)
+            spikes = sum(
+                engine.step(numpy.zeros((2, 2), dtype=int))[0]
+                for _ in range(20))
+            self.assertEqual((2, engine.n_neurons), spikes.shape)
+            self.assertTrue(spikes.any())
+            if encoding == 3:
+                # A bin of each variable has each rank
+                self.assertEqual([40, 40], spikes.sum(axis=1).tolist())
+            elif encoding == 2:
+                self.assertTrue((spikes <= 1).all())
+
+    def test_same_seeds_same_spikes(self):
+        spikes = []
+        for _ in range(2):
+            engine = PendulumEngine(4, random_seed=4, central=0)
+            spikes.append([engine.step(numpy.ones((4, 2), dtype=int))[0]
+                           for _ in range(100)])
+        self.assertTrue(numpy.array_equal(*spikes))
+
+    def test_reset(self):
+        engine = PendulumEngine(2, pole_angle=30, random_seed=5)
+        for _ in range(1000):
+            engine.step(numpy.zeros((2, 2), dtype=int))
+        self.assertFalse(engine.in_bounds.any())
+        engine.reset([1])
+        self.assertEqual([False, True], engine.in_bounds.tolist())
+        self.assertAlmostEqual(2.4, engine.cart_positions[1], places=6)
+        self.assertEqual(0, engine.max_balance_times[1])
+        self.assertEqual(1000, engine.tick)
+
+    def test_bad_arguments(self):
+        engine = PendulumEngine(2)
+        with self.assertRaises(ValueError):
+            engine.step(numpy.zeros((2, 3)))
+        with self.assertRaises(ValueError):
+            PendulumEngine(2, encoding=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import struct
+import unittest
+from unittest import mock
+
+from pacman.model.graphs.common import Slice
+from pacman.model.placements import Placement
+
+from spinn_utilities.config_holder import set_config
+
+from spinn_front_end_common.interface.provenance import ProvenanceReader
+
+from spynnaker.pyNN.config_setup import unittest_setup
+
+from spinn_gym import (
+    Bandit, BatchedBreakout, Breakout, DoublePendulum, Logic, Pendulum,
+    Recall)
+
+
+class TestProvenance(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Reports", "write_provenance", "True")
+
+    def __check(self, vertex):
+        """ Parse a buffer of the provenance words of a vertex, packed as
+            the binary writes them after the system words
+        """
+        n_items = len(vertex.PROVENANCE_ITEMS)
+        self.assertGreater(n_items, 0)
+        self.assertEqual(n_items, vertex._n_additional_data_items)
+        values = [1000 + 7 * index for index in range(n_items)]
+        n_words = vertex.N_SYSTEM_PROVENANCE_WORDS + n_items
+        data = struct.pack(
+            f"<{n_words}I", *range(vertex.N_SYSTEM_PROVENANCE_WORDS),
+            *values)
+        expected = dict(zip(vertex.PROVENANCE_ITEMS, values))
+
+        placement = Placement(vertex, 0, 0, 3)
+        with mock.patch.object(
+                type(vertex), "_read_provenance_data",
+                return_value=struct.unpack(f"<{n_words}I", data)):
+            self.assertEqual(
+                expected, vertex.get_provenance_counters(placement))
+
+        vertex.parse_extra_provenance_items(
+            vertex.label, 0, 0, 3, list(values))
+        with ProvenanceReader() as db:
+            self.assertEqual(expected, dict(db.run_query(
+                "SELECT description, the_value FROM core_provenance_view "
+                "WHERE x = 0 AND y = 0 AND p = 3")))
+
+    def test_breakout(self):
+        self.__check(Breakout().machine_vertex)
+
+    def test_batched_breakout(self):
+        game = BatchedBreakout(3)
+        vertex_slice = Slice(0, game.n_atoms - 1)
+        self.__check(game.create_machine_vertex(
+            vertex_slice, game.get_sdram_used_by_atoms(vertex_slice),
+            game.label))
+
+    def test_pendulum(self):
+        self.__check(Pendulum().machine_vertex)
+
+    def test_double_pendulum(self):
+        self.__check(DoublePendulum().machine_vertex)
+
+    def test_bandit(self):
+        self.__check(Bandit(arms=[0.1, 0.9]).machine_vertex)
+
+    def test_logic(self):
+        self.__check(Logic(
+            truth_table=[0, 1, 1, 0], input_sequence=[0, 1]).machine_vertex)
+
+    def test_recall(self):
+        self.__check(Recall().machine_vertex)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+import unittest
+
+import numpy
+
+from spinn_gym import RecallEngine
+from spinn_gym.games.inverted_pendulum.pendulum_engine import to_s1615
+from spinn_gym.games.store_recall.store_recall_machine_vertex import (
+    RecallMachineVertex)
+from spinn_gym.utilities import SeedStream
+
+from binary_harness import build_binary, run_binary
+
+
+class TestRecallEngine(unittest.TestCase):
+
+    def test_matches_binary(self):
+        with tempfile.TemporaryDirectory() as build_dir:
+            binary = build_binary("store_recall", build_dir)
+            if binary is None:
+                self.skipTest("No C compiler to build the binary with")
+            for pop_size, period, stochastic, prob_command in (
+                    (1, 20, 1, 0.75), (3, 7, 1, 1 / 6), (2, 10, 0, 0.75)):
+                rng = numpy.random.default_rng(period)
+                seeds = SeedStream(period).spawn(3)
+                engine = RecallEngine(
+                    3, rate_on=50, pop_size=pop_size,
+                    prob_command=prob_command, prob_in_change=[0.2, 0.5, 1],
+                    time_period=period, stochastic=stochastic,
+                    random_seed=seeds)
+                actions = rng.integers(0, 3, (3000, 3, 2))
+                spikes = []
+                scores = []
+                for tick_actions in actions:
+                    spikes.append(engine.step(tick_actions))
+                    scores.append(
+                        numpy.column_stack([engine.scores, engine.trials]))
+
+                # The binary reads its probabilities as the bits of floats
+                bits = to_s1615(
+                    [prob_command, 0.2, 0.5, 1]).view(numpy.uint32)
+                for task, seed in enumerate(seeds):
+                    # Value 0 is key 0 and value 1 is key 1
+                    keys = [[0] * tick_actions[task][0] +
+                            [1] * tick_actions[task][1]
+                            for tick_actions in actions]
+                    packets, records, provenance = run_binary(binary, [
+                        [], [0], [],
+                        [period, pop_size, *seed, 50, 0, stochastic, 0,
+                         int(bits[0]), int(bits[task + 1]), 0, 0], []], keys,
+                        with_provenance=True)
+                    binary_spikes = numpy.zeros(
+                        (3000, pop_size * 4), dtype=int)
+                    for tick, key in packets:
+                        binary_spikes[tick, key] += 1
+                    self.assertEqual(
+                        binary_spikes.tolist(),
+                        [tick_spikes[task].tolist()
+                         for tick_spikes in spikes])
+                    self.assertTrue(records)
+                    self.assertEqual(
+                        [(tick, numpy.array(words, dtype=numpy.uint32).view(
+                            numpy.int32).tolist())
+                         for tick, _, words in records],
+                        [(tick, scores[tick][task].tolist())
+                         for tick, _, _ in records])
+
+                    # The provenance is written in the order it is read
+                    self.assertEqual(
+                        len(RecallMachineVertex.PROVENANCE_ITEMS),
+                        len(provenance))
+                    counters = dict(zip(
+                        RecallMachineVertex.PROVENANCE_ITEMS,
+                        provenance))
+                    self.assertEqual(
+                        sum(map(len, keys)),
+                        counters["Input_packets_received"])
+                    self.assertEqual(len(packets), counters["Spikes_sent"])
+
+    def test_scores(self):
+        engine = RecallEngine(
+            2, prob_command=0.75, time_period=10, random_seed=1)
+        for _ in range(2000):
+            # The first task always chooses 0 and the second 1, so each
+            # wins every recall of its value and loses every other one
+            engine.step(numpy.array([[1, 0], [0, 1]]))
+        scores = engine.scores
+        trials = engine.trials
+        self.assertTrue((trials > 0).all())
+        self.assertTrue(scores[0, 0] > 0 > scores[0, 1])
+        self.assertTrue(scores[1, 0] < 0 < scores[1, 1])
+        self.assertEqual(
+            trials.tolist(), numpy.abs(scores).sum(axis=1).tolist())
+        self.assertTrue(numpy.allclose(
+            scores.sum(axis=1) / trials, engine.accuracies))
+
+        # Without a penalty, the wrong value only fails to score
+        engine = RecallEngine(1, time_period=10, random_seed=1)
+        for _ in range(2000):
+            engine.step(numpy.array([[1, 0]]))
+        self.assertEqual(0, engine.scores[0, 1])
+        self.assertTrue(0 < engine.scores[0, 0] < engine.trials[0])
+
+    def test_reset(self):
+        engine = RecallEngine(2, time_period=5, random_seed=2)
+        for _ in range(500):
+            engine.step(numpy.array([[3, 0], [0, 1]]))
+        engine.reset([0])
+        self.assertEqual([0, 0], engine.scores[0].tolist())
+        self.assertEqual(0, engine.trials[0])
+        self.assertTrue(numpy.isnan(engine.accuracies[0]))
+        self.assertEqual(RecallEngine.STATE_IDLE, engine.states[0])
+        self.assertTrue(engine.trials[1] > 0)
+        self.assertEqual(500, engine.tick)
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            RecallEngine(2, rate_on=0, stochastic=0)
+        with self.assertRaises(ValueError):
+            RecallEngine(2).step(numpy.zeros((2, 4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+from spinn_gym import (
+    Bandit, Breakout, DoublePendulum, Logic, Pendulum, Recall)
+
+
+class TestRecordingSizes(unittest.TestCase):
+
+    def __check(self, make_game, n_samples, n_words):
+        """ Check that 10 seconds of a game has room for a number of
+            samples of the score, of a number of words, and of a tick too
+            when only changes are recorded
+        """
+        for changes_only in (False, True):
+            game = make_game(
+                simulation_duration_ms=10000,
+                record_changes_only=changes_only)
+            size = game.machine_vertex.recording_sizes[0]
+            self.assertEqual(
+                n_samples * (n_words + changes_only) * 4, size)
+            self.assertEqual(
+                n_samples * game.recorded_score_dtype.itemsize, size)
+
+    def test_breakout(self):
+        self.__check(Breakout, 10, 1)
+
+    def test_pendulum(self):
+        self.__check(lambda **kwargs: Pendulum(reward_based=0, **kwargs),
+                     100, 2)
+        self.__check(lambda **kwargs: Pendulum(reward_based=1, **kwargs),
+                     100, 1)
+
+    def test_double_pendulum(self):
+        self.__check(
+            lambda **kwargs: DoublePendulum(reward_based=0, **kwargs),
+            100, 3)
+        self.__check(
+            lambda **kwargs: DoublePendulum(reward_based=1, **kwargs),
+            100, 1)
+
+    def test_bandit(self):
+        self.__check(lambda **kwargs: Bandit(reward_based=0, **kwargs),
+                     10, 1)
+        self.__check(lambda **kwargs: Bandit(reward_based=1, **kwargs),
+                     10, 1)
+
+    def test_logic(self):
+        self.__check(lambda **kwargs: Logic(
+            truth_table=[0, 1, 1, 0], input_sequence=[0, 1], **kwargs),
+            10, 1)
+
+    def test_recall(self):
+        self.__check(Recall, 10, 3)
+
+    def test_partial_sample(self):
+        # A run that ends between samples is rounded up to a whole sample
+        game = Pendulum(reward_based=0, simulation_duration_ms=1050)
+        self.assertEqual(11 * 8, game.machine_vertex.recording_sizes[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+from spinn_gym import (
+    Bandit, Breakout, DoublePendulum, Logic, Pendulum)
+
+
+class TestRewriteParameters(unittest.TestCase):
+
+    def test_set_arms(self):
+        game = Bandit(arms=[0.25, 0.75])
+        vertex = game.machine_vertex
+        self.assertFalse(vertex.reload_required())
+        game.set_parameter_values("arms", [0.5, 1])
+        self.assertTrue(vertex.reload_required())
+        arms = game.get_parameter_values("arms")
+        self.assertAlmostEqual(0.5, arms[0])
+        self.assertEqual(1.0, arms[1])
+        self.assertEqual(0xffffffff, vertex.get_parameter_region_data()[-1])
+        vertex.set_reload_required(False)
+        self.assertFalse(vertex.reload_required())
+
+    def test_size_change(self):
+        game = Logic(truth_table=[0, 1, 1, 0], input_sequence=[0, 1])
+        with self.assertRaises(ValueError):
+            game.set_parameter_values("truth_table", [0, 1])
+        self.assertEqual(
+            [0, 1, 1, 0],
+            game.machine_vertex.get_parameter_value("truth_table"))
+        self.assertFalse(game.machine_vertex.reload_required())
+        game.set_parameter_values("truth_table", [1, 0, 0, 1])
+        self.assertEqual(
+            [1, 0, 0, 1],
+            game.machine_vertex.get_parameter_value("truth_table"))
+        # The table is archived packed
+        self.assertEqual(
+            [0b1001], game.machine_vertex.parameters["truth_table_words"])
+
+    def test_not_rewritable(self):
+        game = Bandit(arms=[0.25, 0.75])
+        self.assertNotIn("random_seed", game.get_parameters())
+        with self.assertRaises(KeyError):
+            game.set_parameter_values("random_seed", [1, 2, 3, 4])
+
+    def test_reward_based(self):
+        # The bandit's score is read as the reward_based it runs with
+        game = Bandit(arms=[0.25, 0.75])
+        self.assertEqual(("Score", ), game.score_dtype.names)
+        game.set_parameter_values("reward_based", 0)
+        self.assertEqual(("correct_pulls", ), game.score_dtype.names)
+        self.assertEqual(
+            ("tick", "correct_pulls"),
+            Bandit(record_changes_only=True, reward_based=0)
+            .recorded_score_dtype.names)
+
+        # The pendulums' score has a layout of its own for each, so it
+        # can't be changed
+        for game in (Pendulum(), DoublePendulum()):
+            with self.assertRaises(KeyError):
+                game.set_parameter_values("reward_based", 0)
+
+    def test_encoding(self):
+        # The encoding sets the number of neurons of a pendulum
+        for game in (Pendulum(), DoublePendulum()):
+            n_atoms = game.n_atoms
+            self.assertNotIn("encoding", game.get_parameters())
+            with self.assertRaises(KeyError):
+                game.set_parameter_values("encoding", 1)
+            self.assertEqual(n_atoms, game.n_atoms)
+
+    def test_reset(self):
+        game = Breakout(random_seed=[1, 2, 3, 4])
+        vertex = game.machine_vertex
+        game.reset()
+        self.assertTrue(vertex.reload_required())
+        self.assertEqual(1, vertex.get_parameter_region_data()[-1])
+        game.reset(seed=[5, 6, 7, 8])
+        data = vertex.get_parameter_region_data()
+        self.assertEqual([5, 6, 7, 8, 0, 3], data[3:].tolist())
+
+        # Once reloaded, the reset is not asked for again
+        vertex.set_reload_required(False)
+        game.set_parameter_values("bricking", 0)
+        self.assertEqual(0, vertex.get_parameter_region_data()[-1])
+
+        with self.assertRaises(ValueError):
+            game.reset(seed=[1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
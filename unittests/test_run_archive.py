@@ -0,0 +1,90 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+
+import numpy
+
+from spinn_gym.utilities import load_run, RunArchive, save_run
+
+SCORE_DTYPE = numpy.dtype([("score_0", numpy.int32),
+                           ("score_1", numpy.int32)])
+
+
+class TestRunArchive(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._root = self._tmp.name
+        self._scores = []
+        for run, length in enumerate((5, 0, 3, 7)):
+            scores = numpy.zeros(length, dtype=SCORE_DTYPE)
+            scores["score_0"] = numpy.arange(length) + run * 100
+            scores["score_1"] = run
+            self._scores.append(scores)
+            save_run(os.path.join(self._root, f"run_{run}"),
+                     {"score": scores},
+                     {"seed": numpy.array([1, 2, 3, run], numpy.uint32),
+                      "rate": numpy.float32(0.5)})
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trip(self):
+        run = load_run(os.path.join(self._root, "run_3"))
+        self.assertEqual(["score"], run.channel_names)
+        self.assertEqual([1, 2, 3, 3], run.metadata["seed"])
+        self.assertEqual(0.5, run.metadata["rate"])
+        scores = run["score"]
+        self.assertIsInstance(scores, numpy.memmap)
+        numpy.testing.assert_array_equal(self._scores[3], scores)
+        with self.assertRaises(KeyError):
+            run["events"]  # pylint: disable=pointless-statement
+
+    def test_concatenate(self):
+        archive = RunArchive.from_directory(self._root)
+        self.assertEqual(4, len(archive))
+        channel = archive.channel("score")
+        expected = numpy.concatenate(self._scores)
+        self.assertEqual(expected.shape, channel.shape)
+        self.assertEqual(SCORE_DTYPE, channel.dtype)
+        numpy.testing.assert_array_equal(expected, numpy.asarray(channel))
+        numpy.testing.assert_array_equal(expected[3:9], channel[3:9])
+        numpy.testing.assert_array_equal(expected[::-2], channel[::-2])
+        numpy.testing.assert_array_equal(expected[-1], channel[-1])
+        indices = numpy.array([14, 0, 5, 7, -1])
+        numpy.testing.assert_array_equal(expected[indices], channel[indices])
+        mask = expected["score_0"] % 2 == 0
+        numpy.testing.assert_array_equal(expected[mask], channel[mask])
+        self.assertEqual([0, 5, 5, 8, 15], channel.offsets.tolist())
+        self.assertEqual(3, channel.run_of(8))
+        self.assertEqual(
+            [5, 0, 3, 7], [len(chunk) for chunk in channel.chunks()])
+        with self.assertRaises(IndexError):
+            channel[15]  # pylint: disable=pointless-statement
+
+    def test_select(self):
+        archive = RunArchive.from_directory(self._root).select(
+            lambda metadata: metadata["seed"][3] >= 2)
+        self.assertEqual(2, len(archive))
+        numpy.testing.assert_array_equal(
+            numpy.concatenate(self._scores[2:]),
+            numpy.asarray(archive.channel("score")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy
+
+from spinn_gym import Recall
+from spinn_gym.utilities import expand_score_changes
+
+
+class TestScoreChanges(unittest.TestCase):
+
+    def test_expand(self):
+        changes = numpy.array(
+            [(1000, 1, 0), (3000, 2, 1), (7000, 2, 3)],
+            dtype=[("tick", numpy.uint32), ("a", numpy.int32),
+                   ("b", numpy.int32)])
+        scores = expand_score_changes(changes, numpy.arange(0, 9000, 1000))
+        self.assertEqual(("a", "b"), scores.dtype.names)
+        self.assertEqual([0, 1, 1, 2, 2, 2, 2, 2, 2], scores["a"].tolist())
+        self.assertEqual([0, 0, 0, 1, 1, 1, 1, 3, 3], scores["b"].tolist())
+
+    def test_decode_changes(self):
+        game = Recall(record_changes_only=True)
+        self.assertEqual(("tick", "score_0", "score_1", "trials"),
+                         game.recorded_score_dtype.names)
+        raw = numpy.array([1000, 1, 0, 1, 5000, 1, 1, 2],
+                          dtype=numpy.uint32).tobytes()
+        changes = game.decode_scores(raw)
+        self.assertEqual([1000, 5000], changes["tick"].tolist())
+        scores = expand_score_changes(changes, [999, 1000, 4999, 5000])
+        self.assertEqual([0, 1, 1, 2], scores["trials"].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
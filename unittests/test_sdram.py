@@ -0,0 +1,171 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from collections import defaultdict
+import unittest
+
+import numpy
+
+from pacman.model.graphs.common import Slice
+from pacman.model.placements import Placement
+from pacman_test_objects import SimpleTestVertex
+from pacman.model.routing_info import (
+    AppVertexRoutingInfo, BaseKeyAndMask, MachineVertexRoutingInfo,
+    RoutingInfo)
+
+from spinn_front_end_common.interface.ds import DataType
+
+from spynnaker.pyNN.config_setup import unittest_setup
+from spynnaker.pyNN.data.spynnaker_data_writer import SpynnakerDataWriter
+from spynnaker.pyNN.utilities.constants import SPIKE_PARTITION_ID
+
+from spinn_gym import (
+    Bandit, BatchedBreakout, Breakout, DoublePendulum, Logic, Pendulum,
+    Recall)
+
+
+class _MemorySpec(object):
+    """ Records what a data specification reserves and writes, in memory
+    """
+
+    def __init__(self):
+        self.reserved = dict()
+        self.written = defaultdict(int)
+        self.__region = None
+
+    def comment(self, comment):
+        pass
+
+    def reserve_memory_region(self, region, size, label=None,
+                              reference=None):
+        # pylint: disable=unused-argument
+        assert region not in self.reserved
+        self.reserved[region] = size
+
+    def switch_write_focus(self, region):
+        assert region in self.reserved
+        self.__region = region
+
+    def write_value(self, data, data_type=DataType.UINT32):
+        self.written[self.__region] += len(data_type.as_bytes(data))
+
+    def write_array(self, array_values, data_type=DataType.UINT32):
+        self.written[self.__region] += numpy.array(
+            array_values, dtype=data_type.numpy_typename).nbytes
+
+    def end_specification(self):
+        self.__region = None
+
+
+class TestSdram(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        self.__writer = SpynnakerDataWriter.mock()
+
+    def __check(self, game, vertices):
+        game.source_vertex = SimpleTestVertex(
+            2 * game.n_atoms, max_atoms_per_core=8)
+        routing_infos = RoutingInfo()
+        routing_infos.add_routing_info(AppVertexRoutingInfo(
+            BaseKeyAndMask(0x10000000, 0xFFFF0000), SPIKE_PARTITION_ID,
+            game.source_vertex, 0xFFFFFFF8, 3, 0xFFF))
+        routing_infos.add_routing_info(AppVertexRoutingInfo(
+            BaseKeyAndMask(0, 0xFFF00000), SPIKE_PARTITION_ID, game,
+            0xFFFF0000, 16, len(vertices) - 1))
+        for index, vertex in enumerate(vertices):
+            routing_infos.add_routing_info(MachineVertexRoutingInfo(
+                BaseKeyAndMask(index << 16, 0xFFFF0000), SPIKE_PARTITION_ID,
+                vertex, index))
+        self.__writer.set_routing_infos(routing_infos)
+
+        for vertex in vertices:
+            spec = _MemorySpec()
+            vertex.generate_data_specification(
+                spec, Placement(vertex, 0, 0, 1))
+            self.assertEqual(vertex.get_region_sizes(), spec.reserved)
+            for region, size in spec.written.items():
+                self.assertLessEqual(
+                    size, spec.reserved[region],
+                    f"{vertex} overruns region {region}")
+            # The recording of a run of any length fits
+            sdram = vertex.sdram_required
+            for n_ticks in (1, 99, 100, 101, 999, 1000, 1001, 86400000):
+                self.assertGreaterEqual(
+                    sdram.get_total_sdram(n_ticks),
+                    sum(spec.reserved.values()) +
+                    sum(vertex.get_recording_sizes(n_ticks)))
+
+    def __check_one(self, game):
+        self.__check(game, [game.machine_vertex])
+
+    def test_breakout(self):
+        self.__check_one(Breakout())
+
+    def test_batched_breakout(self):
+        game = BatchedBreakout(5, games_per_core=2)
+        vertices = []
+        per_core = game.get_max_atoms_per_core()
+        for lo_atom in range(0, game.n_atoms, per_core):
+            vertex_slice = Slice(
+                lo_atom, min(lo_atom + per_core, game.n_atoms) - 1)
+            vertices.append(game.create_machine_vertex(
+                vertex_slice, game.get_sdram_used_by_atoms(vertex_slice),
+                game.label))
+        self.__check(game, vertices)
+
+    def test_pendulums(self):
+        self.__check_one(Pendulum())
+        self.__check_one(DoublePendulum())
+
+    def test_bandit(self):
+        self.__check_one(Bandit(arms=[0.1, 0.2, 0.3, 0.4, 0.5]))
+
+    def test_logic(self):
+        self.__check_one(Logic(
+            truth_table=[0, 1, 1, 0, 1, 0, 0, 1],
+            input_sequence=[0, 1, 0]))
+
+    def test_recall(self):
+        self.__check_one(Recall(record_changes_only=True))
+
+    def test_default_bounds(self):
+        # A game costs little before it records anything, and less than a
+        # megabyte for a minute of recording
+        batched = BatchedBreakout(64)
+        sdrams = [batched.get_sdram_used_by_atoms(
+            Slice(0, batched.get_max_atoms_per_core() - 1))]
+        for game in (Bandit(arms=[0.1, 0.9]), Breakout(), DoublePendulum(),
+                     DoublePendulum(reward_based=0), Logic(
+                         truth_table=[0, 1, 1, 0], input_sequence=[0, 1]),
+                     Pendulum(), Pendulum(reward_based=0), Recall()):
+            sdrams.append(game.machine_vertex.sdram_required)
+        for sdram in sdrams:
+            self.assertLess(sdram.fixed, 64 * 1024)
+            self.assertLess(sdram.get_total_sdram(60000), 1024 * 1024)
+
+    def test_run_length(self):
+        # The recording is sized for the ticks between extractions
+        vertex = Pendulum(reward_based=0).machine_vertex
+        self.assertEqual([6048000 * 8, 8], vertex.recording_sizes)
+        self.__writer.set_max_run_time_steps(1050)
+        self.assertEqual([88, 8], vertex.recording_sizes)
+        vertex = Pendulum(
+            reward_based=0, simulation_duration_ms=500).machine_vertex
+        self.assertEqual([40, 8], vertex.recording_sizes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy
+
+from spinn_gym import Breakout, Pendulum
+from spinn_gym.utilities import (
+    get_root_seed, resolve_random_seed, resolve_random_seeds, SeedStream,
+    set_root_seed)
+
+
+class TestSeedStreams(unittest.TestCase):
+
+    def test_reproducible(self):
+        first = SeedStream(1234).spawn(100)
+        self.assertEqual(first, SeedStream(1234).spawn(100))
+        self.assertNotEqual(first, SeedStream(1235).spawn(100))
+        self.assertEqual(100, len(set(map(tuple, first))))
+
+    def test_32_bit(self):
+        seeds = numpy.array(SeedStream(7).spawn(1000))
+        self.assertEqual((1000, 4), seeds.shape)
+        self.assertTrue(numpy.all(seeds >= 0))
+        self.assertTrue(numpy.all(seeds <= 0xFFFFFFFF))
+
+    def test_games_draw_from_stream(self):
+        set_root_seed(42)
+        self.assertEqual(42, get_root_seed())
+        seeds = [Breakout().machine_vertex.parameters["random_seed"],
+                 Pendulum().machine_vertex.parameters["random_seed"]]
+        self.assertNotEqual(seeds[0], seeds[1])
+        self.assertEqual(SeedStream(42).spawn(2), seeds)
+
+    def test_seed_from_int(self):
+        game = Breakout(random_seed=numpy.int64(5))
+        vertex = game.machine_vertex
+        self.assertEqual(Breakout(random_seed=5).machine_vertex.parameters[
+            "random_seed"], vertex.parameters["random_seed"])
+        game.reset(seed=numpy.random.SeedSequence(6))
+        self.assertEqual(Breakout(random_seed=6).machine_vertex.parameters[
+            "random_seed"], vertex.parameters["random_seed"])
+
+    def test_single_seed_matches_first_of_set(self):
+        # A game given an int starts as the first of the games an engine
+        # is given the same int for
+        for random_seed in (5, numpy.int64(5)):
+            self.assertEqual(resolve_random_seeds(5, 1)[0],
+                             resolve_random_seed(random_seed))
+            self.assertEqual(
+                resolve_random_seeds(5, 3)[0],
+                Pendulum(random_seed=random_seed).machine_vertex.parameters[
+                    "random_seed"])
+        self.assertEqual(SeedStream(5).next_seed(), resolve_random_seed(5))
+        self.assertEqual(
+            resolve_random_seeds(numpy.random.SeedSequence(9), 1)[0],
+            resolve_random_seed(numpy.random.SeedSequence(9)))
+
+
+if __name__ == '__main__':
+    unittest.main()
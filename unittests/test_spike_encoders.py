@@ -0,0 +1,89 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy
+
+from spinn_gym.utilities import SpikeEncoder, spike_source_times
+from spinn_gym.utilities.spike_encoders import (
+    RANK, RATE, RECEPTIVE_BINS, SPIKE_TIME, to_relative)
+
+
+class TestSpikeEncoders(unittest.TestCase):
+
+    def test_random_encodings(self):
+        # 3 frames of a batch of 2 states of 2 variables
+        states = numpy.array([[[0, 0.5], [1, 0.25]]] * 3)
+        for encoding, n_neurons in ((RATE, 2), (RECEPTIVE_BINS, 10)):
+            rasters = [
+                SpikeEncoder(encoding, number_of_bins=5,
+                             max_firing_rate=500, frame_length=100,
+                             random_seed=1).raster(states)
+                for _ in range(2)]
+            self.assertEqual((300, 2, n_neurons), rasters[0].shape)
+            self.assertTrue(numpy.array_equal(*rasters))
+            self.assertTrue(rasters[0].any())
+
+        # A rate spikes more the higher the value
+        rates = SpikeEncoder(
+            RATE, max_firing_rate=500, frame_length=1000,
+            random_seed=2).raster([[0, 0.2, 1]]).mean(axis=0)
+        self.assertEqual(0, rates[0])
+        self.assertTrue(0.05 < rates[1] < 0.15)
+        self.assertTrue(0.45 < rates[2] < 0.55)
+
+    def test_frame_encodings(self):
+        encoder = SpikeEncoder(
+            RANK, number_of_bins=5, frame_length=5)
+        raster = encoder.raster([[0.0], [0.5], [1.0]])
+        self.assertEqual((15, 5), raster.shape)
+        # Each bin spikes once a frame, the nearest first
+        self.assertEqual([[1] * 5] * 3,
+                         raster.reshape(3, 5, 5).sum(axis=1).tolist())
+        self.assertEqual([0, 2, 4], raster[::5].argmax(axis=1).tolist())
+
+        encoder = SpikeEncoder(
+            SPIKE_TIME, number_of_bins=5, bin_overlap=1, frame_length=20)
+        raster = encoder.raster([[0.5]])
+        # Only the bin at the value spikes, at the start of the frame
+        self.assertEqual([0, 0, 1, 0, 0], raster.sum(axis=0).tolist())
+        self.assertEqual(1, raster[0, 2])
+        self.assertTrue(numpy.array_equal(
+            raster[3], encoder.encode([0.5], tick_in_frame=3)))
+        with self.assertRaises(ValueError):
+            encoder.encode([0.5])
+
+    def test_spike_source_times(self):
+        raster = numpy.zeros((4, 2, 3), dtype=numpy.uint8)
+        raster[0, 0, 1] = 1
+        raster[2, 0, 1] = 1
+        raster[3, 1, 2] = 2
+        times = spike_source_times(raster, timestep=0.5, start=10)
+        self.assertEqual([[], [10, 11], [], [], [], [11.5]],
+                         [list(neuron) for neuron in times])
+
+    def test_to_relative(self):
+        self.assertTrue(numpy.allclose(
+            [[0, 0.5], [1, 0.25]],
+            to_relative([[-1, 2], [1, 1]], [-1, 0], [1, 4])))
+
+    def test_bad_encoding(self):
+        with self.assertRaises(ValueError):
+            SpikeEncoder(4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import numpy
+
+from spinn_gym import (
+    BanditEngine, BreakoutEngine, DoublePendulumEngine, LogicEngine,
+    PendulumEngine, RecallEngine, VectorEnv)
+
+
+class TestVectorEnv(unittest.TestCase):
+
+    def test_all_games(self):
+        for engine in (
+                BreakoutEngine(3, random_seed=1),
+                PendulumEngine(3, random_seed=1),
+                DoublePendulumEngine(3, random_seed=1),
+                BanditEngine(3, [0.1, 0.5, 0.9], random_seed=1),
+                LogicEngine(3, [0, 1, 1, 0], [1, 0], random_seed=1),
+                RecallEngine(3, pop_size=2, random_seed=1)):
+            env = VectorEnv(engine, ticks_per_step=10)
+            observations = env.reset()
+            self.assertEqual((3, engine.n_neurons), observations.shape)
+            self.assertFalse(observations.any())
+            total = numpy.zeros(observations.shape, dtype=int)
+            for _ in range(100):
+                step = env.step(
+                    numpy.ones((3, env.n_actions), dtype=int))
+                # The same buffers are given back every step
+                self.assertIs(observations, step[0])
+                total += observations
+            self.assertTrue(total.any())
+
+    def test_matches_engine(self):
+        engine = LogicEngine(2, [0, 1, 1, 0], [1, 0], random_seed=2)
+        env = VectorEnv(LogicEngine(
+            2, [0, 1, 1, 0], [1, 0], random_seed=2), ticks_per_step=200)
+        actions = numpy.array([[0, 5], [5, 0]])
+        for _ in range(3):
+            spikes = engine.step(actions).astype(int)
+            for _ in range(199):
+                spikes += engine.step(numpy.zeros((2, 2), dtype=int))
+            observations, rewards, dones = env.step(actions)
+            self.assertEqual(spikes.tolist(), observations.tolist())
+            self.assertEqual([1, 0], rewards.tolist())
+            self.assertFalse(dones.any())
+
+    def test_breakout(self):
+        engine = BreakoutEngine(2, random_seed=3)
+        env = VectorEnv(BreakoutEngine(2, random_seed=3))
+        actions = numpy.array([[1, 0], [0, 1]])
+        for _ in range(300):
+            neuron_ids, _ = engine.step(actions)
+            observations, rewards, _ = env.step(actions)
+            for game in range(2):
+                sent = neuron_ids[game][neuron_ids[game] >= 0]
+                self.assertEqual(
+                    numpy.bincount(sent, minlength=env.n_neurons).tolist(),
+                    observations[game].tolist())
+        self.assertEqual(engine.scores.tolist(), env.engine.scores.tolist())
+
+    def test_done_and_reset(self):
+        env = VectorEnv(PendulumEngine(2, pole_angle=30, random_seed=4), 20)
+        rewards = numpy.zeros(2)
+        for _ in range(50):
+            _, reward, dones = env.step(numpy.zeros((2, 2), dtype=int))
+            rewards += reward
+        self.assertTrue(dones.all())
+        self.assertEqual(
+            rewards.tolist(), env.engine.max_balance_times.tolist())
+        env.reset([1])
+        self.assertEqual([True, False], dones.tolist())
+        self.assertTrue(env.engine.in_bounds[1])
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            VectorEnv(RecallEngine(2), ticks_per_step=0)
+        with self.assertRaises(ValueError):
+            VectorEnv(BanditEngine(2, [0.5] * 3)).step(numpy.zeros((2, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()